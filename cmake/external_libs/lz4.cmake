@@ -0,0 +1,12 @@
+set(lz4_USE_STATIC_LIBS ON)
+set(lz4_CFLAGS "-fstack-protector-all -fPIC -D_FORTIFY_SOURCE=2 -O2")
+mindspore_add_pkg(lz4
+        VER 1.9.2
+        LIBS lz4
+        GIT_REPOSITORY https://github.com/lz4/lz4.git
+        GIT_TAG v1.9.2
+        CMAKE_PATH build/cmake
+        CMAKE_OPTION -DCMAKE_BUILD_TYPE=Release -DBUILD_SHARED_LIBS=OFF -DBUILD_STATIC_LIBS=ON
+                     -DLZ4_BUILD_CLI=OFF -DLZ4_BUILD_LEGACY_LZ4C=OFF)
+include_directories(${lz4_INC})
+add_library(mindspore::lz4 ALIAS lz4::lz4)
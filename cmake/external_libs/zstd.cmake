@@ -0,0 +1,12 @@
+set(zstd_USE_STATIC_LIBS ON)
+set(zstd_CFLAGS "-fstack-protector-all -fPIC -D_FORTIFY_SOURCE=2 -O2")
+mindspore_add_pkg(zstd
+        VER 1.4.4
+        LIBS zstd
+        GIT_REPOSITORY https://github.com/facebook/zstd.git
+        GIT_TAG v1.4.4
+        CMAKE_PATH build/cmake
+        CMAKE_OPTION -DCMAKE_BUILD_TYPE=Release -DZSTD_BUILD_STATIC=ON -DZSTD_BUILD_SHARED=OFF
+                     -DZSTD_BUILD_PROGRAMS=OFF)
+include_directories(${zstd_INC})
+add_library(mindspore::zstd ALIAS zstd::zstd)
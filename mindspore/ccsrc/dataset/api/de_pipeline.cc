@@ -38,6 +38,7 @@
 #include "dataset/util/status.h"
 #include "mindrecord/include/shard_category.h"
 #include "mindrecord/include/shard_distributed_sample.h"
+#include "mindrecord/include/shard_index_filter.h"
 #include "mindrecord/include/shard_sample.h"
 #include "mindrecord/include/shard_shuffle.h"
 #include "pybind11/stl.h"
@@ -387,12 +388,17 @@ Status DEPipeline::ParseMindRecordOp(const py::dict &args, std::shared_ptr<Datas
         (void)builder->SetNumMindRecordWorkers(ToInt(value));
       } else if (key == "block_reader" && ToBool(value) == true) {
         (void)builder->SetBlockReader();
+      } else if (key == "use_mmap" && ToBool(value) == true) {
+        (void)builder->SetUseMmap();
       } else if (key == "sampler") {
         int num_padded = 0;
         if (!args["num_padded"].is_none()) {
           num_padded = ToInt(args["num_padded"]);
         }
         RETURN_IF_NOT_OK(BuildMindrecordSamplerChain(value, &operators, num_padded));
+      } else if (key == "index_filter") {
+        auto conditions = py::reinterpret_borrow<py::object>(value).cast<mindrecord::INDEX_CONDITIONS>();
+        operators.push_back(std::make_shared<mindrecord::ShardIndexFilter>(conditions));
       }
     }
   }
@@ -1230,6 +1236,8 @@ Status DEPipeline::ParseBuildVocabOp(const py::dict &args, std::shared_ptr<Datas
         (void)builder->SetSpecialFirst(ToBool(value));
       } else if (key == "special_tokens") {
         (void)builder->SetSpecialTokens(ToStringVector(value));
+      } else if (key == "word_count_file") {
+        (void)builder->SetWordCountFile(ToString(value));
       }
     }
   }
@@ -80,6 +80,7 @@
 #include "dataset/text/vocab.h"
 #include "dataset/util/random.h"
 #include "mindrecord/include/shard_distributed_sample.h"
+#include "mindrecord/include/shard_index_filter.h"
 #include "mindrecord/include/shard_operator.h"
 #include "mindrecord/include/shard_pk_sample.h"
 #include "mindrecord/include/shard_sample.h"
@@ -91,6 +92,7 @@
 
 #ifdef ENABLE_ICU4C
 #include "dataset/text/kernels/basic_tokenizer_op.h"
+#include "dataset/text/kernels/bert_encode_op.h"
 #include "dataset/text/kernels/bert_tokenizer_op.h"
 #include "dataset/text/kernels/case_fold_op.h"
 #include "dataset/text/kernels/normalize_utf8_op.h"
@@ -187,13 +189,25 @@ void bindDatasetOps(py::module *m) {
 
   (void)py::class_<MindRecordOp, DatasetOp, std::shared_ptr<MindRecordOp>>(*m, "MindRecordOp")
     .def_static("get_num_rows", [](const std::vector<std::string> &paths, bool load_dataset, const py::object &sampler,
-                                   const int64_t num_padded) {
+                                   const int64_t num_padded, const py::object &index_filter) {
       int64_t count = 0;
       std::shared_ptr<mindrecord::ShardOperator> op;
       if (py::hasattr(sampler, "create_for_minddataset")) {
         auto create = sampler.attr("create_for_minddataset");
         op = create().cast<std::shared_ptr<mindrecord::ShardOperator>>();
       }
+      if (!index_filter.is_none()) {
+        // rows are filtered by the index before sampling, so the filter is the deepest child of the sampler chain
+        auto filter_op =
+          std::make_shared<mindrecord::ShardIndexFilter>(index_filter.cast<mindrecord::INDEX_CONDITIONS>());
+        if (op == nullptr) {
+          op = filter_op;
+        } else {
+          auto child_op = op;
+          while (child_op->HasChildOp()) child_op = child_op->GetChildOp();
+          (void)child_op->SetChildOp(filter_op);
+        }
+      }
       THROW_IF_ERROR(MindRecordOp::CountTotalRows(paths, load_dataset, op, &count, num_padded));
       return count;
     });
@@ -605,10 +619,16 @@ void bindTokenizerOps(py::module *m) {
          py::arg("separator"));
   (void)py::class_<WordpieceTokenizerOp, TensorOp, std::shared_ptr<WordpieceTokenizerOp>>(
     *m, "WordpieceTokenizerOp", "Tokenize scalar token or 1-D tokens to subword tokens.")
-    .def(py::init<const std::shared_ptr<Vocab> &, const std::string &, const int &, const std::string &>(),
+    .def(py::init<const std::shared_ptr<Vocab> &, const std::string &, const int &, const std::string &, const int &>(),
          py::arg("vocab"), py::arg("suffix_indicator") = std::string(WordpieceTokenizerOp::kDefSuffixIndicator),
          py::arg("max_bytes_per_token") = WordpieceTokenizerOp::kDefMaxBytesPerToken,
-         py::arg("unknown_token") = std::string(WordpieceTokenizerOp::kDefUnknownToken));
+         py::arg("unknown_token") = std::string(WordpieceTokenizerOp::kDefUnknownToken),
+         py::arg("cache_size") = WordpieceTokenizerOp::kDefCacheSize)
+    .def("get_cache_stats", [](WordpieceTokenizerOp &self) {
+      int64_t hits = 0, misses = 0;
+      (void)self.GetCacheStats(&hits, &misses);
+      return py::make_tuple(hits, misses);
+    });
 }
 
 void bindDependIcuTokenizerOps(py::module *m) {
@@ -643,14 +663,42 @@ void bindDependIcuTokenizerOps(py::module *m) {
   (void)py::class_<BertTokenizerOp, TensorOp, std::shared_ptr<BertTokenizerOp>>(*m, "BertTokenizerOp",
                                                                                 "Tokenizer used for Bert text process.")
     .def(py::init<const std::shared_ptr<Vocab> &, const std::string &, const int &, const std::string &, bool, bool,
-                  NormalizeForm, bool>(),
+                  NormalizeForm, bool, const int &>(),
          py::arg("vocab"), py::arg("suffix_indicator") = std::string(WordpieceTokenizerOp::kDefSuffixIndicator),
          py::arg("max_bytes_per_token") = WordpieceTokenizerOp::kDefMaxBytesPerToken,
          py::arg("unknown_token") = std::string(WordpieceTokenizerOp::kDefUnknownToken),
          py::arg("lower_case") = BasicTokenizerOp::kDefLowerCase,
          py::arg("keep_whitespace") = BasicTokenizerOp::kDefKeepWhitespace,
          py::arg("normalization_form") = BasicTokenizerOp::kDefNormalizationForm,
-         py::arg("preserve_unused_token") = BasicTokenizerOp::kDefPreserveUnusedToken);
+         py::arg("preserve_unused_token") = BasicTokenizerOp::kDefPreserveUnusedToken,
+         py::arg("cache_size") = WordpieceTokenizerOp::kDefCacheSize)
+    .def("get_cache_stats", [](BertTokenizerOp &self) {
+      int64_t hits = 0, misses = 0;
+      (void)self.GetCacheStats(&hits, &misses);
+      return py::make_tuple(hits, misses);
+    });
+  (void)py::class_<BertEncodeOp, TensorOp, std::shared_ptr<BertEncodeOp>>(
+    *m, "BertEncodeOp", "Tokenize, lookup, truncate and pad Bert inputs in one op.")
+    .def(py::init<const std::shared_ptr<Vocab> &, int32_t, const std::string &, const int &, const std::string &, bool,
+                  bool, NormalizeForm, bool, const std::string &, const std::string &, const std::string &,
+                  const int &>(),
+         py::arg("vocab"), py::arg("max_seq_len"),
+         py::arg("suffix_indicator") = std::string(WordpieceTokenizerOp::kDefSuffixIndicator),
+         py::arg("max_bytes_per_token") = WordpieceTokenizerOp::kDefMaxBytesPerToken,
+         py::arg("unknown_token") = std::string(WordpieceTokenizerOp::kDefUnknownToken),
+         py::arg("lower_case") = BasicTokenizerOp::kDefLowerCase,
+         py::arg("keep_whitespace") = BasicTokenizerOp::kDefKeepWhitespace,
+         py::arg("normalization_form") = BasicTokenizerOp::kDefNormalizationForm,
+         py::arg("preserve_unused_token") = BasicTokenizerOp::kDefPreserveUnusedToken,
+         py::arg("cls_token") = std::string(BertEncodeOp::kDefClsToken),
+         py::arg("sep_token") = std::string(BertEncodeOp::kDefSepToken),
+         py::arg("pad_token") = std::string(BertEncodeOp::kDefPadToken),
+         py::arg("cache_size") = WordpieceTokenizerOp::kDefCacheSize)
+    .def("get_cache_stats", [](BertEncodeOp &self) {
+      int64_t hits = 0, misses = 0;
+      (void)self.GetCacheStats(&hits, &misses);
+      return py::make_tuple(hits, misses);
+    });
 #endif
 }
 
@@ -702,6 +750,10 @@ void bindSamplerOps(py::module *m) {
       }
     }));
 
+  (void)py::class_<mindrecord::ShardIndexFilter, mindrecord::ShardOperator,
+                   std::shared_ptr<mindrecord::ShardIndexFilter>>(*m, "MindrecordIndexFilter")
+    .def(py::init<mindrecord::INDEX_CONDITIONS>());
+
   (void)py::class_<mindrecord::ShardDistributedSample, mindrecord::ShardSample,
                    std::shared_ptr<mindrecord::ShardDistributedSample>>(*m, "MindrecordDistributedSampler")
     .def(py::init<int64_t, int64_t, bool, uint32_t>());
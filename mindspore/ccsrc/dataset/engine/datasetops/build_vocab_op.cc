@@ -17,67 +17,110 @@
 #include "dataset/engine/datasetops/build_vocab_op.h"
 
 #include <algorithm>
+#include <cstdio>
+#include <fstream>
 #include <limits>
+#include <queue>
 #include <string>
 #include <unordered_map>
 #include <utility>
 #include "dataset/core/config_manager.h"
+#include "dataset/util/path.h"
 
 namespace mindspore {
 namespace dataset {
 
 BuildVocabOp::BuildVocabOp(std::shared_ptr<Vocab> vocab, std::vector<std::string> col_names,
                            std::pair<int64_t, int64_t> freq_r, int64_t top_k, const std::vector<std::string> &tokens,
-                           bool prepend, int32_t num_workers, int32_t op_conn_size)
+                           bool prepend, int32_t num_workers, int32_t op_conn_size, const std::string &word_count_file)
     : ParallelOp(num_workers, op_conn_size),
-      interval_(op_conn_size * num_workers),
       vocab_(vocab),
       col_names_(col_names),
       freq_range_(freq_r),
       top_k_(top_k),
       special_tokens_(tokens),
-      special_first_(prepend) {
-  // init two queues for thread sync
+      special_first_(prepend),
+      word_count_file_(word_count_file),
+      shard_cnt_(num_workers),
+      prior_cnt_(num_workers) {
+  // init queues for thread sync
   distributor_queue_ = std::make_unique<Queue<TensorRow>>(num_workers * op_conn_size);
-  collector_queue_ =
-    std::make_unique<Queue<std::unique_ptr<std::unordered_map<std::string, int64_t>>>>(num_workers * op_conn_size);
+  for (int32_t i = 0; i < num_workers; i++) {
+    shard_queues_.push_back(std::make_unique<Queue<std::unique_ptr<WordCountMap>>>(num_workers));
+  }
+  collector_queue_ = std::make_unique<Queue<std::unique_ptr<std::vector<WordFreq>>>>(num_workers);
 }
 
 Status BuildVocabOp::WorkerEntry(int32_t worker_id) {
   TaskManager::FindMe()->Post();
+  std::vector<std::unique_ptr<WordCountMap>> wrkr_maps;
+  for (int32_t i = 0; i < num_workers_; i++) {
+    wrkr_maps.push_back(std::make_unique<WordCountMap>());
+  }
   TensorRow new_row;
   RETURN_IF_NOT_OK(distributor_queue_->PopFront(&new_row));
-  std::unique_ptr<std::unordered_map<std::string, int64_t>> wrkr_map =
-    std::make_unique<std::unordered_map<std::string, int64_t>>();
-  int32_t row_cnt = 0;
   while (!new_row.empty()) {
     for (int32_t col : col_ids_) {
       CHECK_FAIL_RETURN_UNEXPECTED(!new_row[col]->type().IsNumeric(), "from_dataset only works on string columns");
       for (auto itr = new_row[col]->begin<std::string_view>(); itr != new_row[col]->end<std::string_view>(); itr++) {
-        (*wrkr_map)[std::string(*itr)] += 1;
+        (*wrkr_maps[ShardOf(*itr)])[std::string(*itr)] += 1;
       }
     }
-    row_cnt++;  // row is processed by this point
-    if ((row_cnt % interval_ == 0) && ((row_cnt / interval_) % num_workers_ == worker_id) && (!wrkr_map->empty())) {
-      RETURN_IF_NOT_OK(collector_queue_->Add(std::move(wrkr_map)));
-      wrkr_map = std::make_unique<std::unordered_map<std::string, int64_t>>();
-    }
     RETURN_IF_NOT_OK(distributor_queue_->PopFront(&new_row));
   }
-  // clean up
-  if (!wrkr_map->empty()) {
-    RETURN_IF_NOT_OK(collector_queue_->Add(std::move(wrkr_map)));
+  // send every shard to the worker merging it
+  for (int32_t i = 0; i < num_workers_; i++) {
+    RETURN_IF_NOT_OK(shard_queues_[i]->Add(std::move(wrkr_maps[i])));
   }
-  // empty map as quit signal
-  RETURN_IF_NOT_OK(collector_queue_->Add(std::make_unique<std::unordered_map<std::string, int64_t>>()));
+  // merge the counts of the shard of this worker, starting from the counts of the previous build
+  WordCountMap &word_cnt = shard_cnt_[worker_id];
+  word_cnt = std::move(prior_cnt_[worker_id]);
+  for (int32_t i = 0; i < num_workers_; i++) {
+    std::unique_ptr<WordCountMap> wrkr_map;
+    RETURN_IF_NOT_OK(shard_queues_[worker_id]->PopFront(&wrkr_map));
+    RETURN_UNEXPECTED_IF_NULL(wrkr_map);
+    if (word_cnt.empty()) {
+      word_cnt = std::move(*wrkr_map);
+    } else {
+      for (const auto &wd : *wrkr_map) word_cnt[wd.first] += wd.second;
+    }
+  }
+  auto words = std::make_unique<std::vector<WordFreq>>();
+  TopKWords(word_cnt, words.get());
+  RETURN_IF_NOT_OK(collector_queue_->Add(std::move(words)));
   return Status::OK();
 }
 
+void BuildVocabOp::TopKWords(const WordCountMap &word_cnt, std::vector<WordFreq> *out) const {
+  // the top of the heap is the least frequent word taken so far
+  std::priority_queue<WordFreq, std::vector<WordFreq>, decltype(&FreqGreater)> heap(&FreqGreater);
+  for (const auto &wd : word_cnt) {
+    if (wd.second < freq_range_.first || wd.second > freq_range_.second) {
+      continue;
+    }
+    heap.emplace(wd.second, &wd.first);
+    if (static_cast<int64_t>(heap.size()) > top_k_) {
+      heap.pop();
+    }
+  }
+  out->resize(heap.size());
+  for (auto itr = out->rbegin(); itr != out->rend(); itr++) {
+    *itr = heap.top();
+    heap.pop();
+  }
+}
+
 Status BuildVocabOp::operator()() {
   // launch the collector thread
   RETURN_UNEXPECTED_IF_NULL(tree_);
   RETURN_IF_NOT_OK(distributor_queue_->Register(tree_->AllTasks()));
+  for (auto &shard_queue : shard_queues_) {
+    RETURN_IF_NOT_OK(shard_queue->Register(tree_->AllTasks()));
+  }
   RETURN_IF_NOT_OK(collector_queue_->Register(tree_->AllTasks()));
+  if (!word_count_file_.empty()) {
+    RETURN_IF_NOT_OK(LoadWordCount());
+  }
   // launch worker threads and collector thread
   RETURN_IF_NOT_OK(
     tree_->LaunchWorkers(num_workers_, std::bind(&BuildVocabOp::WorkerEntry, this, std::placeholders::_1)));
@@ -119,58 +162,60 @@ Status BuildVocabOp::operator()() {
 
 Status BuildVocabOp::CollectorThread() {
   TaskManager::FindMe()->Post();
-  int32_t num_quited_worker = 0;
-  std::unique_ptr<std::unordered_map<std::string, int64_t>> wrkr_map;
-  while (num_quited_worker != num_workers_) {
-    RETURN_IF_NOT_OK(collector_queue_->PopFront(&wrkr_map));
-    RETURN_UNEXPECTED_IF_NULL(wrkr_map);
-    if (!wrkr_map->empty()) {
-      for (const auto &wd : *wrkr_map) word_cnt_[wd.first] += wd.second;
-    } else {
-      ++num_quited_worker;
-    }
+  std::vector<std::unique_ptr<std::vector<WordFreq>>> shard_words;
+  for (int32_t i = 0; i < num_workers_; i++) {
+    std::unique_ptr<std::vector<WordFreq>> words;
+    RETURN_IF_NOT_OK(collector_queue_->PopFront(&words));
+    RETURN_UNEXPECTED_IF_NULL(words);
+    shard_words.push_back(std::move(words));
   }  // all frequencies are obtained
-  CHECK_FAIL_RETURN_UNEXPECTED(!word_cnt_.empty(), "word_cnt is empty");
-  std::vector<std::string> words;
-  // make sure enough is reserved, this will become a partially sorted list eventually
-  words.reserve(wrkr_map->size());
-
-  for (auto it = word_cnt_.begin(); it != word_cnt_.end();) {
-    if (it->second >= freq_range_.first && it->second <= freq_range_.second) {
-      words.push_back(it->first);
-      it++;
-    } else {
-      it = word_cnt_.erase(it);
-    }
+  CHECK_FAIL_RETURN_UNEXPECTED(
+    std::any_of(shard_cnt_.begin(), shard_cnt_.end(), [](const WordCountMap &cnt) { return !cnt.empty(); }),
+    "word_cnt is empty");
+  if (!word_count_file_.empty()) {
+    RETURN_IF_NOT_OK(SaveWordCount());
   }
   std::string err_msg;
 
   for (const std::string &sp_tk : special_tokens_) {
     // if a special word exists in dataset, warn user about this
-    err_msg += (word_cnt_.find(sp_tk) != word_cnt_.end() ? sp_tk + "\t" : "");
+    const WordCountMap &word_cnt = shard_cnt_[ShardOf(sp_tk)];
+    auto itr = word_cnt.find(sp_tk);
+    if (itr != word_cnt.end() && itr->second >= freq_range_.first && itr->second <= freq_range_.second) {
+      err_msg += sp_tk + "\t";
+    }
   }
 
   CHECK_FAIL_RETURN_UNEXPECTED(err_msg.empty(), "These specials words are already in the dataset: " + err_msg + ".");
 
-  int64_t num_words = std::min(static_cast<int64_t>(words.size()), top_k_);
-  if (num_words == 0) {
+  // merge the top-k words of all shards, the heap holds the next word of every shard
+  using ShardPos = std::pair<size_t, size_t>;
+  auto pos_less = [&shard_words](const ShardPos &p1, const ShardPos &p2) {
+    return FreqGreater((*shard_words[p2.first])[p2.second], (*shard_words[p1.first])[p1.second]);
+  };
+  std::priority_queue<ShardPos, std::vector<ShardPos>, decltype(pos_less)> heads(pos_less);
+  for (size_t i = 0; i < shard_words.size(); i++) {
+    if (!shard_words[i]->empty()) heads.emplace(i, 0);
+  }
+  std::vector<const std::string *> words;
+  while (!heads.empty() && static_cast<int64_t>(words.size()) < top_k_) {
+    ShardPos pos = heads.top();
+    heads.pop();
+    words.push_back((*shard_words[pos.first])[pos.second].second);
+    if (pos.second + 1 < shard_words[pos.first]->size()) heads.emplace(pos.first, pos.second + 1);
+  }
+
+  if (words.empty()) {
     MS_LOG(WARNING) << "No word falls in the frequency range: (" << freq_range_.first << "," << freq_range_.second
                     << ") vocab would be empty (except for special tokens).";
   }
 
-  // this would take the top-k most frequent words
-  std::partial_sort(words.begin(), words.begin() + num_words, words.end(),
-                    [this](const std::string &w1, const std::string &w2) {
-                      int64_t f1 = word_cnt_[w1], f2 = word_cnt_[w2];
-                      return f1 == f2 ? w1 < w2 : f1 > f2;
-                    });
-
   if (special_first_) {
     for (const std::string &sp_tk : special_tokens_) vocab_->append_word(sp_tk);
   }
 
-  for (int64_t i = 0; i < num_words; i++) {
-    vocab_->append_word(words[i]);
+  for (const std::string *word : words) {
+    vocab_->append_word(*word);
   }
 
   if (!special_first_) {
@@ -179,7 +224,53 @@ Status BuildVocabOp::CollectorThread() {
 
   RETURN_IF_NOT_OK(out_connector_->Add(0, std::make_unique<DataBuffer>(0, DataBuffer::kDeBFlagEOE)));
   RETURN_IF_NOT_OK(out_connector_->Add(0, std::make_unique<DataBuffer>(0, DataBuffer::kDeBFlagEOF)));
-  // then use std::nth_element to partial sort
+  return Status::OK();
+}
+
+// The word count file is binary: the number of words, then the byte length, bytes and count of every word,
+// numbers are int64.
+Status BuildVocabOp::LoadWordCount() {
+  if (!Path(word_count_file_).Exists()) {
+    return Status::OK();
+  }
+  std::ifstream handle(word_count_file_, std::ios::binary);
+  CHECK_FAIL_RETURN_UNEXPECTED(handle.is_open(), "Can not open word count file: " + word_count_file_);
+  int64_t num_words = 0;
+  (void)handle.read(reinterpret_cast<char *>(&num_words), sizeof(num_words));
+  for (int64_t i = 0; i < num_words && handle.good(); i++) {
+    int64_t len = 0;
+    int64_t cnt = 0;
+    (void)handle.read(reinterpret_cast<char *>(&len), sizeof(len));
+    CHECK_FAIL_RETURN_UNEXPECTED(handle.good() && len >= 0, "Invalid word count file: " + word_count_file_);
+    std::string word(len, '\0');
+    (void)handle.read(&word[0], len);
+    (void)handle.read(reinterpret_cast<char *>(&cnt), sizeof(cnt));
+    prior_cnt_[ShardOf(word)][word] += cnt;
+  }
+  CHECK_FAIL_RETURN_UNEXPECTED(handle.good(), "Invalid word count file: " + word_count_file_);
+  return Status::OK();
+}
+
+Status BuildVocabOp::SaveWordCount() const {
+  // write to a temporary file first, so the counts of the previous build are kept if saving fails
+  std::string tmp_file = word_count_file_ + ".tmp";
+  std::ofstream handle(tmp_file, std::ios::binary | std::ios::trunc);
+  CHECK_FAIL_RETURN_UNEXPECTED(handle.is_open(), "Can not open word count file: " + tmp_file);
+  int64_t num_words = 0;
+  for (const auto &word_cnt : shard_cnt_) num_words += static_cast<int64_t>(word_cnt.size());
+  (void)handle.write(reinterpret_cast<const char *>(&num_words), sizeof(num_words));
+  for (const auto &word_cnt : shard_cnt_) {
+    for (const auto &wd : word_cnt) {
+      int64_t len = static_cast<int64_t>(wd.first.size());
+      (void)handle.write(reinterpret_cast<const char *>(&len), sizeof(len));
+      (void)handle.write(wd.first.data(), len);
+      (void)handle.write(reinterpret_cast<const char *>(&wd.second), sizeof(wd.second));
+    }
+  }
+  handle.close();
+  CHECK_FAIL_RETURN_UNEXPECTED(!handle.fail(), "Failed to write word count file: " + tmp_file);
+  CHECK_FAIL_RETURN_UNEXPECTED(std::rename(tmp_file.c_str(), word_count_file_.c_str()) == 0,
+                               "Failed to write word count file: " + word_count_file_);
   return Status::OK();
 }
 
@@ -190,7 +281,8 @@ Status BuildVocabOp::Builder::Build(std::shared_ptr<BuildVocabOp> *op) {
                                "frequency range [a,b] should be 0 <= a <= b (a,b are inclusive)");
   (*op) = std::make_shared<BuildVocabOp>(
     builder_vocab_, builder_col_names_, std::make_pair(builder_min_freq_, builder_max_freq_), builder_top_k_,
-    builder_speical_tokens_, builder_special_first_, builder_num_workers_, builder_connector_size_);
+    builder_speical_tokens_, builder_special_first_, builder_num_workers_, builder_connector_size_,
+    builder_word_count_file_);
   return Status::OK();
 }
 
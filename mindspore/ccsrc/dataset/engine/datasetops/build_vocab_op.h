@@ -16,10 +16,12 @@
 #ifndef DATASET_ENGINE_DATASETOPS_BUILD_VOCAB_OP_H_
 #define DATASET_ENGINE_DATASETOPS_BUILD_VOCAB_OP_H_
 
+#include <functional>
 #include <vector>
 #include <memory>
 #include <unordered_map>
 #include <string>
+#include <string_view>
 #include <utility>
 
 #include "dataset/core/tensor.h"
@@ -108,6 +110,15 @@ class BuildVocabOp : public ParallelOp {
       return *this;
     }
 
+    // set the file keeping the word counts, used to update a vocab incrementally
+    // @param const std::string &file - counts in this file are added to the counts of the dataset, then the
+    //     merged counts are saved back to it
+    // @return Builder & reference to builder class object
+    Builder &SetWordCountFile(const std::string &file) {
+      builder_word_count_file_ = file;
+      return *this;
+    }
+
     // The builder "build" method creates the final object.
     // @param std::shared_ptr<BuildVocabOp> *op - DatasetOp
     // @return - The error code return
@@ -123,11 +134,12 @@ class BuildVocabOp : public ParallelOp {
     std::vector<std::string> builder_speical_tokens_;
     std::shared_ptr<Vocab> builder_vocab_;
     int64_t builder_top_k_;
+    std::string builder_word_count_file_;
   };
 
   BuildVocabOp(std::shared_ptr<Vocab> vocab, std::vector<std::string> col_names, std::pair<int64_t, int64_t> freq_range,
                int64_t top_k, const std::vector<std::string> &tokens, bool prepend, int32_t num_workers,
-               int32_t op_connector_size);
+               int32_t op_connector_size, const std::string &word_count_file = "");
 
   ~BuildVocabOp() = default;
 
@@ -153,7 +165,32 @@ class BuildVocabOp : public ParallelOp {
   Status Reset() override { RETURN_STATUS_UNEXPECTED("Reset shouldn't be called in BuildVocabOp"); }
 
  private:
-  const int32_t interval_;
+  using WordCountMap = std::unordered_map<std::string, int64_t>;
+  // frequency of a word and the word, which is owned by one of shard_cnt_
+  using WordFreq = std::pair<int64_t, const std::string *>;
+
+  // Words are split into num_workers_ shards by hash. Every worker counts the words of its rows for all shards,
+  // then worker i merges the counts of shard i from all the workers.
+  // @param std::string_view word
+  // @return index of the shard of the word
+  size_t ShardOf(std::string_view word) const { return std::hash<std::string_view>{}(word) % num_workers_; }
+
+  // Take the top_k_ most frequent words within freq_range_ of a shard with a bounded heap
+  // @param const WordCountMap &word_cnt - counts of the shard
+  // @param std::vector<WordFreq> *out - words taken, in vocab order
+  void TopKWords(const WordCountMap &word_cnt, std::vector<WordFreq> *out) const;
+
+  // Order of words in the vocab: higher frequency first, lexicographical for the same frequency
+  static bool FreqGreater(const WordFreq &w1, const WordFreq &w2) {
+    return w1.first == w2.first ? *w1.second < *w2.second : w1.first > w2.first;
+  }
+
+  // Load the counts saved in word_count_file_ into prior_cnt_, nothing is loaded if the file does not exist
+  Status LoadWordCount();
+
+  // Save the merged counts of all shards to word_count_file_
+  Status SaveWordCount() const;
+
   bool special_first_;
   std::shared_ptr<Vocab> vocab_;
   std::vector<std::string> col_names_;
@@ -164,10 +201,15 @@ class BuildVocabOp : public ParallelOp {
   std::pair<int64_t, int64_t> freq_range_;
 
   int64_t top_k_;                                        // every thing means top_k_ == int32_max
+  std::string word_count_file_;                          // empty if the counts are not kept
   std::unique_ptr<ChildIterator> child_iterator_;        // child iterator for fetching TensorRows 1 by 1
   std::unique_ptr<Queue<TensorRow>> distributor_queue_;  // master thread assigns each worker TensorRow via this
-  std::unique_ptr<Queue<std::unique_ptr<std::unordered_map<std::string, int64_t>>>> collector_queue_;
-  std::unordered_map<std::string, int64_t> word_cnt_;
+  // worker i receives the counts of shard i from every worker via shard_queues_[i]
+  std::vector<std::unique_ptr<Queue<std::unique_ptr<WordCountMap>>>> shard_queues_;
+  // each worker sends the top_k_ words of its shard to the collector via this
+  std::unique_ptr<Queue<std::unique_ptr<std::vector<WordFreq>>>> collector_queue_;
+  std::vector<WordCountMap> shard_cnt_;  // merged counts of each shard
+  std::vector<WordCountMap> prior_cnt_;  // counts loaded from word_count_file_ of each shard
 };
 }  // namespace dataset
 }  // namespace mindspore
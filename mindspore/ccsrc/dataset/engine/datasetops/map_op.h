@@ -194,6 +194,10 @@ class MapOp : public ParallelOp {
   // @return The post map columns order
   std::vector<std::string> const &ColumnsOrder() const { return columns_order_; }
 
+  // TensorOps getter
+  // @return The TensorOps applied by this op
+  std::vector<std::shared_ptr<TensorOp>> const &TFuncs() const { return tfuncs_; }
+
  private:
   // Local queues where worker threads can pop from.
   // Popping directly from the Connector can block if the previous designated threads haven't pop.
@@ -52,6 +52,7 @@ MindRecordOp::Builder::Builder() : build_dataset_file_({}) {
   build_rows_per_buffer_ = cfg->rows_per_buffer();
   build_op_connector_queue_size_ = cfg->op_connector_size();
   build_block_reader_ = false;
+  build_use_mmap_ = false;
   builder_num_workers_ = 0;
   build_num_padded_ = 0;
   build_sample_ = nullptr;
@@ -71,8 +72,8 @@ Status MindRecordOp::Builder::Build(std::shared_ptr<MindRecordOp> *ptr) {
   }
   new_mind_record_op = std::make_shared<MindRecordOp>(
     build_num_mind_record_workers_, build_rows_per_buffer_, build_dataset_file_, build_load_dataset_,
-    build_op_connector_queue_size_, build_columns_to_load_, build_operators_, build_block_reader_, build_num_padded_,
-    sample_json, build_sample_bytes_);
+    build_op_connector_queue_size_, build_columns_to_load_, build_operators_, build_block_reader_, build_use_mmap_,
+    build_num_padded_, sample_json, build_sample_bytes_);
 
   RETURN_IF_NOT_OK(new_mind_record_op->Init());
   *ptr = std::move(new_mind_record_op);
@@ -114,7 +115,7 @@ MindRecordOp::MindRecordOp(int32_t num_mind_record_workers, int32_t rows_per_buf
                            std::vector<std::string> dataset_file, bool load_dataset, int32_t op_connector_queue_size,
                            const std::vector<std::string> &columns_to_load,
                            const std::vector<std::shared_ptr<ShardOperator>> &operators, const bool &block_reader,
-                           int64_t num_padded, const mindrecord::json &sample_json,
+                           const bool &use_mmap, int64_t num_padded, const mindrecord::json &sample_json,
                            const std::map<std::string, std::string> &sample_bytes)
     : ParallelOp(num_mind_record_workers, op_connector_queue_size),
       rows_per_buffer_(rows_per_buffer),
@@ -124,6 +125,7 @@ MindRecordOp::MindRecordOp(int32_t num_mind_record_workers, int32_t rows_per_buf
       operators_(operators),
       num_mind_record_workers_(num_mind_record_workers),
       block_reader_(block_reader),
+      use_mmap_(use_mmap),
       num_rows_(0),
       buffers_needed_(0),
       buf_cnt_(0),
@@ -142,6 +144,7 @@ MindRecordOp::MindRecordOp(int32_t num_mind_record_workers, int32_t rows_per_buf
 // Private helper method to encapsulate some common construction/reset tasks
 Status MindRecordOp::Init() {
   shard_reader_ = std::make_unique<ShardReader>();
+  shard_reader_->SetUseMmap(use_mmap_);
   auto rc = shard_reader_->Open(dataset_file_, load_dataset_, num_mind_record_workers_, columns_to_load_, operators_,
                                 block_reader_, num_padded_);
 
@@ -314,8 +317,8 @@ Status MindRecordOp::GetBufferFromReader(std::unique_ptr<DataBuffer> *fetched_bu
     }
     if (task_type == mindrecord::TaskType::kCommonTask) {
       for (const auto &tupled_row : tupled_buffer) {
-        std::vector<uint8_t> columns_blob = std::get<0>(tupled_row);
-        mindrecord::json columns_json = std::get<1>(tupled_row);
+        const std::vector<uint8_t> &columns_blob = std::get<0>(tupled_row);
+        const mindrecord::json &columns_json = std::get<1>(tupled_row);
         TensorRow tensor_row;
         RETURN_IF_NOT_OK(LoadTensorRow(&tensor_row, columns_blob, columns_json, task_type));
         tensor_table->push_back(std::move(tensor_row));
@@ -99,6 +99,11 @@ class MindRecordOp : public ParallelOp {
       return *this;
     }
 
+    Builder &SetUseMmap() {
+      build_use_mmap_ = true;
+      return *this;
+    }
+
     Builder &SetLoadDataset(bool load_dataset) {
       build_load_dataset_ = load_dataset;
       return *this;
@@ -133,6 +138,7 @@ class MindRecordOp : public ParallelOp {
     std::vector<std::string> build_columns_to_load_;
     std::vector<std::shared_ptr<ShardOperator>> build_operators_;
     bool build_block_reader_;
+    bool build_use_mmap_;
     int64_t build_num_padded_;
     py::handle build_sample_;
     std::map<std::string, std::string> build_sample_bytes_;
@@ -146,10 +152,11 @@ class MindRecordOp : public ParallelOp {
   // @param op_connector_queue_size - The output connector queue size
   // @param columns_to_load - The list of columns to use (column name)
   // @param operators - ShardOperators for Shuffle, Category, Sample
+  // @param use_mmap - Read blob data from the files mapped into memory
   MindRecordOp(int32_t num_mind_record_workers, int32_t rows_per_buffer, std::vector<std::string> dataset_file,
                bool load_dataset, int32_t op_connector_queue_size, const std::vector<std::string> &columns_to_load,
                const std::vector<std::shared_ptr<ShardOperator>> &operators, const bool &block_reader,
-               int64_t num_padded_, const mindrecord::json &sample_json,
+               const bool &use_mmap, int64_t num_padded_, const mindrecord::json &sample_json,
                const std::map<std::string, std::string> &sample_bytes_);
 
   // Destructor
@@ -241,6 +248,7 @@ class MindRecordOp : public ParallelOp {
   std::vector<std::shared_ptr<ShardOperator>> operators_;  // ShardOperators to use
   int32_t num_mind_record_workers_;                        // number of workers to be spawned by ShardReader
   bool block_reader_;                                      // block reader switch
+  bool use_mmap_;                                          // mmap switch
   int32_t buffers_needed_;                                 // Counter for the buffers that were fetched
   int64_t buf_cnt_;                                        // Buffer counter
   int32_t num_rows_;                                       // One more than the last row id in the range for this cache
@@ -24,6 +24,7 @@
 #include "dataset/engine/perf/device_queue_tracing.h"
 #include "dataset/engine/perf/connector_size.h"
 #include "dataset/engine/perf/dataset_iterator_tracing.h"
+#include "dataset/engine/perf/tensor_op_cache_stats.h"
 #include "utils/log_adapter.h"
 
 namespace mindspore {
@@ -74,6 +75,9 @@ Status ProfilingManager::Initialize() {
 
   std::shared_ptr<Sampling> monitor_sampling = std::make_shared<ConnectorSize>(tree_);
   RETURN_IF_NOT_OK(RegisterSamplingNode(monitor_sampling));
+  // tensor_op_cache node samples the cache stats of TensorOps such as WordpieceTokenizerOp
+  std::shared_ptr<Sampling> cache_sampling = std::make_shared<TensorOpCacheStats>(tree_);
+  RETURN_IF_NOT_OK(RegisterSamplingNode(cache_sampling));
 
   return Status::OK();
 }
@@ -31,6 +31,7 @@ class ExecutionTree;
 const char kDeviceQueueTracingName[] = "Device Queue Tracing";
 const char kDatasetIteratorTracingName[] = "Dataset Iterator Tracing";
 const char kConnectorSizeSamplingName[] = "Connector Size Sampling";
+const char kTensorOpCacheSamplingName[] = "TensorOp Cache Sampling";
 
 // Profiling is a class of basic unit of profiling action
 // This base class encapsulate the serialization output logic
@@ -0,0 +1,95 @@
+/**
+ * Copyright 2020 Huawei Technologies Co., Ltd
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+#include "dataset/engine/perf/tensor_op_cache_stats.h"
+
+#include <fstream>
+#include <memory>
+#include <sstream>
+#include <string>
+#include <nlohmann/json.hpp>
+#include "dataset/core/config_manager.h"
+#include "dataset/engine/datasetops/map_op.h"
+#include "dataset/engine/execution_tree.h"
+#include "dataset/util/path.h"
+
+using json = nlohmann::json;
+namespace mindspore {
+namespace dataset {
+
+// Sample action
+Status TensorOpCacheStats::Sample() {
+  for (auto &node : *tree_) {
+    auto map_op = dynamic_cast<MapOp *>(&node);
+    if (map_op == nullptr) {
+      continue;
+    }
+    auto &tfuncs = map_op->TFuncs();
+    for (size_t i = 0; i < tfuncs.size(); i++) {
+      int64_t hits = 0;
+      int64_t misses = 0;
+      if (!tfuncs[i]->GetCacheStats(&hits, &misses)) {
+        continue;
+      }
+      CacheStatsSamples &samples = sample_table_[std::make_pair(map_op->id(), i)];
+      if (samples.tensor_op.empty()) {
+        std::stringstream ss;
+        ss << *tfuncs[i];
+        samples.tensor_op = ss.str();
+      }
+      samples.hits.push_back(hits);
+      samples.misses.push_back(misses);
+    }
+  }
+  return Status::OK();
+}
+
+// Save profiling data to file
+Status TensorOpCacheStats::SaveToFile() {
+  // Take a last sample, the pipeline may finish before the first sampling interval
+  RETURN_IF_NOT_OK(Sample());
+  if (sample_table_.empty()) {
+    return Status::OK();
+  }
+  std::ofstream os(file_path_, std::ios::trunc);
+  if (!os.is_open()) {
+    RETURN_STATUS_UNEXPECTED("Profiling file can not be opened.");
+  }
+  json output;
+  std::shared_ptr<ConfigManager> cfg = GlobalContext::config_manager();
+  output["sampling_interval"] = cfg->monitor_sampling_interval();
+  for (auto &item : sample_table_) {
+    const CacheStatsSamples &samples = item.second;
+    int64_t total = samples.hits.back() + samples.misses.back();
+    json json_node;
+    json_node["op_id"] = item.first.first;
+    json_node["tensor_op_index"] = item.first.second;
+    json_node["tensor_op"] = samples.tensor_op;
+    json_node["metrics"]["cache"] = {
+      {"hits", samples.hits},
+      {"misses", samples.misses},
+      {"hit_rate", total == 0 ? 0.0 : static_cast<double>(samples.hits.back()) / total}};
+    output["op_info"].push_back(json_node);
+  }
+  os << output;
+  return Status::OK();
+}
+
+Status TensorOpCacheStats::Init(const std::string &dir_path, const std::string &device_id) {
+  file_path_ = (Path(dir_path) / Path("tensor_op_cache_profiling_" + device_id + ".json")).toString();
+  return Status::OK();
+}
+}  // namespace dataset
+}  // namespace mindspore
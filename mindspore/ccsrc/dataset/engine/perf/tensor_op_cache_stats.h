@@ -0,0 +1,65 @@
+/**
+ * Copyright 2020 Huawei Technologies Co., Ltd
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+#ifndef MINDSPORE_TENSOR_OP_CACHE_STATS_H
+#define MINDSPORE_TENSOR_OP_CACHE_STATS_H
+
+#include <map>
+#include <string>
+#include <utility>
+#include <vector>
+#include "dataset/engine/perf/profiling.h"
+
+namespace mindspore {
+namespace dataset {
+class ExecutionTree;
+
+// TensorOp cache stats sampling samples the hit and miss count of the TensorOps keeping a cache, such as
+// WordpieceTokenizerOp, in every MapOp of the pipeline.
+// It support JSON serialization for external usage.
+class TensorOpCacheStats : public Sampling {
+  // Samples of one TensorOp, the counts are accumulated since the TensorOp is created
+  struct CacheStatsSamples {
+    std::string tensor_op;
+    std::vector<int64_t> hits;
+    std::vector<int64_t> misses;
+  };
+  // Key is the op id of the MapOp and the index of the TensorOp in the MapOp
+  using CacheStatsTable = std::map<std::pair<int32_t, size_t>, CacheStatsSamples>;
+
+ public:
+  explicit TensorOpCacheStats(ExecutionTree *tree) : tree_(tree) {}
+
+  ~TensorOpCacheStats() = default;
+
+  // Driver function for cache stats sampling.
+  // This function samples the cache stats of the TensorOps of every MapOp within the ExecutionTree
+  Status Sample() override;
+
+  std::string Name() const override { return kTensorOpCacheSamplingName; };
+
+  // Save sampling data to file, nothing is saved if no TensorOp keeps a cache
+  // @return Status - The error code return
+  Status SaveToFile() override;
+
+  Status Init(const std::string &dir_path, const std::string &device_id) override;
+
+ private:
+  ExecutionTree *tree_ = nullptr;  // ExecutionTree pointer
+  CacheStatsTable sample_table_;   // Samples of all TensorOps keeping a cache
+};
+}  // namespace dataset
+}  // namespace mindspore
+#endif  // MINDSPORE_TENSOR_OP_CACHE_STATS_H
@@ -137,6 +137,12 @@ class TensorOp {
   // @param outputs out: vector of the types of the output tensors to be filled.
   // @return Status
   virtual Status OutputType(const std::vector<DataType> &inputs, std::vector<DataType> &outputs);
+
+  // Function to get the hit and miss count of the cache kept by the TensorOp, it is reported by profiling.
+  // @param hits out: number of cache hits.
+  // @param misses out: number of cache misses.
+  // @return false if the TensorOp does not keep a cache.
+  virtual bool GetCacheStats(int64_t *hits, int64_t *misses) const { return false; }
 };
 }  // namespace dataset
 }  // namespace mindspore
@@ -0,0 +1,114 @@
+/**
+ * Copyright 2020 Huawei Technologies Co., Ltd
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+#include "dataset/text/kernels/bert_encode_op.h"
+
+#include <algorithm>
+#include <string_view>
+
+namespace mindspore {
+namespace dataset {
+
+const char BertEncodeOp::kDefClsToken[] = "[CLS]";
+const char BertEncodeOp::kDefSepToken[] = "[SEP]";
+const char BertEncodeOp::kDefPadToken[] = "[PAD]";
+
+BertEncodeOp::BertEncodeOp(const std::shared_ptr<Vocab> &vocab, int32_t max_seq_len,
+                           const std::string &suffix_indicator, const int &max_bytes_per_token,
+                           const std::string &unknown_token, bool lower_case, bool keep_whitespace,
+                           NormalizeForm normalization_form, bool preserve_unused_token, const std::string &cls_token,
+                           const std::string &sep_token, const std::string &pad_token, const int &cache_size)
+    : vocab_(vocab),
+      max_seq_len_(max_seq_len),
+      wordpiece_tokenizer_(vocab, suffix_indicator, max_bytes_per_token, unknown_token, cache_size),
+      basic_tokenizer_(lower_case, keep_whitespace, normalization_form, preserve_unused_token) {
+  unknown_id_ = vocab_->Lookup(unknown_token, -1);
+  cls_id_ = vocab_->Lookup(cls_token, -1);
+  sep_id_ = vocab_->Lookup(sep_token, -1);
+  pad_id_ = vocab_->Lookup(pad_token, -1);
+}
+
+Status BertEncodeOp::Encode(const std::shared_ptr<Tensor> &input, std::vector<WordIdType> *out_ids) {
+  CHECK_FAIL_RETURN_UNEXPECTED(input->Rank() == 0 && input->type() == DataType::DE_STRING,
+                               "The input tensors should be scalar string tensors");
+  std::shared_ptr<Tensor> words;
+  RETURN_IF_NOT_OK(basic_tokenizer_.Compute(input, &words));
+  for (auto iter = words->begin<std::string_view>(); iter != words->end<std::string_view>(); iter++) {
+    if ((*iter).empty()) {
+      continue;
+    }
+    RETURN_IF_NOT_OK(wordpiece_tokenizer_.GetTokenIds(std::string(*iter), unknown_id_, out_ids));
+  }
+  return Status::OK();
+}
+
+void BertEncodeOp::TruncatePair(dsize_t max_length, std::vector<WordIdType> *ids_a, std::vector<WordIdType> *ids_b) {
+  dsize_t length_a = ids_a->size();
+  dsize_t length_b = ids_b->size();
+  while (length_a + length_b > max_length) {
+    if (length_a > length_b) {
+      length_a--;
+    } else {
+      length_b--;
+    }
+  }
+  ids_a->resize(length_a);
+  ids_b->resize(length_b);
+}
+
+Status BertEncodeOp::Compute(const TensorRow &input, TensorRow *output) {
+  IO_CHECK_VECTOR(input, output);
+  CHECK_FAIL_RETURN_UNEXPECTED(input.size() == 1 || input.size() == 2, "Number of inputs should be one or two.");
+  CHECK_FAIL_RETURN_UNEXPECTED(unknown_id_ >= 0 && cls_id_ >= 0 && sep_id_ >= 0 && pad_id_ >= 0,
+                               "The unknown, cls, sep and pad tokens should all be in the vocab.");
+  bool is_pair = input.size() == 2;
+  // room left for [CLS] text_a [SEP] (text_b [SEP])
+  dsize_t num_special = is_pair ? 3 : 2;
+  CHECK_FAIL_RETURN_UNEXPECTED(max_seq_len_ > num_special, "max_seq_len is too small for the special tokens.");
+
+  std::vector<WordIdType> ids_a;
+  std::vector<WordIdType> ids_b;
+  RETURN_IF_NOT_OK(Encode(input[0], &ids_a));
+  if (is_pair) {
+    RETURN_IF_NOT_OK(Encode(input[1], &ids_b));
+  }
+  TruncatePair(max_seq_len_ - num_special, &ids_a, &ids_b);
+
+  std::vector<int32_t> input_ids(max_seq_len_, pad_id_);
+  std::vector<int32_t> token_type_ids(max_seq_len_, 0);
+  std::vector<int32_t> attention_mask(max_seq_len_, 0);
+  dsize_t pos = 0;
+  input_ids[pos++] = cls_id_;
+  pos = std::copy(ids_a.begin(), ids_a.end(), input_ids.begin() + pos) - input_ids.begin();
+  input_ids[pos++] = sep_id_;
+  if (is_pair) {
+    dsize_t type_b_begin = pos;
+    pos = std::copy(ids_b.begin(), ids_b.end(), input_ids.begin() + pos) - input_ids.begin();
+    input_ids[pos++] = sep_id_;
+    std::fill(token_type_ids.begin() + type_b_begin, token_type_ids.begin() + pos, 1);
+  }
+  std::fill(attention_mask.begin(), attention_mask.begin() + pos, 1);
+
+  std::shared_ptr<Tensor> out;
+  RETURN_IF_NOT_OK(Tensor::CreateTensor(&out, input_ids, TensorShape({max_seq_len_})));
+  output->push_back(out);
+  RETURN_IF_NOT_OK(Tensor::CreateTensor(&out, token_type_ids, TensorShape({max_seq_len_})));
+  output->push_back(out);
+  RETURN_IF_NOT_OK(Tensor::CreateTensor(&out, attention_mask, TensorShape({max_seq_len_})));
+  output->push_back(out);
+  return Status::OK();
+}
+}  // namespace dataset
+}  // namespace mindspore
@@ -0,0 +1,83 @@
+/**
+ * Copyright 2020 Huawei Technologies Co., Ltd
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+#ifndef DATASET_TEXT_KERNELS_BERT_ENCODE_OP_H_
+#define DATASET_TEXT_KERNELS_BERT_ENCODE_OP_H_
+#include <memory>
+#include <string>
+#include <vector>
+
+#include "dataset/core/tensor.h"
+#include "dataset/kernels/tensor_op.h"
+#include "dataset/text/kernels/basic_tokenizer_op.h"
+#include "dataset/text/kernels/wordpiece_tokenizer_op.h"
+#include "dataset/text/vocab.h"
+#include "dataset/util/status.h"
+
+namespace mindspore {
+namespace dataset {
+
+// Fused Bert input op: tokenize one text or a text pair, look up the subword ids, truncate the pair and pad
+// to a fixed length. Outputs input_ids, token_type_ids and attention_mask as int32 tensors of max_seq_len.
+class BertEncodeOp : public TensorOp {
+ public:
+  static const char kDefClsToken[];
+  static const char kDefSepToken[];
+  static const char kDefPadToken[];
+  BertEncodeOp(const std::shared_ptr<Vocab> &vocab, int32_t max_seq_len,
+               const std::string &suffix_indicator = WordpieceTokenizerOp::kDefSuffixIndicator,
+               const int &max_bytes_per_token = WordpieceTokenizerOp::kDefMaxBytesPerToken,
+               const std::string &unknown_token = WordpieceTokenizerOp::kDefUnknownToken,
+               bool lower_case = BasicTokenizerOp::kDefLowerCase,
+               bool keep_whitespace = BasicTokenizerOp::kDefKeepWhitespace,
+               NormalizeForm normalization_form = BasicTokenizerOp::kDefNormalizationForm,
+               bool preserve_unused_token = BasicTokenizerOp::kDefPreserveUnusedToken,
+               const std::string &cls_token = kDefClsToken, const std::string &sep_token = kDefSepToken,
+               const std::string &pad_token = kDefPadToken,
+               const int &cache_size = WordpieceTokenizerOp::kDefCacheSize);
+
+  ~BertEncodeOp() override = default;
+
+  void Print(std::ostream &out) const override { out << "BertEncodeOp"; }
+
+  Status Compute(const TensorRow &input, TensorRow *output) override;
+
+  uint32_t NumInput() override { return 0; }
+
+  uint32_t NumOutput() override { return 3; }
+
+  bool GetCacheStats(int64_t *hits, int64_t *misses) const override {
+    return wordpiece_tokenizer_.GetCacheStats(hits, misses);
+  }
+
+ private:
+  // Tokenize a scalar string tensor and append the subword ids of all its words to out_ids
+  Status Encode(const std::shared_ptr<Tensor> &input, std::vector<WordIdType> *out_ids);
+
+  // Shorten the longer sequence one id at a time until both fit in max_length, as TruncateSequencePairOp does
+  static void TruncatePair(dsize_t max_length, std::vector<WordIdType> *ids_a, std::vector<WordIdType> *ids_b);
+
+  std::shared_ptr<Vocab> vocab_;
+  int32_t max_seq_len_;
+  WordpieceTokenizerOp wordpiece_tokenizer_;
+  BasicTokenizerOp basic_tokenizer_;
+  WordIdType unknown_id_;
+  WordIdType cls_id_;
+  WordIdType sep_id_;
+  WordIdType pad_id_;
+};
+}  // namespace dataset
+}  // namespace mindspore
+#endif  // DATASET_TEXT_KERNELS_BERT_ENCODE_OP_H_
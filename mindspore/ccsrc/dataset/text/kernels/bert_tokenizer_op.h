@@ -35,8 +35,9 @@ class BertTokenizerOp : public TensorOp {
                   bool lower_case = BasicTokenizerOp::kDefLowerCase,
                   bool keep_whitespace = BasicTokenizerOp::kDefKeepWhitespace,
                   NormalizeForm normalization_form = BasicTokenizerOp::kDefNormalizationForm,
-                  bool preserve_unused_token = BasicTokenizerOp::kDefPreserveUnusedToken)
-      : wordpiece_tokenizer_(vocab, suffix_indicator, max_bytes_per_token, unknown_token),
+                  bool preserve_unused_token = BasicTokenizerOp::kDefPreserveUnusedToken,
+                  const int &cache_size = WordpieceTokenizerOp::kDefCacheSize)
+      : wordpiece_tokenizer_(vocab, suffix_indicator, max_bytes_per_token, unknown_token, cache_size),
         basic_tokenizer_(lower_case, keep_whitespace, normalization_form, preserve_unused_token) {}
 
   ~BertTokenizerOp() override = default;
@@ -45,6 +46,10 @@ class BertTokenizerOp : public TensorOp {
 
   Status Compute(const std::shared_ptr<Tensor> &input, std::shared_ptr<Tensor> *output) override;
 
+  bool GetCacheStats(int64_t *hits, int64_t *misses) const override {
+    return wordpiece_tokenizer_.GetCacheStats(hits, misses);
+  }
+
  private:
   WordpieceTokenizerOp wordpiece_tokenizer_;
   BasicTokenizerOp basic_tokenizer_;
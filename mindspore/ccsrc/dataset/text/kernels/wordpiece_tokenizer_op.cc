@@ -24,16 +24,21 @@ namespace dataset {
 const char WordpieceTokenizerOp::kDefSuffixIndicator[] = "##";
 const int WordpieceTokenizerOp::kDefMaxBytesPerToken = 100;
 const char WordpieceTokenizerOp::kDefUnknownToken[] = "[UNK]";
+const int WordpieceTokenizerOp::kDefCacheSize = 10000;
 
 WordpieceTokenizerOp::WordpieceTokenizerOp(const std::shared_ptr<Vocab> &vocab, const std::string &suffix_indicator,
-                                           const int &max_bytes_per_token, const std::string &unknown_token)
+                                           const int &max_bytes_per_token, const std::string &unknown_token,
+                                           const int &cache_size)
     : vocab_(vocab),
       suffix_indicator_(suffix_indicator),
       max_bytes_per_token_(max_bytes_per_token),
-      unknown_token_(unknown_token) {}
+      unknown_token_(unknown_token),
+      cache_size_(cache_size),
+      cache_hits_(0),
+      cache_misses_(0) {}
 
 Status WordpieceTokenizerOp::LookupWord(const std::string &input_token, const RuneStrArray &runes, const int start,
-                                        bool *out_found, int *out_end) const {
+                                        bool *out_found, int *out_end, WordIdType *out_id) const {
   CHECK_FAIL_RETURN_UNEXPECTED(start >= 0 && start < input_token.size(), "Out of range");
   *out_found = false;
   for (int i = runes.size() - 1; i >= 0; i--) {
@@ -44,8 +49,12 @@ Status WordpieceTokenizerOp::LookupWord(const std::string &input_token, const Ru
       word = suffix_indicator_ + word;
     }
     WordIdType default_id = -1;
-    if (vocab_->Lookup(word, default_id) != default_id) {
+    WordIdType id = vocab_->Lookup(word, default_id);
+    if (id != default_id) {
       *out_found = true;
+      if (out_id != nullptr) {
+        *out_id = id;
+      }
       break;
     }
   }
@@ -73,9 +82,12 @@ Status WordpieceTokenizerOp::AddSubword(const std::string &input_token, const in
   return Status::OK();
 }
 
-Status WordpieceTokenizerOp::GetTokens(const std::string &input_token, std::vector<std::string> *out_tokens) const {
+Status WordpieceTokenizerOp::SplitWord(const std::string &input_token, bool *out_found,
+                                       std::vector<Subword> *out_subwords) const {
+  out_subwords->clear();
+  *out_found = false;
   if (input_token.size() > max_bytes_per_token_) {
-    return FoundNoToken(input_token, out_tokens);
+    return Status::OK();
   }
   RuneStrArray runes;
   if (!DecodeRunesInString(input_token.data(), input_token.size(), runes)) {
@@ -84,13 +96,85 @@ Status WordpieceTokenizerOp::GetTokens(const std::string &input_token, std::vect
   int end;
   for (int start = 0; start < input_token.size();) {
     bool found;
-    RETURN_IF_NOT_OK(LookupWord(input_token, runes, start, &found, &end));
-    if (found) {
-      RETURN_IF_NOT_OK(AddSubword(input_token, start, end, out_tokens));
-      start = end;
-    } else {
-      return FoundNoToken(input_token, out_tokens);
+    WordIdType id;
+    RETURN_IF_NOT_OK(LookupWord(input_token, runes, start, &found, &end, &id));
+    if (!found) {
+      // subwords of a word are only kept if the whole word can be tokenized
+      out_subwords->clear();
+      return Status::OK();
     }
+    out_subwords->push_back({start, end, id});
+    start = end;
+  }
+  *out_found = true;
+  return Status::OK();
+}
+
+Status WordpieceTokenizerOp::CachedSplitWord(const std::string &input_token, bool *out_found,
+                                             std::vector<Subword> *out_subwords) const {
+  if (cache_size_ <= 0) {
+    return SplitWord(input_token, out_found, out_subwords);
+  }
+  {
+    std::unique_lock<std::mutex> lck(cache_mux_);
+    auto iter = cache_map_.find(input_token);
+    if (iter != cache_map_.end()) {
+      cache_hits_++;
+      cache_list_.splice(cache_list_.begin(), cache_list_, iter->second);
+      *out_found = iter->second->second.found;
+      *out_subwords = iter->second->second.subwords;
+      return Status::OK();
+    }
+    cache_misses_++;
+  }
+  // split the word without holding the lock, another thread may split the same word at the same time
+  RETURN_IF_NOT_OK(SplitWord(input_token, out_found, out_subwords));
+  std::unique_lock<std::mutex> lck(cache_mux_);
+  if (cache_map_.find(input_token) == cache_map_.end()) {
+    cache_list_.emplace_front(input_token, CacheEntry{*out_found, *out_subwords});
+    cache_map_.emplace(cache_list_.front().first, cache_list_.begin());
+    if (cache_list_.size() > static_cast<size_t>(cache_size_)) {
+      (void)cache_map_.erase(cache_list_.back().first);
+      cache_list_.pop_back();
+    }
+  }
+  return Status::OK();
+}
+
+bool WordpieceTokenizerOp::GetCacheStats(int64_t *hits, int64_t *misses) const {
+  if (cache_size_ <= 0) {
+    return false;
+  }
+  std::unique_lock<std::mutex> lck(cache_mux_);
+  *hits = cache_hits_;
+  *misses = cache_misses_;
+  return true;
+}
+
+Status WordpieceTokenizerOp::GetTokens(const std::string &input_token, std::vector<std::string> *out_tokens) const {
+  bool found;
+  std::vector<Subword> subwords;
+  RETURN_IF_NOT_OK(CachedSplitWord(input_token, &found, &subwords));
+  if (!found) {
+    return FoundNoToken(input_token, out_tokens);
+  }
+  for (const auto &subword : subwords) {
+    RETURN_IF_NOT_OK(AddSubword(input_token, subword.start, subword.end, out_tokens));
+  }
+  return Status::OK();
+}
+
+Status WordpieceTokenizerOp::GetTokenIds(const std::string &input_token, WordIdType unknown_id,
+                                         std::vector<WordIdType> *out_ids) const {
+  bool found;
+  std::vector<Subword> subwords;
+  RETURN_IF_NOT_OK(CachedSplitWord(input_token, &found, &subwords));
+  if (!found) {
+    out_ids->push_back(unknown_id);
+    return Status::OK();
+  }
+  for (const auto &subword : subwords) {
+    out_ids->push_back(subword.id);
   }
   return Status::OK();
 }
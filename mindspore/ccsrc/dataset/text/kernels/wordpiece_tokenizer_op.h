@@ -15,9 +15,13 @@
  */
 #ifndef DATASET_TEXT_KERNELS_WORDPIECE_TOKENIZER_OP_H_
 #define DATASET_TEXT_KERNELS_WORDPIECE_TOKENIZER_OP_H_
+#include <list>
 #include <memory>
+#include <mutex>
 #include <string>
 #include <string_view>
+#include <unordered_map>
+#include <utility>
 #include <vector>
 
 #include "cppjieba/Unicode.hpp"
@@ -37,9 +41,10 @@ class WordpieceTokenizerOp : public TensorOp {
   static const char kDefSuffixIndicator[];
   static const int kDefMaxBytesPerToken;
   static const char kDefUnknownToken[];
+  static const int kDefCacheSize;
   WordpieceTokenizerOp(const std::shared_ptr<Vocab> &vocab, const std::string &suffix_indicator = kDefSuffixIndicator,
                        const int &max_bytes_per_token = kDefMaxBytesPerToken,
-                       const std::string &unknown_token = kDefUnknownToken);
+                       const std::string &unknown_token = kDefUnknownToken, const int &cache_size = kDefCacheSize);
 
   ~WordpieceTokenizerOp() override = default;
 
@@ -47,19 +52,59 @@ class WordpieceTokenizerOp : public TensorOp {
 
   Status Compute(const std::shared_ptr<Tensor> &input, std::shared_ptr<Tensor> *output) override;
 
+  // Tokenize one word to the vocab ids of its subwords, without building the subword strings
+  // @param const std::string &input_token - word to be tokenized
+  // @param WordIdType unknown_id - id to output when the word can not be tokenized
+  // @param std::vector<WordIdType> *out_ids - subword ids are appended to it
+  // @return error code
+  Status GetTokenIds(const std::string &input_token, WordIdType unknown_id, std::vector<WordIdType> *out_ids) const;
+
+  bool GetCacheStats(int64_t *hits, int64_t *misses) const override;
+
  protected:
+  // A subword of a word, the byte range [start, end) of the word and its vocab id
+  struct Subword {
+    int start;
+    int end;
+    WordIdType id;
+  };
+
   Status AddSubword(const std::string &input_token, const int start, const int end,
                     std::vector<std::string> *out_token) const;
   Status FoundNoToken(const std::string &input_token, std::vector<std::string> *out_tokens) const;
   Status LookupWord(const std::string &input_token, const RuneStrArray &runes, const int start, bool *out_found,
-                    int *out_end) const;
+                    int *out_end, WordIdType *out_id = nullptr) const;
   Status GetTokens(const std::string &input_token, std::vector<std::string> *out_tokens) const;
 
+  // Split one word to subwords, greedy longest match first
+  // @param const std::string &input_token - word to be split
+  // @param bool *out_found - false if the word can not be tokenized, out_subwords is left empty then
+  // @param std::vector<Subword> *out_subwords - subwords of the word
+  // @return error code
+  Status SplitWord(const std::string &input_token, bool *out_found, std::vector<Subword> *out_subwords) const;
+
+  // Same as SplitWord, but the result of the most recently split words are kept in a cache which is shared
+  // by all the threads running this op
+  Status CachedSplitWord(const std::string &input_token, bool *out_found, std::vector<Subword> *out_subwords) const;
+
  private:
+  struct CacheEntry {
+    bool found;
+    std::vector<Subword> subwords;
+  };
+  // Cached words, the most recently used first. The keys of cache_map_ are views of the words in this list.
+  using CacheList = std::list<std::pair<std::string, CacheEntry>>;
+
   const std::shared_ptr<Vocab> vocab_;
   const std::string suffix_indicator_;
   const int max_bytes_per_token_;
   const std::string unknown_token_;
+  const int cache_size_;
+  mutable std::mutex cache_mux_;
+  mutable CacheList cache_list_;
+  mutable std::unordered_map<std::string_view, CacheList::iterator> cache_map_;
+  mutable int64_t cache_hits_;
+  mutable int64_t cache_misses_;
 };
 }  // namespace dataset
 }  // namespace mindspore
@@ -452,6 +452,14 @@ REGISTER_PYBIND_DEFINE(Tensor, ([](const py::module *m) {
                                  >>> data = mindspore.Tensor(np.ones((2, 3)))
                                  >>> data.set_init_flag(True)
                              )mydelimiter")
+                           .def("set_dirty", &Tensor::set_dirty, R"mydelimiter(
+                             Set tensor dirty_flag, the host data of a dirty tensor is synchronized to device when
+                             it is used next time.
+
+                             Examples:
+                                 >>> data = mindspore.Tensor(np.ones((2, 3)))
+                                 >>> data.set_dirty(True)
+                             )mydelimiter")
                            .def("dim", &Tensor::DataDim, R"mydelimiter(
                              Get tensor's data dimension.
 
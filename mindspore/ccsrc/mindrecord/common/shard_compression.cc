@@ -0,0 +1,114 @@
+/**
+ * Copyright 2020 Huawei Technologies Co., Ltd
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#include "mindrecord/include/shard_compression.h"
+#include "mindrecord/include/shard_column.h"
+#include "lz4.h"
+#include "zstd.h"
+
+namespace mindspore {
+namespace mindrecord {
+bool IsSupportedCompression(const std::string &compression) {
+  return compression.empty() || compression == kCompressionLz4 || compression == kCompressionZstd;
+}
+
+MSRStatus CompressBytes(const std::string &compression, const std::vector<uint8_t> &src, std::vector<uint8_t> *dst) {
+  if (dst == nullptr) {
+    MS_LOG(ERROR) << "Destination of compression is null.";
+    return FAILED;
+  }
+  uint64_t src_size = src.size();
+  const char *src_data = reinterpret_cast<const char *>(src.data());
+  uint64_t bound = 0;
+  if (compression == kCompressionLz4) {
+    if (src_size > LZ4_MAX_INPUT_SIZE) {
+      MS_LOG(ERROR) << "Data of " << src_size << " bytes is too large for lz4.";
+      return FAILED;
+    }
+    bound = LZ4_compressBound(static_cast<int>(src_size));
+  } else if (compression == kCompressionZstd) {
+    bound = ZSTD_compressBound(src_size);
+  } else {
+    MS_LOG(ERROR) << "Compression " << compression << " is not supported.";
+    return FAILED;
+  }
+
+  dst->resize(kInt64Len + bound);
+  for (uint64_t i = 0; i < kInt64Len; ++i) {
+    (*dst)[i] = static_cast<uint8_t>((src_size >> (kInt64Len - 1 - i) * kBitsOfByte) & 0xFF);
+  }
+  char *dst_data = reinterpret_cast<char *>(dst->data() + kInt64Len);
+  uint64_t compressed_size = 0;
+  if (compression == kCompressionLz4) {
+    int ret = LZ4_compress_default(src_data, dst_data, static_cast<int>(src_size), static_cast<int>(bound));
+    if (ret <= 0) {
+      MS_LOG(ERROR) << "Failed to compress data by lz4.";
+      return FAILED;
+    }
+    compressed_size = static_cast<uint64_t>(ret);
+  } else {
+    size_t ret = ZSTD_compress(dst_data, bound, src_data, src_size, kZstdCompressionLevel);
+    if (ZSTD_isError(ret)) {
+      MS_LOG(ERROR) << "Failed to compress data by zstd: " << ZSTD_getErrorName(ret);
+      return FAILED;
+    }
+    compressed_size = ret;
+  }
+  dst->resize(kInt64Len + compressed_size);
+  return SUCCESS;
+}
+
+MSRStatus DecompressBytes(const std::string &compression, const std::vector<uint8_t> &src, std::vector<uint8_t> *dst) {
+  if (dst == nullptr) {
+    MS_LOG(ERROR) << "Destination of decompression is null.";
+    return FAILED;
+  }
+  if (src.size() < kInt64Len) {
+    MS_LOG(ERROR) << "Compressed data is truncated.";
+    return FAILED;
+  }
+  uint64_t dst_size = 0;
+  for (uint64_t i = 0; i < kInt64Len; ++i) {
+    dst_size = (dst_size << kBitsOfByte) + src[i];
+  }
+  uint64_t src_size = src.size() - kInt64Len;
+  const char *src_data = reinterpret_cast<const char *>(src.data() + kInt64Len);
+  dst->resize(dst_size);
+  char *dst_data = reinterpret_cast<char *>(dst->data());
+  if (compression == kCompressionLz4) {
+    if (dst_size > LZ4_MAX_INPUT_SIZE || src_size > LZ4_MAX_INPUT_SIZE) {
+      MS_LOG(ERROR) << "Data compressed by lz4 is corrupted.";
+      return FAILED;
+    }
+    int ret = LZ4_decompress_safe(src_data, dst_data, static_cast<int>(src_size), static_cast<int>(dst_size));
+    if (ret < 0 || static_cast<uint64_t>(ret) != dst_size) {
+      MS_LOG(ERROR) << "Failed to decompress data by lz4.";
+      return FAILED;
+    }
+  } else if (compression == kCompressionZstd) {
+    size_t ret = ZSTD_decompress(dst_data, dst_size, src_data, src_size);
+    if (ZSTD_isError(ret) || ret != dst_size) {
+      MS_LOG(ERROR) << "Failed to decompress data by zstd.";
+      return FAILED;
+    }
+  } else {
+    MS_LOG(ERROR) << "Compression " << compression << " is not supported.";
+    return FAILED;
+  }
+  return SUCCESS;
+}
+}  // namespace mindrecord
+}  // namespace mindspore
@@ -64,7 +64,9 @@ void BindShardHeader(const py::module *m) {
     .def("get_statistics", &ShardHeader::GetStatistics)
     .def("get_fields", &ShardHeader::GetFields)
     .def("get_schema_by_id", &ShardHeader::GetSchemaByID)
-    .def("get_statistic_by_id", &ShardHeader::GetStatisticByID);
+    .def("get_statistic_by_id", &ShardHeader::GetStatisticByID)
+    .def("set_compression", &ShardHeader::SetCompression)
+    .def("get_compression", &ShardHeader::GetCompression);
 }
 
 void BindShardWriter(py::module *m) {
@@ -78,6 +80,7 @@ void BindShardWriter(py::module *m) {
     .def("write_raw_data", (MSRStatus(ShardWriter::*)(std::map<uint64_t, std::vector<py::handle>> &,
                                                       vector<vector<uint8_t>> &, bool, bool)) &
                              ShardWriter::WriteRawData)
+    .def("write_columns", &ShardWriter::WriteColumns)
     .def("commit", &ShardWriter::Commit);
 }
 
@@ -93,6 +96,10 @@ void BindShardReader(const py::module *m) {
     .def("get_blob_fields", &ShardReader::GetBlobFields)
     .def("get_next", (std::vector<std::tuple<std::vector<std::vector<uint8_t>>, pybind11::object>>(ShardReader::*)()) &
                        ShardReader::GetNextPy)
+    .def("set_use_mmap", &ShardReader::SetUseMmap)
+    .def("get_file_paths", &ShardReader::GetFilePaths)
+    .def("get_blob_views", &ShardReader::GetBlobViewsPy)
+    .def("get_next_batch", &ShardReader::GetNextBatchPy)
     .def("finish", &ShardReader::Finish)
     .def("close", &ShardReader::Close);
 }
@@ -101,7 +108,9 @@ void BindShardIndexGenerator(const py::module *m) {
   (void)py::class_<ShardIndexGenerator>(*m, "ShardIndexGenerator", py::module_local())
     .def(py::init<const std::string &, bool>())
     .def("build", &ShardIndexGenerator::Build)
-    .def("write_to_db", &ShardIndexGenerator::WriteToDatabase);
+    .def("write_to_db", &ShardIndexGenerator::WriteToDatabase)
+    .def("check_index", &ShardIndexGenerator::CheckIndex)
+    .def("write_manifest", &ShardIndexGenerator::WriteManifest);
 }
 
 void BindShardSegment(py::module *m) {
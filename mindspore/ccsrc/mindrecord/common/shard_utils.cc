@@ -125,6 +125,43 @@ std::pair<MSRStatus, std::string> GetParentDir(const std::string &path) {
   return {SUCCESS, "/"};
 }
 
+std::string GetManifestPath(const std::string &first_shard, int shard_count) {
+  if (shard_count <= 1) {
+    return first_shard + kManifestSuffix;
+  }
+  // remove the shard id appended to the file name by FileWriter, padded to the width of the last shard id
+  auto suffix_size = std::to_string(shard_count - 1).size();
+  if (first_shard.size() <= suffix_size) {
+    return first_shard + kManifestSuffix;
+  }
+  return first_shard.substr(0, first_shard.size() - suffix_size) + kManifestSuffix;
+}
+
+std::vector<std::string> GetManifestCandidates(const std::string &path) {
+  std::vector<std::string> candidates{GetManifestPath(path, 1)};
+  // the reader does not know the shard count, so try every possible width of the shard id suffix
+  auto max_suffix_size = std::to_string(kMaxShardCount - 1).size();
+  for (size_t suffix_size = 1; suffix_size <= max_suffix_size && suffix_size < path.size(); ++suffix_size) {
+    auto suffix = path.substr(path.size() - suffix_size);
+    if (suffix.find_first_not_of("0123456789") != std::string::npos) {
+      break;
+    }
+    candidates.push_back(path.substr(0, path.size() - suffix_size) + kManifestSuffix);
+  }
+  return candidates;
+}
+
+std::pair<MSRStatus, std::pair<uint64_t, int64_t>> GetFileStat(const std::string &path) {
+  struct stat file_stat;
+  if (stat(common::SafeCStr(path), &file_stat) != 0) {
+    MS_LOG(DEBUG) << "Failed to get the stat of file: " << path;
+    return {FAILED, {0, 0}};
+  }
+  auto mtime_ns = static_cast<int64_t>(file_stat.st_mtim.tv_sec) * kNanosecondsPerSecond +
+                  static_cast<int64_t>(file_stat.st_mtim.tv_nsec);
+  return {SUCCESS, {static_cast<uint64_t>(file_stat.st_size), mtime_ns}};
+}
+
 bool CheckIsValidUtf8(const std::string &str) {
   int n = 0;
   int ix = str.length();
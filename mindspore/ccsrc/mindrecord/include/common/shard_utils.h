@@ -66,7 +66,9 @@ const int kUnsignedInt4 = 4;
 enum LabelCategory { kSchemaLabel, kStatisticsLabel, kIndexLabel };
 
 const char kVersion[] = "3.0";
-const std::vector<std::string> kSupportedVersion = {"2.0", kVersion};
+// version of the files whose blob data is compressed by a codec
+const char kCompressedVersion[] = "3.1";
+const std::vector<std::string> kSupportedVersion = {"2.0", kVersion, kCompressedVersion};
 
 enum ShardType {
   kNLP = 0,
@@ -113,6 +115,14 @@ const int kMaxSchemaCount = 1;
 const int kMaxThreadCount = 32;
 const int kMaxFieldCount = 100;
 
+// suffix of the manifest which covers a MindRecord File series
+const char kManifestSuffix[] = ".mrmanifest";
+
+// maximum number of categories of an index field counted in the manifest for each shard
+const int kMaxManifestCategories = 1 << 12;
+
+const int64_t kNanosecondsPerSecond = 1000000000;
+
 // Minimum free disk size
 const int kMinFreeDiskSize = 10;  // 10M
 
@@ -173,6 +183,22 @@ enum DiskSizeType { kTotalSize = 0, kFreeSize };
 /// \return size in Megabytes
 std::pair<MSRStatus, uint64_t> GetDiskSize(const std::string &str_dir, const DiskSizeType &disk_type);
 
+/// \brief get the path of the manifest of a MindRecord File series
+/// \param first_shard path of the first MindRecord File
+/// \param shard_count number of MindRecord Files
+/// \return path of the file without the suffix of shard id, followed by the manifest suffix
+std::string GetManifestPath(const std::string &first_shard, int shard_count);
+
+/// \brief get the paths of manifests which may cover a MindRecord File
+/// \param path path of MindRecord File
+/// \return candidate paths of manifest, one for each possible width of the shard id suffix
+std::vector<std::string> GetManifestCandidates(const std::string &path);
+
+/// \brief get the size and last modified time of file
+/// \param path file path
+/// \return pair<MSRStatus, pair<size in bytes, modified time in nanoseconds>>
+std::pair<MSRStatus, std::pair<uint64_t, int64_t>> GetFileStat(const std::string &path);
+
 /// \brief get the max hardware concurrency
 /// \return max concurrency
 uint32_t GetMaxThreadNum();
@@ -0,0 +1,51 @@
+/**
+ * Copyright 2020 Huawei Technologies Co., Ltd
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#ifndef MINDRECORD_INCLUDE_SHARD_COMPRESSION_H_
+#define MINDRECORD_INCLUDE_SHARD_COMPRESSION_H_
+
+#include <string>
+#include <vector>
+#include "mindrecord/include/common/shard_utils.h"
+
+namespace mindspore {
+namespace mindrecord {
+const char kCompressionLz4[] = "lz4";
+const char kCompressionZstd[] = "zstd";
+const int kZstdCompressionLevel = 3;
+
+/// \brief check whether the codec is supported, empty means no compression
+/// \param[in] compression the codec
+/// \return true if the codec is supported
+bool IsSupportedCompression(const std::string &compression);
+
+/// \brief compress the data, the result is the original size as uint64 followed by the compressed data
+/// \param[in] compression the codec, "lz4" or "zstd"
+/// \param[in] src the data to be compressed
+/// \param[out] dst the compressed data
+/// \return SUCCESS if compressed, FAILED if not
+MSRStatus CompressBytes(const std::string &compression, const std::vector<uint8_t> &src, std::vector<uint8_t> *dst);
+
+/// \brief decompress the data compressed by CompressBytes
+/// \param[in] compression the codec, "lz4" or "zstd"
+/// \param[in] src the compressed data
+/// \param[out] dst the original data
+/// \return SUCCESS if decompressed, FAILED if the data is corrupted
+MSRStatus DecompressBytes(const std::string &compression, const std::vector<uint8_t> &src, std::vector<uint8_t> *dst);
+}  // namespace mindrecord
+}  // namespace mindspore
+
+#endif  // MINDRECORD_INCLUDE_SHARD_COMPRESSION_H_
@@ -118,6 +118,14 @@ class ShardHeader {
 
   void SetPageSize(const uint64_t &page_size) { page_size_ = page_size; }
 
+  /// \brief get the codec of blob data, empty if blob data is not compressed
+  std::string GetCompression() const { return compression_; }
+
+  /// \brief set the codec which compresses the blob data of each row
+  /// \param[in] compression the codec, "lz4", "zstd" or empty for no compression
+  /// \return SUCCESS if the codec is supported, FAILED if not
+  MSRStatus SetCompression(const std::string &compression);
+
   std::vector<std::string> SerializeHeader();
 
   MSRStatus PagesToFile(const std::string dump_file_name);
@@ -173,6 +181,7 @@ class ShardHeader {
   uint32_t shard_count_;
   uint64_t header_size_;
   uint64_t page_size_;
+  std::string compression_;
 
   std::shared_ptr<Index> index_;
   std::vector<std::string> shard_addresses_;
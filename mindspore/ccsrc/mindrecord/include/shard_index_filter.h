@@ -0,0 +1,63 @@
+/**
+ * Copyright 2019 Huawei Technologies Co., Ltd
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#ifndef MINDRECORD_INCLUDE_SHARD_INDEX_FILTER_H_
+#define MINDRECORD_INCLUDE_SHARD_INDEX_FILTER_H_
+
+#include <algorithm>
+#include <string>
+#include <tuple>
+#include <utility>
+#include <vector>
+#include "mindrecord/include/shard_operator.h"
+
+namespace mindspore {
+namespace mindrecord {
+using INDEX_CONDITIONS = std::vector<std::tuple<std::string, std::string, std::vector<std::string>>>;
+
+// comparison operators which could be pushed into the index
+const std::vector<std::string> kIndexFilterOperators = {"==", "!=", "<", "<=", ">", ">=", "in"};
+
+class ShardIndexFilter : public ShardOperator {
+ public:
+  /// \brief select the rows whose index fields satisfy all the conditions when reading index
+  /// \param[in] conditions tuples of index field, comparison operator and values, values of "in" could be more
+  ///     than one and the others take only one value
+  explicit ShardIndexFilter(const INDEX_CONDITIONS &conditions);
+
+  ~ShardIndexFilter() override{};
+
+  const INDEX_CONDITIONS &GetConditions() const { return conditions_; }
+
+  /// \brief the rows are filtered when the tasks are created from the index, nothing to do on the tasks
+  MSRStatus Execute(ShardTask &tasks) override;
+
+  int64_t GetNumSamples(int64_t dataset_size, int64_t num_classes) override;
+
+  /// \brief generate the condition of sql on the index table
+  /// \param[in] schema json schema of the mindrecord files
+  /// \param[in] index_fields schema id and name of index fields
+  /// \return pair<MSRStatus, sql condition>
+  std::pair<MSRStatus, std::string> GetSqlCondition(const json &schema,
+                                                    const std::vector<std::pair<uint64_t, std::string>> &index_fields);
+
+ private:
+  INDEX_CONDITIONS conditions_;
+};
+}  // namespace mindrecord
+}  // namespace mindspore
+
+#endif  // MINDRECORD_INCLUDE_SHARD_INDEX_FILTER_H_
@@ -54,9 +54,20 @@ class ShardIndexGenerator {
   /// \return the type of field
   static std::string TakeFieldType(const std::string &field_path, json schema);
 
-  /// \brief create databases for indexes
+  /// \brief create databases for indexes, when appending only the rows of the pages committed after the last
+  ///        indexed row group are inserted into the existing databases
   MSRStatus WriteToDatabase();
 
+  /// \brief write the manifest of the mindrecord files after the databases are created, it records the schema, the
+  ///        size, number of rows, blob bytes and the number of rows of each category of index fields of each file,
+  ///        the fields with unique values or too many categories in some file, like file names, are not counted
+  /// \return pair<MSRStatus, path of manifest>
+  std::pair<MSRStatus, std::string> WriteManifest();
+
+  /// \brief check the databases are consistent with the pages of the mindrecord files
+  /// \return SUCCESS if every row group of every shard is indexed with the right pages, row ids and offsets
+  MSRStatus CheckIndex();
+
  private:
   static int Callback(void *not_used, int argc, char **argv, char **az_col_name);
 
@@ -64,7 +75,26 @@ class ShardIndexGenerator {
 
   static std::string ConvertJsonToSQL(const std::string &json);
 
-  std::pair<MSRStatus, sqlite3 *> CreateDatabase(int shard_no);
+  /// \brief query an integer from the first column of the first row of the result
+  /// \param[in] sql
+  /// \param[in] db
+  /// \return pair<MSRStatus, value>, value is -1 if the result is empty or null
+  static std::pair<MSRStatus, int64_t> QueryInteger(const std::string &sql, sqlite3 *db);
+
+  /// \param[in] shard_no
+  /// \param[out] start_row_group the first row group which is not indexed in the existing database
+  std::pair<MSRStatus, sqlite3 *> CreateDatabase(int shard_no, int *start_row_group);
+
+  /// \brief remove the rows of the last indexed row group which may be extended or moved by appending
+  /// \param[in] db
+  /// \return pair<MSRStatus, the first row group to be indexed>
+  std::pair<MSRStatus, int> PrepareIncrementalIndex(sqlite3 *db);
+
+  MSRStatus CheckShardIndex(int shard_no);
+
+  /// \brief get the entry of a shard in manifest from its database, the categories of an index field are counted
+  ///        only if it has at most kMaxManifestCategories categories and its values are not unique in the shard
+  std::pair<MSRStatus, json> GetShardManifest(int shard_no);
 
   std::pair<MSRStatus, std::vector<json>> GetSchemaDetails(const std::vector<uint64_t> &schema_lens, std::fstream &in);
 
@@ -77,9 +107,10 @@ class ShardIndexGenerator {
   /// \param blob_id_to_page_id
   /// \param raw_page_id
   /// \param in
+  /// \param start_row_group row groups before it are already indexed and skipped
   /// \return field name, db type, field value
   ROW_DATA GenerateRowData(int shard_no, const std::map<int, int> &blob_id_to_page_id, int raw_page_id,
-                           std::fstream &in);
+                           std::fstream &in, int start_row_group = 0);
   ///
   /// \param db
   /// \param sql
@@ -92,10 +123,14 @@ class ShardIndexGenerator {
   INDEX_FIELDS GenerateIndexFields(const std::vector<json> &schema_detail);
 
   MSRStatus ExecuteTransaction(const int &shard_no, std::pair<MSRStatus, sqlite3 *> &db,
-                               const std::vector<int> &raw_page_ids, const std::map<int, int> &blob_id_to_page_id);
+                               const std::vector<int> &raw_page_ids, const std::map<int, int> &blob_id_to_page_id,
+                               int start_row_group = 0);
 
   MSRStatus CreateShardNameTable(sqlite3 *db, const std::string &shard_name);
 
+  /// \brief create a covering index on each index field for reading pages by category
+  MSRStatus CreateCategoryIndexes(sqlite3 *db);
+
   MSRStatus AddBlobPageInfo(std::vector<std::tuple<std::string, std::string, std::string>> &row_data,
                             const std::shared_ptr<Page> cur_blob_page, uint64_t &cur_blob_page_offset,
                             std::fstream &in);
@@ -20,6 +20,8 @@
 #include <dirent.h>
 #include <signal.h>
 #if !defined(_WIN32) && !defined(_WIN64)
+#include <fcntl.h>
+#include <sys/mman.h>
 #include <sys/prctl.h>
 #endif
 #include <sys/stat.h>
@@ -47,6 +49,7 @@
 #include "mindrecord/include/shard_column.h"
 #include "mindrecord/include/shard_distributed_sample.h"
 #include "mindrecord/include/shard_error.h"
+#include "mindrecord/include/shard_index_filter.h"
 #include "mindrecord/include/shard_index_generator.h"
 #include "mindrecord/include/shard_operator.h"
 #include "mindrecord/include/shard_reader.h"
@@ -197,6 +200,21 @@ class ShardReader {
   /// \return a batch of images and image data
   std::vector<std::tuple<std::vector<std::vector<uint8_t>>, pybind11::object>> GetNextPy();
 
+  /// \brief return the next rows as columns, python API
+  /// \param[in] batch_size the number of rows
+  /// \return MSRStatus and None if no row is left, or tuple of the number of rows, the blob columns in the order of
+  ///     loaded columns and the dict of raw columns; a blob column is a tuple of the concatenated bytes of the rows and
+  ///     the uint64 offsets of the rows, a raw column is the int64 or float64 values of the rows or the list of strings
+  std::pair<MSRStatus, pybind11::object> GetNextBatchPy(int64_t batch_size);
+
+  /// \brief return the blob columns of rows without reading them in mmap mode, python API
+  /// \param[in] start the id of the first task
+  /// \param[in] num the number of tasks
+  /// \return MSRStatus and, for each row, the blob columns and the raw data; a blob column is a tuple of file index,
+  ///     offset and size in the file if it can be viewed in place, or the decoded bytes if it is compressed
+  std::pair<MSRStatus, std::vector<std::tuple<std::vector<pybind11::object>, pybind11::object>>> GetBlobViewsPy(
+    int64_t start, int64_t num);
+
   /// \brief  get blob filed list
   /// \return blob field list
   std::pair<ShardType, std::vector<std::string>> GetBlobFields();
@@ -209,6 +227,15 @@ class ShardReader {
   /// \return null
   void SetAllInIndex(bool all_in_index) { all_in_index_ = all_in_index; }
 
+  /// \brief set flag of mmap mode, in which the files are mapped into memory and blob data is read from the mapping
+  /// \param[in] use_mmap whether to read by mmap, it must be set before open
+  /// \return null
+  void SetUseMmap(bool use_mmap) { use_mmap_ = use_mmap; }
+
+  /// \brief get file paths of the shards
+  /// \return file paths in the order of shard id
+  std::vector<std::string> GetFilePaths() const { return file_paths_; }
+
   /// \brief get NLP flag
   bool GetNlpFlag();
 
@@ -219,6 +246,9 @@ class ShardReader {
   /// \brief sqlite call back function
   static int SelectCallback(void *p_data, int num_fields, char **p_fields, char **p_col_names);
 
+  /// \brief decompress the blob data of one row in place if it is compressed by a codec
+  MSRStatus DecompressBlob(std::vector<uint8_t> *blob);
+
  private:
   /// \brief wrap up labels to json format
   MSRStatus ConvertLabelToJson(const std::vector<std::vector<std::string>> &labels, std::shared_ptr<std::fstream> fs,
@@ -228,6 +258,14 @@ class ShardReader {
   /// \brief read all rows for specified columns
   ROW_GROUPS ReadAllRowGroup(std::vector<std::string> &columns);
 
+  /// \brief generate the sql condition of all the index filters in operators
+  /// \return pair<MSRStatus, sql condition>, the condition is empty if there is no index filter
+  std::pair<MSRStatus, std::string> GetIndexFilterCondition(
+    const std::vector<std::shared_ptr<ShardOperator>> &operators);
+
+  /// \brief count the rows which satisfy the sql condition in the index of all the shards
+  MSRStatus CountRowsByCondition(const std::string &condition, int64_t *count);
+
   /// \brief read all rows in one shard
   MSRStatus ReadAllRowsInShard(int shard_id, const std::string &sql, const std::vector<std::string> &columns,
                                std::vector<std::vector<std::vector<uint64_t>>> &offsets,
@@ -305,12 +343,30 @@ class ShardReader {
   /// \brief get number of classes
   int64_t GetNumClasses(const std::string &category_field);
 
+  /// \brief check whether the categories of the field are counted in the manifests read by ReadManifest
+  bool IsCountedInManifest(const std::string &category_field);
+
+  /// \brief get the number of rows and categories from the manifests which cover the files, instead of opening the
+  ///        headers and databases of all the files
+  /// \return SUCCESS if all the files are covered by manifests and not modified since the manifests are written
+  MSRStatus ReadManifest(const std::vector<std::string> &file_paths, bool load_dataset);
+
   /// \brief get meta of header
   std::pair<MSRStatus, std::vector<std::string>> GetMeta(const std::string &file_path, json &meta_data);
 
   /// \brief extract uncompressed data based on column list
   std::pair<MSRStatus, std::vector<std::vector<uint8_t>>> UnCompressBlob(const std::vector<uint8_t> &raw_blob_data);
 
+  /// \brief map all the files into memory in mmap mode
+  MSRStatus MapFiles();
+
+  /// \brief unmap the files mapped in mmap mode
+  void UnmapFiles();
+
+  /// \brief get the location in file or decoded bytes of selected blob columns of one row in mmap mode
+  std::pair<MSRStatus, std::vector<pybind11::object>> GetBlobViews(int shard_id, uint64_t blob_offset,
+                                                                   uint64_t blob_size);
+
  protected:
   uint64_t header_size_;                       // header size
   uint64_t page_size_;                         // page size
@@ -327,6 +383,7 @@ class ShardReader {
   int n_consumer_;                                         // number of workers (threads)
   std::vector<std::string> selected_columns_;              // columns which will be read
   std::map<string, uint64_t> column_schema_id_;            // column-schema map
+  std::string index_filter_condition_;                     // sql condition of index filters
   std::vector<std::shared_ptr<ShardOperator>> operators_;  // data operators, including shuffle, sample and category
   ShardTask tasks_;                                        // shard task
   std::mutex shard_locker_;                                // locker of shard
@@ -334,6 +391,13 @@ class ShardReader {
   // flags
   bool all_in_index_ = true;  // if all columns are stored in index-table
   bool interrupt_ = false;    // reader interrupted
+  bool use_mmap_ = false;     // read blob data from the files mapped into memory
+  bool use_manifest_ = false;  // number of rows and categories are got from manifests
+
+  std::vector<std::pair<uint8_t *, uint64_t>> mapped_files_;  // address and size of mapped files in mmap mode
+  std::vector<json> manifest_categories_;  // counted categories of index fields of each shard in manifests
+
+  std::vector<std::tuple<std::vector<uint8_t>, json>> pending_rows_;  // rows fetched but not returned by batch API
 
   int num_padded_;  // number of padding samples
 
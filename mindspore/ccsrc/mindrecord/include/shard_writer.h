@@ -22,6 +22,7 @@
 #include <unistd.h>
 #include <algorithm>
 #include <array>
+#include <atomic>
 #include <chrono>
 #include <exception>
 #include <fstream>
@@ -108,6 +109,16 @@ class ShardWriter {
                          std::map<uint64_t, std::vector<py::handle>> &blob_data, bool sign = true,
                          bool parallel_writer = false);
 
+  /// \brief write data given by columns for call from python
+  /// \param[in] raw_columns dict of raw field name and the list of its values of all rows
+  /// \param[in] blob contiguous buffer of the merged blob data of all rows
+  /// \param[in] blob_offsets int64 buffer, the blob of row i is blob[blob_offsets[i], blob_offsets[i + 1]),
+  ///     empty if there is no blob field
+  /// \param[in] sign validate data or not
+  /// \return MSRStatus the status of MSRStatus to judge if write successfully
+  MSRStatus WriteColumns(const py::dict &raw_columns, const py::buffer &blob, const py::buffer &blob_offsets,
+                         bool sign = true, bool parallel_writer = false);
+
  private:
   /// \brief write shard header data to disk
   MSRStatus WriteShardHeader();
@@ -118,6 +129,13 @@ class ShardWriter {
   /// \brief populate error data
   void PopulateMutexErrorData(const int &row, const std::string &message, std::map<int, std::string> &err_raw_data);
 
+  /// \brief compress the blob data of each row by the codec in shard header in multiple thread run
+  MSRStatus CompressBlobData(std::vector<std::vector<uint8_t>> &blob_data);
+
+  /// \brief compress a slice of blob data
+  void CompressSliceBlob(int start_row, int end_row, std::vector<std::vector<uint8_t>> &blob_data,
+                         std::atomic<bool> &failed);
+
   /// \brief check data
   void CheckSliceData(int start_row, int end_row, json schema, const std::vector<json> &sub_raw_data,
                       std::map<int, std::string> &err_raw_data);
@@ -13,6 +13,8 @@
  * See the License for the specific language governing permissions and
  * limitations under the License.
  */
+#include <iomanip>
+#include <sstream>
 #include <thread>
 
 #include "mindrecord/include/shard_index_generator.h"
@@ -163,6 +165,26 @@ MSRStatus ShardIndexGenerator::ExecuteSQL(const std::string &sql, sqlite3 *db, c
   }
 }
 
+std::pair<MSRStatus, int64_t> ShardIndexGenerator::QueryInteger(const std::string &sql, sqlite3 *db) {
+  sqlite3_stmt *stmt = nullptr;
+  if (sqlite3_prepare_v2(db, common::SafeCStr(sql), -1, &stmt, 0) != SQLITE_OK) {
+    MS_LOG(ERROR) << "SQL error: could not prepare statement, sql: " << sql;
+    (void)sqlite3_finalize(stmt);
+    return {FAILED, -1};
+  }
+  int64_t value = -1;
+  int rc = sqlite3_step(stmt);
+  if (rc == SQLITE_ROW && sqlite3_column_type(stmt, 0) != SQLITE_NULL) {
+    value = sqlite3_column_int64(stmt, 0);
+  } else if (rc != SQLITE_ROW && rc != SQLITE_DONE) {
+    MS_LOG(ERROR) << "SQL error: Could not step (execute) stmt, sql: " << sql;
+    (void)sqlite3_finalize(stmt);
+    return {FAILED, -1};
+  }
+  (void)sqlite3_finalize(stmt);
+  return {SUCCESS, value};
+}
+
 std::pair<MSRStatus, std::string> ShardIndexGenerator::GenerateFieldName(
   const std::pair<uint64_t, std::string> &field) {
   // Replaces dots and dashes with underscores for SQL use
@@ -216,7 +238,30 @@ MSRStatus ShardIndexGenerator::CreateShardNameTable(sqlite3 *db, const std::stri
   return SUCCESS;
 }
 
-std::pair<MSRStatus, sqlite3 *> ShardIndexGenerator::CreateDatabase(int shard_no) {
+std::pair<MSRStatus, int> ShardIndexGenerator::PrepareIncrementalIndex(sqlite3 *db) {
+  auto table = QueryInteger("SELECT COUNT(*) FROM SQLITE_MASTER WHERE TYPE='table' AND NAME='INDEXES';", db);
+  if (table.first != SUCCESS) {
+    return {FAILED, 0};
+  }
+  if (table.second <= 0) {
+    return {SUCCESS, -1};
+  }
+  auto last_row_group = QueryInteger("SELECT MAX(ROW_GROUP_ID) FROM INDEXES;", db);
+  if (last_row_group.first != SUCCESS) {
+    return {FAILED, 0};
+  }
+  if (last_row_group.second < 0) {
+    return {SUCCESS, 0};
+  }
+  // appending extends the last row group and may move it to a new raw page, so it is indexed again
+  std::string sql = "DELETE FROM INDEXES WHERE ROW_GROUP_ID >= " + std::to_string(last_row_group.second) + ";";
+  if (ExecuteSQL(sql, db, "delete last row group successfully.") != SUCCESS) {
+    return {FAILED, 0};
+  }
+  return {SUCCESS, static_cast<int>(last_row_group.second)};
+}
+
+std::pair<MSRStatus, sqlite3 *> ShardIndexGenerator::CreateDatabase(int shard_no, int *start_row_group) {
   std::string shard_address = shard_header_.GetShardAddressByID(shard_no);
   if (shard_address.empty()) {
     MS_LOG(ERROR) << "Shard address is null, shard no: " << shard_no;
@@ -230,6 +275,19 @@ std::pair<MSRStatus, sqlite3 *> ShardIndexGenerator::CreateDatabase(int shard_no
     return {FAILED, nullptr};
   }
   sqlite3 *db = ret1.second;
+  *start_row_group = 0;
+  if (append_) {
+    auto ret2 = PrepareIncrementalIndex(db);
+    if (ret2.first != SUCCESS) {
+      (void)sqlite3_close(db);
+      return {FAILED, nullptr};
+    }
+    if (ret2.second >= 0) {
+      MS_LOG(INFO) << "Update index db of shard: " << shard_no << " from row group: " << ret2.second;
+      *start_row_group = ret2.second;
+      return {SUCCESS, db};
+    }
+  }
   std::string sql = "DROP TABLE IF EXISTS INDEXES;";
   if (ExecuteSQL(sql, db, "drop table successfully.") != SUCCESS) {
     return {FAILED, nullptr};
@@ -412,7 +470,7 @@ void ShardIndexGenerator::AddIndexFieldByRawData(
 }
 
 ROW_DATA ShardIndexGenerator::GenerateRowData(int shard_no, const std::map<int, int> &blob_id_to_page_id,
-                                              int raw_page_id, std::fstream &in) {
+                                              int raw_page_id, std::fstream &in, int start_row_group) {
   std::vector<std::vector<std::tuple<std::string, std::string, std::string>>> full_data;
 
   // current raw data page
@@ -423,6 +481,9 @@ ROW_DATA ShardIndexGenerator::GenerateRowData(int shard_no, const std::map<int,
 
   // pair: row_group id, offset in raw data page
   for (pair<int, int> blob_ids : row_group_list) {
+    if (blob_ids.first < start_row_group) {
+      continue;
+    }
     // get blob data page according to row_group id
     std::shared_ptr<Page> cur_blob_page = shard_header_.GetPage(shard_no, blob_id_to_page_id.at(blob_ids.first)).first;
 
@@ -516,7 +577,8 @@ INDEX_FIELDS ShardIndexGenerator::GenerateIndexFields(const std::vector<json> &s
 
 MSRStatus ShardIndexGenerator::ExecuteTransaction(const int &shard_no, std::pair<MSRStatus, sqlite3 *> &db,
                                                   const std::vector<int> &raw_page_ids,
-                                                  const std::map<int, int> &blob_id_to_page_id) {
+                                                  const std::map<int, int> &blob_id_to_page_id,
+                                                  int start_row_group) {
   // Add index data to database
   std::string shard_address = shard_header_.GetShardAddressByID(shard_no);
   if (shard_address.empty()) {
@@ -537,7 +599,7 @@ MSRStatus ShardIndexGenerator::ExecuteTransaction(const int &shard_no, std::pair
       MS_LOG(ERROR) << "Generate raw SQL failed";
       return FAILED;
     }
-    auto data = GenerateRowData(shard_no, blob_id_to_page_id, raw_page_id, in);
+    auto data = GenerateRowData(shard_no, blob_id_to_page_id, raw_page_id, in, start_row_group);
     if (data.first != SUCCESS) {
       MS_LOG(ERROR) << "Generate raw data failed";
       return FAILED;
@@ -551,6 +613,10 @@ MSRStatus ShardIndexGenerator::ExecuteTransaction(const int &shard_no, std::pair
   (void)sqlite3_exec(db.second, "END TRANSACTION;", nullptr, nullptr, nullptr);
   in.close();
 
+  if (CreateCategoryIndexes(db.second) != SUCCESS) {
+    return FAILED;
+  }
+
   // Close database
   if (sqlite3_close(db.second) != SQLITE_OK) {
     MS_LOG(ERROR) << "Close database failed";
@@ -560,6 +626,22 @@ MSRStatus ShardIndexGenerator::ExecuteTransaction(const int &shard_no, std::pair
   return SUCCESS;
 }
 
+MSRStatus ShardIndexGenerator::CreateCategoryIndexes(sqlite3 *db) {
+  // cover the lookups of pages by category, which filter rows by blob page and read the blob offsets
+  for (const auto &field : fields_) {
+    auto ret = GenerateFieldName(field);
+    if (ret.first != SUCCESS) {
+      return FAILED;
+    }
+    std::string sql = "CREATE INDEX IF NOT EXISTS CATEGORY_" + ret.second + " ON INDEXES(" + ret.second +
+                      ", PAGE_ID_BLOB, PAGE_OFFSET_BLOB, PAGE_OFFSET_BLOB_END);";
+    if (ExecuteSQL(sql, db, "create category index successfully.") != SUCCESS) {
+      return FAILED;
+    }
+  }
+  return SUCCESS;
+}
+
 MSRStatus ShardIndexGenerator::WriteToDatabase() {
   fields_ = shard_header_.GetFields();
   page_size_ = shard_header_.GetPageSize();
@@ -592,7 +674,8 @@ MSRStatus ShardIndexGenerator::WriteToDatabase() {
 void ShardIndexGenerator::DatabaseWriter() {
   int shard_no = task_++;
   while (shard_no < shard_header_.GetShardCount()) {
-    auto db = CreateDatabase(shard_no);
+    int start_row_group = 0;
+    auto db = CreateDatabase(shard_no, &start_row_group);
     if (db.first != SUCCESS || db.second == nullptr || write_success_ == false) {
       write_success_ = false;
       return;
@@ -608,13 +691,17 @@ void ShardIndexGenerator::DatabaseWriter() {
     for (uint64_t i = 0; i < total_pages; ++i) {
       std::shared_ptr<Page> cur_page = shard_header_.GetPage(shard_no, i).first;
       if (cur_page->GetPageType() == "RAW_DATA") {
-        raw_page_ids.push_back(i);
+        // skip the raw pages whose row groups are all indexed already
+        auto row_group_ids = cur_page->GetRowGroupIds();
+        if (!row_group_ids.empty() && row_group_ids.back().first >= start_row_group) {
+          raw_page_ids.push_back(i);
+        }
       } else if (cur_page->GetPageType() == "BLOB_DATA") {
         blob_id_to_page_id[cur_page->GetPageTypeID()] = i;
       }
     }
 
-    if (ExecuteTransaction(shard_no, db, raw_page_ids, blob_id_to_page_id) != SUCCESS) {
+    if (ExecuteTransaction(shard_no, db, raw_page_ids, blob_id_to_page_id, start_row_group) != SUCCESS) {
       write_success_ = false;
       return;
     }
@@ -622,5 +709,209 @@ void ShardIndexGenerator::DatabaseWriter() {
     shard_no = task_++;
   }
 }
+
+MSRStatus ShardIndexGenerator::CheckShardIndex(int shard_no) {
+  std::string shard_address = shard_header_.GetShardAddressByID(shard_no);
+  if (shard_address.empty()) {
+    MS_LOG(ERROR) << "Shard address is null, shard no: " << shard_no;
+    return FAILED;
+  }
+  sqlite3 *db = nullptr;
+  if (sqlite3_open_v2(common::SafeCStr(shard_address + ".db"), &db, SQLITE_OPEN_READONLY, nullptr) != SQLITE_OK) {
+    MS_LOG(ERROR) << "Can't open database, error: " << sqlite3_errmsg(db);
+    (void)sqlite3_close(db);
+    return FAILED;
+  }
+
+  // row group id -> raw page id, raw page offset, blob page id, start row id, end row id
+  std::map<int, std::vector<int64_t>> expected;
+  std::map<int, std::pair<int64_t, int64_t>> raw_pages;
+  auto total_pages = shard_header_.GetLastPageId(shard_no) + 1;
+  for (uint64_t i = 0; i < total_pages; ++i) {
+    std::shared_ptr<Page> cur_page = shard_header_.GetPage(shard_no, i).first;
+    if (cur_page->GetPageType() == "RAW_DATA") {
+      for (const auto &row_group : cur_page->GetRowGroupIds()) {
+        raw_pages[row_group.first] = {static_cast<int64_t>(i), static_cast<int64_t>(row_group.second)};
+      }
+    } else if (cur_page->GetPageType() == "BLOB_DATA" && cur_page->GetEndRowID() > cur_page->GetStartRowID()) {
+      expected[cur_page->GetPageTypeID()] = {-1, -1, static_cast<int64_t>(i),
+                                             static_cast<int64_t>(cur_page->GetStartRowID()),
+                                             static_cast<int64_t>(cur_page->GetEndRowID())};
+    }
+  }
+  for (auto &row_group : expected) {
+    if (raw_pages.find(row_group.first) == raw_pages.end()) {
+      MS_LOG(ERROR) << "Row group: " << row_group.first << " of shard: " << shard_no << " is not in any raw page.";
+      (void)sqlite3_close(db);
+      return FAILED;
+    }
+    row_group.second[0] = raw_pages[row_group.first].first;
+    row_group.second[1] = raw_pages[row_group.first].second;
+  }
+
+  std::string sql =
+    "SELECT ROW_GROUP_ID, PAGE_ID_RAW, MIN(PAGE_OFFSET_RAW), PAGE_ID_BLOB, MIN(ROW_ID), MAX(ROW_ID) + 1, COUNT(*)"
+    " FROM INDEXES GROUP BY ROW_GROUP_ID, PAGE_ID_RAW, PAGE_ID_BLOB;";
+  sqlite3_stmt *stmt = nullptr;
+  if (sqlite3_prepare_v2(db, common::SafeCStr(sql), -1, &stmt, 0) != SQLITE_OK) {
+    MS_LOG(ERROR) << "SQL error: could not prepare statement, sql: " << sql;
+    (void)sqlite3_finalize(stmt);
+    (void)sqlite3_close(db);
+    return FAILED;
+  }
+  MSRStatus status = SUCCESS;
+  size_t indexed_row_groups = 0;
+  while (status == SUCCESS && sqlite3_step(stmt) == SQLITE_ROW) {
+    indexed_row_groups++;
+    auto row_group_id = static_cast<int>(sqlite3_column_int64(stmt, 0));
+    std::vector<int64_t> actual;
+    for (int i = 1; i < 6; ++i) {
+      actual.push_back(sqlite3_column_int64(stmt, i));
+    }
+    auto count = sqlite3_column_int64(stmt, 6);
+    if (expected.find(row_group_id) == expected.end() || expected[row_group_id] != actual ||
+        count != actual[4] - actual[3]) {
+      MS_LOG(ERROR) << "Index of row group: " << row_group_id << " in shard: " << shard_no
+                    << " is inconsistent with the pages.";
+      status = FAILED;
+    }
+  }
+  (void)sqlite3_finalize(stmt);
+  (void)sqlite3_close(db);
+  if (status == SUCCESS && indexed_row_groups != expected.size()) {
+    MS_LOG(ERROR) << "Index of shard: " << shard_no << " has " << indexed_row_groups << " row groups, but "
+                  << expected.size() << " are expected.";
+    status = FAILED;
+  }
+  return status;
+}
+
+MSRStatus ShardIndexGenerator::CheckIndex() {
+  for (int shard_no = 0; shard_no < shard_header_.GetShardCount(); ++shard_no) {
+    if (CheckShardIndex(shard_no) != SUCCESS) {
+      return FAILED;
+    }
+  }
+  MS_LOG(INFO) << "Index db of " << shard_header_.GetShardCount() << " shards are consistent.";
+  return SUCCESS;
+}
+
+std::pair<MSRStatus, json> ShardIndexGenerator::GetShardManifest(int shard_no) {
+  std::string shard_address = shard_header_.GetShardAddressByID(shard_no);
+  auto file_stat = GetFileStat(shard_address);
+  if (shard_address.empty() || file_stat.first != SUCCESS) {
+    MS_LOG(ERROR) << "Failed to get the stat of shard: " << shard_no;
+    return {FAILED, json()};
+  }
+  sqlite3 *db = nullptr;
+  if (sqlite3_open_v2(common::SafeCStr(shard_address + ".db"), &db, SQLITE_OPEN_READONLY, nullptr) != SQLITE_OK) {
+    MS_LOG(ERROR) << "Can't open database, error: " << sqlite3_errmsg(db);
+    (void)sqlite3_close(db);
+    return {FAILED, json()};
+  }
+  auto num_rows = QueryInteger("SELECT COUNT(*) FROM INDEXES;", db);
+  auto blob_bytes = QueryInteger("SELECT SUM(PAGE_OFFSET_BLOB_END - PAGE_OFFSET_BLOB) FROM INDEXES;", db);
+  if (num_rows.first != SUCCESS || blob_bytes.first != SUCCESS) {
+    (void)sqlite3_close(db);
+    return {FAILED, json()};
+  }
+
+  json categories = json::object();
+  for (const auto &field : shard_header_.GetFields()) {
+    auto ret = GenerateFieldName(field);
+    if (ret.first != SUCCESS) {
+      (void)sqlite3_close(db);
+      return {FAILED, json()};
+    }
+    auto num_categories = QueryInteger("SELECT COUNT(DISTINCT " + ret.second + ") FROM INDEXES;", db);
+    if (num_categories.first != SUCCESS) {
+      (void)sqlite3_close(db);
+      return {FAILED, json()};
+    }
+    // keys like file names would make the manifest grow with the rows, and are useless for category samplers
+    if (num_categories.second > kMaxManifestCategories ||
+        (num_categories.second == num_rows.second && num_rows.second > 1)) {
+      continue;
+    }
+    std::string sql = "SELECT " + ret.second + ", COUNT(*) FROM INDEXES GROUP BY " + ret.second + ";";
+    sqlite3_stmt *stmt = nullptr;
+    if (sqlite3_prepare_v2(db, common::SafeCStr(sql), -1, &stmt, 0) != SQLITE_OK) {
+      MS_LOG(ERROR) << "SQL error: could not prepare statement, sql: " << sql;
+      (void)sqlite3_finalize(stmt);
+      (void)sqlite3_close(db);
+      return {FAILED, json()};
+    }
+    json counts = json::object();
+    while (sqlite3_step(stmt) == SQLITE_ROW) {
+      auto value = reinterpret_cast<const char *>(sqlite3_column_text(stmt, 0));
+      counts[value == nullptr ? "" : value] = sqlite3_column_int64(stmt, 1);
+    }
+    (void)sqlite3_finalize(stmt);
+    categories[field.second] = counts;
+  }
+  (void)sqlite3_close(db);
+  auto db_stat = GetFileStat(shard_address + ".db");
+  if (db_stat.first != SUCCESS) {
+    MS_LOG(ERROR) << "Failed to get the stat of index db of shard: " << shard_no;
+    return {FAILED, json()};
+  }
+
+  json shard;
+  shard["name"] = GetFileName(shard_address).second;
+  shard["size"] = file_stat.second.first;
+  shard["mtime"] = file_stat.second.second;
+  shard["db_size"] = db_stat.second.first;
+  shard["db_mtime"] = db_stat.second.second;
+  shard["num_rows"] = num_rows.second;
+  shard["blob_bytes"] = std::max(blob_bytes.second, static_cast<int64_t>(0));
+  shard["categories"] = categories;
+  return {SUCCESS, shard};
+}
+
+std::pair<MSRStatus, std::string> ShardIndexGenerator::WriteManifest() {
+  std::string schema = shard_header_.GetSchemas()[0]->GetSchema()["schema"].dump();
+  // FNV-1a hash of schema, which is stable across platforms
+  uint64_t schema_hash = 14695981039346656037ULL;
+  for (const auto &c : schema) {
+    schema_hash = (schema_hash ^ static_cast<uint8_t>(c)) * 1099511628211ULL;
+  }
+  std::stringstream hash_stream;
+  hash_stream << std::hex << std::setw(16) << std::setfill('0') << schema_hash;
+
+  json manifest;
+  manifest["schema"] = shard_header_.GetSchemas()[0]->GetSchema()["schema"];
+  manifest["schema_hash"] = hash_stream.str();
+  manifest["num_rows"] = 0;
+  manifest["shards"] = json::array();
+  for (int shard_no = 0; shard_no < shard_header_.GetShardCount(); ++shard_no) {
+    auto shard = GetShardManifest(shard_no);
+    if (shard.first != SUCCESS) {
+      return {FAILED, ""};
+    }
+    manifest["num_rows"] = manifest["num_rows"].get<int64_t>() + shard.second["num_rows"].get<int64_t>();
+    manifest["shards"].push_back(shard.second);
+  }
+  // a field not counted in some shard is not counted in any shard, the number of its classes is got from databases
+  for (const auto &field : shard_header_.GetFields()) {
+    bool counted = true;
+    for (const auto &shard : manifest["shards"]) {
+      counted = counted && shard["categories"].find(field.second) != shard["categories"].end();
+    }
+    if (!counted) {
+      for (auto &shard : manifest["shards"]) shard["categories"].erase(field.second);
+    }
+  }
+
+  std::string manifest_path = GetManifestPath(shard_header_.GetShardAddressByID(0), shard_header_.GetShardCount());
+  std::ofstream out(common::SafeCStr(manifest_path), std::ios::out | std::ios::trunc);
+  if (!out.good()) {
+    MS_LOG(ERROR) << "Failed to open manifest: " << manifest_path;
+    return {FAILED, ""};
+  }
+  out << manifest.dump();
+  out.close();
+  MS_LOG(INFO) << "Write manifest: " << manifest_path << " successfully.";
+  return {SUCCESS, manifest_path};
+}
 }  // namespace mindrecord
 }  // namespace mindspore
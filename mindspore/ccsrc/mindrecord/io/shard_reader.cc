@@ -14,6 +14,7 @@
  * limitations under the License.
  */
 
+#include "mindrecord/include/shard_compression.h"
 #include "mindrecord/include/shard_distributed_sample.h"
 #include "mindrecord/include/shard_reader.h"
 #include "common/utils.h"
@@ -149,11 +150,55 @@ MSRStatus ShardReader::Init(const std::vector<std::string> &file_paths, bool loa
     num_rows_ += std::get<3>(rg);
   }
 
+  if (use_mmap_ && MapFiles() != SUCCESS) {
+    return FAILED;
+  }
+
   MS_LOG(INFO) << "Get meta from mindrecord file & index file successfully.";
 
   return SUCCESS;
 }
 
+MSRStatus ShardReader::MapFiles() {
+#if defined(_WIN32) || defined(_WIN64)
+  MS_LOG(ERROR) << "Mmap mode is not supported on Windows.";
+  return FAILED;
+#else
+  for (const auto &file : file_paths_) {
+    int fd = ::open(common::SafeCStr(file), O_RDONLY);
+    if (fd < 0) {
+      MS_LOG(ERROR) << "Failed to open file " << file << " for mmap.";
+      return FAILED;
+    }
+    struct stat file_stat;
+    if (fstat(fd, &file_stat) != 0 || file_stat.st_size == 0) {
+      MS_LOG(ERROR) << "Failed to get the size of file " << file << " for mmap.";
+      ::close(fd);
+      return FAILED;
+    }
+    void *address = mmap(nullptr, file_stat.st_size, PROT_READ, MAP_SHARED, fd, 0);
+    ::close(fd);
+    if (address == MAP_FAILED) {
+      MS_LOG(ERROR) << "Failed to mmap file " << file << ".";
+      return FAILED;
+    }
+    mapped_files_.emplace_back(static_cast<uint8_t *>(address), static_cast<uint64_t>(file_stat.st_size));
+  }
+  return SUCCESS;
+#endif
+}
+
+void ShardReader::UnmapFiles() {
+#if !defined(_WIN32) && !defined(_WIN64)
+  for (auto &mapped_file : mapped_files_) {
+    if (munmap(mapped_file.first, mapped_file.second) != 0) {
+      MS_LOG(ERROR) << "Failed to munmap file.";
+    }
+  }
+#endif
+  mapped_files_.clear();
+}
+
 MSRStatus ShardReader::CheckColumnList(const std::vector<std::string> &selected_columns) {
   vector<int> inSchema(selected_columns.size(), 0);
   for (auto &p : GetShardHeader()->GetSchemas()) {
@@ -236,6 +281,7 @@ ShardReader::~ShardReader() { Close(); }
 void ShardReader::Close() {
   (void)Finish();  // interrupt reading and stop threads
   FileStreamsOperator();
+  UnmapFiles();
 }
 
 std::shared_ptr<ShardHeader> ShardReader::GetShardHeader() const { return shard_header_; }
@@ -436,7 +482,11 @@ ROW_GROUPS ShardReader::ReadAllRowGroup(std::vector<std::string> &columns) {
     fields += ", PAGE_ID_RAW, PAGE_OFFSET_RAW, PAGE_OFFSET_RAW_END ";
   }
 
-  std::string sql = "SELECT " + fields + " FROM INDEXES ORDER BY ROW_ID ;";
+  std::string sql = "SELECT " + fields + " FROM INDEXES";
+  if (!index_filter_condition_.empty()) {
+    sql += " WHERE " + index_filter_condition_;
+  }
+  sql += " ORDER BY ROW_ID ;";
 
   std::vector<std::thread> thread_read_db = std::vector<std::thread>(shard_count_);
   for (int x = 0; x < shard_count_; x++) {
@@ -450,6 +500,45 @@ ROW_GROUPS ShardReader::ReadAllRowGroup(std::vector<std::string> &columns) {
   return std::make_tuple(SUCCESS, std::move(offsets), std::move(column_values));
 }
 
+std::pair<MSRStatus, std::string> ShardReader::GetIndexFilterCondition(
+  const std::vector<std::shared_ptr<ShardOperator>> &operators) {
+  std::string condition;
+  auto schema = shard_header_->GetSchemas()[0]->GetSchema()["schema"];
+  for (const auto &op : operators) {
+    auto filter_op = std::dynamic_pointer_cast<ShardIndexFilter>(op);
+    if (!filter_op) continue;
+    auto ret = filter_op->GetSqlCondition(schema, shard_header_->GetFields());
+    if (ret.first != SUCCESS) {
+      return {FAILED, ""};
+    }
+    if (ret.second.empty()) continue;
+    condition += (condition.empty() ? "" : " AND ") + ret.second;
+  }
+  return {SUCCESS, condition};
+}
+
+MSRStatus ShardReader::CountRowsByCondition(const std::string &condition, int64_t *count) {
+  std::string sql = "SELECT COUNT(*) FROM INDEXES";
+  if (!condition.empty()) {
+    sql += " WHERE " + condition;
+  }
+  *count = 0;
+  for (int x = 0; x < shard_count_; x++) {
+    std::vector<std::vector<std::string>> rows;
+    char *errmsg = nullptr;
+    int rc = sqlite3_exec(database_paths_[x], common::SafeCStr(sql), SelectCallback, &rows, &errmsg);
+    if (rc != SQLITE_OK || rows.size() != 1 || rows[0].size() != 1) {
+      MS_LOG(ERROR) << "Error in select statement, sql: " << sql << ", error: " << (errmsg ? errmsg : "");
+      sqlite3_free(errmsg);
+      return FAILED;
+    }
+    sqlite3_free(errmsg);
+    *count += std::stoll(rows[0][0]);
+  }
+  MS_LOG(INFO) << "Get " << *count << " rows which satisfy the index filter.";
+  return SUCCESS;
+}
+
 ROW_GROUP_BRIEF ShardReader::ReadRowGroupBrief(int group_id, int shard_id, const std::vector<std::string> &columns) {
   const auto &ret = shard_header_->GetPageByGroupId(group_id, shard_id);
   if (SUCCESS != ret.first) {
@@ -766,6 +855,20 @@ MSRStatus ShardReader::Finish() {
 }
 
 int64_t ShardReader::GetNumClasses(const std::string &category_field) {
+  if (use_manifest_) {
+    if (!IsCountedInManifest(category_field)) {
+      MS_LOG(ERROR) << "Field " << category_field << " is not counted in manifest.";
+      return -1;
+    }
+    // the categories are collected only for the field used
+    std::set<std::string> categories;
+    for (const auto &shard_categories : manifest_categories_) {
+      for (const auto &category : shard_categories[category_field].items()) {
+        categories.insert(category.key());
+      }
+    }
+    return static_cast<int64_t>(categories.size());
+  }
   auto shard_count = file_paths_.size();
   auto index_fields = shard_header_->GetFields();
 
@@ -802,19 +905,117 @@ int64_t ShardReader::GetNumClasses(const std::string &category_field) {
   return categories.size();
 }
 
-MSRStatus ShardReader::CountTotalRows(const std::vector<std::string> &file_paths, bool load_dataset,
-                                      const std::shared_ptr<ShardOperator> &ops, int64_t *count, const int num_padded) {
-  if (SUCCESS != Init(file_paths, load_dataset)) {
+bool ShardReader::IsCountedInManifest(const std::string &category_field) {
+  for (const auto &shard_categories : manifest_categories_) {
+    if (shard_categories.find(category_field) == shard_categories.end()) {
+      return false;
+    }
+  }
+  return true;
+}
+
+MSRStatus ShardReader::ReadManifest(const std::vector<std::string> &file_paths, bool load_dataset) {
+  std::map<std::string, json> manifests;
+  // directory and entry in manifest of each file
+  std::vector<std::pair<std::string, json>> shards;
+  std::string schema_hash;
+  try {
+    for (const auto &file : file_paths) {
+      auto dir = GetParentDir(file);
+      auto name = GetFileName(file);
+      if (dir.first != SUCCESS || name.first != SUCCESS) {
+        return FAILED;
+      }
+      bool found = false;
+      for (const auto &candidate : GetManifestCandidates(file)) {
+        if (manifests.find(candidate) == manifests.end()) {
+          std::ifstream fin(common::SafeCStr(candidate));
+          if (!fin.good()) continue;
+          manifests[candidate] = json::parse(fin);
+        }
+        const auto &manifest = manifests[candidate];
+        for (const auto &shard : manifest["shards"]) {
+          if (shard["name"].get<std::string>() != name.second) continue;
+          if (!schema_hash.empty() && manifest["schema_hash"].get<std::string>() != schema_hash) {
+            MS_LOG(DEBUG) << "Schema of manifest: " << candidate << " is different.";
+            return FAILED;
+          }
+          schema_hash = manifest["schema_hash"].get<std::string>();
+          found = true;
+          break;
+        }
+        if (!found) continue;
+        if (load_dataset) {
+          for (const auto &shard : manifest["shards"]) shards.emplace_back(dir.second, shard);
+        } else {
+          for (const auto &shard : manifest["shards"]) {
+            if (shard["name"].get<std::string>() == name.second) shards.emplace_back(dir.second, shard);
+          }
+        }
+        break;
+      }
+      if (!found) {
+        MS_LOG(DEBUG) << "File: " << file << " is not covered by manifest.";
+        return FAILED;
+      }
+    }
+
+    int64_t num_rows = 0;
+    std::vector<json> categories;
+    for (const auto &shard : shards) {
+      auto file_path = shard.first + shard.second["name"].get<std::string>();
+      auto file_stat = GetFileStat(file_path);
+      auto db_stat = GetFileStat(file_path + ".db");
+      if (file_stat.first != SUCCESS || file_stat.second.first != shard.second["size"].get<uint64_t>() ||
+          file_stat.second.second != shard.second["mtime"].get<int64_t>() || db_stat.first != SUCCESS ||
+          db_stat.second.first != shard.second["db_size"].get<uint64_t>() ||
+          db_stat.second.second != shard.second["db_mtime"].get<int64_t>()) {
+        MS_LOG(DEBUG) << "File: " << shard.second["name"] << " is modified after manifest is written.";
+        return FAILED;
+      }
+      num_rows += shard.second["num_rows"].get<int64_t>();
+      categories.push_back(shard.second["categories"]);
+    }
+    num_rows_ = num_rows;
+    manifest_categories_ = std::move(categories);
+  } catch (json::exception &e) {
+    MS_LOG(DEBUG) << "Failed to parse manifest, error: " << e.what();
     return FAILED;
   }
-  int64_t num_samples = num_rows_;
-  bool root = true;
+  use_manifest_ = true;
+  MS_LOG(INFO) << "Get number of rows and categories from manifest successfully.";
+  return SUCCESS;
+}
+
+MSRStatus ShardReader::CountTotalRows(const std::vector<std::string> &file_paths, bool load_dataset,
+                                      const std::shared_ptr<ShardOperator> &ops, int64_t *count, const int num_padded) {
   std::stack<std::shared_ptr<ShardOperator>> stack_ops;
+  std::vector<std::shared_ptr<ShardOperator>> filter_ops;
   std::shared_ptr<ShardOperator> op(ops);
   while (op != nullptr) {
     stack_ops.push(op);
+    if (std::dynamic_pointer_cast<ShardIndexFilter>(op)) {
+      filter_ops.push_back(op);
+    }
     op = op->GetChildOp();
   }
+  int64_t num_samples = 0;
+  if (filter_ops.empty()) {
+    if (SUCCESS != ReadManifest(file_paths, load_dataset) && SUCCESS != Init(file_paths, load_dataset)) {
+      return FAILED;
+    }
+    num_samples = num_rows_;
+  } else {
+    // rows are counted by the index, the manifest only records the number of all rows
+    if (SUCCESS != Init(file_paths, load_dataset)) {
+      return FAILED;
+    }
+    auto condition = GetIndexFilterCondition(filter_ops);
+    if (SUCCESS != condition.first || SUCCESS != CountRowsByCondition(condition.second, &num_samples)) {
+      return FAILED;
+    }
+  }
+  bool root = true;
   while (!stack_ops.empty()) {
     op = stack_ops.top();
     stack_ops.pop();
@@ -825,9 +1026,22 @@ MSRStatus ShardReader::CountTotalRows(const std::vector<std::string> &file_paths
         MS_LOG(DEBUG) << "Padding samples work on shuffle sampler.";
         root = false;
       }
+    } else if (std::dynamic_pointer_cast<ShardIndexFilter>(op)) {
+      num_samples = op->GetNumSamples(num_samples, 0);
     } else if (std::dynamic_pointer_cast<ShardCategory>(op)) {
+      if (!filter_ops.empty()) {
+        MS_LOG(ERROR) << "Index filter can not be used with category sampler.";
+        return FAILED;
+      }
       auto category_op = std::dynamic_pointer_cast<ShardCategory>(op);
       std::string category_field = category_op->GetCategoryField();
+      // the fields not counted in manifests, e.g. with too many categories, are counted by the databases
+      if (use_manifest_ && !IsCountedInManifest(category_field)) {
+        if (SUCCESS != Init(file_paths, load_dataset)) {
+          return FAILED;
+        }
+        use_manifest_ = false;
+      }
       auto num_classes = GetNumClasses(category_field);
       num_samples = category_op->GetNumSamples(num_samples, num_classes);
     } else if (std::dynamic_pointer_cast<ShardSample>(op)) {
@@ -1070,6 +1284,20 @@ MSRStatus ShardReader::CreateTasksByRow(const std::vector<std::tuple<int, int, i
 
 MSRStatus ShardReader::CreateTasks(const std::vector<std::tuple<int, int, int, uint64_t>> &row_group_summary,
                                    const std::vector<std::shared_ptr<ShardOperator>> &operators) {
+  auto condition = GetIndexFilterCondition(operators);
+  if (SUCCESS != condition.first) {
+    return FAILED;
+  }
+  index_filter_condition_ = condition.second;
+  if (!index_filter_condition_.empty()) {
+    bool has_category = std::any_of(operators.begin(), operators.end(), [](const std::shared_ptr<ShardOperator> &op) {
+      return std::dynamic_pointer_cast<ShardCategory>(op) != nullptr;
+    });
+    if (block_reader_ || has_category) {
+      MS_LOG(ERROR) << "Index filter can not be used in block-reader mode or with category sampler.";
+      return FAILED;
+    }
+  }
   if (block_reader_) {
     if (SUCCESS != CreateTasksByBlock(row_group_summary, operators)) {
       return FAILED;
@@ -1115,6 +1343,21 @@ MSRStatus ShardReader::CreateTasks(const std::vector<std::tuple<int, int, int, u
   return SUCCESS;
 }
 
+MSRStatus ShardReader::DecompressBlob(std::vector<uint8_t> *blob) {
+  const std::string &compression = shard_header_->GetCompression();
+  // dummy blob data is not compressed if there is no blob field
+  if (compression.empty() || shard_column_->GetNumBlobColumn() == 0) {
+    return SUCCESS;
+  }
+  std::vector<uint8_t> decompressed;
+  if (DecompressBytes(compression, *blob, &decompressed) != SUCCESS) {
+    MS_LOG(ERROR) << "Failed to decompress blob data by " << compression;
+    return FAILED;
+  }
+  blob->swap(decompressed);
+  return SUCCESS;
+}
+
 TASK_RETURN_CONTENT ShardReader::ConsumerOneTask(int task_id, uint32_t consumer_id) {
   // All tasks are done
   if (task_id >= static_cast<int>(tasks_.Size())) {
@@ -1143,24 +1386,41 @@ TASK_RETURN_CONTENT ShardReader::ConsumerOneTask(int task_id, uint32_t consumer_
   const std::shared_ptr<Page> &page = ret.second;
 
   // Pack image list
-  std::vector<uint8_t> images(addr[1] - addr[0]);
+  std::vector<uint8_t> images;
   auto file_offset = header_size_ + page_size_ * (page->GetPageID()) + addr[0];
+  if (use_mmap_) {
+    // Copy from the mapped file, no system call or file stream per consumer
+    if (file_offset + addr[1] - addr[0] > mapped_files_[shard_id].second) {
+      MS_LOG(ERROR) << "Blob data exceeds the size of file.";
+      return std::make_pair(
+        FAILED, std::make_pair(TaskType::kCommonTask, std::vector<std::tuple<std::vector<uint8_t>, json>>()));
+    }
+    const uint8_t *blob = mapped_files_[shard_id].first + file_offset;
+    images.assign(blob, blob + addr[1] - addr[0]);
+  } else {
+    images.resize(addr[1] - addr[0]);
+    auto &io_seekg = file_streams_random_[consumer_id][shard_id]->seekg(file_offset, std::ios::beg);
+    if (!io_seekg.good() || io_seekg.fail() || io_seekg.bad()) {
+      MS_LOG(ERROR) << "File seekg failed";
+      file_streams_random_[consumer_id][shard_id]->close();
+      return std::make_pair(
+        FAILED, std::make_pair(TaskType::kCommonTask, std::vector<std::tuple<std::vector<uint8_t>, json>>()));
+    }
 
-  auto &io_seekg = file_streams_random_[consumer_id][shard_id]->seekg(file_offset, std::ios::beg);
-  if (!io_seekg.good() || io_seekg.fail() || io_seekg.bad()) {
-    MS_LOG(ERROR) << "File seekg failed";
-    file_streams_random_[consumer_id][shard_id]->close();
-    return std::make_pair(FAILED,
-                          std::make_pair(TaskType::kCommonTask, std::vector<std::tuple<std::vector<uint8_t>, json>>()));
+    auto &io_read =
+      file_streams_random_[consumer_id][shard_id]->read(reinterpret_cast<char *>(&images[0]), addr[1] - addr[0]);
+    if (!io_read.good() || io_read.fail() || io_read.bad()) {
+      MS_LOG(ERROR) << "File read failed";
+      file_streams_random_[consumer_id][shard_id]->close();
+      return std::make_pair(FAILED,
+                            std::pair(TaskType::kCommonTask, std::vector<std::tuple<std::vector<uint8_t>, json>>()));
+    }
   }
 
-  auto &io_read =
-    file_streams_random_[consumer_id][shard_id]->read(reinterpret_cast<char *>(&images[0]), addr[1] - addr[0]);
-  if (!io_read.good() || io_read.fail() || io_read.bad()) {
-    MS_LOG(ERROR) << "File read failed";
-    file_streams_random_[consumer_id][shard_id]->close();
+  // Decompress in the worker thread
+  if (DecompressBlob(&images) != SUCCESS) {
     return std::make_pair(FAILED,
-                          std::pair(TaskType::kCommonTask, std::vector<std::tuple<std::vector<uint8_t>, json>>()));
+                          std::make_pair(TaskType::kCommonTask, std::vector<std::tuple<std::vector<uint8_t>, json>>()));
   }
 
   // Deliver batch data to output map
@@ -1303,6 +1563,9 @@ std::shared_ptr<std::vector<std::tuple<std::vector<uint8_t>, json>>> ShardReader
   auto &addr_end = offsets[rowId][1];
   std::vector<uint8_t> images(blob_page.begin() + addr_start, blob_page.begin() + addr_end);
   std::vector<std::tuple<std::vector<uint8_t>, json>> batch;
+  if (DecompressBlob(&images) != SUCCESS) {
+    return std::make_shared<std::vector<std::tuple<std::vector<uint8_t>, json>>>(std::move(batch));
+  }
   batch.emplace_back(std::move(images), std::move(labels[rowId]));
   return std::make_shared<std::vector<std::tuple<std::vector<uint8_t>, json>>>(std::move(batch));
 }
@@ -1413,12 +1676,194 @@ std::vector<std::tuple<std::vector<std::vector<uint8_t>>, pybind11::object>> Sha
   return data;
 }
 
+std::pair<MSRStatus, pybind11::object> ShardReader::GetNextBatchPy(int64_t batch_size) {
+  std::vector<std::tuple<std::vector<uint8_t>, json>> rows;
+  rows.swap(pending_rows_);
+  while (static_cast<int64_t>(rows.size()) < batch_size) {
+    auto res = GetNext();
+    if (res.empty()) break;
+    std::move(res.begin(), res.end(), std::back_inserter(rows));
+  }
+  if (static_cast<int64_t>(rows.size()) > batch_size) {
+    pending_rows_.assign(std::make_move_iterator(rows.begin() + batch_size), std::make_move_iterator(rows.end()));
+    rows.resize(batch_size);
+  }
+  if (rows.empty()) {
+    return {SUCCESS, pybind11::none()};
+  }
+
+  auto schema = shard_header_->GetSchemas()[0]->GetSchema()["schema"];
+  std::vector<std::vector<uint8_t>> blob_values;
+  std::vector<std::vector<uint64_t>> blob_offsets;
+  std::map<std::string, std::vector<int64_t>> int_columns;
+  std::map<std::string, std::vector<double>> float_columns;
+  std::map<std::string, pybind11::list> string_columns;
+  for (const auto &row : rows) {
+    auto ret = UnCompressBlob(std::get<0>(row));
+    if (ret.first != SUCCESS) {
+      return {FAILED, pybind11::none()};
+    }
+    if (blob_values.empty()) {
+      blob_values.resize(ret.second.size());
+      blob_offsets.assign(ret.second.size(), std::vector<uint64_t>(1, 0));
+    }
+    for (size_t i = 0; i < ret.second.size() && i < blob_values.size(); ++i) {
+      blob_values[i].insert(blob_values[i].end(), ret.second[i].begin(), ret.second[i].end());
+      blob_offsets[i].push_back(blob_values[i].size());
+    }
+    for (const auto &item : std::get<1>(row).items()) {
+      if (schema.find(item.key()) == schema.end()) continue;
+      std::string type = schema[item.key()]["type"];
+      if (type == "int32" || type == "int64") {
+        int_columns[item.key()].push_back(item.value().get<int64_t>());
+      } else if (type == "float32" || type == "float64") {
+        float_columns[item.key()].push_back(item.value().get<double>());
+      } else {
+        string_columns[item.key()].append(item.value().get<std::string>());
+      }
+    }
+  }
+
+  pybind11::list blob_columns;
+  for (size_t i = 0; i < blob_values.size(); ++i) {
+    blob_columns.append(pybind11::make_tuple(
+      pybind11::bytes(reinterpret_cast<const char *>(blob_values[i].data()), blob_values[i].size()),
+      pybind11::bytes(reinterpret_cast<const char *>(blob_offsets[i].data()), blob_offsets[i].size() * kInt64Len)));
+  }
+  pybind11::dict raw_columns;
+  for (const auto &column : int_columns) {
+    raw_columns[pybind11::str(column.first)] =
+      pybind11::bytes(reinterpret_cast<const char *>(column.second.data()), column.second.size() * sizeof(int64_t));
+  }
+  for (const auto &column : float_columns) {
+    raw_columns[pybind11::str(column.first)] =
+      pybind11::bytes(reinterpret_cast<const char *>(column.second.data()), column.second.size() * sizeof(double));
+  }
+  for (const auto &column : string_columns) {
+    raw_columns[pybind11::str(column.first)] = column.second;
+  }
+  return {SUCCESS, pybind11::make_tuple(rows.size(), blob_columns, raw_columns)};
+}
+
+std::pair<MSRStatus, std::vector<pybind11::object>> ShardReader::GetBlobViews(int shard_id, uint64_t blob_offset,
+                                                                              uint64_t blob_size) {
+  std::vector<pybind11::object> views;
+  const uint8_t *blob = mapped_files_[shard_id].first + blob_offset;
+  // Blob data compressed as a whole has to be decoded
+  if (!shard_header_->GetCompression().empty()) {
+    std::vector<uint8_t> raw_blob(blob, blob + blob_size);
+    if (DecompressBlob(&raw_blob) != SUCCESS) {
+      return {FAILED, {}};
+    }
+    auto ret = UnCompressBlob(raw_blob);
+    if (ret.first != SUCCESS) {
+      return {FAILED, {}};
+    }
+    for (const auto &column : ret.second) {
+      views.emplace_back(pybind11::bytes(reinterpret_cast<const char *>(column.data()), column.size()));
+    }
+    return {SUCCESS, std::move(views)};
+  }
+
+  auto loaded_columns = selected_columns_.size() == 0 ? shard_column_->GetColumnName() : selected_columns_;
+  auto blob_fields = GetBlobFields().second;
+  std::vector<uint8_t> raw_blob;
+  for (const auto &column_name : loaded_columns) {
+    auto it = std::find(blob_fields.begin(), blob_fields.end(), column_name);
+    if (it == blob_fields.end()) continue;
+    ColumnDataType column_data_type = ColumnNoDataType;
+    uint64_t column_data_type_size = 1;
+    std::vector<int64_t> column_shape;
+    (void)shard_column_->GetColumnTypeByName(column_name, &column_data_type, &column_data_type_size, &column_shape);
+
+    // Integer arrays compressed by shard column have to be decoded
+    if (shard_column_->CheckCompressBlob() && (column_data_type == ColumnInt32 || column_data_type == ColumnInt64)) {
+      if (raw_blob.empty()) {
+        raw_blob.assign(blob, blob + blob_size);
+      }
+      const unsigned char *data = nullptr;
+      std::unique_ptr<unsigned char[]> data_ptr;
+      uint64_t n_bytes = 0;
+      if (shard_column_->GetColumnFromBlob(column_name, raw_blob, &data, &data_ptr, &n_bytes) != SUCCESS) {
+        MS_LOG(ERROR) << "Error when get data from blob, column name is " << column_name << ".";
+        return {FAILED, {}};
+      }
+      if (data == nullptr) {
+        data = data_ptr.get();
+      }
+      views.emplace_back(pybind11::bytes(reinterpret_cast<const char *>(data), n_bytes));
+      continue;
+    }
+
+    // Locate the column in blob, every column has a big-endian uint64 length ahead if there are multiple columns
+    uint64_t shift_idx = 0;
+    uint64_t n_bytes = blob_size;
+    if (blob_fields.size() > 1) {
+      auto blob_id = static_cast<uint64_t>(it - blob_fields.begin());
+      for (uint64_t i = 0; i <= blob_id; i++) {
+        if (shift_idx + kInt64Len > blob_size) {
+          MS_LOG(ERROR) << "Blob data is corrupted, column name is " << column_name << ".";
+          return {FAILED, {}};
+        }
+        n_bytes = 0;
+        for (uint64_t j = 0; j < kInt64Len; j++) {
+          n_bytes = (n_bytes << kBitsOfByte) + blob[shift_idx + j];
+        }
+        shift_idx += kInt64Len;
+        if (i < blob_id) {
+          shift_idx += n_bytes;
+        }
+      }
+      if (shift_idx + n_bytes > blob_size) {
+        MS_LOG(ERROR) << "Blob data is corrupted, column name is " << column_name << ".";
+        return {FAILED, {}};
+      }
+    }
+    views.emplace_back(pybind11::make_tuple(shard_id, blob_offset + shift_idx, n_bytes));
+  }
+  return {SUCCESS, std::move(views)};
+}
+
+std::pair<MSRStatus, std::vector<std::tuple<std::vector<pybind11::object>, pybind11::object>>>
+ShardReader::GetBlobViewsPy(int64_t start, int64_t num) {
+  std::vector<std::tuple<std::vector<pybind11::object>, pybind11::object>> data;
+  if (!use_mmap_) {
+    MS_LOG(ERROR) << "Blob views are only available in mmap mode.";
+    return {FAILED, {}};
+  }
+  int64_t end = std::min(start + num, static_cast<int64_t>(tasks_.Size()));
+  for (int64_t task_id = std::max(start, static_cast<int64_t>(0)); task_id < end; ++task_id) {
+    auto task = tasks_.GetTaskByID(tasks_.permutation_[task_id]);
+    if (std::get<0>(task) == TaskType::kPaddedTask) continue;
+    auto shard_id = std::get<0>(std::get<1>(task));
+    auto group_id = std::get<1>(std::get<1>(task));
+    auto addr = std::get<2>(task);
+    const auto &ret = shard_header_->GetPageByGroupId(group_id, shard_id);
+    if (SUCCESS != ret.first) {
+      return {FAILED, {}};
+    }
+    uint64_t blob_offset = header_size_ + page_size_ * (ret.second->GetPageID()) + addr[0];
+    uint64_t blob_size = addr[1] - addr[0];
+    if (blob_offset + blob_size > mapped_files_[shard_id].second) {
+      MS_LOG(ERROR) << "Blob data exceeds the size of file.";
+      return {FAILED, {}};
+    }
+    auto views = GetBlobViews(shard_id, blob_offset, blob_size);
+    if (views.first != SUCCESS) {
+      return {FAILED, {}};
+    }
+    data.emplace_back(std::move(views.second), nlohmann::detail::FromJsonImpl(std::get<3>(task)));
+  }
+  return {SUCCESS, std::move(data)};
+}
+
 void ShardReader::Reset() {
   {
     std::lock_guard<std::mutex> lck(mtx_delivery_);
     task_id_ = 0;
     deliver_id_ = 0;
   }
+  pending_rows_.clear();
   cv_delivery_.notify_all();
 }
 
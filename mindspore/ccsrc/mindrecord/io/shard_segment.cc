@@ -229,6 +229,10 @@ std::pair<MSRStatus, std::vector<uint8_t>> ShardSegment::PackImages(int group_id
     return {FAILED, {}};
   }
 
+  if (DecompressBlob(&images) != SUCCESS) {
+    return {FAILED, {}};
+  }
+
   return {SUCCESS, std::move(images)};
 }
 
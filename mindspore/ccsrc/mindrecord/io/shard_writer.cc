@@ -17,6 +17,7 @@
 #include "mindrecord/include/shard_writer.h"
 #include "common/utils.h"
 #include "mindrecord/include/common/shard_utils.h"
+#include "mindrecord/include/shard_compression.h"
 #include "./securec.h"
 
 using mindspore::LogStream;
@@ -455,6 +456,47 @@ MSRStatus ShardWriter::CheckData(const std::map<uint64_t, std::vector<json>> &ra
   return SUCCESS;
 }
 
+void ShardWriter::CompressSliceBlob(int start_row, int end_row, std::vector<std::vector<uint8_t>> &blob_data,
+                                    std::atomic<bool> &failed) {
+  const std::string compression = shard_header_->GetCompression();
+  std::vector<uint8_t> compressed;
+  for (int i = start_row; i < end_row; ++i) {
+    if (CompressBytes(compression, blob_data[i], &compressed) == FAILED) {
+      failed = true;
+      return;
+    }
+    blob_data[i].swap(compressed);
+  }
+}
+
+MSRStatus ShardWriter::CompressBlobData(std::vector<std::vector<uint8_t>> &blob_data) {
+  if (shard_header_->GetCompression().empty() || blob_data.empty()) {
+    return SUCCESS;
+  }
+  int row_count = static_cast<int>(blob_data.size());
+  int thread_num = static_cast<int>(std::thread::hardware_concurrency());
+  if (thread_num <= 0) {
+    thread_num = kThreadNumber;
+  }
+  thread_num = std::min(std::min(thread_num, kMaxThreadCount), row_count);
+  std::atomic<bool> failed(false);
+  std::vector<std::thread> thread_set(thread_num);
+  for (int x = 0; x < thread_num; ++x) {
+    int start_row = row_count * x / thread_num;
+    int end_row = row_count * (x + 1) / thread_num;
+    thread_set[x] =
+      std::thread(&ShardWriter::CompressSliceBlob, this, start_row, end_row, std::ref(blob_data), std::ref(failed));
+  }
+  for (int x = 0; x < thread_num; ++x) {
+    thread_set[x].join();
+  }
+  if (failed) {
+    MS_LOG(ERROR) << "Failed to compress blob data by " << shard_header_->GetCompression();
+    return FAILED;
+  }
+  return SUCCESS;
+}
+
 std::tuple<MSRStatus, int, int> ShardWriter::ValidateRawData(std::map<uint64_t, std::vector<json>> &raw_data,
                                                              std::vector<std::vector<uint8_t>> &blob_data, bool sign) {
   auto rawdata_iter = raw_data.begin();
@@ -618,6 +660,11 @@ MSRStatus ShardWriter::WriteRawDataPreCheck(std::map<uint64_t, std::vector<json>
     }
   }
 
+  // compress blob by the codec of shard header
+  if (CompressBlobData(blob_data) == FAILED) {
+    return FAILED;
+  }
+
   // Add 4-bytes dummy blob data if no any blob fields
   if (blob_data.size() == 0 && raw_data.size() > 0) {
     blob_data = std::vector<std::vector<uint8_t>>(raw_data[0].size(), std::vector<uint8_t>(kUnsignedInt4, 0));
@@ -750,6 +797,54 @@ MSRStatus ShardWriter::WriteRawData(std::map<uint64_t, std::vector<py::handle>>
   return WriteRawData(raw_data_json, blob_data, sign, parallel_writer);
 }
 
+MSRStatus ShardWriter::WriteColumns(const py::dict &raw_columns, const py::buffer &blob,
+                                    const py::buffer &blob_offsets, bool sign, bool parallel_writer) {
+  py::buffer_info blob_info = blob.request();
+  py::buffer_info offsets_info = blob_offsets.request();
+  if (blob_info.itemsize != 1 || offsets_info.ndim != 1 ||
+      (offsets_info.size > 0 && offsets_info.format != py::format_descriptor<int64_t>::format())) {
+    MS_LOG(ERROR) << "Blob should be a bytes buffer and blob offsets should be a 1-D int64 buffer";
+    return FAILED;
+  }
+
+  // Split the blob buffer to the blob of each row
+  std::vector<std::vector<uint8_t>> blob_data;
+  if (offsets_info.size > 0) {
+    auto offsets = static_cast<const int64_t *>(offsets_info.ptr);
+    auto data = static_cast<const uint8_t *>(blob_info.ptr);
+    int64_t row_count = offsets_info.size - 1;
+    blob_data.reserve(row_count);
+    for (int64_t i = 0; i < row_count; ++i) {
+      if (offsets[i] < 0 || offsets[i] > offsets[i + 1] || offsets[i + 1] > blob_info.size) {
+        MS_LOG(ERROR) << "Blob offsets are out of range at row " << i;
+        return FAILED;
+      }
+      blob_data.emplace_back(data + offsets[i], data + offsets[i + 1]);
+    }
+  }
+
+  // Build the json of each row from the raw columns
+  std::map<uint64_t, std::vector<json>> raw_data;
+  if (!raw_columns.empty()) {
+    std::vector<json> rows;
+    for (const auto &column : raw_columns) {
+      std::string field = py::str(column.first);
+      auto values = py::reinterpret_borrow<py::list>(column.second);
+      if (rows.empty()) {
+        rows = std::vector<json>(values.size(), json::object());
+      } else if (values.size() != rows.size()) {
+        MS_LOG(ERROR) << "Row count of column " << field << " is not equal to the other columns";
+        return FAILED;
+      }
+      for (size_t i = 0; i < values.size(); ++i) {
+        rows[i][field] = nlohmann::detail::ToJsonImpl(values[i]);
+      }
+    }
+    raw_data[0] = std::move(rows);
+  }
+  return WriteRawData(raw_data, blob_data, sign, parallel_writer);
+}
+
 MSRStatus ShardWriter::ParallelWriteData(const std::vector<std::vector<uint8_t>> &blob_data,
                                          const std::vector<std::vector<uint8_t>> &bin_raw_data) {
   auto shards = BreakIntoShards();
@@ -23,6 +23,7 @@
 #include <vector>
 
 #include "common/utils.h"
+#include "mindrecord/include/shard_compression.h"
 #include "mindrecord/include/shard_error.h"
 #include "mindrecord/include/shard_page.h"
 
@@ -54,6 +55,13 @@ MSRStatus ShardHeader::InitializeHeader(const std::vector<json> &headers, bool l
       ParseShardAddress(header["shard_addresses"]);
       header_size_ = header["header_size"].get<uint64_t>();
       page_size_ = header["page_size"].get<uint64_t>();
+      if (header.find("compression") != header.end()) {
+        compression_ = header["compression"].get<std::string>();
+        if (!IsSupportedCompression(compression_)) {
+          MS_LOG(ERROR) << "Compression " << compression_ << " is not supported.";
+          return FAILED;
+        }
+      }
     }
     ParsePage(header["page"], shard_index, load_dataset);
     shard_index++;
@@ -151,6 +159,9 @@ std::pair<MSRStatus, json> ShardHeader::BuildSingleHeader(const std::string &fil
                  {"blob_fields", raw_header["schema"][0]["blob_fields"]},
                  {"schema", raw_header["schema"][0]["schema"]},
                  {"version", raw_header["version"]}};
+  if (raw_header.find("compression") != raw_header.end()) {
+    header["compression"] = raw_header["compression"];
+  }
   return {SUCCESS, header};
 }
 
@@ -234,6 +245,15 @@ MSRStatus ShardHeader::InitByFiles(const std::vector<std::string> &file_paths) {
 
 void ShardHeader::ParseHeader(const json &header) {}
 
+MSRStatus ShardHeader::SetCompression(const std::string &compression) {
+  if (!IsSupportedCompression(compression)) {
+    MS_LOG(ERROR) << "Compression " << compression << " is not supported.";
+    return FAILED;
+  }
+  compression_ = compression;
+  return SUCCESS;
+}
+
 MSRStatus ShardHeader::ParseIndexFields(const json &index_fields) {
   std::vector<std::pair<uint64_t, std::string>> parsed_index_fields;
   for (auto &index_field : index_fields) {
@@ -335,11 +355,14 @@ std::vector<std::string> ShardHeader::SerializeHeader() {
       s += "\"index_fields\":" + index + ",";
       s += "\"page\":" + pages[shardId] + ",";
       s += "\"page_size\":" + std::to_string(page_size_) + ",";
+      if (!compression_.empty()) {
+        s += "\"compression\":\"" + compression_ + "\",";
+      }
       s += "\"schema\":" + schema + ",";
       s += "\"shard_addresses\":" + address + ",";
       s += "\"shard_id\":" + std::to_string(shardId) + ",";
       s += "\"statistics\":" + stats + ",";
-      s += "\"version\":\"" + std::string(kVersion) + "\"";
+      s += "\"version\":\"" + std::string(compression_.empty() ? kVersion : kCompressedVersion) + "\"";
       s += "}";
       header.emplace_back(s);
     }
@@ -0,0 +1,94 @@
+/**
+ * Copyright 2019 Huawei Technologies Co., Ltd
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#include "mindrecord/include/shard_index_filter.h"
+#include "mindrecord/include/shard_index_generator.h"
+
+using mindspore::LogStream;
+using mindspore::ExceptionType::NoExceptionType;
+using mindspore::MsLogLevel::ERROR;
+
+namespace mindspore {
+namespace mindrecord {
+ShardIndexFilter::ShardIndexFilter(const INDEX_CONDITIONS &conditions) : conditions_(conditions) {}
+
+MSRStatus ShardIndexFilter::Execute(ShardTask &tasks) { return SUCCESS; }
+
+int64_t ShardIndexFilter::GetNumSamples(int64_t dataset_size, int64_t num_classes) { return dataset_size; }
+
+std::pair<MSRStatus, std::string> ShardIndexFilter::GetSqlCondition(
+  const json &schema, const std::vector<std::pair<uint64_t, std::string>> &index_fields) {
+  std::string condition;
+  for (const auto &item : conditions_) {
+    const auto &field = std::get<0>(item);
+    const auto &op = std::get<1>(item);
+    const auto &values = std::get<2>(item);
+    auto it = std::find_if(index_fields.begin(), index_fields.end(),
+                           [&field](const std::pair<uint64_t, std::string> &x) { return x.second == field; });
+    if (it == index_fields.end() || schema.find(field) == schema.end()) {
+      MS_LOG(ERROR) << "Field " << field << " is not an index field.";
+      return {FAILED, ""};
+    }
+    if (std::find(kIndexFilterOperators.begin(), kIndexFilterOperators.end(), op) == kIndexFilterOperators.end() ||
+        values.empty() || (op != "in" && values.size() != 1)) {
+      MS_LOG(ERROR) << "Condition on field " << field << " is invalid, operator: " << op;
+      return {FAILED, ""};
+    }
+    auto field_name = ShardIndexGenerator::GenerateFieldName(*it);
+    if (field_name.first != SUCCESS) {
+      return {FAILED, ""};
+    }
+
+    // number values are checked and the quotes in string values are escaped to avoid sql injection
+    bool is_number = kNumberFieldTypeSet.find(schema[field]["type"]) != kNumberFieldTypeSet.end();
+    std::vector<std::string> literals;
+    for (const auto &value : values) {
+      if (is_number) {
+        size_t pos = 0;
+        try {
+          (void)std::stold(value, &pos);
+        } catch (const std::exception &e) {
+          pos = 0;
+        }
+        if (value.empty() || pos != value.size()) {
+          MS_LOG(ERROR) << "Value " << value << " of field " << field << " is not a number.";
+          return {FAILED, ""};
+        }
+        literals.push_back(value);
+      } else {
+        std::string literal = "'";
+        for (const auto &c : value) {
+          literal += (c == '\'') ? std::string("''") : std::string(1, c);
+        }
+        literals.push_back(literal + "'");
+      }
+    }
+
+    condition += condition.empty() ? "" : " AND ";
+    if (op == "in") {
+      condition += field_name.second + " IN (";
+      for (size_t i = 0; i < literals.size(); ++i) {
+        condition += (i == 0 ? "" : ", ") + literals[i];
+      }
+      condition += ")";
+    } else {
+      condition += field_name.second + " " + (op == "==" ? "=" : op) + " " + literals[0];
+    }
+  }
+  return {SUCCESS, condition};
+}
+}  // namespace mindrecord
+}  // namespace mindspore
@@ -139,7 +139,11 @@ class Parameter:
         x = copy(self)
         x.name = prefix + '.' + x.name
         x.is_init = False
-        if init != 'same':
+        x._owned_data = None
+        if init == 'same':
+            # the data is shared with the clone, it can not be updated in place for either of them
+            self._owned_data = None
+        else:
             shape = self.default_input.shape
             dtype = self.default_input.dtype
             if isinstance(init, (str, Initializer, numbers.Number)):
@@ -211,10 +215,13 @@ class Parameter:
         """Set `default_input` of current `Parameter`."""
         if isinstance(data, bool):
             raise ValueError('Parameter data can not be `bool`')
+        # the tensor whose buffer is created for this parameter only, which could be updated in place
+        self._owned_data = None
         if isinstance(data, Tensor):
             # make a copy of Tensor to init the parameter
             data = Tensor(data.asnumpy().copy())
             data.init_flag = False
+            self._owned_data = data
         elif isinstance(data, Initializer):
             self.init_mode = data
             data = MetaTensor(self.init_mode.dtype, self.init_mode.shape)
@@ -26,6 +26,7 @@ from .datasets import *
 from .iterators import *
 from .serializer_deserializer import serialize, deserialize, show, compare
 from .samplers import *
+from .predicates import index_field
 from ..core.configuration import config, ConfigurationManager
 
 __all__ = ["config", "ConfigurationManager", "zip",
@@ -33,4 +34,5 @@ __all__ = ["config", "ConfigurationManager", "zip",
            "MindDataset", "GeneratorDataset", "TFRecordDataset", "CLUEDataset",
            "ManifestDataset", "Cifar10Dataset", "Cifar100Dataset", "CelebADataset",
            "VOCDataset", "CocoDataset", "TextFileDataset", "Schema", "DistributedSampler",
-           "PKSampler", "RandomSampler", "SequentialSampler", "SubsetRandomSampler", "WeightedRandomSampler"]
+           "PKSampler", "RandomSampler", "SequentialSampler", "SubsetRandomSampler", "WeightedRandomSampler",
+           "index_field"]
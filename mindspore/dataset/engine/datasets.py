@@ -39,6 +39,7 @@ from mindspore._c_expression import typing
 from mindspore import log as logger
 from . import samplers
 from .iterators import DictIterator, TupleIterator
+from .predicates import IndexPredicate
 from .validators import check_batch, check_shuffle, check_map, check_filter, check_repeat, check_skip, check_zip, \
     check_rename, check_numpyslicesdataset, \
     check_take, check_project, check_imagefolderdatasetv2, check_mnist_cifar_dataset, check_manifestdataset, \
@@ -894,8 +895,9 @@ class Dataset:
 
         return ProjectDataset(self, columns)
 
-    def build_vocab(self, vocab, columns, freq_range, top_k, special_tokens, special_first):
-        return BuildVocabDataset(self, vocab, columns, freq_range, top_k, special_tokens, special_first)
+    def build_vocab(self, vocab, columns, freq_range, top_k, special_tokens, special_first, word_count_file=None):
+        return BuildVocabDataset(self, vocab, columns, freq_range, top_k, special_tokens, special_first,
+                                 word_count_file=word_count_file)
 
     def apply(self, apply_func):
         """
@@ -2674,6 +2676,8 @@ class MindDataset(MappableDataset):
             plus num_padded should be divisible by num_shards.
         num_samples (int, optional): The number of samples to be included in the dataset
             (default=None, all samples).
+        use_mmap (bool, optional): Whether to map the files into memory and read blob data from
+            the mapping instead of the file streams of each reader (default=False).
 
     Raises:
         ValueError: If num_shards is specified but shard_id is None.
@@ -2685,7 +2689,7 @@ class MindDataset(MappableDataset):
     def __init__(self, dataset_file, columns_list=None, num_parallel_workers=None,
                  shuffle=None, num_shards=None, shard_id=None,
                  block_reader=False, sampler=None, padded_sample=None,
-                 num_padded=None, num_samples=None):
+                 num_padded=None, num_samples=None, use_mmap=False):
         super().__init__(num_parallel_workers)
         if isinstance(dataset_file, list):
             self.load_dataset = False
@@ -2725,6 +2729,8 @@ class MindDataset(MappableDataset):
         self.block_reader = block_reader
         self.padded_sample = padded_sample
         self.num_padded = num_padded
+        self.use_mmap = use_mmap
+        self.index_filter = None
 
     def get_args(self):
         args = super().get_args()
@@ -2742,11 +2748,54 @@ class MindDataset(MappableDataset):
         args["shuffle_option"] = self.shuffle_option
         args["num_samples"] = self.num_samples
         args["block_reader"] = self.block_reader
+        args["use_mmap"] = self.use_mmap
         args["num_padded"] = self.num_padded
         args["padded_sample"] = padded_sample
         args["sampler"] = self.sampler
+        args["index_filter"] = self.index_filter
         return args
 
+    @check_filter
+    def filter(self, predicate, input_columns=None, num_parallel_workers=1):
+        """
+        Filter dataset by predicate.
+
+        IndexPredicate built by index_field is pushed into the index of the MindRecord files, so only the matching
+        rows are read and the size of filtered dataset is known without reading. The fields of it must be index
+        fields. It is applied on rows as other predicates when block_reader, PKSampler or padded_sample is used,
+        or input_columns differs from the fields of it.
+
+        Args:
+            predicate (callable): python callable which returns a boolean value, if False then filter the element.
+            input_columns (list[str], optional): List of names of the input columns, when
+                default=None, the predicate will be applied on all columns in the dataset.
+            num_parallel_workers (int, optional): Number of workers to process the Dataset
+                in parallel (default=None).
+
+        Returns:
+            MindDataset if predicate is pushed into the index, otherwise FilterDataset.
+
+        Examples:
+            >>> import mindspore.dataset as ds
+            >>> from mindspore.dataset import index_field
+            >>> data = ds.MindDataset("test.mindrecord")
+            >>> data = data.filter((index_field("label") > 2) & (index_field("label") != 5))
+        """
+        if not isinstance(predicate, IndexPredicate):
+            return super().filter(predicate, input_columns, num_parallel_workers)
+        push_down = not self.block_reader and self.padded_sample is None and \
+                    not isinstance(self.sampler, samplers.PKSampler) and \
+                    (input_columns is None or list(input_columns) == predicate.columns)
+        if not push_down:
+            if input_columns is None:
+                input_columns = predicate.columns
+            return super().filter(predicate, input_columns, num_parallel_workers)
+        dataset = copy.copy(self)
+        dataset.input = []
+        dataset.output = []
+        dataset.index_filter = (self.index_filter or []) + predicate.to_index_conditions()
+        return dataset
+
     def get_dataset_size(self):
         """
         Get the number of batches in an epoch.
@@ -2759,7 +2808,8 @@ class MindDataset(MappableDataset):
                 dataset_file = [self.dataset_file]
             else:
                 dataset_file = self.dataset_file
-            num_rows = MindRecordOp.get_num_rows(dataset_file, self.load_dataset, self.sampler, self.num_padded)
+            num_rows = MindRecordOp.get_num_rows(dataset_file, self.load_dataset, self.sampler, self.num_padded,
+                                                 self.index_filter)
             return num_rows
         return self._dataset_size
 
@@ -4873,10 +4923,12 @@ class BuildVocabDataset(DatasetOp):
         special_first(bool, optional): whether special_tokens will be prepended/appended to vocab, If special_tokens
             is specified and special_first is set to None, special_tokens will be prepended. (default=None).
         prefetch_size (int, optional): prefetch number of records ahead of the user's request (default=None).
+        word_count_file(str, optional): file keeping the word counts, the counts in it are added to the counts of
+            the dataset, then the merged counts are saved back to it (default=None, word counts are not kept).
     """
 
     def __init__(self, input_dataset, vocab, columns, freq_range, top_k, special_tokens, special_first,
-                 prefetch_size=None):
+                 prefetch_size=None, word_count_file=None):
         super().__init__()
         self.columns = columns
         self.input.append(input_dataset)
@@ -4886,6 +4938,7 @@ class BuildVocabDataset(DatasetOp):
         self.top_k = top_k
         self.special_tokens = special_tokens
         self.special_first = special_first
+        self.word_count_file = word_count_file
         input_dataset.output.append(self)
 
     def get_args(self):
@@ -4897,6 +4950,7 @@ class BuildVocabDataset(DatasetOp):
         args["top_k"] = self.top_k
         args["special_tokens"] = self.special_tokens
         args["special_first"] = self.special_first
+        args["word_count_file"] = self.word_count_file
         return args
 
     def __deepcopy__(self, memodict):
@@ -4915,5 +4969,6 @@ class BuildVocabDataset(DatasetOp):
         new_op.vocab = self.vocab
         new_op.special_tokens = copy.deepcopy(self.special_tokens)
         new_op.special_first = copy.deepcopy(self.special_first)
+        new_op.word_count_file = self.word_count_file
 
         return new_op
@@ -0,0 +1,181 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Declarative predicates on the index fields of MindRecord, which could be pushed into the index of
+MindDataset by filter instead of being evaluated on every row.
+"""
+import math
+import numpy as np
+
+__all__ = ['index_field', 'IndexField', 'IndexPredicate']
+
+
+def _to_literal(value):
+    """Convert the value compared with an index field to the literal passed to the index."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, bool):
+        return str(int(value))
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            raise ValueError("Value {} compared with index field should be finite.".format(value))
+        return repr(value)
+    if isinstance(value, str):
+        return value
+    raise TypeError("Value {} compared with index field should be int, float or str.".format(value))
+
+
+def _to_scalar(value):
+    """Convert the column of a row to python scalar."""
+    value = np.asarray(value)
+    if value.size != 1:
+        raise ValueError("Index predicate could only be applied on scalar columns.")
+    value = value.reshape(()).item()
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+_COMPARATORS = {
+    "==": lambda x, values: x == values[0],
+    "!=": lambda x, values: x != values[0],
+    "<": lambda x, values: x < values[0],
+    "<=": lambda x, values: x <= values[0],
+    ">": lambda x, values: x > values[0],
+    ">=": lambda x, values: x >= values[0],
+    "in": lambda x, values: x in values,
+}
+
+
+class IndexPredicate:
+    """
+    Conjunction of comparisons on index fields.
+
+    It is callable with the columns in the order of `columns`, so it works as a normal filter predicate on any
+    dataset, while MindDataset pushes it into the index and only reads the matching rows.
+
+    Args:
+        conditions (list[tuple]): Tuples of index field, comparison operator and the values compared with.
+    """
+
+    def __init__(self, conditions):
+        for field, op, values in conditions:
+            if op not in _COMPARATORS:
+                raise ValueError("Comparison operator {} on field {} is not supported.".format(op, field))
+            if not values or (op != "in" and len(values) != 1):
+                raise ValueError("Comparison {} on field {} takes wrong number of values.".format(op, field))
+            for value in values:
+                _to_literal(value)
+        self.conditions = list(conditions)
+
+    def __and__(self, other):
+        if not isinstance(other, IndexPredicate):
+            return NotImplemented
+        return IndexPredicate(self.conditions + other.conditions)
+
+    @property
+    def columns(self):
+        """Names of the fields used by the predicate, in order of first use."""
+        columns = []
+        for field, _, _ in self.conditions:
+            if field not in columns:
+                columns.append(field)
+        return columns
+
+    def to_index_conditions(self):
+        """
+        Get the conditions with values converted to string literals, as consumed by the MindRecord index.
+
+        Returns:
+            list[tuple], tuples of index field, comparison operator and list of literals.
+        """
+        return [(field, op, [_to_literal(value) for value in values]) for field, op, values in self.conditions]
+
+    def __call__(self, *args):
+        if len(args) != len(self.columns):
+            raise ValueError("Index predicate takes {} columns {}, but got {}.".format(
+                len(self.columns), self.columns, len(args)))
+        row = {name: _to_scalar(value) for name, value in zip(self.columns, args)}
+        return all(_COMPARATORS[op](row[field], values) for field, op, values in self.conditions)
+
+    def __repr__(self):
+        return " & ".join("({} {} {})".format(field, op, values if op == "in" else repr(values[0]))
+                          for field, op, values in self.conditions)
+
+
+class IndexField:
+    """
+    Index field of MindRecord, compared with values to build IndexPredicate.
+
+    Args:
+        name (str): Name of the index field.
+    """
+
+    def __init__(self, name):
+        if not isinstance(name, str) or not name:
+            raise ValueError("Name of index field should be a non-empty str.")
+        self.name = name
+
+    __hash__ = None
+
+    def __eq__(self, other):
+        return IndexPredicate([(self.name, "==", [other])])
+
+    def __ne__(self, other):
+        return IndexPredicate([(self.name, "!=", [other])])
+
+    def __lt__(self, other):
+        return IndexPredicate([(self.name, "<", [other])])
+
+    def __le__(self, other):
+        return IndexPredicate([(self.name, "<=", [other])])
+
+    def __gt__(self, other):
+        return IndexPredicate([(self.name, ">", [other])])
+
+    def __ge__(self, other):
+        return IndexPredicate([(self.name, ">=", [other])])
+
+    def isin(self, values):
+        """
+        Build the predicate that the field is one of the values.
+
+        Args:
+            values (list): Values of the field to be kept.
+
+        Returns:
+            IndexPredicate, the predicate.
+        """
+        return IndexPredicate([(self.name, "in", list(values))])
+
+
+def index_field(name):
+    """
+    Refer to an index field of MindRecord to build predicates for filter.
+
+    Args:
+        name (str): Name of the index field.
+
+    Returns:
+        IndexField, the field to be compared with values.
+
+    Examples:
+        >>> import mindspore.dataset as ds
+        >>> from mindspore.dataset import index_field
+        >>> data = ds.MindDataset("test.mindrecord", shuffle=False)
+        >>> # only the rows which satisfy the predicate are read from the files
+        >>> data = data.filter((index_field("label") >= 3) & index_field("file_name").isin(["a.jpg", "b.jpg"]))
+    """
+    return IndexField(name)
@@ -454,7 +454,7 @@ def check_minddataset(method):
 
         nreq_param_int = ['num_samples', 'num_parallel_workers', 'seed', 'num_shards', 'shard_id', 'num_padded']
         nreq_param_list = ['columns_list']
-        nreq_param_bool = ['block_reader']
+        nreq_param_bool = ['block_reader', 'use_mmap']
         nreq_param_dict = ['padded_sample']
 
         # check dataset_file; required argument
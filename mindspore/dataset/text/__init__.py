@@ -27,7 +27,8 @@ __all__ = [
 
 if platform.system().lower() != 'windows':
     from .transforms import UnicodeScriptTokenizer, WhitespaceTokenizer, CaseFold, NormalizeUTF8, \
-        RegexReplace, RegexTokenizer, BasicTokenizer, BertTokenizer
+        RegexReplace, RegexTokenizer, BasicTokenizer, BertTokenizer, BertEncode
 
     __all__.append(["UnicodeScriptTokenizer", "WhitespaceTokenizer", "CaseFold", "NormalizeUTF8",
-                    "RegexReplace", "RegexTokenizer", "BasicTokenizer", "BertTokenizer", "NormalizeForm"])
+                    "RegexReplace", "RegexTokenizer", "BasicTokenizer", "BertTokenizer", "BertEncode",
+                    "NormalizeForm"])
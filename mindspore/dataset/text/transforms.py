@@ -24,7 +24,7 @@ import mindspore._c_dataengine as cde
 from .utils import JiebaMode, NormalizeForm
 from .validators import check_lookup, check_jieba_add_dict, \
     check_jieba_add_word, check_jieba_init, check_ngram, check_pair_truncate, \
-    check_to_number
+    check_to_number, check_bert_encode, check_wordpiece_tokenizer, check_bert_tokenizer
 from ..core.datatypes import mstype_to_detype
 
 
@@ -196,14 +196,21 @@ class WordpieceTokenizer(cde.WordpieceTokenizerOp):
         max_bytes_per_token(int, optional): Tokens exceeding this length will not be further split(default 100).
         unknown_token(string, optional): When we can not found the token: if 'unknown_token' is empty string,
             return the token directly, else return 'unknown_token'(default '[UNK]').
+        cache_size(int, optional): Number of most recently tokenized words whose subwords are cached, the cache
+            is shared by all the workers of the map. 0 disables the cache(default 10000). The cache hits and misses
+            are reported by dataset profiling, and can be read with get_cache_stats().
     """
 
-    def __init__(self, vocab, suffix_indicator='##', max_bytes_per_token=100, unknown_token='[UNK]'):
+    @check_wordpiece_tokenizer
+    def __init__(self, vocab, suffix_indicator='##', max_bytes_per_token=100, unknown_token='[UNK]',
+                 cache_size=10000):
         self.vocab = vocab
         self.suffix_indicator = suffix_indicator
         self.max_bytes_per_token = max_bytes_per_token
         self.unknown_token = unknown_token
-        super().__init__(self.vocab, self.suffix_indicator, self.max_bytes_per_token, self.unknown_token)
+        self.cache_size = cache_size
+        super().__init__(self.vocab, self.suffix_indicator, self.max_bytes_per_token, self.unknown_token,
+                         self.cache_size)
 
 
 if platform.system().lower() != 'windows':
@@ -338,11 +345,15 @@ if platform.system().lower() != 'windows':
                 only effective when 'lower_case' is False. See NormalizeUTF8 for details(default 'NONE').
             preserve_unused_token(bool, optional), If True, do not split special tokens like
                 '[CLS]', '[SEP]', '[UNK]', '[PAD]', '[MASK]'(default True).
+            cache_size(int, optional): Number of most recently tokenized words whose subwords are cached, the cache
+                is shared by all the workers of the map. 0 disables the cache(default 10000). The cache hits and
+                misses are reported by dataset profiling, and can be read with get_cache_stats().
         """
 
+        @check_bert_tokenizer
         def __init__(self, vocab, suffix_indicator='##', max_bytes_per_token=100,
                      unknown_token='[UNK]', lower_case=False, keep_whitespace=False,
-                     normalization_form=NormalizeForm.NONE, preserve_unused_token=True):
+                     normalization_form=NormalizeForm.NONE, preserve_unused_token=True, cache_size=10000):
             self.vocab = vocab
             self.suffix_indicator = suffix_indicator
             self.max_bytes_per_token = max_bytes_per_token
@@ -351,8 +362,72 @@ if platform.system().lower() != 'windows':
             self.keep_whitespace = keep_whitespace
             self.normalization_form = DE_C_INTER_NORMALIZE_FORM[normalization_form]
             self.preserve_unused_token = preserve_unused_token
+            self.cache_size = cache_size
             super().__init__(self.vocab, self.suffix_indicator, self.max_bytes_per_token, self.unknown_token,
-                             self.lower_case, self.keep_whitespace, self.normalization_form, self.preserve_unused_token)
+                             self.lower_case, self.keep_whitespace, self.normalization_form, self.preserve_unused_token,
+                             self.cache_size)
+
+
+    class BertEncode(cde.BertEncodeOp):
+        """
+        Fused Bert input op, equivalent to BertTokenizer, Lookup, TruncateSequencePair and padding
+        with [CLS] and [SEP] inserted, in a single op.
+
+        Takes one scalar string column, or two for a text pair, and outputs three int32 columns of
+        length max_seq_len: input_ids, token_type_ids and attention_mask. Subwords are looked up
+        while they are matched, so no intermediate string or id tensors are built.
+
+        Args:
+            vocab(Vocab): a Vocab object, it must contain unknown_token, cls_token, sep_token and pad_token.
+            max_seq_len(int): Length of the output columns, the texts are truncated longest first to fit.
+            suffix_indicator(string, optional): Used to show that the subword is the last part of a word(default '##').
+            max_bytes_per_token(int, optional): Tokens exceeding this length will not be further split(default 100).
+            unknown_token(string, optional): Token whose id is used for words which can not be tokenized
+                (default '[UNK]').
+            lower_case(bool, optional): If True, apply CaseFold, NormalizeUTF8(NFD mode), RegexReplace operation
+                on input text to make the text to lower case and strip accents characters; If False, only apply
+                NormalizeUTF8('normalization_form' mode) operation on input text(default False).
+            keep_whitespace(bool, optional), If True, the whitespace will be kept in out tokens(default False).
+            normalization_form(Enum, optional), Used to specify a specific normlaize mode,
+                only effective when 'lower_case' is False. See NormalizeUTF8 for details(default 'NONE').
+            preserve_unused_token(bool, optional), If True, do not split special tokens like
+                '[CLS]', '[SEP]', '[UNK]', '[PAD]', '[MASK]'(default True).
+            cls_token(string, optional): Token inserted at the beginning(default '[CLS]').
+            sep_token(string, optional): Token inserted after each text(default '[SEP]').
+            pad_token(string, optional): Token padding the input_ids up to max_seq_len(default '[PAD]').
+            cache_size(int, optional): Number of most recently tokenized words whose subwords are cached, the cache
+                is shared by all the workers of the map. 0 disables the cache(default 10000). The cache hits and
+                misses are reported by dataset profiling, and can be read with get_cache_stats().
+
+        Examples:
+            >>> data = data.map(input_columns=["text_a", "text_b"],
+            >>>                 output_columns=["input_ids", "token_type_ids", "attention_mask"],
+            >>>                 columns_order=["input_ids", "token_type_ids", "attention_mask"],
+            >>>                 operations=BertEncode(vocab, max_seq_len=128, lower_case=True))
+        """
+
+        @check_bert_encode
+        def __init__(self, vocab, max_seq_len, suffix_indicator='##', max_bytes_per_token=100,
+                     unknown_token='[UNK]', lower_case=False, keep_whitespace=False,
+                     normalization_form=NormalizeForm.NONE, preserve_unused_token=True,
+                     cls_token='[CLS]', sep_token='[SEP]', pad_token='[PAD]', cache_size=10000):
+            self.vocab = vocab
+            self.max_seq_len = max_seq_len
+            self.suffix_indicator = suffix_indicator
+            self.max_bytes_per_token = max_bytes_per_token
+            self.unknown_token = unknown_token
+            self.lower_case = lower_case
+            self.keep_whitespace = keep_whitespace
+            self.normalization_form = DE_C_INTER_NORMALIZE_FORM[normalization_form]
+            self.preserve_unused_token = preserve_unused_token
+            self.cls_token = cls_token
+            self.sep_token = sep_token
+            self.pad_token = pad_token
+            self.cache_size = cache_size
+            super().__init__(self.vocab, self.max_seq_len, self.suffix_indicator, self.max_bytes_per_token,
+                             self.unknown_token, self.lower_case, self.keep_whitespace, self.normalization_form,
+                             self.preserve_unused_token, self.cls_token, self.sep_token, self.pad_token,
+                             self.cache_size)
 
 
 class TruncateSequencePair(cde.TruncateSequencePairOp):
@@ -31,12 +31,12 @@ class Vocab(cde.Vocab):
     @classmethod
     @check_from_dataset
     def from_dataset(cls, dataset, columns=None, freq_range=None, top_k=None, special_tokens=None,
-                     special_first=None):
+                     special_first=None, word_count_file=None):
         """
         Build a vocab from a dataset. This would collect all unique words in a dataset and return a vocab within
         the frequency range specified by user in freq_range. User would be warned if no words fall into the frequency.
         Words in vocab are ordered from highest frequency to lowest frequency. Words with the same frequency would be
-        ordered lexicographically.
+        ordered lexicographically. Words are counted by num_parallel_workers of the dataset in parallel.
 
         Args:
             dataset(Dataset): dataset to build vocab from.
@@ -54,12 +54,22 @@ class Vocab(cde.Vocab):
                 special_tokens=["<pad>","<unk>"] (default=None, no special tokens will be added).
             special_first(bool, optional): whether special_tokens will be prepended/appended to vocab. If special_tokens
                 is specified and special_first is set to None, special_tokens will be prepended. (default=None).
+            word_count_file(str, optional): file keeping the word counts of all the data a vocab is built from. If it
+                exists, the counts in it are added to the counts of dataset, then the merged counts are saved back to
+                it. So a vocab can be updated when new data arrives by building it from the new data only
+                (default=None, word counts are not kept).
         return:
             text.Vocab: Vocab object built from dataset.
+
+        Examples:
+            >>> vocab = text.Vocab.from_dataset(data_part1, "text", word_count_file="word_count.bin")
+            >>> # later, count the new data only, vocab is built from the words of part1 and part2
+            >>> vocab = text.Vocab.from_dataset(data_part2, "text", word_count_file="word_count.bin")
         """
 
         vocab = Vocab()
-        root = copy.deepcopy(dataset).build_vocab(vocab, columns, freq_range, top_k, special_tokens, special_first)
+        root = copy.deepcopy(dataset).build_vocab(vocab, columns, freq_range, top_k, special_tokens, special_first,
+                                                  word_count_file)
         for d in root.create_dict_iterator():
             if d is not None:
                 raise ValueError("from_dataset should receive data other than None.")
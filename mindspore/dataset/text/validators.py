@@ -22,7 +22,7 @@ import mindspore._c_dataengine as cde
 import mindspore.common.dtype as mstype
 
 from mindspore._c_expression import typing
-from ..transforms.validators import check_uint32, check_pos_int64
+from ..transforms.validators import check_uint32, check_pos_int32, check_pos_int64, INT32_MAX
 
 
 def check_unique_list_of_words(words, arg_name):
@@ -40,6 +40,15 @@ def check_unique_list_of_words(words, arg_name):
     return words_set
 
 
+def check_cache_size(cache_size):
+    """Check that cache_size is an int between 0 and INT32_MAX"""
+
+    if not isinstance(cache_size, int) or isinstance(cache_size, bool):
+        raise ValueError("cache_size needs to be type int.")
+    if cache_size < 0 or cache_size > INT32_MAX:
+        raise ValueError("cache_size should be between 0 and {}.".format(INT32_MAX))
+
+
 def check_lookup(method):
     """A wrapper that wrap a parameter checker to the original function."""
 
@@ -244,7 +253,8 @@ def check_from_dataset(method):
     @wraps(method)
     def new_method(self, *args, **kwargs):
 
-        dataset, columns, freq_range, top_k, special_tokens, special_first = (list(args) + 6 * [None])[:6]
+        dataset, columns, freq_range, top_k, special_tokens, special_first, word_count_file = \
+            (list(args) + 7 * [None])[:7]
         if "dataset" in kwargs:
             dataset = kwargs.get("dataset")
         if "columns" in kwargs:
@@ -257,6 +267,8 @@ def check_from_dataset(method):
             special_tokens = kwargs.get("special_tokens")
         if "special_first" in kwargs:
             special_first = kwargs.get("special_first")
+        if "word_count_file" in kwargs:
+            word_count_file = kwargs.get("word_count_file")
 
         if columns is None:
             columns = []
@@ -299,12 +311,16 @@ def check_from_dataset(method):
 
         check_unique_list_of_words(special_tokens, "special_tokens")
 
+        if word_count_file is not None and not isinstance(word_count_file, str):
+            raise ValueError("word_count_file needs to be a string.")
+
         kwargs["dataset"] = dataset
         kwargs["columns"] = columns
         kwargs["freq_range"] = freq_range
         kwargs["top_k"] = top_k
         kwargs["special_tokens"] = special_tokens
         kwargs["special_first"] = special_first
+        kwargs["word_count_file"] = word_count_file
 
         return method(self, **kwargs)
 
@@ -388,6 +404,76 @@ def check_pair_truncate(method):
     return new_method
 
 
+def check_wordpiece_tokenizer(method):
+    """Wrapper method to check the parameters of WordpieceTokenizer."""
+
+    @wraps(method)
+    def new_method(self, *args, **kwargs):
+        arg_names = ["vocab", "suffix_indicator", "max_bytes_per_token", "unknown_token", "cache_size"]
+        for name, value in zip(arg_names, args):
+            kwargs[name] = value
+
+        if "cache_size" in kwargs:
+            check_cache_size(kwargs["cache_size"])
+
+        return method(self, **kwargs)
+
+    return new_method
+
+
+def check_bert_tokenizer(method):
+    """Wrapper method to check the parameters of BertTokenizer."""
+
+    @wraps(method)
+    def new_method(self, *args, **kwargs):
+        arg_names = ["vocab", "suffix_indicator", "max_bytes_per_token", "unknown_token", "lower_case",
+                     "keep_whitespace", "normalization_form", "preserve_unused_token", "cache_size"]
+        for name, value in zip(arg_names, args):
+            kwargs[name] = value
+
+        if "cache_size" in kwargs:
+            check_cache_size(kwargs["cache_size"])
+
+        return method(self, **kwargs)
+
+    return new_method
+
+
+def check_bert_encode(method):
+    """Wrapper method to check the parameters of BertEncode."""
+
+    @wraps(method)
+    def new_method(self, *args, **kwargs):
+        arg_names = ["vocab", "max_seq_len", "suffix_indicator", "max_bytes_per_token", "unknown_token",
+                     "lower_case", "keep_whitespace", "normalization_form", "preserve_unused_token",
+                     "cls_token", "sep_token", "pad_token", "cache_size"]
+        for name, value in zip(arg_names, args):
+            kwargs[name] = value
+
+        vocab = kwargs.get("vocab")
+        if not isinstance(vocab, cde.Vocab):
+            raise ValueError("vocab is not an instance of cde.Vocab.")
+
+        max_seq_len = kwargs.get("max_seq_len")
+        if max_seq_len is None:
+            raise ValueError("max_seq_len is not provided.")
+        check_pos_int32(max_seq_len)
+        if max_seq_len < 4:
+            raise ValueError("max_seq_len should be at least 4 to hold [CLS], [SEP] and one token of each text.")
+
+        for name in ["suffix_indicator", "unknown_token", "cls_token", "sep_token", "pad_token"]:
+            if name in kwargs and not isinstance(kwargs[name], str):
+                raise ValueError("{} needs to be type str.".format(name))
+        if "max_bytes_per_token" in kwargs:
+            check_pos_int32(kwargs["max_bytes_per_token"])
+        if "cache_size" in kwargs:
+            check_cache_size(kwargs["cache_size"])
+
+        return method(self, **kwargs)
+
+    return new_method
+
+
 def check_to_number(method):
     """A wrapper that wraps a parameter check to the original function (ToNumber)."""
 
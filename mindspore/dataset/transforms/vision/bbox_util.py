@@ -0,0 +1,371 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Vectorized bounding box utilities for detection input pipelines.
+
+All functions work on whole arrays of boxes at once instead of looping over boxes, and
+accept leading batch dimensions where noted. Boxes are in corner format
+(x_min, y_min, x_max, y_max) unless stated otherwise; xywh_to_xyxy() and xyxy_to_xywh()
+convert from and to the (x, y, w, h) layout of the dataset bounding box columns.
+Since only differences between coordinates are used, the functions give the same results
+for boxes in (y_min, x_min, y_max, x_max) order, as long as all inputs share that order.
+"""
+import random
+
+import numpy as np
+
+
+def xywh_to_xyxy(boxes):
+    """
+    Convert boxes from (x, y, w, h) to (x_min, y_min, x_max, y_max).
+
+    Args:
+        boxes (numpy.ndarray): Boxes of shape (..., 4), extra trailing columns (e.g. labels) are kept.
+
+    Returns:
+        numpy.ndarray, converted boxes in float32.
+    """
+    boxes = np.array(boxes, dtype=np.float32)
+    boxes[..., 2:4] += boxes[..., 0:2]
+    return boxes
+
+
+def xyxy_to_xywh(boxes):
+    """
+    Convert boxes from (x_min, y_min, x_max, y_max) to (x, y, w, h).
+
+    Args:
+        boxes (numpy.ndarray): Boxes of shape (..., 4), extra trailing columns (e.g. labels) are kept.
+
+    Returns:
+        numpy.ndarray, converted boxes in float32.
+    """
+    boxes = np.array(boxes, dtype=np.float32)
+    boxes[..., 2:4] -= boxes[..., 0:2]
+    return boxes
+
+
+def box_area(boxes):
+    """
+    Compute the area of boxes.
+
+    Args:
+        boxes (numpy.ndarray): Boxes of shape (..., 4).
+
+    Returns:
+        numpy.ndarray, areas of shape (...).
+    """
+    return np.maximum(boxes[..., 2] - boxes[..., 0], 0.) * np.maximum(boxes[..., 3] - boxes[..., 1], 0.)
+
+
+def bbox_iou(boxes_a, boxes_b):
+    """
+    Compute the pairwise IoU of two sets of boxes.
+
+    Args:
+        boxes_a (numpy.ndarray): Boxes of shape (..., N, 4).
+        boxes_b (numpy.ndarray): Boxes of shape (..., M, 4), leading dimensions broadcast with boxes_a.
+
+    Returns:
+        numpy.ndarray, IoU of shape (..., N, M).
+    """
+    boxes_a = np.asarray(boxes_a, dtype=np.float32)[..., :, None, :4]
+    boxes_b = np.asarray(boxes_b, dtype=np.float32)[..., None, :, :4]
+    inter_min = np.maximum(boxes_a[..., :2], boxes_b[..., :2])
+    inter_max = np.minimum(boxes_a[..., 2:], boxes_b[..., 2:])
+    inter_wh = np.maximum(inter_max - inter_min, 0.)
+    inter = inter_wh[..., 0] * inter_wh[..., 1]
+    union = box_area(boxes_a) + box_area(boxes_b) - inter
+    return inter / np.maximum(union, np.finfo(np.float32).eps)
+
+
+def wh_iou(wh_a, wh_b):
+    """
+    Compute the pairwise IoU of two sets of boxes sharing the same center, given by width and height only.
+
+    This is the IoU used to match ground truth boxes to anchor shapes in YOLO.
+
+    Args:
+        wh_a (numpy.ndarray): Widths and heights of shape (..., N, 2).
+        wh_b (numpy.ndarray): Widths and heights of shape (..., M, 2).
+
+    Returns:
+        numpy.ndarray, IoU of shape (..., N, M).
+    """
+    wh_a = np.asarray(wh_a, dtype=np.float32)[..., :, None, :]
+    wh_b = np.asarray(wh_b, dtype=np.float32)[..., None, :, :]
+    inter_wh = np.minimum(wh_a, wh_b)
+    inter = inter_wh[..., 0] * inter_wh[..., 1]
+    union = wh_a[..., 0] * wh_a[..., 1] + wh_b[..., 0] * wh_b[..., 1] - inter
+    return inter / np.maximum(union, np.finfo(np.float32).eps)
+
+
+def encode_boxes(boxes, anchors, scaling=(0.1, 0.2)):
+    """
+    Encode boxes as center offsets and log scales relative to anchors, as used by SSD.
+
+    Args:
+        boxes (numpy.ndarray): Boxes of shape (..., 4).
+        anchors (numpy.ndarray): Anchors of shape (..., 4), broadcast with boxes.
+        scaling (sequence): Variances of the center and of the size encoding (default=(0.1, 0.2)).
+
+    Returns:
+        numpy.ndarray, encoded boxes of shape (..., 4).
+    """
+    boxes = np.asarray(boxes, dtype=np.float32)
+    anchors = np.asarray(anchors, dtype=np.float32)
+    box_center = (boxes[..., :2] + boxes[..., 2:4]) / 2
+    box_size = np.maximum(boxes[..., 2:4] - boxes[..., :2], np.finfo(np.float32).eps)
+    anchor_center = (anchors[..., :2] + anchors[..., 2:4]) / 2
+    anchor_size = anchors[..., 2:4] - anchors[..., :2]
+    offsets = (box_center - anchor_center) / (anchor_size * scaling[0])
+    scales = np.log(box_size / anchor_size) / scaling[1]
+    return np.concatenate((offsets, scales), axis=-1)
+
+
+def decode_boxes(encoded, anchors, scaling=(0.1, 0.2)):
+    """
+    Decode boxes encoded by encode_boxes().
+
+    Args:
+        encoded (numpy.ndarray): Encoded boxes of shape (..., 4).
+        anchors (numpy.ndarray): Anchors of shape (..., 4), broadcast with encoded.
+        scaling (sequence): Variances of the center and of the size encoding (default=(0.1, 0.2)).
+
+    Returns:
+        numpy.ndarray, boxes of shape (..., 4).
+    """
+    encoded = np.asarray(encoded, dtype=np.float32)
+    anchors = np.asarray(anchors, dtype=np.float32)
+    anchor_center = (anchors[..., :2] + anchors[..., 2:4]) / 2
+    anchor_size = anchors[..., 2:4] - anchors[..., :2]
+    center = encoded[..., :2] * scaling[0] * anchor_size + anchor_center
+    size = np.exp(encoded[..., 2:4] * scaling[1]) * anchor_size
+    return np.concatenate((center - size / 2, center + size / 2), axis=-1)
+
+
+def assign_targets(gt_boxes, gt_labels, anchors, match_threshold=0.5):
+    """
+    Assign ground truth boxes to anchors by IoU, as used by SSD.
+
+    Every anchor takes the ground truth box it overlaps most if the IoU is above match_threshold,
+    and the best anchor of every ground truth box is always matched to it.
+
+    Args:
+        gt_boxes (numpy.ndarray): Ground truth boxes of shape (G, 4).
+        gt_labels (numpy.ndarray): Labels of shape (G,), 0 is reserved for the background.
+        anchors (numpy.ndarray): Anchors of shape (A, 4).
+        match_threshold (float): IoU above which an anchor is matched (default=0.5).
+
+    Returns:
+        - numpy.ndarray, matched ground truth box of every anchor, of shape (A, 4), zeros for background.
+        - numpy.ndarray, label of every anchor, of shape (A,), 0 for background.
+        - numpy.ndarray, mask of shape (A,), True for matched anchors.
+    """
+    gt_boxes = np.asarray(gt_boxes, dtype=np.float32).reshape(-1, 4)
+    gt_labels = np.asarray(gt_labels).reshape(-1)
+    num_anchors = len(anchors)
+    if gt_boxes.shape[0] == 0:
+        return np.zeros((num_anchors, 4), np.float32), np.zeros(num_anchors, gt_labels.dtype), \
+               np.zeros(num_anchors, np.bool_)
+
+    iou = bbox_iou(gt_boxes, anchors)
+    # force a match between each ground truth box and its best anchor
+    iou[np.arange(gt_boxes.shape[0]), np.argmax(iou, axis=1)] = 2.0
+    best_gt = np.argmax(iou, axis=0)
+    matched = iou[best_gt, np.arange(num_anchors)] > match_threshold
+
+    boxes = np.where(matched[:, None], gt_boxes[best_gt], 0.).astype(np.float32)
+    labels = np.where(matched, gt_labels[best_gt], 0).astype(gt_labels.dtype)
+    return boxes, labels, matched
+
+
+def assign_yolo_targets(gt_boxes, gt_labels, anchors, anchor_mask, input_shape, strides, num_classes):
+    """
+    Build the YOLO target grids of every output layer for one image.
+
+    Every valid ground truth box is assigned to the grid cell containing its center, in the layer
+    and slot of the anchor shape matching it best.
+
+    Args:
+        gt_boxes (numpy.ndarray): Ground truth boxes of shape (G, 4) in pixels of the network input.
+        gt_labels (numpy.ndarray): Labels of shape (G,).
+        anchors (numpy.ndarray): Anchor widths and heights of shape (A, 2) in pixels.
+        anchor_mask (list[list[int]]): Anchor indexes used by each layer.
+        input_shape (sequence): Height and width of the network input.
+        strides (list[int]): Downsampling stride of each layer.
+        num_classes (int): Number of classes.
+
+    Returns:
+        list[numpy.ndarray], one target of shape (H / stride, W / stride, len(mask), 5 + num_classes)
+        per layer, holding normalized (center_x, center_y, w, h), objectness and one-hot class.
+    """
+    gt_boxes = np.asarray(gt_boxes, dtype=np.float32).reshape(-1, 4)
+    gt_labels = np.asarray(gt_labels).reshape(-1).astype(np.int64)
+    input_h, input_w = input_shape
+    normalizer = np.array([input_w, input_h], np.float32)
+    centers = (gt_boxes[:, 0:2] + gt_boxes[:, 2:4]) // 2. / normalizer
+    sizes = gt_boxes[:, 2:4] - gt_boxes[:, 0:2]
+
+    valid = sizes[:, 0] >= 1
+    centers, sizes, gt_labels = centers[valid], sizes[valid], gt_labels[valid]
+    best_anchor = np.argmax(wh_iou(sizes, anchors), axis=-1)
+
+    targets = []
+    for mask, stride in zip(anchor_mask, strides):
+        grid_h, grid_w = input_h // stride, input_w // stride
+        target = np.zeros((grid_h, grid_w, len(mask), 5 + num_classes), dtype=np.float32)
+        slots = np.full(len(anchors), -1)
+        slots[mask] = np.arange(len(mask))
+        slot = slots[best_anchor]
+        selected = slot >= 0
+        i = np.floor(centers[selected, 0] * grid_w).astype(np.int32)
+        j = np.floor(centers[selected, 1] * grid_h).astype(np.int32)
+        k = slot[selected]
+        target[j, i, k, 0:2] = centers[selected]
+        target[j, i, k, 2:4] = sizes[selected] / normalizer
+        target[j, i, k, 4] = 1.
+        target[j, i, k, 5 + gt_labels[selected]] = 1.
+        targets.append(target)
+    return targets
+
+
+def flip_boxes(boxes, width):
+    """
+    Flip boxes horizontally within an image of the given width.
+
+    Args:
+        boxes (numpy.ndarray): Boxes of shape (..., 4), extra trailing columns are kept.
+        width (float or numpy.ndarray): Image width, or widths of shape (...) per batch element.
+
+    Returns:
+        numpy.ndarray, flipped boxes.
+    """
+    boxes = np.array(boxes, dtype=np.float32)
+    width = np.asarray(width, dtype=np.float32)[..., None]
+    x_min = boxes[..., 0].copy()
+    boxes[..., 0] = width - boxes[..., 2]
+    boxes[..., 2] = width - x_min
+    return boxes
+
+
+def crop_boxes(boxes, crops, keep_center=True, min_size=1.):
+    """
+    Adjust boxes for a set of candidate crops at once.
+
+    Boxes are clipped to each crop and shifted to the crop origin. Evaluating all candidate
+    crops of a random crop search in one call replaces a per-candidate loop.
+
+    Args:
+        boxes (numpy.ndarray): Boxes of shape (N, 4), extra trailing columns are kept.
+        crops (numpy.ndarray): Crop windows of shape (K, 4) or (4,).
+        keep_center (bool): Keep only boxes whose center lies inside the crop (default=True).
+            If False, keep boxes overlapping the crop.
+        min_size (float): Minimum width and height of a kept box after clipping (default=1.).
+
+    Returns:
+        - numpy.ndarray, cropped boxes of shape (K, N, 4) or (N, 4).
+        - numpy.ndarray, keep mask of shape (K, N) or (N,).
+    """
+    boxes = np.asarray(boxes, dtype=np.float32)
+    crops = np.asarray(crops, dtype=np.float32)
+    single = crops.ndim == 1
+    crops = crops.reshape(-1, 1, 4)
+
+    cropped = np.broadcast_to(boxes, (crops.shape[0],) + boxes.shape).copy()
+    cropped[..., 0:2] = np.maximum(cropped[..., 0:2], crops[..., 0:2])
+    cropped[..., 2:4] = np.minimum(cropped[..., 2:4], crops[..., 2:4])
+    size = cropped[..., 2:4] - cropped[..., 0:2]
+    keep = np.all(size >= min_size, axis=-1)
+    if keep_center:
+        centers = (boxes[:, 0:2] + boxes[:, 2:4]) / 2
+        keep &= np.all((centers > crops[..., 0:2]) & (centers < crops[..., 2:4]), axis=-1)
+    cropped[..., 0:4] -= np.tile(crops[..., 0:2], 2)
+
+    if single:
+        return cropped[0], keep[0]
+    return cropped, keep
+
+
+def affine_boxes(boxes, matrix, width, height, min_size=1.):
+    """
+    Transform boxes with a 2x3 affine matrix, e.g. the matrix of a random affine or resize and pad.
+
+    The four corners of every box are transformed and the axis aligned box around them is
+    clipped to the output image.
+
+    Args:
+        boxes (numpy.ndarray): Boxes of shape (N, 4), extra trailing columns are kept.
+        matrix (numpy.ndarray): Affine matrix of shape (2, 3) mapping input to output pixel coordinates.
+        width (int): Width of the output image.
+        height (int): Height of the output image.
+        min_size (float): Minimum width and height of a kept box after clipping (default=1.).
+
+    Returns:
+        - numpy.ndarray, transformed boxes of shape (N, 4).
+        - numpy.ndarray, keep mask of shape (N,).
+    """
+    boxes = np.array(boxes, dtype=np.float32)
+    matrix = np.asarray(matrix, dtype=np.float32)
+    corners = boxes[:, [0, 1, 2, 1, 0, 3, 2, 3]].reshape(-1, 4, 2)
+    corners = corners @ matrix[:, :2].T + matrix[:, 2]
+    boxes[:, 0:2] = np.clip(corners.min(axis=1), 0, [width, height])
+    boxes[:, 2:4] = np.clip(corners.max(axis=1), 0, [width, height])
+    keep = np.all(boxes[:, 2:4] - boxes[:, 0:2] >= min_size, axis=-1)
+    return boxes, keep
+
+
+def random_crop_with_boxes(boxes, width, height, min_iou_choices=(None, 0.1, 0.3, 0.5, 0.7, 0.9),
+                           max_trials=50, scale=(0.3, 1.0), ratio=(0.5, 2.)):
+    """
+    Draw an SSD style random crop window, evaluating all candidate windows at once.
+
+    Args:
+        boxes (numpy.ndarray): Boxes of shape (N, 4) in pixels.
+        width (int): Image width.
+        height (int): Image height.
+        min_iou_choices (sequence): Minimum IoU choices of the kept boxes with the crop, None means no crop.
+        max_trials (int): Number of candidate crop windows (default=50).
+        scale (sequence): Range of the crop side relative to the image side (default=(0.3, 1.0)).
+        ratio (sequence): Range of the crop height to width ratio (default=(0.5, 2.)).
+
+    Returns:
+        - numpy.ndarray, crop window (x_min, y_min, x_max, y_max) in integer pixels, or None if not cropped.
+        - numpy.ndarray, cropped boxes of the kept objects.
+    """
+    # seeded from the python random library like the other random ops, so that ds.config.set_seed applies
+    random_state = np.random.RandomState(random.getrandbits(32))
+    min_iou = min_iou_choices[random_state.randint(len(min_iou_choices))]
+    if min_iou is None:
+        return None, boxes
+
+    crop_w = random_state.uniform(scale[0], scale[1], max_trials) * width
+    crop_h = random_state.uniform(scale[0], scale[1], max_trials) * height
+    left = random_state.random_sample(max_trials) * (width - crop_w)
+    top = random_state.random_sample(max_trials) * (height - crop_h)
+    crops = np.stack((left, top, left + crop_w, top + crop_h), axis=-1).astype(np.int32).astype(np.float32)
+
+    overlap = bbox_iou(crops, boxes)
+    touched = overlap > 0
+    valid = (crop_h / crop_w >= ratio[0]) & (crop_h / crop_w <= ratio[1]) & touched.any(axis=1)
+    valid &= np.where(touched, overlap, np.inf).min(axis=1) >= min_iou
+    cropped, keep = crop_boxes(boxes, crops, keep_center=True, min_size=0.)
+    keep &= touched
+    valid &= keep.any(axis=1)
+    if not valid.any():
+        return None, boxes
+
+    trial = np.argmax(valid)
+    return crops[trial].astype(np.int32), cropped[trial][keep[trial]]
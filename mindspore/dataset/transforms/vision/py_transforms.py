@@ -21,8 +21,14 @@ python PIL in image learning task, this module is a good tool to process image
 augmentations. Users could also self-define their own augmentations with python
 PIL.
 """
+import hashlib
 import numbers
+import os
 import random
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
 
 import numpy as np
 from PIL import Image
@@ -32,7 +38,7 @@ from .validators import check_prob, check_crop, check_resize_interpolation, chec
     check_normalize_py, check_random_crop, check_random_color_adjust, check_random_rotation, \
     check_transforms_list, check_random_apply, check_ten_crop, check_num_channels, check_pad, \
     check_random_perspective, check_random_erasing, check_cutout, check_linear_transform, check_random_affine, \
-    check_mix_up, check_positive_degrees, check_uniform_augment_py, check_compose_list
+    check_mix_up, check_positive_degrees, check_uniform_augment_py, check_compose_list, check_decode_cache
 from .utils import Inter, Border
 
 DE_PY_INTER_MODE = {Inter.NEAREST: Image.NEAREST,
@@ -125,7 +131,7 @@ class ToTensor:
 
 class ToType:
     """
-    Convert the input Numpy image array to desired numpy dtype.
+    Convert the input Numpy image array, or a batch of Numpy image arrays, to desired numpy dtype.
 
     Args:
         output_type (numpy datatype): The datatype of the numpy output. e.g. np.float32.
@@ -157,6 +163,8 @@ class ToType:
 class HWC2CHW:
     """
     Transpose a Numpy image array; shape (H, W, C) to shape (C, H, W).
+
+    A batch of Numpy image arrays of shape (N, H, W, C) is transposed to shape (N, C, H, W).
     """
 
     def __call__(self, img):
@@ -164,10 +172,10 @@ class HWC2CHW:
         Call method.
 
         Args:
-            img (numpy.ndarray): Image array, of shape (H, W, C), to have channels swapped.
+            img (numpy.ndarray): Image array, of shape (H, W, C) or (N, H, W, C), to have channels swapped.
 
         Returns:
-            img (numpy.ndarray), Image array, of shape (C, H, W), with channels swapped.
+            img (numpy.ndarray), Image array, of shape (C, H, W) or (N, C, H, W), with channels swapped.
         """
         return util.hwc_to_chw(img)
 
@@ -196,16 +204,224 @@ class ToPIL:
         return util.to_pil(img)
 
 
+class DecodeCache:
+    """
+    Memory-bounded LRU cache of decoded uint8 images, to be shared by Decode across epochs.
+
+    Decoding gives the same result in every epoch, so the decoded image of each source row is kept
+    and only the augmentations after Decode run again. Rows are keyed by a digest of their encoded
+    bytes, which identifies the source row without needing the row id inside the map operation.
+    Images evicted from memory are spilled to a memory-mapped local file if spill_file is given,
+    until spill_bytes are used.
+
+    Note:
+        The cache lives in the process that runs Decode. With python_multiprocessing=True in map(),
+        every worker process holds its own cache and its own spill file.
+
+    Args:
+        max_bytes (int): Maximum number of bytes of decoded images kept in memory.
+        resize (int or sequence, optional): Downscale images before caching them (default=None).
+            If resize is an int, the smaller edge of larger images is resized to this value with
+            the same image aspect ratio. If resize is a sequence of (height, width), every image
+            is resized to this size.
+        spill_file (str, optional): Path prefix of the local file holding images evicted from memory
+            (default=None). The process id and a unique suffix are appended to it, so that the caches in different
+            processes do not share the file. The file is removed once it is mapped into memory, or by close()
+            and the release of the cache on the platforms not allowing it.
+        spill_bytes (int, optional): Size of spill_file in bytes, must be given with spill_file (default=None).
+
+    Examples:
+        >>> cache = py_transforms.DecodeCache(max_bytes=8 * 1024 ** 3, resize=256)
+        >>> py_transforms.ComposeOp([py_transforms.Decode(cache=cache),
+        >>>                          py_transforms.RandomResizedCrop(224),
+        >>>                          py_transforms.RandomHorizontalFlip(0.5),
+        >>>                          py_transforms.ToTensor()])
+    """
+
+    @check_decode_cache
+    def __init__(self, max_bytes, resize=None, spill_file=None, spill_bytes=None):
+        self.max_bytes = max_bytes
+        self.resize = resize
+        self.spill_file = spill_file
+        self.spill_bytes = spill_bytes
+        self._reset()
+
+    def _reset(self):
+        self._lock = threading.Lock()
+        self._images = OrderedDict()
+        self._cached_bytes = 0
+        self._spill = None
+        self._spill_pid = None
+        self._spill_finalizer = None
+        self._spill_index = {}
+        self._spill_offset = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __getstate__(self):
+        # the lock, the cached images and the mapped file are not shared with other processes
+        return {"max_bytes": self.max_bytes, "resize": self.resize,
+                "spill_file": self.spill_file, "spill_bytes": self.spill_bytes}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._reset()
+
+    def __len__(self):
+        return len(self._images) + len(self._spill_index)
+
+    def close(self):
+        """Drop the images spilled by this process and remove its spill file."""
+        with self._lock:
+            self._close_spill()
+
+    def _close_spill(self):
+        # the file is unmapped before it is removed
+        self._spill = None
+        if self._spill_finalizer is not None and self._spill_pid == os.getpid():
+            self._spill_finalizer()
+        self._spill_pid = None
+        self._spill_finalizer = None
+        self._spill_index = {}
+        self._spill_offset = 0
+
+    def _check_spill_process(self):
+        """Drop the spilled images inherited by a forked process, whose spill file belongs to the parent."""
+        if self._spill_pid is not None and self._spill_pid != os.getpid():
+            # the finalizer is detached, so that the file of the parent is not removed by this process
+            if self._spill_finalizer is not None:
+                self._spill_finalizer.detach()
+            self._close_spill()
+
+    @staticmethod
+    def _remove_spill_file(path, pid):
+        if os.getpid() == pid and os.path.exists(path):
+            os.remove(path)
+
+    def _open_spill(self):
+        """Create the spill file of this process and map it into memory."""
+        directory, prefix = os.path.split(self.spill_file)
+        fd, path = tempfile.mkstemp(prefix="{}.{}.".format(prefix, os.getpid()), dir=directory or os.curdir)
+        os.close(fd)
+        self._spill = np.memmap(path, dtype=np.uint8, mode="w+", shape=(self.spill_bytes,))
+        self._spill_pid = os.getpid()
+        try:
+            # the mapping keeps the data of the removed file, and no file is left if the worker is killed
+            os.remove(path)
+        except OSError:
+            self._spill_finalizer = weakref.finalize(self, DecodeCache._remove_spill_file, path, self._spill_pid)
+
+    @property
+    def cached_bytes(self):
+        return self._cached_bytes
+
+    @staticmethod
+    def key(img):
+        """Get the cache key of an encoded image."""
+        return hashlib.blake2b(memoryview(np.ascontiguousarray(img)).cast("B"), digest_size=16).digest()
+
+    def get(self, key):
+        """
+        Get the decoded image cached for key.
+
+        Args:
+            key (bytes): Cache key returned by DecodeCache.key().
+
+        Returns:
+            numpy.ndarray, the cached uint8 image of shape (H, W, C), or None if key is not cached.
+        """
+        with self._lock:
+            self._check_spill_process()
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+                self.hits += 1
+                return image
+            location = self._spill_index.get(key)
+            if location is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            offset, shape = location
+            return np.array(self._spill[offset:offset + int(np.prod(shape))]).reshape(shape)
+
+    def put(self, key, image):
+        """
+        Cache a decoded image, evicting the least recently used images beyond max_bytes.
+
+        Args:
+            key (bytes): Cache key returned by DecodeCache.key().
+            image (numpy.ndarray): Decoded uint8 image of shape (H, W, C).
+        """
+        if image.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._images:
+                return
+            self._images[key] = image
+            self._cached_bytes += image.nbytes
+            while self._cached_bytes > self.max_bytes:
+                evicted_key, evicted = self._images.popitem(last=False)
+                self._cached_bytes -= evicted.nbytes
+                self.evictions += 1
+                self._spill_image(evicted_key, evicted)
+
+    def _spill_image(self, key, image):
+        """Append an evicted image to the spill file while it has room left."""
+        if self.spill_file is None or key in self._spill_index:
+            return
+        if self._spill_offset + image.nbytes > self.spill_bytes:
+            return
+        self._check_spill_process()
+        if self._spill is None:
+            self._open_spill()
+        self._spill[self._spill_offset:self._spill_offset + image.nbytes] = image.reshape(-1)
+        self._spill_index[key] = (self._spill_offset, image.shape)
+        self._spill_offset += image.nbytes
+
+    def decode(self, img):
+        """
+        Decode the input image, reusing the cached result of a previous decode of the same image.
+
+        Args:
+            img (Bytes-like Objects): Image to be decoded.
+
+        Returns:
+            img (PIL Image), Decoded image in RGB mode.
+        """
+        key = self.key(img)
+        image = self.get(key)
+        if image is None:
+            decoded = util.decode(img)
+            if self.resize is not None:
+                if not isinstance(self.resize, int) or min(decoded.size) > self.resize:
+                    decoded = util.resize(decoded, self.resize)
+            image = np.array(decoded, dtype=np.uint8)
+            image.flags.writeable = False
+            self.put(key, image)
+        return Image.fromarray(image)
+
+
 class Decode:
     """
     Decode the input image to PIL Image format in RGB mode.
 
+    Args:
+        cache (DecodeCache, optional): Cache of decoded images reused across epochs (default=None).
+            Augmentations after Decode still run on every epoch.
+
     Examples:
         >>> py_transforms.ComposeOp([py_transforms.Decode(),
         >>>                          py_transforms.RandomHorizontalFlip(0.5),
         >>>                          py_transforms.ToTensor()])
     """
 
+    def __init__(self, cache=None):
+        if cache is not None and not isinstance(cache, DecodeCache):
+            raise TypeError("cache should be a DecodeCache. Got {}".format(type(cache)))
+        self.cache = cache
+
     def __call__(self, img):
         """
         Call method.
@@ -216,6 +432,8 @@ class Decode:
         Returns:
             img (PIL Image), Decoded image in RGB mode.
         """
+        if self.cache is not None:
+            return self.cache.decode(img)
         return util.decode(img)
 
 
@@ -223,7 +441,8 @@ class Normalize:
     """
     Normalize the input Numpy image array of shape (C, H, W) with the given mean and standard deviation.
 
-    The values of the array need to be in range [0.0, 1.0].
+    The values of the array need to be in range [0.0, 1.0]. A batch of Numpy image arrays of shape
+    (N, C, H, W) is normalized at once, e.g. when applied after batch().
 
     Args:
         mean (sequence): List or tuple of mean values for each channel, w.r.t channel order.
@@ -246,7 +465,7 @@ class Normalize:
         Call method.
 
         Args:
-            img (numpy.ndarray): Image array to be normalized.
+            img (numpy.ndarray): Image array of shape (C, H, W) or (N, C, H, W) to be normalized.
 
         Returns:
             img (numpy.ndarray), Normalized Image array.
@@ -319,6 +538,9 @@ class RandomHorizontalFlip:
     """
     Randomly flip the input image horizontally with a given probability.
 
+    A batch of Numpy image arrays of shape (N, C, H, W) is also accepted, in which case
+    each image of the batch is flipped independently with the given probability.
+
     Args:
         prob (float, optional): Probability of the image being flipped (default=0.5).
 
@@ -326,6 +548,9 @@ class RandomHorizontalFlip:
         >>> py_transforms.ComposeOp([py_transforms.Decode(),
         >>>                          py_transforms.RandomHorizontalFlip(0.5),
         >>>                          py_transforms.ToTensor()])
+        >>>
+        >>> # flip a batch of CHW images, e.g. after ToTensor, with one call per batch
+        >>> data = data.batch(32).map(input_columns="image", operations=py_transforms.RandomHorizontalFlip(0.5))
     """
 
     @check_prob
@@ -337,10 +562,11 @@ class RandomHorizontalFlip:
         Call method.
 
         Args:
-            img (PIL Image): Image to be flipped horizontally.
+            img (PIL Image or numpy.ndarray): Image, or batch of images of shape (N, C, H, W),
+                to be flipped horizontally.
 
         Returns:
-            img (PIL Image), Randomly flipped image.
+            img (PIL Image or numpy.ndarray), Randomly flipped image.
         """
         return util.random_horizontal_flip(img, self.prob)
 
@@ -942,7 +1168,8 @@ class RandomErasing:
     """
     Erase the pixels, within a selected rectangle region, to the given value.
 
-    Randomly applied on the input Numpy image array with a given probability.
+    Randomly applied on the input Numpy image array with a given probability. A batch of Numpy image
+    arrays of shape (N, C, H, W) is also accepted, in which case each sample draws its own parameters.
 
     Zhun Zhong et al. 'Random Erasing Data Augmentation' 2017 See https://arxiv.org/pdf/1708.04896.pdf
 
@@ -980,11 +1207,14 @@ class RandomErasing:
         Call method.
 
         Args:
-            np_img (numpy.ndarray): Numpy image array of shape (C, H, W) to be randomly erased.
+            np_img (numpy.ndarray): Numpy image array of shape (C, H, W) or (N, C, H, W) to be randomly erased.
 
         Returns:
             np_img (numpy.ndarray), Erased Numpy image array.
         """
+        if util.is_numpy(np_img) and np_img.ndim == 4:
+            return util.random_erasing_batch(np_img, self.prob, self.scale, self.ratio, self.value,
+                                             self.inplace, self.max_attempts)
         bounded = True
         if self.prob > random.random():
             i, j, erase_h, erase_w, erase_value = util.get_erase_params(np_img, self.scale, self.ratio,
@@ -997,6 +1227,9 @@ class Cutout:
     """
     Randomly cut (mask) out a given number of square patches from the input Numpy image array.
 
+    A batch of Numpy image arrays of shape (N, C, H, W) is also accepted, in which case
+    each sample draws its own patch locations.
+
     Terrance DeVries and Graham W. Taylor 'Improved Regularization of Convolutional Neural Networks with Cutout' 2017
     See https://arxiv.org/pdf/1708.04552.pdf
 
@@ -1020,13 +1253,15 @@ class Cutout:
         Call method.
 
         Args:
-            np_img (numpy.ndarray): Numpy image array of shape (C, H, W) to be cut out.
+            np_img (numpy.ndarray): Numpy image array of shape (C, H, W) or (N, C, H, W) to be cut out.
 
         Returns:
             np_img (numpy.ndarray), Numpy image array with square patches cut out.
         """
         if not isinstance(np_img, np.ndarray):
             raise TypeError('img should be Numpy array. Got {}'.format(type(np_img)))
+        if np_img.ndim == 4:
+            return util.cutout_batch(np_img, self.length, self.num_patches)
         _, image_h, image_w = np_img.shape
         scale = (self.length * self.length) / (image_h * image_w)
         bounded = False
@@ -79,7 +79,7 @@ def normalize(img, mean, std):
     Normalize the image between [0, 1] with respect to mean and standard deviation.
 
     Args:
-        img (numpy.ndarray): Image array of shape CHW to be normalized.
+        img (numpy.ndarray): Image array of shape CHW, or a batch of image arrays of shape NCHW, to be normalized.
         mean (list): List of mean values for each channel, w.r.t channel order.
         std (list): List of standard deviations for each channel, w.r.t. channel order.
 
@@ -88,8 +88,10 @@ def normalize(img, mean, std):
     """
     if not is_numpy(img):
         raise TypeError('img should be Numpy Image. Got {}'.format(type(img)))
+    if img.ndim not in (3, 4):
+        raise ValueError('img dimension should be 3 or 4. Got {}'.format(img.ndim))
 
-    num_channels = img.shape[0]  # shape is (C, H, W)
+    num_channels = img.shape[-3]  # shape is (C, H, W) or (N, C, H, W)
 
     if len(mean) != len(std):
         raise ValueError("Length of mean and std must be equal")
@@ -130,17 +132,19 @@ def decode(img):
 
 def hwc_to_chw(img):
     """
-    Transpose the input image; shape (H, W, C) to shape (C, H, W).
+    Transpose the input image; shape (H, W, C) to shape (C, H, W), or shape (N, H, W, C) to shape (N, C, H, W).
 
     Args:
-        img (numpy.ndarray): Image to be converted.
+        img (numpy.ndarray): Image or batch of images to be converted.
 
     Returns:
         img (numpy.ndarray), Converted image.
     """
-    if is_numpy(img):
-        return img.transpose(2, 0, 1).copy()
-    raise TypeError('img should be Numpy array. Got {}'.format(type(img)))
+    if not is_numpy(img):
+        raise TypeError('img should be Numpy array. Got {}'.format(type(img)))
+    if img.ndim == 4:
+        return img.transpose(0, 3, 1, 2).copy()
+    return img.transpose(2, 0, 1).copy()
 
 
 def to_tensor(img, output_type):
@@ -222,13 +226,15 @@ def random_horizontal_flip(img, prob):
     Randomly flip the input image horizontally.
 
     Args:
-        img (PIL Image): Image to be flipped.
+        img (PIL Image or numpy.ndarray): Image to be flipped, or a batch of Numpy images of shape (N, C, H, W).
             If the given probability is above the random probability, then the image is flipped.
         prob (float): Probability of the image being flipped.
 
     Returns:
-        img (PIL Image), Converted image.
+        img (PIL Image or numpy.ndarray), Converted image.
     """
+    if is_numpy(img) and img.ndim == 4:
+        return random_horizontal_flip_batch(img, prob)
     if not is_pil(img):
         raise TypeError(augment_error_message.format(type(img)))
 
@@ -237,6 +243,34 @@ def random_horizontal_flip(img, prob):
     return img
 
 
+def _batch_random_state():
+    """
+    Get a numpy random generator for the random parameters of a batch, seeded from the python random library
+    like the per-image ops, so that the batch ops are reproducible under ds.config.set_seed.
+    """
+    return np.random.RandomState(random.getrandbits(32))
+
+
+def random_horizontal_flip_batch(np_imgs, prob):
+    """
+    Randomly flip each image of a batch horizontally, drawing one flip decision per sample.
+
+    Args:
+        np_imgs (numpy.ndarray): Batch of Numpy images of shape (N, C, H, W) to be flipped.
+        prob (float): Probability of each image being flipped.
+
+    Returns:
+        np_imgs (numpy.ndarray), Batch of randomly flipped images.
+    """
+    if not is_numpy(np_imgs) or np_imgs.ndim != 4:
+        raise TypeError('imgs should be Numpy array of shape (N, C, H, W). Got {}'.format(type(np_imgs)))
+
+    flip_mask = _batch_random_state().random_sample(np_imgs.shape[0]) < prob
+    np_imgs = np_imgs.copy()
+    np_imgs[flip_mask] = np_imgs[flip_mask, ..., ::-1]
+    return np_imgs
+
+
 def random_vertical_flip(img, prob):
     """
     Randomly flip the input image vertically.
@@ -1100,6 +1134,142 @@ def erase(np_img, i, j, height, width, erase_value, inplace=False):
     return np_img
 
 
+def _region_mask(image_h, image_w, top, left, height, width):
+    """Build a boolean mask of shape (N, H, W) that is True inside each sample's rectangle."""
+    rows = np.arange(image_h)
+    cols = np.arange(image_w)
+    in_rows = (rows >= top[..., None]) & (rows < (top + height)[..., None])
+    in_cols = (cols >= left[..., None]) & (cols < (left + width)[..., None])
+    return in_rows[..., :, None] & in_cols[..., None, :]
+
+
+def get_erase_params_batch(np_imgs, scale, ratio, max_attempts):
+    """
+    Helper function to get per-sample rectangle parameters for batched RandomErasing.
+
+    Each sample draws max_attempts candidates at once; the first candidate which fits inside
+    the image is used. Samples without any fitting candidate get an empty region.
+
+    Args:
+        np_imgs (numpy.ndarray): Batch of Numpy images of shape (N, C, H, W).
+        scale (sequence): Range of the relative erase area to the original image.
+        ratio (sequence): Range of the aspect ratio of the erase area.
+        max_attempts (int): The maximum number of attempts to propose a valid erase area.
+
+    Returns:
+        tuple of numpy.ndarray, (top, left, height, width) of shape (N,) each.
+    """
+    batch_size, _, image_h, image_w = np_imgs.shape
+    size = (batch_size, max_attempts)
+    random_state = _batch_random_state()
+
+    erase_area = random_state.uniform(scale[0], scale[1], size) * image_h * image_w
+    aspect_ratio = random_state.uniform(ratio[0], ratio[1], size)
+    erase_w = np.round(np.sqrt(erase_area * aspect_ratio)).astype(np.int64)
+    erase_h = np.round(erase_w / aspect_ratio).astype(np.int64)
+
+    valid = (erase_h < image_h) & (erase_w < image_w)
+    found = valid.any(axis=1)
+    attempt = np.argmax(valid, axis=1)
+    samples = np.arange(batch_size)
+    height = np.where(found, erase_h[samples, attempt], 0)
+    width = np.where(found, erase_w[samples, attempt], 0)
+
+    top = np.floor(random_state.random_sample(batch_size) * (image_h - height + 1)).astype(np.int64)
+    left = np.floor(random_state.random_sample(batch_size) * (image_w - width + 1)).astype(np.int64)
+    return top, left, height, width
+
+
+def erase_batch(np_imgs, region_mask, value, inplace=False):
+    """
+    Erase the pixels of a batch of Numpy images, within the given per-sample regions, to the given value.
+
+    Args:
+        np_imgs (numpy.ndarray): Batch of Numpy images of shape (N, C, H, W) to be erased.
+        region_mask (numpy.ndarray): Boolean mask of shape (N, H, W), True for pixels to be erased.
+        value (int, str or sequence): Erase value. A single number is applied to all channels, a str
+            draws values from a standard normal distribution and a sequence of length 3 gives one
+            value per channel.
+        inplace (bool, optional): Apply this transform inplace. Default is False.
+
+    Returns:
+        np_imgs (numpy.ndarray), Erased batch of Numpy images.
+    """
+    if isinstance(value, numbers.Number):
+        erase_value = value
+    elif isinstance(value, (str, bytes)):
+        erase_value = _batch_random_state().normal(loc=0.0, scale=1.0, size=np_imgs.shape)
+    elif isinstance(value, (tuple, list)) and len(value) == 3:
+        erase_value = np.array(value)[None, :, None, None]
+    else:
+        raise ValueError("The value for erasing should be either a single value, or a string "
+                         "'random', or a sequence of 3 elements for RGB respectively.")
+
+    if not inplace:
+        np_imgs = np_imgs.copy()
+    erase_value = np.broadcast_to(erase_value, np_imgs.shape)
+    np.copyto(np_imgs, erase_value, casting='unsafe', where=region_mask[:, None, :, :])
+    return np_imgs
+
+
+def random_erasing_batch(np_imgs, prob, scale, ratio, value, inplace, max_attempts):
+    """
+    Apply RandomErasing to a batch of Numpy images, with independent random parameters for each sample.
+
+    Args:
+        np_imgs (numpy.ndarray): Batch of Numpy images of shape (N, C, H, W) to be randomly erased.
+        prob (float): Probability of applying RandomErasing to each sample.
+        scale (sequence): Range of the relative erase area to the original image.
+        ratio (sequence): Range of the aspect ratio of the erase area.
+        value (int, str or sequence): Erase value, see erase_batch().
+        inplace (bool): Apply this transform inplace.
+        max_attempts (int): The maximum number of attempts to propose a valid erase area.
+
+    Returns:
+        np_imgs (numpy.ndarray), Erased batch of Numpy images.
+    """
+    if not is_numpy(np_imgs) or np_imgs.ndim != 4:
+        raise TypeError('imgs should be Numpy array of shape (N, C, H, W). Got {}'.format(type(np_imgs)))
+
+    batch_size, _, image_h, image_w = np_imgs.shape
+    top, left, height, width = get_erase_params_batch(np_imgs, scale, ratio, max_attempts)
+    region_mask = _region_mask(image_h, image_w, top, left, height, width)
+    region_mask &= (_batch_random_state().random_sample(batch_size) < prob)[:, None, None]
+    return erase_batch(np_imgs, region_mask, value, inplace)
+
+
+def cutout_batch(np_imgs, length, num_patches):
+    """
+    Apply Cutout to a batch of Numpy images, with independent patch locations for each sample.
+
+    Args:
+        np_imgs (numpy.ndarray): Batch of Numpy images of shape (N, C, H, W) to be cut out.
+        length (int): The side length of each square patch.
+        num_patches (int): Number of patches to be cut out of each image.
+
+    Returns:
+        np_imgs (numpy.ndarray), Batch of Numpy images with square patches cut out.
+    """
+    if not is_numpy(np_imgs) or np_imgs.ndim != 4:
+        raise TypeError('imgs should be Numpy array of shape (N, C, H, W). Got {}'.format(type(np_imgs)))
+
+    batch_size, _, image_h, image_w = np_imgs.shape
+    if length >= image_h or length >= image_w:
+        return np_imgs
+
+    # patch centers may fall anywhere in the image, the patch is clipped to the image borders
+    random_state = _batch_random_state()
+    center_y = random_state.randint(0, image_h + 1, size=(batch_size, num_patches))
+    center_x = random_state.randint(0, image_w + 1, size=(batch_size, num_patches))
+    top = np.clip(center_y - length // 2, 0, image_h)
+    left = np.clip(center_x - length // 2, 0, image_w)
+    height = np.clip(center_y + length // 2, 0, image_h) - top
+    width = np.clip(center_x + length // 2, 0, image_w) - left
+
+    region_mask = _region_mask(image_h, image_w, top, left, height, width).any(axis=1)
+    return erase_batch(np_imgs, region_mask, 0)
+
+
 def linear_transform(np_img, transformation_matrix, mean_vector):
     """
     Apply linear transformation to the input Numpy image array, given a square transformation matrix and a mean_vector.
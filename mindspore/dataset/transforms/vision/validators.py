@@ -21,7 +21,7 @@ from mindspore._c_dataengine import TensorOp
 
 from .utils import Inter, Border
 from ...transforms.validators import check_pos_int32, check_pos_float32, check_value, check_uint8, FLOAT_MAX_INTEGER, \
-    check_bool, check_2tuple, check_range, check_list, check_type, check_positive, INT32_MAX
+    check_bool, check_2tuple, check_range, check_list, check_type, check_positive, check_pos_int64, INT32_MAX
 
 
 def check_inter_mode(mode):
@@ -687,6 +687,45 @@ def check_cutout(method):
     return new_method
 
 
+def check_decode_cache(method):
+    """Wrapper method to check the parameters of decoded image cache."""
+
+    @wraps(method)
+    def new_method(self, *args, **kwargs):
+        args = (list(args) + 4 * [None])[:4]
+        max_bytes, resize, spill_file, spill_bytes = args
+        if "max_bytes" in kwargs:
+            max_bytes = kwargs.get("max_bytes")
+        if "resize" in kwargs:
+            resize = kwargs.get("resize")
+        if "spill_file" in kwargs:
+            spill_file = kwargs.get("spill_file")
+        if "spill_bytes" in kwargs:
+            spill_bytes = kwargs.get("spill_bytes")
+
+        if max_bytes is None:
+            raise ValueError("max_bytes is not provided.")
+        check_pos_int64(max_bytes)
+        kwargs["max_bytes"] = max_bytes
+
+        if resize is not None:
+            kwargs["resize"] = check_resize_size(resize)
+
+        if spill_file is not None:
+            if not isinstance(spill_file, str):
+                raise TypeError("spill_file should be a str.")
+            if spill_bytes is None:
+                raise ValueError("spill_bytes should be provided together with spill_file.")
+            kwargs["spill_file"] = spill_file
+        if spill_bytes is not None:
+            check_pos_int64(spill_bytes)
+            kwargs["spill_bytes"] = spill_bytes
+
+        return method(self, **kwargs)
+
+    return new_method
+
+
 def check_linear_transform(method):
     """Wrapper method to check the parameters of linear transform."""
 
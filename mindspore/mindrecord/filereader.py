@@ -15,14 +15,18 @@
 """
 This module is to read data from mindrecord.
 """
+import mmap
 from .shardreader import ShardReader
 from .shardheader import ShardHeader
-from .shardutils import populate_data
+from .shardutils import populate_data, populate_columns
 from .shardutils import MIN_CONSUMER_COUNT, MAX_CONSUMER_COUNT, check_filename
 from .common.exceptions import ParamValueError, ParamTypeError
 
 __all__ = ['FileReader']
 
+# number of rows whose blob views are fetched at a time in mmap mode
+VIEW_BATCH_SIZE = 1024
+
 class FileReader:
     """
     Class to read MindRecord File series.
@@ -33,11 +37,15 @@ class FileReader:
            It should not be smaller than 1 or larger than the number of CPU.
        columns (list[str], optional): List of fields which correspond data would be read (default=None).
        operator(int, optional): Reserved parameter for operators (default=None).
+       use_mmap (bool, optional): Whether to map the files into memory and return blob fields as read-only views
+           into the mapping instead of copies (default=False). Fields of bytes are returned as memoryview and
+           fields of ndarray as numpy.ndarray over the mapping, except integer arrays and compressed blob data
+           which have to be decoded. Not supported on Windows.
 
     Raises:
         ParamValueError: If file_name, num_consumer or columns is invalid.
     """
-    def __init__(self, file_name, num_consumer=4, columns=None, operator=None):
+    def __init__(self, file_name, num_consumer=4, columns=None, operator=None, use_mmap=False):
         if isinstance(file_name, list):
             for f in file_name:
                 check_filename(f)
@@ -60,10 +68,18 @@ class FileReader:
                 raise ParamTypeError('columns', 'list')
         else:
             self._columns = None
+        if not isinstance(use_mmap, bool):
+            raise ParamTypeError('use_mmap', 'bool')
+        self._use_mmap = use_mmap
         self._reader = ShardReader()
-        self._reader.open(file_name, num_consumer, columns, operator)
+        self._reader.open(file_name, num_consumer, columns, operator, use_mmap)
         self._header = ShardHeader(self._reader.get_header())
-        self._reader.launch()
+        self._buffers = []
+        if use_mmap:
+            for path in self._reader.get_file_paths():
+                with open(path, "rb") as f:
+                    self._buffers.append(memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)))
+        self._reader.launch(use_mmap)
 
 
     def get_next(self):
@@ -75,13 +91,59 @@ class FileReader:
 
         Raises:
             MRMUnsupportedSchemaError: If schema is invalid.
+            MRMFetchDataError: If failed to locate the blob data of rows in mmap mode.
         """
+        if self._use_mmap:
+            yield from self._get_next_views()
+            return
         iterator = self._reader.get_next()
         while iterator:
             for blob, raw in iterator:
                 yield populate_data(raw, blob, self._columns, self._header.blob_fields, self._header.schema)
             iterator = self._reader.get_next()
 
+    def get_next_batch(self, batch_size):
+        """
+        Yield the data of batch_size rows at a time as columns, the last batch may be smaller.
+
+        The rows are loaded by the same consumer threads as get_next, but are assembled into columns
+        in c++ instead of one dict per row.
+
+        Args:
+            batch_size (int): Number of rows in a batch.
+
+        Yields:
+            dict: keys is the same as columns, values are numpy.ndarray of shape [rows] for number fields,
+            numpy.ndarray of shape [rows] + shape for array fields with fixed shape, list of str for string
+            fields, and tuple of values and offsets for bytes fields and array fields with variable shape,
+            where the i-th row is values[offsets[i]:offsets[i + 1]].
+
+        Raises:
+            ParamValueError: If batch_size is invalid or the file is opened in mmap mode.
+            MRMUnsupportedSchemaError: If schema is invalid.
+            MRMFetchDataError: If failed to uncompress the blob data of rows.
+        """
+        if not isinstance(batch_size, int) or isinstance(batch_size, bool) or batch_size < 1:
+            raise ParamValueError("Batch size should be int and greater than 0.")
+        if self._use_mmap:
+            raise ParamValueError("get_next_batch is not supported in mmap mode.")
+        batch = self._reader.get_next_batch(batch_size)
+        while batch:
+            num_rows, blob, raw = batch
+            yield populate_columns(num_rows, blob, raw, self._columns, self._header.blob_fields, self._header.schema)
+            batch = self._reader.get_next_batch(batch_size)
+
+    def _get_next_views(self):
+        """Yield rows whose blob fields are views into the mapped files."""
+        start = 0
+        rows = self._reader.get_blob_views(start, VIEW_BATCH_SIZE)
+        while rows:
+            for blob, raw in rows:
+                blob = [self._buffers[x[0]][x[1]:x[1] + x[2]] if isinstance(x, tuple) else x for x in blob]
+                yield populate_data(raw, blob, self._columns, self._header.blob_fields, self._header.schema)
+            start += VIEW_BATCH_SIZE
+            rows = self._reader.get_blob_views(start, VIEW_BATCH_SIZE)
+
     def finish(self):
         """
         Stop reader worker.
@@ -93,4 +155,6 @@ class FileReader:
 
     def close(self):
         """Stop reader worker and close File."""
+        # the mapping is released once all the views yielded are released
+        self._buffers = []
         return self._reader.close()
@@ -25,8 +25,9 @@ from .shardreader import ShardReader
 from .shardheader import ShardHeader
 from .shardindexgenerator import ShardIndexGenerator
 from .shardutils import MIN_SHARD_COUNT, MAX_SHARD_COUNT, VALID_ATTRIBUTES, VALID_ARRAY_ATTRIBUTES, \
-    check_filename, VALUE_TYPE_MAP
-from .common.exceptions import ParamValueError, ParamTypeError, MRMInvalidSchemaError, MRMDefineIndexError
+    VALID_COMPRESSIONS, check_filename, VALUE_TYPE_MAP
+from .common.exceptions import ParamValueError, ParamTypeError, MRMInvalidSchemaError, MRMDefineIndexError, \
+    MRMValidateDataError
 
 __all__ = ['FileWriter']
 
@@ -38,11 +39,13 @@ class FileWriter:
         file_name (str): File name of MindRecord File.
         shard_num (int, optional): Number of MindRecord File (default=1).
             It should be between [1, 1000].
+        compression (str, optional): Codec which compresses the blob data of each row, "lz4" or "zstd"
+            (default=None). Blob data is decompressed transparently when reading.
 
     Raises:
-        ParamValueError: If file_name or shard_num is invalid.
+        ParamValueError: If file_name, shard_num or compression is invalid.
     """
-    def __init__(self, file_name, shard_num=1):
+    def __init__(self, file_name, shard_num=1, compression=None):
         check_filename(file_name)
         self._file_name = file_name
 
@@ -69,6 +72,10 @@ class FileWriter:
 
         self._append = False
         self._header = ShardHeader()
+        if compression is not None:
+            if compression not in VALID_COMPRESSIONS:
+                raise ParamValueError("Compression should be one of {}.".format(VALID_COMPRESSIONS))
+            self._header.set_compression(compression)
         self._writer = ShardWriter()
         self._generator = None
 
@@ -238,6 +245,137 @@ class FileWriter:
         self._verify_based_on_schema(raw_data)
         return self._writer.write_raw_data(raw_data, True, parallel_writer)
 
+    def write_columns(self, columns, parallel_writer=False):
+        """
+        Write data given by columns and generate sequential pair of MindRecord File.
+
+        Each column is validated once against the schema instead of row by row, and the blob fields of all
+        rows are handed to the writer as one contiguous buffer, so it is much faster than write_raw_data
+        when writing a large number of rows.
+
+        Args:
+           columns (dict): Dict of field name and the values of all rows. The column of a field with shape is
+               an ndarray of shape (rows, *shape), or a list of ndarray if the shape contains -1. The column of
+               a bytes field is a list of bytes. The column of other fields is a 1-D ndarray or a list.
+               Arrays are converted to the type of the schema only if no value is truncated or out of range.
+           parallel_writer (bool, optional): Load data parallel if it equals to True (default=False).
+
+        Returns:
+            MSRStatus, SUCCESS or FAILED.
+
+        Raises:
+            ParamTypeError: If columns is not a dict.
+            MRMValidateDataError: If columns do not match the schema.
+            MRMOpenError: If failed to open MindRecord File.
+            MRMSetHeaderError: If failed to set header.
+            MRMWriteDatasetError: If failed to write dataset.
+
+        Examples:
+            >>> writer = FileWriter("test.mindrecord")
+            >>> writer.add_schema({"label": {"type": "int32"}, "feature": {"type": "float32", "shape": [2, 3]}})
+            >>> writer.write_columns({"label": np.arange(100), "feature": np.random.rand(100, 2, 3)})
+            >>> writer.commit()
+        """
+        self.open_and_set_header()
+        if not isinstance(columns, dict):
+            raise ParamTypeError('columns', 'dict')
+        raw_columns, blob_columns, num_rows = self._verify_columns(columns)
+        return self._writer.write_columns(raw_columns, blob_columns, num_rows, False, parallel_writer)
+
+    def _verify_columns(self, columns):
+        """
+        Verify columns according to schema, every column is checked once.
+
+        Args:
+           columns (dict): Dict of field name and the values of all rows.
+
+        Returns:
+            dict, raw field name and the list of its values.
+            list, columns of blob fields in the order of blob fields.
+            int, number of rows.
+
+        Raises:
+            MRMValidateDataError: If columns do not match the schema.
+        """
+        schema_content = self._header.schema
+        blob_fields = self._header.blob_fields
+        missing = set(schema_content) - set(columns)
+        if missing:
+            raise MRMValidateDataError("there is not {} column in the data.".format(sorted(missing)))
+
+        num_rows = None
+        raw_columns = {}
+        blob_columns = {}
+        for field, field_schema in schema_content.items():
+            column = columns[field]
+            if len(column) == 0 or (num_rows is not None and len(column) != num_rows):
+                raise MRMValidateDataError("row count of column '{}' is {}, it should be the same non zero "
+                                           "number for all columns.".format(field, len(column)))
+            num_rows = len(column)
+            data_type = field_schema["type"]
+            if 'shape' in field_schema:
+                blob_columns[field] = self._verify_array_column(field, column, data_type, field_schema['shape'])
+            elif data_type == "bytes":
+                if isinstance(column, np.ndarray) or not all(isinstance(v, bytes) for v in column):
+                    raise MRMValidateDataError("column '{}' should be a list of bytes.".format(field))
+                blob_columns[field] = column
+            else:
+                raw_columns[field] = self._verify_scalar_column(field, column, data_type)
+        return raw_columns, [blob_columns[field] for field in blob_fields], num_rows
+
+    @staticmethod
+    def _verify_array_column(field, column, data_type, shape):
+        """Verify the column of a field with shape, and convert it to the dtype of the schema."""
+        if isinstance(column, np.ndarray) and -1 not in shape:
+            if column.dtype.kind not in "iuf" or column[0].size != int(np.prod(shape)):
+                raise MRMValidateDataError("column '{}' does not match type {} and shape {}."
+                                           .format(field, data_type, shape))
+            return FileWriter._cast_array(field, column, data_type)
+        # the shape of each row may differ
+        fixed_size = int(np.prod([d for d in shape if d != -1]))
+        checked = []
+        for value in column:
+            if not isinstance(value, np.ndarray) or value.dtype.kind not in "iuf" or \
+                    (-1 in shape and value.size % max(fixed_size, 1) != 0) or \
+                    (-1 not in shape and value.size != fixed_size):
+                raise MRMValidateDataError("column '{}' does not match type {} and shape {}."
+                                           .format(field, data_type, shape))
+            checked.append(FileWriter._cast_array(field, value, data_type))
+        return checked
+
+    @staticmethod
+    def _cast_array(field, array, data_type):
+        """Convert the array to the dtype of the schema, the casts which change the values are rejected."""
+        if not np.can_cast(array.dtype, data_type, "same_kind"):
+            raise MRMValidateDataError("column '{}' of {} can not be converted to {}."
+                                       .format(field, array.dtype, data_type))
+        if np.dtype(data_type).kind == "i" and not np.can_cast(array.dtype, data_type) and array.size:
+            info = np.iinfo(data_type)
+            if array.min() < info.min or array.max() > info.max:
+                raise MRMValidateDataError("column '{}' is out of the range of {}.".format(field, data_type))
+        return np.ascontiguousarray(array, dtype=data_type)
+
+    @staticmethod
+    def _verify_scalar_column(field, column, data_type):
+        """Verify the column of a scalar field, and convert it to a list."""
+        if data_type == "string":
+            if isinstance(column, np.ndarray):
+                if column.dtype.kind != 'U':
+                    raise MRMValidateDataError("column '{}' does not match type {}.".format(field, data_type))
+                return column.tolist()
+            if not all(isinstance(v, str) for v in column):
+                raise MRMValidateDataError("column '{}' does not match type {}.".format(field, data_type))
+            return list(column)
+        array = np.asarray(column)
+        kinds = "iu" if data_type in ("int32", "int64") else "iuf"
+        if array.ndim != 1 or array.dtype.kind not in kinds:
+            raise MRMValidateDataError("column '{}' does not match type {}.".format(field, data_type))
+        if data_type == "int32" and (array.min() < np.iinfo(np.int32).min or array.max() > np.iinfo(np.int32).max):
+            raise MRMValidateDataError("column '{}' is out of the range of int32.".format(field))
+        if data_type in ("float32", "float64"):
+            array = array.astype(np.float64)
+        return array.tolist()
+
     def set_header_size(self, header_size):
         """
         Set the size of header.
@@ -271,7 +409,7 @@ class FileWriter:
 
     def commit(self):
         """
-        Flush data to disk and generate the correspond db files.
+        Flush data to disk and generate the correspond db files and manifest.
 
         Returns:
             MSRStatus, SUCCESS or FAILED.
@@ -296,6 +434,8 @@ class FileWriter:
                 self._generator = ShardIndexGenerator(os.path.realpath(self._paths[0]), self._append)
             self._generator.build()
             self._generator.write_to_db()
+            manifest = self._generator.write_manifest()
+            os.chmod(manifest, stat.S_IRUSR | stat.S_IWUSR)
 
         mindrecord_files = []
         index_files = []
@@ -16,13 +16,82 @@
 This module is to support reading page from mindrecord.
 """
 
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+import json
+import threading
+import time
+import numpy as np
+
 from mindspore import log as logger
 from .shardsegment import ShardSegment
 from .shardutils import MIN_CONSUMER_COUNT, MAX_CONSUMER_COUNT, check_filename
-from .common.exceptions import ParamValueError, ParamTypeError, MRMDefineCategoryError
+from .common.exceptions import ParamValueError, ParamTypeError, MRMDefineCategoryError, MindRecordException
 
 __all__ = ['MindPage']
 
+# number of recent requests whose latency is kept for percentiles
+LATENCY_WINDOW = 1024
+
+
+def _page_nbytes(rows):
+    """Estimate the memory used by the rows of a page."""
+    nbytes = 0
+    for row in rows:
+        for value in row.values():
+            if isinstance(value, np.ndarray):
+                nbytes += value.nbytes
+            elif isinstance(value, (bytes, str)):
+                nbytes += len(value)
+            else:
+                nbytes += 8
+    return nbytes
+
+
+def _copy_rows(rows):
+    """Copy the rows of a cached page so that the cache is not changed by the caller."""
+    return [{key: value.copy() if isinstance(value, np.ndarray) else value for key, value in row.items()}
+            for row in rows]
+
+
+class _PageCache:
+    """LRU cache of pages whose total size is limited by a byte budget."""
+    def __init__(self, capacity):
+        self._capacity = capacity
+        self._pages = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    @property
+    def nbytes(self):
+        return self._nbytes
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._pages:
+                return None
+            self._pages.move_to_end(key)
+            return self._pages[key][0]
+
+    def put(self, key, rows):
+        nbytes = _page_nbytes(rows)
+        if nbytes > self._capacity:
+            return
+        with self._lock:
+            if key in self._pages:
+                self._nbytes -= self._pages.pop(key)[1]
+            self._pages[key] = (rows, nbytes)
+            self._nbytes += nbytes
+            while self._nbytes > self._capacity:
+                self._nbytes -= self._pages.popitem(last=False)[1][1]
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._pages.clear()
+            self._nbytes = 0
+
 class MindPage:
     """
     Class to read MindRecord File series in pagination.
@@ -31,12 +100,16 @@ class MindPage:
         file_name (str): One of MindRecord File or file list.
         num_consumer(int, optional): Number of consumer threads which load data to memory (default=4).
             It should not be smaller than 1 or larger than the number of CPU.
+        cache_size (int, optional): Size in bytes of the LRU cache of pages read, 0 means no cache (default=0).
+            The rows of a cached page are shared by all the requests of the page.
+        prefetch (bool, optional): Whether to read the next page of the same category in background
+            into the cache after a page is requested, only available with cache (default=False).
 
     Raises:
-        ParamValueError: If file_name, num_consumer or columns is invalid.
+        ParamValueError: If file_name, num_consumer, cache_size or columns is invalid.
         MRMInitSegmentError: If failed to initialize ShardSegment.
     """
-    def __init__(self, file_name, num_consumer=4):
+    def __init__(self, file_name, num_consumer=4, cache_size=0, prefetch=False):
         if isinstance(file_name, list):
             for f in file_name:
                 check_filename(f)
@@ -53,11 +126,25 @@ class MindPage:
         else:
             raise ParamValueError("Consumer number is illegal.")
 
+        if not isinstance(cache_size, int) or isinstance(cache_size, bool) or cache_size < 0:
+            raise ParamValueError("Cache size should be int and greater than or equal to 0.")
+        if not isinstance(prefetch, bool):
+            raise ParamTypeError('prefetch', 'bool')
+
         self._segment = ShardSegment()
         self._segment.open(file_name, num_consumer)
         self._category_field = None
         self._candidate_fields = [field[:field.rfind('_')] for field in self._segment.get_category_fields()]
 
+        self._cache = _PageCache(cache_size) if cache_size else None
+        self._prefetcher = ThreadPoolExecutor(max_workers=1) if self._cache and prefetch else None
+        self._segment_lock = threading.Lock()
+        self._pending = {}
+        self._category_counts = None
+        self._hits = 0
+        self._misses = 0
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+
     @property
     def candidate_fields(self):
         """
@@ -93,6 +180,8 @@ class MindPage:
             raise ParamTypeError('category_fields', 'str')
         if category_field not in self._candidate_fields:
             raise MRMDefineCategoryError("Field '{}' is not a candidate category field.".format(category_field))
+        self._category_field = category_field
+        self._category_counts = None
         return self._segment.set_category_field(category_field)
 
     @property
@@ -108,6 +197,7 @@ class MindPage:
         if category_field not in self._candidate_fields:
             raise MRMDefineCategoryError("Field '{}' is not a candidate category field.".format(category_field))
         self._category_field = category_field
+        self._category_counts = None
         return self._segment.set_category_field(self._category_field)
 
     def read_category_info(self):
@@ -145,7 +235,7 @@ class MindPage:
             raise ParamValueError("Page should be int and greater than or equal to 0.")
         if not isinstance(num_row, int) or num_row <= 0:
             raise ParamValueError("num_row should be int and greater than 0.")
-        return self._segment.read_at_page_by_id(category_id, page, num_row)
+        return self._read_page("id", category_id, page, num_row)
 
     def read_at_page_by_name(self, category_name, page, num_row):
         """
@@ -166,4 +256,96 @@ class MindPage:
             raise ParamValueError("Page should be int and greater than or equal to 0.")
         if not isinstance(num_row, int) or num_row <= 0:
             raise ParamValueError("num_row should be int and greater than 0.")
-        return self._segment.read_at_page_by_name(category_name, page, num_row)
+        return self._read_page("name", category_name, page, num_row)
+
+    def close(self):
+        """Stop the prefetch thread and release the page cache."""
+        if self._prefetcher is not None:
+            self._prefetcher.shutdown(wait=True)
+            self._prefetcher = None
+        if self._cache is not None:
+            self._cache.clear()
+
+    @property
+    def cache_stats(self):
+        """
+        Return statistics of the page cache and the latency of page requests.
+
+        Returns:
+            dict, number of cache hits, misses and evictions, bytes cached, and the 50th, 90th and 99th
+            percentiles in milliseconds of the latency of the recent requests.
+        """
+        latencies = np.array(self._latencies) * 1000
+        percentiles = np.percentile(latencies, [50, 90, 99]) if latencies.size else [0.0, 0.0, 0.0]
+        return {"hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._cache.evictions if self._cache else 0,
+                "cached_bytes": self._cache.nbytes if self._cache else 0,
+                "latency_p50": float(percentiles[0]),
+                "latency_p90": float(percentiles[1]),
+                "latency_p99": float(percentiles[2])}
+
+    def _fetch_page(self, by, category, page, num_row):
+        """Read a page from files, the segment is not shared by threads."""
+        with self._segment_lock:
+            if by == "id":
+                return self._segment.read_at_page_by_id(category, page, num_row)
+            return self._segment.read_at_page_by_name(category, page, num_row)
+
+    def _read_page(self, by, category, page, num_row):
+        """Read a page through the cache and prefetch the next page."""
+        start = time.perf_counter()
+        if self._cache is None:
+            rows = self._fetch_page(by, category, page, num_row)
+            self._misses += 1
+            self._latencies.append(time.perf_counter() - start)
+            return rows
+
+        key = (self._category_field, by, category, page, num_row)
+        rows = self._cache.get(key)
+        if rows is None:
+            pending = self._pending.get(key)
+            rows = pending.result() if pending is not None else None
+        if rows is None:
+            self._misses += 1
+            rows = self._fetch_page(by, category, page, num_row)
+            self._cache.put(key, rows)
+        else:
+            self._hits += 1
+        if self._prefetcher is not None:
+            self._prefetch(by, category, page + 1, num_row)
+        self._latencies.append(time.perf_counter() - start)
+        return _copy_rows(rows)
+
+    def _prefetch(self, by, category, page, num_row):
+        """Read a page into the cache in background if it exists and is not cached."""
+        key = (self._category_field, by, category, page, num_row)
+        if key in self._pending or self._cache.get(key) is not None:
+            return
+        if page * num_row >= self._get_category_count(by, category):
+            return
+
+        def _load():
+            try:
+                rows = self._fetch_page(by, category, page, num_row)
+                self._cache.put(key, rows)
+                return rows
+            except MindRecordException:
+                logger.warning("Failed to prefetch page {} of category {}.".format(page, category))
+                return None
+
+        future = self._prefetcher.submit(_load)
+        self._pending[key] = future
+        # registered after the future is stored, so that a finished load is never left pending
+        future.add_done_callback(lambda _: self._pending.pop(key, None))
+
+    def _get_category_count(self, by, category):
+        """Return the number of rows of a category, 0 if it is not found."""
+        if self._category_counts is None:
+            with self._segment_lock:
+                info = json.loads(self.read_category_info())
+            self._category_counts = {}
+            for item in info["categories"]:
+                self._category_counts[("id", item["id"])] = item["count"]
+                self._category_counts[("name", item["name"])] = item["count"]
+        return self._category_counts.get((by, category), 0)
@@ -17,7 +17,8 @@ This module is to write data into mindrecord.
 """
 import mindspore._c_mindrecord as ms
 from mindspore import log as logger
-from .common.exceptions import MRMAddSchemaError, MRMAddIndexError, MRMBuildSchemaError, MRMGetMetaError
+from .common.exceptions import MRMAddSchemaError, MRMAddIndexError, MRMBuildSchemaError, MRMGetMetaError, \
+    ParamValueError
 
 __all__ = ['ShardHeader']
 
@@ -92,6 +93,29 @@ class ShardHeader:
             raise MRMBuildSchemaError
         return schema
 
+    def set_compression(self, compression):
+        """
+        Set the codec which compresses the blob data of each row.
+
+        Args:
+            compression (str): Codec, "lz4" or "zstd".
+
+        Returns:
+            MSRStatus, SUCCESS or FAILED.
+
+        Raises:
+            ParamValueError: If the codec is not supported.
+        """
+        ret = self._header.set_compression(compression)
+        if ret != ms.MSRStatus.SUCCESS:
+            raise ParamValueError("Compression {} is not supported.".format(compression))
+        return ret
+
+    @property
+    def compression(self):
+        """Getter of compression, empty if blob data is not compressed"""
+        return self._header.get_compression()
+
     @property
     def header(self):
         """Getter of header"""
@@ -30,6 +30,7 @@ class ShardIndexGenerator:
     Args:
         path (str): Absolute path of MindRecord File.
         append (bool): If True, open existed MindRecord Files for appending, or create new MindRecord Files.
+            When appending, existing db files are updated incrementally with the rows of the newly committed pages.
 
     Raises:
         MRMIndexGeneratorError: If failed to create index generator.
@@ -60,6 +61,8 @@ class ShardIndexGenerator:
         """
         Create index field in table for reading data.
 
+        The db files of all shards are written in parallel.
+
         Returns:
             MSRStatus, SUCCESS or FAILED.
 
@@ -71,3 +74,41 @@ class ShardIndexGenerator:
             logger.error("Failed to write to database.")
             raise MRMGenerateIndexError
         return ret
+
+    def write_manifest(self):
+        """
+        Write the manifest of MindRecord Files after the db files are written.
+
+        The manifest is a json file next to the first MindRecord File whose name is the file name without
+        shard id followed by ".mrmanifest". It records the schema and its hash, and the size, number of rows,
+        blob bytes and number of rows of each category of index fields of every MindRecord File, so that
+        the dataset size can be got without opening all the files. The index fields with unique values or more
+        than 4096 categories in some file, like file names, are not counted to keep the manifest small.
+
+        Returns:
+            str, path of the manifest.
+
+        Raises:
+            MRMGenerateIndexError: If failed to write the manifest.
+        """
+        ret, path = self._generator.write_manifest()
+        if ret != ms.MSRStatus.SUCCESS:
+            logger.error("Failed to write manifest.")
+            raise MRMGenerateIndexError
+        return path
+
+    def check_index(self):
+        """
+        Check the db files are consistent with the pages of MindRecord Files.
+
+        Returns:
+            MSRStatus, SUCCESS or FAILED.
+
+        Raises:
+            MRMGenerateIndexError: If the db files are inconsistent.
+        """
+        ret = self._generator.check_index()
+        if ret != ms.MSRStatus.SUCCESS:
+            logger.error("Index is inconsistent with MindRecord File.")
+            raise MRMGenerateIndexError
+        return ret
@@ -17,7 +17,7 @@ This module is to read data from mindrecord.
 """
 import mindspore._c_mindrecord as ms
 from mindspore import log as logger
-from .common.exceptions import MRMOpenError, MRMLaunchError, MRMFinishError
+from .common.exceptions import MRMOpenError, MRMLaunchError, MRMFinishError, MRMFetchDataError
 
 __all__ = ['ShardReader']
 
@@ -30,7 +30,7 @@ class ShardReader:
     def __init__(self):
         self._reader = ms.ShardReader()
 
-    def open(self, file_name, num_consumer=4, columns=None, operator=None):
+    def open(self, file_name, num_consumer=4, columns=None, operator=None, use_mmap=False):
         """
         Open file and prepare to read MindRecord File.
 
@@ -39,6 +39,8 @@ class ShardReader:
            num_consumer (int): Number of worker threads which load data in parallel. Default: 4.
            columns (list[str]): List of fields which correspond data would be read.
            operator(int): Reserved parameter for operators. Default: None.
+           use_mmap (bool): Whether to map the files into memory and read blob data from the mapping.
+               Default: False.
 
         Returns:
             MSRStatus, SUCCESS or FAILED.
@@ -53,23 +55,27 @@ class ShardReader:
         else:
             load_dataset = True
             file_name = [file_name]
+        self._reader.set_use_mmap(use_mmap)
         ret = self._reader.open(file_name, load_dataset, num_consumer, columns, operator)
         if ret != ms.MSRStatus.SUCCESS:
             logger.error("Failed to open {}.".format(file_name))
             raise MRMOpenError
         return ret
 
-    def launch(self):
+    def launch(self, is_simple_reader=False):
         """
         Launch the worker threads to load data.
 
+        Args:
+            is_simple_reader (bool): Only create the tasks without launching worker threads. Default: False.
+
         Returns:
             MSRStatus, SUCCESS or FAILED.
 
         Raises:
             MRMLaunchError: If failed to launch worker threads.
         """
-        ret = self._reader.launch(False)
+        ret = self._reader.launch(is_simple_reader)
         if ret != ms.MSRStatus.SUCCESS:
             logger.error("Failed to launch worker threads.")
             raise MRMLaunchError
@@ -84,6 +90,57 @@ class ShardReader:
         """
         return self._reader.get_next()
 
+    def get_next_batch(self, batch_size):
+        """
+        Return the next rows as columns.
+
+        Args:
+            batch_size (int): Number of rows.
+
+        Returns:
+            tuple, number of rows, list of blob columns and dict of raw columns, or None if no row is left.
+            A blob column is a tuple of the concatenated bytes of rows and the uint64 offsets of rows in bytes,
+            a raw column is the bytes of int64 or float64 values, or the list of strings.
+
+        Raises:
+            MRMFetchDataError: If failed to uncompress the blob data of rows.
+        """
+        ret, batch = self._reader.get_next_batch(batch_size)
+        if ret != ms.MSRStatus.SUCCESS:
+            logger.error("Failed to get the next batch.")
+            raise MRMFetchDataError
+        return batch
+
+    def get_blob_views(self, start, num):
+        """
+        Return the blob columns of rows without reading them, only available in mmap mode.
+
+        Args:
+            start (int): Index of the first row.
+            num (int): Number of rows.
+
+        Returns:
+            list of tuple, the blob columns and raw data of each row. A blob column is a tuple of
+            file index, offset and size if it can be viewed in place, or the decoded bytes.
+
+        Raises:
+            MRMFetchDataError: If failed to locate the blob data of rows.
+        """
+        ret, rows = self._reader.get_blob_views(start, num)
+        if ret != ms.MSRStatus.SUCCESS:
+            logger.error("Failed to get the blob views of rows from {}.".format(start))
+            raise MRMFetchDataError
+        return rows
+
+    def get_file_paths(self):
+        """
+        Return the paths of MindRecord Files in the order of shard id.
+
+        Returns:
+            list of str.
+        """
+        return self._reader.get_file_paths()
+
     def get_blob_fields(self):
         """
         Return blob fields of MindRecord.
@@ -40,6 +40,7 @@ VALUE_TYPE_MAP = {"int": ["int32", "int64"], "float": ["float32", "float64"], "s
 
 VALID_ATTRIBUTES = ["int32", "int64", "float32", "float64", "string", "bytes"]
 VALID_ARRAY_ATTRIBUTES = ["int32", "int64", "float32", "float64"]
+VALID_COMPRESSIONS = ["lz4", "zstd"]
 
 
 def check_filename(path):
@@ -81,7 +82,8 @@ def populate_data(raw, blob, columns, blob_fields, schema):
 
     Args:
         raw (Dict): Data contain primitive data like "int32", "int64", "float32", "float64", "string", "bytes".
-        blob (Bytes): Data contain bytes and ndarray data.
+        blob (list): Data contain bytes and ndarray data, each column is a list of bytes or a memoryview
+            which is rendered without copy.
         columns(List): List of column name which will be populated.
         blob_fields (List): Refer to the field which data stored in blob.
         schema(Dict): Dict of Schema
@@ -117,5 +119,59 @@ def populate_data(raw, blob, columns, blob_fields, schema):
             raw[field] = blob_data
 
     for i, blob_field in enumerate(loaded_columns):
-        _render_raw(blob_field, bytes(blob[i]))
+        _render_raw(blob_field, blob[i] if isinstance(blob[i], memoryview) else bytes(blob[i]))
     return raw
+
+
+def populate_columns(num_rows, blob, raw, columns, blob_fields, schema):
+    """
+    Reconstruct columns of a batch of rows from raw and blob columns.
+
+    Args:
+        num_rows (int): Number of rows.
+        blob (list): Blob columns, each is a tuple of the concatenated bytes of rows and the uint64 offsets.
+        raw (Dict): Raw columns, each is the bytes of int64 or float64 values, or the list of strings.
+        columns(List): List of column name which will be populated.
+        blob_fields (List): Refer to the field which data stored in blob.
+        schema(Dict): Dict of Schema
+
+    Returns:
+        dict, numpy.ndarray of shape [num_rows] for number fields and of shape [num_rows] + shape for
+        array fields with fixed shape, list of str for string fields, tuple of values and offsets of
+        rows for bytes fields and array fields with variable shape.
+
+    Raises:
+        MRMUnsupportedSchemaError: If schema is invalid.
+    """
+    data = {}
+    for field, value in raw.items():
+        if field not in schema:
+            continue
+        data_type = schema[field]['type']
+        if data_type == 'string':
+            data[field] = value
+        else:
+            buffer_type = np.int64 if data_type in VALUE_TYPE_MAP["int"] else np.float64
+            data[field] = np.frombuffer(value, dtype=buffer_type).astype(data_type, copy=False)
+    if not blob_fields:
+        return data
+
+    loaded_columns = [column for column in columns if column in blob_fields] if columns else blob_fields
+    for i, blob_field in enumerate(loaded_columns):
+        values = np.frombuffer(blob[i][0], dtype=np.uint8)
+        offsets = np.frombuffer(blob[i][1], dtype=np.uint64).astype(np.int64)
+        data_type = schema[blob_field]['type']
+        data_shape = schema[blob_field]['shape'] if 'shape' in schema[blob_field] else []
+        if not data_shape:
+            data[blob_field] = (values, offsets)
+            continue
+        item_size = np.dtype(data_type).itemsize
+        values = values.view(data_type)
+        if -1 in data_shape:
+            data[blob_field] = (values, offsets // item_size)
+            continue
+        try:
+            data[blob_field] = np.reshape(values, [num_rows] + data_shape)
+        except ValueError:
+            raise MRMUnsupportedSchemaError('Shape in schema is illegal.')
+    return data
@@ -172,6 +172,79 @@ class ShardWriter:
             raise MRMWriteDatasetError
         return ret
 
+    def write_columns(self, raw_columns, blob_columns, num_rows, validate=True, parallel_writer=False):
+        """
+        Write data given by columns.
+
+        Blob data of all rows are merged into one contiguous buffer, so no per row dict is built.
+
+        Args:
+           raw_columns (dict): Dict of raw field name and the list of its values.
+           blob_columns (list): Columns of blob fields in the order of blob fields, each of them is an ndarray
+               of shape (num_rows, ...) or a list of bytes.
+           num_rows (int): Number of rows.
+           validate (bool, optional): verify data according schema if it equals to True.
+           parallel_writer (bool, optional): Load data parallel if it equals to True.
+
+        Returns:
+            MSRStatus, SUCCESS or FAILED.
+
+        Raises:
+            MRMWriteDatasetError: If failed to write dataset.
+        """
+        blob, blob_offsets = self._merge_blob_columns(blob_columns, num_rows)
+        ret = self._writer.write_columns(raw_columns, blob, blob_offsets, validate, parallel_writer)
+        if ret != ms.MSRStatus.SUCCESS:
+            logger.error("Failed to write dataset.")
+            raise MRMWriteDatasetError
+        return ret
+
+    @staticmethod
+    def _merge_blob_columns(blob_columns, num_rows):
+        """
+        Merge blob columns into one buffer, the blob of each row is merged as _merge_blob does.
+
+        Args:
+           blob_columns (list): Columns of blob fields.
+           num_rows (int): Number of rows.
+
+        Returns:
+            numpy.ndarray, uint8 buffer of the blob of all rows.
+            numpy.ndarray, int64 offsets of the blob of each row in the buffer, whose size is num_rows + 1.
+        """
+        if not blob_columns:
+            return np.zeros(0, np.uint8), np.zeros(0, np.int64)
+        if all(isinstance(column, np.ndarray) for column in blob_columns):
+            # every row has the same size, so the blobs are built as a (num_rows, row_size) matrix
+            rows = [np.ascontiguousarray(column).reshape(num_rows, -1).view(np.uint8) for column in blob_columns]
+            if len(rows) > 1:
+                parts = []
+                for row in rows:
+                    size = np.frombuffer(row.shape[1].to_bytes(8, 'big'), np.uint8)
+                    parts.append(np.broadcast_to(size, (num_rows, 8)))
+                    parts.append(row)
+                rows = [np.concatenate(parts, axis=1)]
+            row_size = rows[0].shape[1]
+            return np.ascontiguousarray(rows[0]).reshape(-1), np.arange(num_rows + 1, dtype=np.int64) * row_size
+
+        def to_bytes(value):
+            return value.tobytes() if isinstance(value, np.ndarray) else bytes(value)
+
+        if len(blob_columns) == 1:
+            pieces = [to_bytes(value) for value in blob_columns[0]]
+        else:
+            pieces = []
+            for values in zip(*blob_columns):
+                merged = []
+                for value in values:
+                    value = to_bytes(value)
+                    merged.append(len(value).to_bytes(8, 'big'))
+                    merged.append(value)
+                pieces.append(b''.join(merged))
+        offsets = np.zeros(num_rows + 1, dtype=np.int64)
+        np.cumsum([len(piece) for piece in pieces], out=offsets[1:])
+        return np.frombuffer(b''.join(pieces), np.uint8), offsets
+
     def _merge_blob(self, blob_data):
         """
         Merge multiple blob data whose type is bytes or ndarray
@@ -15,12 +15,14 @@
 """
 Csv format convert tool for MindRecord.
 """
+from functools import partial
 from importlib import import_module
 import os
 
 from mindspore import log as logger
 from ..filewriter import FileWriter
 from ..shardutils import check_filename
+from .parallel_writer import ParallelWriter, check_num_workers
 
 try:
     pd = import_module("pandas")
@@ -38,13 +40,15 @@ class CsvToMR:
         destination (str): the MindRecord file path to transform into.
         columns_list(list[str], optional): List of columns to be read(default=None).
         partition_number (int, optional): partition size (default=1).
+        num_workers (int, optional): number of processes which write the partitions concurrently,
+            each of them owns partition_number / num_workers partitions (default=1).
 
     Raises:
-        ValueError: If source, destination, partition_number is invalid.
+        ValueError: If source, destination, partition_number or num_workers is invalid.
         RuntimeError: If columns_list is invalid.
     """
 
-    def __init__(self, source, destination, columns_list=None, partition_number=1):
+    def __init__(self, source, destination, columns_list=None, partition_number=1, num_workers=1):
         if not pd:
             raise Exception("Module pandas is not found, please use pip install it.")
         if isinstance(source, str):
@@ -69,6 +73,9 @@ class CsvToMR:
         else:
             raise ValueError("The parameter partition_number must be int")
 
+        check_num_workers(num_workers)
+        self.num_workers = num_workers
+
         self.writer = FileWriter(self.destination, self.partition_number)
 
     def _check_columns(self, columns, columns_name):
@@ -107,14 +114,7 @@ class CsvToMR:
 
     def _get_row_of_csv(self, df):
         """Get row data from csv file."""
-        for _, r in df.iterrows():
-            row = {}
-            for col in self.columns_list:
-                if str(df[col].dtype) == 'bool':
-                    row[col] = int(r[col])
-                else:
-                    row[col] = r[col]
-            yield row
+        return _get_rows(df, list(self.columns_list))
 
     def transform(self):
         """
@@ -133,6 +133,14 @@ class CsvToMR:
 
         logger.info("transformed MindRecord schema is: {}".format(csv_schema))
 
+        if self.num_workers > 1:
+            writer = ParallelWriter(self.destination, self.partition_number, self.num_workers)
+            writer.set_header_size(1 << 24)
+            writer.set_page_size(1 << 26)
+            writer.add_schema(csv_schema, "csv_schema")
+            writer.add_index(list(self.columns_list))
+            return writer.write(df, partial(_get_rows, columns_list=list(self.columns_list)))
+
         # set the header size
         self.writer.set_header_size(1 << 24)
 
@@ -166,3 +174,24 @@ class CsvToMR:
         ret = self.writer.commit()
 
         return ret
+
+
+def _get_rows(df, columns_list):
+    """
+    Get row data from data frame column by column instead of iterating Series of rows.
+
+    Args:
+        df (pandas.DataFrame): data frame of csv file.
+        columns_list (list[str]): list of columns to be read.
+
+    Yields:
+        dict, row data.
+    """
+    columns = []
+    for col in columns_list:
+        if str(df[col].dtype) == 'bool':
+            columns.append(df[col].astype('int32').tolist())
+        else:
+            columns.append(df[col].tolist())
+    for values in zip(*columns):
+        yield dict(zip(columns_list, values))
@@ -22,6 +22,7 @@ from mindspore import log as logger
 from ..common.exceptions import PathNotExistsError
 from ..filewriter import FileWriter
 from ..shardutils import check_filename
+from .parallel_writer import ParallelWriter, check_num_workers
 
 __all__ = ['ImageNetToMR']
 
@@ -43,11 +44,13 @@ class ImageNetToMR:
         image_dir (str): image directory contains n02119789, n02100735, n02110185, n02096294 dir.
         destination (str): the MindRecord file path to transform into.
         partition_number (int, optional): partition size (default=1).
+        num_workers (int, optional): number of processes which read images and write the partitions
+            concurrently, each of them owns partition_number / num_workers partitions (default=1).
 
     Raises:
-        ValueError: If map_file, image_dir or destination is invalid.
+        ValueError: If map_file, image_dir, destination or num_workers is invalid.
     """
-    def __init__(self, map_file, image_dir, destination, partition_number=1):
+    def __init__(self, map_file, image_dir, destination, partition_number=1, num_workers=1):
         check_filename(map_file)
         self.map_file = map_file
 
@@ -64,14 +67,17 @@ class ImageNetToMR:
         else:
             raise ValueError("The parameter partition_number must be int")
 
+        check_num_workers(num_workers)
+        self.num_workers = num_workers
+
         self.writer = FileWriter(self.destination, self.partition_number)
 
-    def _get_imagenet_as_dict(self):
+    def _get_imagenet_files(self):
         """
-        Get data from imagenet as dict.
+        Get image files and their labels from imagenet.
 
-        Yields:
-            data (dict of list): imagenet data list which contains dict.
+        Returns:
+            list[tuple], list of image file name and label.
         """
         if not os.path.exists(self.map_file):
             raise IOError("map file {} not exists".format(self.map_file))
@@ -96,26 +102,24 @@ class ImageNetToMR:
         if not dir_paths:
             raise PathNotExistsError("not valid image dir in {}".format(self.image_dir))
 
-        # get the filename, label and image binary as a dict
+        image_files = []
         for label in dir_paths:
             for item in os.listdir(dir_paths[label]):
                 file_name = os.path.join(dir_paths[label], item)
                 if not item.endswith("JPEG") and not item.endswith("jpg"):
                     logger.warning("{} file is not suffix with JPEG/jpg, skip it.".format(file_name))
                     continue
-                data = {}
-                data["file_name"] = str(file_name)
-                data["label"] = int(label)
-
-                # get the image data
-                image_file = open(file_name, "rb")
-                image_bytes = image_file.read()
-                image_file.close()
-                if not image_bytes:
-                    logger.warning("The image file: {} is invalid.".format(file_name))
-                    continue
-                data["data"] = image_bytes
-                yield data
+                image_files.append((str(file_name), int(label)))
+        return image_files
+
+    def _get_imagenet_as_dict(self):
+        """
+        Get data from imagenet as dict.
+
+        Yields:
+            data (dict of list): imagenet data list which contains dict.
+        """
+        return _read_images(self._get_imagenet_files())
 
     def transform(self):
         """
@@ -132,6 +136,9 @@ class ImageNetToMR:
 
         logger.info("transformed MindRecord schema is: {}".format(imagenet_schema_json))
 
+        if self.num_workers > 1:
+            return self._transform_parallel(imagenet_schema_json, t0_total)
+
         # set the header size
         self.writer.set_header_size(1<<24)
 
@@ -169,3 +176,44 @@ class ImageNetToMR:
         logger.info("--------------------------------------------")
 
         return ret
+
+    def _transform_parallel(self, imagenet_schema_json, t0_total):
+        """
+        Executes transformation from imagenet to MindRecord with num_workers processes.
+
+        Returns:
+            SUCCESS/FAILED, whether successfully written into MindRecord.
+        """
+        writer = ParallelWriter(self.destination, self.partition_number, self.num_workers)
+        writer.set_header_size(1<<24)
+        writer.set_page_size(1<<26)
+        writer.add_schema(imagenet_schema_json, "imagenet_schema")
+        writer.add_index(["label", "file_name"])
+        ret = writer.write(self._get_imagenet_files(), _read_images)
+
+        t1_total = time.time()
+        logger.info("--------------------------------------------")
+        logger.info("END. Total time: {}".format(t1_total - t0_total))
+        logger.info("--------------------------------------------")
+
+        return ret
+
+
+def _read_images(image_files):
+    """
+    Read images as dict.
+
+    Args:
+        image_files (list[tuple]): list of image file name and label.
+
+    Yields:
+        data (dict of list): imagenet data list which contains dict.
+    """
+    for file_name, label in image_files:
+        # get the image data
+        with open(file_name, "rb") as image_file:
+            image_bytes = image_file.read()
+        if not image_bytes:
+            logger.warning("The image file: {} is invalid.".format(file_name))
+            continue
+        yield {"file_name": file_name, "label": label, "data": image_bytes}
@@ -24,6 +24,7 @@ import numpy as np
 from mindspore import log as logger
 from ..filewriter import FileWriter
 from ..shardutils import check_filename, SUCCESS, FAILED
+from .parallel_writer import ParallelWriter, check_num_workers
 
 try:
     cv2 = import_module("cv2")
@@ -42,12 +43,14 @@ class MnistToMR:
                       train-labels-idx1-ubyte.gz.
         destination (str): the MindRecord file directory to transform into.
         partition_number (int, optional): partition size (default=1).
+        num_workers (int, optional): number of processes which encode images and write the partitions
+            concurrently, each of them owns partition_number / num_workers partitions (default=1).
 
     Raises:
-        ValueError: If source/destination/partition_number is invalid.
+        ValueError: If source/destination/partition_number/num_workers is invalid.
     """
 
-    def __init__(self, source, destination, partition_number=1):
+    def __init__(self, source, destination, partition_number=1, num_workers=1):
         self.image_size = 28
         self.num_channels = 1
 
@@ -72,6 +75,10 @@ class MnistToMR:
         else:
             raise ValueError("The parameter partition_number must be int")
 
+        check_num_workers(num_workers)
+        self.num_workers = num_workers
+        self.destination = destination
+
         self.writer_train = FileWriter("{}_train.mindrecord".format(destination), self.partition_number)
         self.writer_test = FileWriter("{}_test.mindrecord".format(destination), self.partition_number)
 
@@ -103,9 +110,7 @@ class MnistToMR:
         """
         train_data = self._extract_images(self.train_data_filename_)
         train_labels = self._extract_labels(self.train_labels_filename_)
-        for data, label in zip(train_data, train_labels):
-            _, img = cv2.imencode(".jpeg", data)
-            yield {"label": int(label), "data": img.tobytes()}
+        return _encode_images(list(zip(train_data, train_labels)))
 
     def _mnist_test_iterator(self):
         """
@@ -116,9 +121,7 @@ class MnistToMR:
         """
         test_data = self._extract_images(self.test_data_filename_)
         test_labels = self._extract_labels(self.test_labels_filename_)
-        for data, label in zip(test_data, test_labels):
-            _, img = cv2.imencode(".jpeg", data)
-            yield {"label": int(label), "data": img.tobytes()}
+        return _encode_images(list(zip(test_data, test_labels)))
 
     def _transform_train(self):
         """
@@ -227,9 +230,57 @@ class MnistToMR:
         if not cv2:
             raise ModuleNotFoundError("opencv-python module not found, please use pip install it.")
 
+        if self.num_workers > 1:
+            return self._transform_parallel()
+
         if self._transform_train() == FAILED:
             return FAILED
         if self._transform_test() == FAILED:
             return FAILED
 
         return SUCCESS
+
+    def _transform_parallel(self):
+        """
+        Executes transformation from Mnist to MindRecord with num_workers processes.
+
+        Returns:
+            SUCCESS/FAILED, whether successfully written into MindRecord.
+        """
+        parts = [("train", self.train_data_filename_, self.train_labels_filename_),
+                 ("test", self.test_data_filename_, self.test_labels_filename_)]
+        for part, data_filename, labels_filename in parts:
+            t0_total = time.time()
+            images = self._extract_images(data_filename)
+            labels = self._extract_labels(labels_filename)
+
+            writer = ParallelWriter("{}_{}.mindrecord".format(self.destination, part), self.partition_number,
+                                    self.num_workers)
+            writer.set_header_size(1 << 24)
+            writer.set_page_size(1 << 26)
+            writer.add_schema(self.mnist_schema_json, "mnist_schema")
+            writer.add_index(["label"])
+            if writer.write(list(zip(images, labels)), _encode_images) == FAILED:
+                return FAILED
+
+            t1_total = time.time()
+            logger.info("--------------------------------------------")
+            logger.info("Total time [{}]: {}".format(part, t1_total - t0_total))
+            logger.info("--------------------------------------------")
+
+        return SUCCESS
+
+
+def _encode_images(images):
+    """
+    Encode mnist images as jpeg.
+
+    Args:
+        images (list[tuple]): list of image and label.
+
+    Yields:
+        data (dict of list): mnist data list which contains dict.
+    """
+    for data, label in images:
+        _, img = cv2.imencode(".jpeg", data)
+        yield {"label": int(label), "data": img.tobytes()}
@@ -0,0 +1,233 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Multi-process writer of MindRecord File series for convert tools.
+"""
+import json
+import multiprocessing
+import os
+import stat
+import struct
+
+from mindspore import log as logger
+from ..common.exceptions import ParamValueError, MRMSetHeaderError
+from ..shardheader import ShardHeader
+from ..shardindexgenerator import ShardIndexGenerator
+from ..shardutils import check_filename, MIN_SHARD_COUNT, MAX_SHARD_COUNT, SUCCESS
+from ..shardwriter import ShardWriter
+
+__all__ = ['ParallelWriter', 'check_num_workers', 'merge_shard_headers']
+
+# the length of header size at the beginning of each MindRecord File
+HEADER_SIZE_LEN = 8
+BATCH_SIZE = 256
+
+
+def check_num_workers(num_workers):
+    """
+    Check the number of worker processes of convert tools.
+
+    Args:
+        num_workers (int): Number of worker processes.
+
+    Raises:
+        ValueError: If num_workers is not a positive int.
+    """
+    if not isinstance(num_workers, int) or isinstance(num_workers, bool) or num_workers < 1:
+        raise ValueError("The parameter num_workers must be int and greater than 0")
+
+
+def merge_shard_headers(paths):
+    """
+    Rewrite the header of MindRecord Files written separately so that they form one MindRecord File series.
+
+    The shard addresses, the shard id and the shard id of every page are reset according to the position
+    of the file in paths, the rest of the header is kept.
+
+    Args:
+        paths (list[str]): List of MindRecord File path in the order of shard id.
+
+    Raises:
+        MRMSetHeaderError: If the merged header does not fit in the header size.
+    """
+    file_names = [os.path.basename(path) for path in paths]
+    for shard_id, path in enumerate(paths):
+        with open(path, "r+b") as fp:
+            header_len = struct.unpack("=Q", fp.read(HEADER_SIZE_LEN))[0]
+            header = json.loads(fp.read(header_len).decode("utf-8"))
+            header["shard_addresses"] = file_names
+            header["shard_id"] = shard_id
+            for page in header["page"] or []:
+                page["shard_id"] = shard_id
+            content = json.dumps(header, separators=(",", ":")).encode("utf-8")
+            if len(content) + HEADER_SIZE_LEN > header["header_size"]:
+                logger.error("Shard header of {} is too big after merging.".format(path))
+                raise MRMSetHeaderError
+            fp.seek(0)
+            fp.write(struct.pack("=Q", len(content)))
+            fp.write(content)
+
+
+def _write_shards(args):
+    """
+    Write the rows of a part of items into a subset of shards in a worker process.
+
+    Returns:
+        int, number of rows written.
+    """
+    paths, schema, desc, index_fields, header_size, page_size, row_generator, items = args
+    header = ShardHeader()
+    header.add_schema(header.build_schema(schema, desc))
+    if index_fields:
+        header.add_index_fields(index_fields)
+
+    writer = ShardWriter()
+    writer.set_header_size(header_size)
+    writer.set_page_size(page_size)
+    writer.open(paths)
+    writer.set_shard_header(header)
+
+    count = 0
+    data_list = []
+    for row in row_generator(items):
+        data_list.append(row)
+        if len(data_list) == BATCH_SIZE:
+            writer.write_raw_data(data_list)
+            count += len(data_list)
+            data_list = []
+    if data_list:
+        writer.write_raw_data(data_list)
+        count += len(data_list)
+    writer.commit()
+    logger.info("transformed {} record into {}".format(count, paths))
+    return count
+
+
+class ParallelWriter:
+    """
+    Class to write a MindRecord File series with multiple processes.
+
+    Each worker process owns a contiguous subset of the shards and writes them concurrently, then the
+    headers of all shards are merged and the index files are generated.
+
+    Args:
+        file_name (str): File name of MindRecord File.
+        shard_num (int, optional): Number of MindRecord File (default=1).
+        num_workers (int, optional): Number of worker processes, no more than shard_num are used (default=1).
+
+    Raises:
+        ParamValueError: If file_name or shard_num is invalid.
+        ValueError: If num_workers is invalid.
+    """
+    def __init__(self, file_name, shard_num=1, num_workers=1):
+        check_filename(file_name)
+        if not isinstance(shard_num, int) or shard_num < MIN_SHARD_COUNT or shard_num > MAX_SHARD_COUNT:
+            raise ParamValueError("Shard number should between {} and {}.".format(MIN_SHARD_COUNT, MAX_SHARD_COUNT))
+        check_num_workers(num_workers)
+
+        if shard_num == 1:
+            self._paths = [file_name]
+        else:
+            suffix_shard_size = len(str(shard_num - 1))
+            self._paths = ["{}{}".format(file_name, str(x).rjust(suffix_shard_size, '0')) for x in range(shard_num)]
+        self._num_workers = min(num_workers, shard_num)
+        self._schema = None
+        self._desc = None
+        self._index_fields = []
+        self._header_size = 1 << 24
+        self._page_size = 1 << 26
+
+    def add_schema(self, content, desc=None):
+        """
+        Set the schema of the MindRecord File series.
+
+        Args:
+            content (dict): Dict of user defined schema.
+            desc (str, optional): String of schema description (default=None).
+        """
+        self._schema = content
+        self._desc = desc
+
+    def add_index(self, index_fields):
+        """
+        Select index fields from schema to accelerate reading.
+
+        Args:
+            index_fields (list[str]): Fields would be set as index which should be primitive type.
+        """
+        self._index_fields = index_fields
+
+    def set_header_size(self, header_size):
+        """
+        Set the size of header.
+
+        Args:
+            header_size (int): Size of header, between 16KB and 128MB.
+        """
+        self._header_size = header_size
+
+    def set_page_size(self, page_size):
+        """
+        Set the size of page.
+
+        Args:
+            page_size (int): Size of page, between 32KB and 256MB.
+        """
+        self._page_size = page_size
+
+    def write(self, items, row_generator):
+        """
+        Write the rows generated from items and generate the index files.
+
+        items are split into num_workers contiguous parts, the worker which owns the i-th subset of shards
+        calls row_generator on the i-th part and writes all the rows it yields.
+
+        Args:
+            items (Union[list, numpy.ndarray, pandas.DataFrame]): Sliceable source of rows.
+            row_generator (Callable): Picklable function which takes a part of items and yields dicts of row.
+
+        Returns:
+            MSRStatus, SUCCESS or FAILED.
+        """
+        shard_num = len(self._paths)
+        tasks = []
+        for worker_id in range(self._num_workers):
+            shard_start = shard_num * worker_id // self._num_workers
+            shard_end = shard_num * (worker_id + 1) // self._num_workers
+            item_start = len(items) * worker_id // self._num_workers
+            item_end = len(items) * (worker_id + 1) // self._num_workers
+            tasks.append((self._paths[shard_start:shard_end], self._schema, self._desc, self._index_fields,
+                          self._header_size, self._page_size, row_generator, items[item_start:item_end]))
+
+        if self._num_workers == 1:
+            counts = [_write_shards(tasks[0])]
+        else:
+            with multiprocessing.Pool(self._num_workers) as pool:
+                counts = pool.map(_write_shards, tasks)
+        logger.info("transformed {} record with {} workers".format(sum(counts), self._num_workers))
+
+        merge_shard_headers(self._paths)
+        generator = ShardIndexGenerator(os.path.realpath(self._paths[0]))
+        generator.build()
+        generator.write_to_db()
+        manifest = generator.write_manifest()
+        os.chmod(manifest, stat.S_IRUSR | stat.S_IWUSR)
+
+        # change the file mode to 600
+        for item in self._paths:
+            os.chmod(item, stat.S_IRUSR | stat.S_IWUSR)
+            if os.path.exists(item + ".db"):
+                os.chmod(item + ".db", stat.S_IRUSR | stat.S_IWUSR)
+        return SUCCESS
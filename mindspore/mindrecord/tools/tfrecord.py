@@ -0,0 +1,259 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+TFRecord reader and tf.train.Example parser which do not depend on tensorflow.
+"""
+from collections import namedtuple
+from importlib import import_module
+import struct
+import numpy as np
+
+from mindspore import log as logger
+
+try:
+    crc32c_module = import_module("crc32c")
+except ModuleNotFoundError:
+    crc32c_module = None
+
+__all__ = ['FixedLenFeature', 'VarLenFeature', 'read_tfrecord', 'parse_example', 'crc32c']
+
+FixedLenFeature = namedtuple('FixedLenFeature', ['shape', 'dtype', 'default_value'])
+FixedLenFeature.__new__.__defaults__ = (None,)
+FixedLenFeature.__doc__ = """
+Configuration of a fixed length feature, same as tf.io.FixedLenFeature.
+
+Args:
+    shape (list[int]): Shape of the feature, [] for a scalar.
+    dtype (str): Type of the feature, "string", "int64" or "float32".
+    default_value (optional): Value used when the feature is missing in an example (default=None).
+"""
+
+VarLenFeature = namedtuple('VarLenFeature', ['dtype'])
+VarLenFeature.__doc__ = """
+Configuration of a variable length feature, same as tf.io.VarLenFeature.
+
+Args:
+    dtype (str): Type of the feature, "int64" or "float32".
+"""
+
+# the kinds of tf.train.Feature
+BYTES_LIST = 1
+FLOAT_LIST = 2
+INT64_LIST = 3
+
+# protobuf wire types
+WIRE_VARINT = 0
+WIRE_64BIT = 1
+WIRE_LENGTH_DELIMITED = 2
+WIRE_32BIT = 5
+
+CRC_MASK_DELTA = 0xa282ead8
+
+
+def _make_crc32c_table():
+    table = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0x82f63b78 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+CRC32C_TABLE = _make_crc32c_table()
+
+
+def crc32c(data):
+    """
+    Compute the CRC-32C (Castagnoli) checksum used by TFRecord.
+
+    The crc32c module is used when it is installed, otherwise a table driven implementation.
+
+    Args:
+        data (bytes): Data to be checked.
+
+    Returns:
+        int, the checksum.
+    """
+    if crc32c_module:
+        return crc32c_module.crc32c(data)
+    crc = 0xffffffff
+    for byte in data:
+        crc = CRC32C_TABLE[(crc ^ byte) & 0xff] ^ (crc >> 8)
+    return crc ^ 0xffffffff
+
+
+def _masked_crc32c(data):
+    crc = crc32c(data)
+    return (((crc >> 15) | (crc << 17)) + CRC_MASK_DELTA) & 0xffffffff
+
+
+def read_tfrecord(file_name, check_crc=False):
+    """
+    Read the records of a TFRecord file one by one.
+
+    Each record is framed as uint64 length, uint32 masked crc of length, data and uint32 masked crc of data.
+
+    Args:
+        file_name (str): Path of TFRecord file.
+        check_crc (bool, optional): Whether to verify the crc of the data of each record, the crc of the
+            length is always verified. It is slow without the crc32c module (default=False).
+
+    Yields:
+        bytes, serialized record.
+
+    Raises:
+        ValueError: If the file is truncated or corrupted.
+    """
+    if check_crc and crc32c_module is None:
+        logger.warning("The crc32c module is not installed, verifying the crc of TFRecord file {} is slow."
+                       .format(file_name))
+    with open(file_name, "rb") as fp:
+        while True:
+            header = fp.read(12)
+            if not header:
+                return
+            if len(header) != 12:
+                raise ValueError("TFRecord file {} is truncated.".format(file_name))
+            length, length_crc = struct.unpack("<QI", header)
+            if _masked_crc32c(header[:8]) != length_crc:
+                raise ValueError("TFRecord file {} is corrupted, crc of length mismatch.".format(file_name))
+            data = fp.read(length)
+            footer = fp.read(4)
+            if len(data) != length or len(footer) != 4:
+                raise ValueError("TFRecord file {} is truncated.".format(file_name))
+            if check_crc and _masked_crc32c(data) != struct.unpack("<I", footer)[0]:
+                raise ValueError("TFRecord file {} is corrupted, crc of data mismatch.".format(file_name))
+            yield data
+
+
+def _read_varint(buf, pos):
+    result = 0
+    shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _iter_fields(buf, start, end):
+    """Yield field number, wire type and value (varint) or (start, end) span of the fields of a message."""
+    pos = start
+    while pos < end:
+        key, pos = _read_varint(buf, pos)
+        field, wire_type = key >> 3, key & 0x7
+        if wire_type == WIRE_VARINT:
+            value, pos = _read_varint(buf, pos)
+            yield field, wire_type, value
+        elif wire_type == WIRE_LENGTH_DELIMITED:
+            length, pos = _read_varint(buf, pos)
+            yield field, wire_type, (pos, pos + length)
+            pos += length
+        elif wire_type == WIRE_64BIT:
+            yield field, wire_type, (pos, pos + 8)
+            pos += 8
+        elif wire_type == WIRE_32BIT:
+            yield field, wire_type, (pos, pos + 4)
+            pos += 4
+        else:
+            raise ValueError("Example is corrupted, wire type {} is not supported.".format(wire_type))
+    if pos != end:
+        raise ValueError("Example is corrupted, message exceeds its length.")
+
+
+def _decode_packed_varints(buf, start, end):
+    """Decode packed varints into int64 all at once."""
+    data = np.frombuffer(buf, np.uint8, count=end - start, offset=start)
+    if data.size == 0:
+        return np.zeros(0, np.int64)
+    is_last = data < 0x80
+    starts = np.flatnonzero(np.concatenate(([True], is_last[:-1])))
+    group = np.cumsum(np.concatenate(([0], is_last[:-1])))
+    shift = (np.arange(data.size) - starts[group]) * 7
+    values = (data & 0x7f).astype(np.uint64) << shift.astype(np.uint64)
+    return np.add.reduceat(values, starts).view(np.int64)
+
+
+def _parse_feature(buf, start, end):
+    """Parse tf.train.Feature into its kind and values."""
+    kind = None
+    values = []
+    for field, wire_type, span in _iter_fields(buf, start, end):
+        if wire_type != WIRE_LENGTH_DELIMITED or field not in (BYTES_LIST, FLOAT_LIST, INT64_LIST):
+            continue
+        kind = field
+        values = []
+        for _, value_type, value in _iter_fields(buf, *span):
+            if kind == BYTES_LIST:
+                values.append(buf[value[0]:value[1]])
+            elif kind == FLOAT_LIST and value_type == WIRE_LENGTH_DELIMITED:
+                values.append(np.frombuffer(buf, "<f4", count=(value[1] - value[0]) // 4, offset=value[0]))
+            elif kind == FLOAT_LIST:
+                values.append(np.frombuffer(buf, "<f4", count=1, offset=value[0]))
+            elif value_type == WIRE_LENGTH_DELIMITED:
+                values.append(_decode_packed_varints(buf, *value))
+            else:
+                values.append(np.array([value], np.uint64).view(np.int64))
+        if kind != BYTES_LIST:
+            dtype = np.float32 if kind == FLOAT_LIST else np.int64
+            values = np.concatenate(values).astype(dtype) if values else np.zeros(0, dtype)
+    return kind, values
+
+
+def parse_example(serialized):
+    """
+    Parse a serialized tf.train.Example.
+
+    Args:
+        serialized (bytes): Serialized tf.train.Example.
+
+    Returns:
+        dict, feature name and the tuple of its kind (1 for bytes, 2 for float, 3 for int64, None if empty)
+        and values (list of bytes, or numpy.ndarray of float32 or int64).
+
+    Raises:
+        ValueError: If serialized is not a valid tf.train.Example.
+
+    Examples:
+        >>> for record in read_tfrecord("test.tfrecord"):
+        >>>     features = parse_example(record)
+    """
+    buf = bytes(serialized)
+    features = {}
+    try:
+        for field, wire_type, span in _iter_fields(buf, 0, len(buf)):
+            # Example.features
+            if field != 1 or wire_type != WIRE_LENGTH_DELIMITED:
+                continue
+            # entries of map Features.feature
+            for entry_field, entry_type, entry in _iter_fields(buf, *span):
+                if entry_field != 1 or entry_type != WIRE_LENGTH_DELIMITED:
+                    continue
+                name = ""
+                feature = (None, [])
+                for key_field, key_type, value in _iter_fields(buf, *entry):
+                    if key_type != WIRE_LENGTH_DELIMITED:
+                        continue
+                    if key_field == 1:
+                        name = buf[value[0]:value[1]].decode("utf-8")
+                    elif key_field == 2:
+                        feature = _parse_feature(buf, *value)
+                features[name] = feature
+    except IndexError:
+        raise ValueError("Example is corrupted, it is truncated.")
+    return features
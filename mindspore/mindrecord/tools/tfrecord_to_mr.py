@@ -15,66 +15,62 @@
 TFRecord convert tool for MindRecord
 """
 
-from importlib import import_module
 from string import punctuation
 import numpy as np
 
 from mindspore import log as logger
 from ..filewriter import FileWriter
 from ..shardutils import check_filename
-
-try:
-    tf = import_module("tensorflow")    # just used to convert tfrecord to mindrecord
-except ModuleNotFoundError:
-    tf = None
+from .tfrecord import read_tfrecord, parse_example, BYTES_LIST, FLOAT_LIST, INT64_LIST
 
 __all__ = ['TFRecordToMR']
 
-SupportedTensorFlowVersion = '2.1.0'
+# feature type: (MindRecord field type, kind of tf.train.Feature which stores it)
+FEATURE_TYPE_MAP = {"string": ("string", BYTES_LIST),
+                    "int8": ("int32", INT64_LIST),
+                    "int16": ("int32", INT64_LIST),
+                    "int32": ("int32", INT64_LIST),
+                    "int64": ("int64", INT64_LIST),
+                    "uint8": ("int32", INT64_LIST),
+                    "uint16": ("int32", INT64_LIST),
+                    "uint32": ("int64", INT64_LIST),
+                    "uint64": ("int64", INT64_LIST),
+                    "bool": ("int32", INT64_LIST),
+                    "float16": ("float32", FLOAT_LIST),
+                    "float32": ("float32", FLOAT_LIST),
+                    "float64": ("float64", FLOAT_LIST)}
 
 def _cast_type(value):
     """
-    Cast complex data type to basic datatype for MindRecord to recognize.
+    Cast feature type to basic datatype for MindRecord to recognize.
 
     Args:
-        value: the TFRecord data type
+        value (Union[str, tf.DType]): the TFRecord data type, i.e. "int64" or tf.int64.
 
     Returns:
         str, which is MindRecord field type.
     """
-    tf_type_to_mr_type = {tf.string: "string",
-                          tf.int8: "int32",
-                          tf.int16: "int32",
-                          tf.int32: "int32",
-                          tf.int64: "int64",
-                          tf.uint8: "int32",
-                          tf.uint16: "int32",
-                          tf.uint32: "int64",
-                          tf.uint64: "int64",
-                          tf.float16: "float32",
-                          tf.float32: "float32",
-                          tf.float64: "float64",
-                          tf.double: "float64",
-                          tf.bool: "int32"}
-    unsupport_tf_type_to_mr_type = {tf.complex64: "None",
-                                    tf.complex128: "None"}
-
-    if value in tf_type_to_mr_type:
-        return tf_type_to_mr_type[value]
-
-    raise ValueError("Type " + value + " is not supported in MindRecord.")
-
-def _cast_string_type_to_np_type(value):
-    """Cast string type like: int32/int64/float32/float64 to np.int32/np.int64/np.float32/np.float64"""
-    string_type_to_np_type = {"int32": np.int32,
-                              "int64": np.int64,
-                              "float32": np.float32,
-                              "float64": np.float64}
-
-    if value in string_type_to_np_type:
-        return string_type_to_np_type[value]
-
-    raise ValueError("Type " + value + " is not supported cast to numpy type in MindRecord.")
+    value = getattr(value, "name", value)
+    if value in FEATURE_TYPE_MAP:
+        return FEATURE_TYPE_MAP[value][0]
+
+    raise ValueError("Type " + str(value) + " is not supported in MindRecord.")
+
+def _cast_values(key, values, field_type):
+    """Cast the values of a feature to the MindRecord field type, the int64 values must fit in int32 fields."""
+    values = np.asarray(values)
+    if field_type == "int32" and values.size:
+        info = np.iinfo(np.int32)
+        if values.min() < info.min or values.max() > info.max:
+            raise ValueError("TFRecord feature: {} has values out of the range of int32.".format(key))
+    return values.astype(field_type)
+
+def _feature_kind(value):
+    """Get the kind of tf.train.Feature which stores the feature type."""
+    return FEATURE_TYPE_MAP[getattr(value, "name", value)][1]
+
+def _is_string(value):
+    return getattr(value, "name", value) == "string"
 
 def _cast_name(key):
     """
@@ -101,31 +97,37 @@ class TFRecordToMR:
     """
     Class is for tranformation from TFRecord to MindRecord.
 
+    The TFRecord file is read and its tf.train.Example records are parsed without tensorflow.
+
     Args:
         source (str): the TFRecord file to be transformed.
         destination (str): the MindRecord file path to tranform into.
         feature_dict (dict): a dictionary than states the feature type, i.e.
             feature_dict = {"xxxx": tf.io.FixedLenFeature([], tf.string), \
-                            "yyyy": tf.io.FixedLenFeature([], tf.int64)}
+                            "yyyy": tf.io.FixedLenFeature([], tf.int64), \
+                            "zzzz": tf.io.VarLenFeature(tf.int64)}
+
+            or the same with FixedLenFeature and VarLenFeature in mindspore.mindrecord.tools.tfrecord if
+            tensorflow is not installed, i.e.
+            feature_dict = {"xxxx": FixedLenFeature([], "string"), \
+                            "yyyy": FixedLenFeature([], "int64"), \
+                            "zzzz": VarLenFeature("int64")}
+
+            VarLenFeature is stored as variable shape field whose shape is [-1].
 
-            **Follow case which uses VarLenFeature not support**
+            **Follow case which uses nested feature_dict or FixedLenSequenceFeature not support**
 
             feature_dict = {"context": {"xxxx": tf.io.FixedLenFeature([], tf.string), \
                                         "yyyy": tf.io.VarLenFeature(tf.int64)}, \
                             "sequence": {"zzzz": tf.io.FixedLenSequenceFeature([], tf.float32)}}
         bytes_fields (list): the bytes fields which are in feature_dict.
+        check_crc (bool, optional): whether to verify the crc of the data of each record, it is slow without
+            the crc32c module (default=False).
 
     Raises:
         ValueError: If parameter is invalid.
-        Exception: when tensorflow module not found or version is not correct.
     """
-    def __init__(self, source, destination, feature_dict, bytes_fields=None):
-        if not tf:
-            raise Exception("Module tensorflow is not found, please use pip install it.")
-
-        if tf.__version__ < SupportedTensorFlowVersion:
-            raise Exception("Module tensorflow version must be greater or equal {}.".format(SupportedTensorFlowVersion))
-
+    def __init__(self, source, destination, feature_dict, bytes_fields=None, check_crc=False):
         if not isinstance(source, str):
             raise ValueError("Parameter source must be string.")
         check_filename(source)
@@ -136,13 +138,15 @@ class TFRecordToMR:
 
         self.source = source
         self.destination = destination
+        self.check_crc = check_crc
 
         if feature_dict is None or not isinstance(feature_dict, dict):
             raise ValueError("Parameter feature_dict is None or not dict.")
 
         for key, val in feature_dict.items():
-            if not isinstance(val, tf.io.FixedLenFeature):
-                raise ValueError("Parameter feature_dict: {} only support FixedLenFeature.".format(feature_dict))
+            if type(val).__name__ not in ("FixedLenFeature", "VarLenFeature"):
+                raise ValueError("Parameter feature_dict: {} only support FixedLenFeature and VarLenFeature."
+                                 .format(feature_dict))
 
         self.feature_dict = feature_dict
 
@@ -158,7 +162,7 @@ class TFRecordToMR:
                     raise ValueError("Parameter bytes_fields's item: {} is not in feature_dict: {}."
                                      .format(item, self.feature_dict))
 
-                if not isinstance(self.feature_dict[item].shape, list):
+                if not isinstance(getattr(self.feature_dict[item], "shape", None), list):
                     raise ValueError("Parameter feature_dict[{}].shape should be a list.".format(item))
 
                 casted_bytes_field = _cast_name(item)
@@ -167,70 +171,112 @@ class TFRecordToMR:
         self.bytes_fields_list = bytes_fields_list
         self.scalar_set = set()
         self.list_set = set()
+        self.var_len_set = set()
 
         mindrecord_schema = {}
         for key, val in self.feature_dict.items():
-            if not val.shape:
-                self.scalar_set.add(_cast_name(key))
-                if key in self.bytes_fields_list:
+            if not hasattr(val, "shape"):
+                if _is_string(val.dtype):
+                    raise ValueError("Parameter feature_dict[{}] is VarLenFeature of string. It is not supported."
+                                     .format(key))
+                self.var_len_set.add(key)
+                mindrecord_schema[_cast_name(key)] = {"type": _cast_type(val.dtype), "shape": [-1]}
+            elif not val.shape:
+                self.scalar_set.add(key)
+                if _cast_name(key) in self.bytes_fields_list:
                     mindrecord_schema[_cast_name(key)] = {"type": "bytes"}
                 else:
                     mindrecord_schema[_cast_name(key)] = {"type": _cast_type(val.dtype)}
             else:
                 if len(val.shape) != 1:
-                    raise ValueError("Parameter len(feature_dict[{}].shape) should be 1.")
+                    raise ValueError("Parameter len(feature_dict[{}].shape) should be 1.".format(key))
                 if val.shape[0] < 1:
                     raise ValueError("Parameter feature_dict[{}].shape[0] should > 0".format(key))
-                if val.dtype == tf.string:
+                if _is_string(val.dtype):
                     raise ValueError("Parameter feautre_dict[{}].dtype is tf.string which shape[0] \
                         is not None. It is not supported.".format(key))
-                self.list_set.add(_cast_name(key))
+                self.list_set.add(key)
                 mindrecord_schema[_cast_name(key)] = {"type": _cast_type(val.dtype), "shape": [val.shape[0]]}
         self.mindrecord_schema = mindrecord_schema
 
-    def _parse_record(self, example):
-        """Returns features for a single example"""
-        features = tf.io.parse_single_example(example, features=self.feature_dict)
-        return features
-
-    def _get_data_when_scalar_field(self, ms_dict, cast_key, key, val):
-        """put data in ms_dict when field type is string"""
-        if isinstance(val.numpy(), (np.ndarray, list)):
-            raise ValueError("The response key: {}, value: {} from TFRecord should be a scalar.".format(key, val))
-        if self.feature_dict[key].dtype == tf.string:
-            if cast_key in self.bytes_fields_list:
-                ms_dict[cast_key] = val.numpy()
+    def _get_feature(self, features, key):
+        """Get the values of a feature from parsed example and check them against feature_dict."""
+        val = self.feature_dict[key]
+        kind, values = features.get(key, (None, []))
+        if key in self.var_len_set:
+            if kind not in (None, _feature_kind(val.dtype)):
+                raise ValueError("TFRecord feature_dict parameter error, type of key: {} is not matched.".format(key))
+            return values if kind else np.zeros(0)
+
+        if kind is None and key not in features and getattr(val, "default_value", None) is not None:
+            default = val.default_value
+            if _is_string(val.dtype):
+                return [default if isinstance(default, bytes) else bytes(default, encoding="utf-8")]
+            return np.reshape(np.asarray(default), -1)
+        if kind != _feature_kind(val.dtype):
+            raise ValueError("TFRecord feature_dict parameter error, key: {} is missing or its type is not matched."
+                             .format(key))
+        expected_len = val.shape[0] if val.shape else 1
+        if len(values) != expected_len:
+            raise ValueError("TFRecord feature_dict parameter error, key: {} has {} values, but expect {}."
+                             .format(key, len(values), expected_len))
+        return values
+
+    def _parse_batch(self, records):
+        """
+        Parse a batch of serialized examples into MindRecord columns.
+
+        Args:
+            records (list[bytes]): serialized tf.train.Example.
+
+        Returns:
+            dict, MindRecord field name and the values of all rows.
+        """
+        values = {key: [] for key in self.feature_dict}
+        for record in records:
+            features = parse_example(record)
+            for key in self.feature_dict:
+                values[key].append(self._get_feature(features, key))
+
+        columns = {}
+        for key, column in values.items():
+            cast_key = _cast_name(key)
+            field_type = self.mindrecord_schema[cast_key]["type"]
+            if field_type == "bytes":
+                columns[cast_key] = [value[0] for value in column]
+            elif field_type == "string":
+                columns[cast_key] = [str(value[0], encoding="utf-8") for value in column]
+            elif key in self.var_len_set:
+                columns[cast_key] = [_cast_values(key, value, field_type) for value in column]
+            elif key in self.scalar_set:
+                columns[cast_key] = _cast_values(key, np.concatenate(column), field_type)
             else:
-                ms_dict[cast_key] = str(val.numpy(), encoding="utf-8")
-        elif _cast_type(self.feature_dict[key].dtype).startswith("int"):
-            ms_dict[cast_key] = int(val.numpy())
-        else:
-            ms_dict[cast_key] = float(val.numpy())
+                columns[cast_key] = _cast_values(key, np.concatenate(column), field_type).reshape(len(column), -1)
+        return columns
+
+    def _tfrecord_batch_iterator(self, batch_size):
+        """Yield columns of batch_size records."""
+        records = []
+        for record in read_tfrecord(self.source, self.check_crc):
+            records.append(record)
+            if len(records) == batch_size:
+                yield self._parse_batch(records)
+                records = []
+        if records:
+            yield self._parse_batch(records)
 
     def tfrecord_iterator(self):
         """Yield a dict with key to be fields in schema, and value to be data."""
-        dataset = tf.data.TFRecordDataset(self.source)
-        dataset = dataset.map(self._parse_record)
-        iterator = dataset.__iter__()
-        index_id = 0
-        try:
-            for features in iterator:
+        for columns in self._tfrecord_batch_iterator(256):
+            num_rows = len(next(iter(columns.values())))
+            for i in range(num_rows):
                 ms_dict = {}
-                index_id = index_id + 1
-                for key, val in features.items():
-                    cast_key = _cast_name(key)
-                    if key in self.scalar_set:
-                        self._get_data_when_scalar_field(ms_dict, cast_key, key, val)
-                    else:
-                        if not isinstance(val.numpy(), np.ndarray) and not isinstance(val.numpy(), list):
-                            raise ValueError("he response key: {}, value: {} from TFRecord should be a ndarray or list."
-                                             .format(key, val))
-                        # list set
-                        ms_dict[cast_key] = \
-                            np.asarray(val, _cast_string_type_to_np_type(self.mindrecord_schema[cast_key]["type"]))
+                for cast_key, column in columns.items():
+                    value = column[i]
+                    if isinstance(value, np.generic):
+                        value = value.item()
+                    ms_dict[cast_key] = value
                 yield ms_dict
-        except tf.errors.InvalidArgumentError:
-            raise ValueError("TFRecord feature_dict parameter error.")
 
     def transform(self):
         """
@@ -245,22 +291,9 @@ class TFRecordToMR:
 
         writer.add_schema(self.mindrecord_schema, "TFRecord to MindRecord")
 
-        tf_iter = self.tfrecord_iterator()
-        batch_size = 256
-
         transform_count = 0
-        while True:
-            data_list = []
-            try:
-                for _ in range(batch_size):
-                    data_list.append(tf_iter.__next__())
-                    transform_count += 1
-
-                writer.write_raw_data(data_list)
-                logger.info("Transformed {} records...".format(transform_count))
-            except StopIteration:
-                if data_list:
-                    writer.write_raw_data(data_list)
-                    logger.info("Transformed {} records...".format(transform_count))
-                break
+        for columns in self._tfrecord_batch_iterator(1024):
+            writer.write_columns(columns)
+            transform_count += len(next(iter(columns.values())))
+            logger.info("Transformed {} records...".format(transform_count))
         return writer.commit()
@@ -196,6 +196,9 @@ def _load_tensor(tensor, dev_mat, tensor_map):
     Returns:
         Tensor, the sliced tensor.
 
+    Raises:
+        ValueError: If the tensor can not be split by the strategy.
+
     Examples:
         >>> tensor = Tensor(np.ones([32, 32]))
         >>> dev_mat = [2, 4]
@@ -203,13 +206,36 @@ def _load_tensor(tensor, dev_mat, tensor_map):
         >>> tensor_slice = _load_tensor(tensor, dev_mat, tensor_map)
     """
     rank = get_rank()
+    np_tensor_slice = _get_tensor_slice(tensor.asnumpy(), dev_mat, tensor_map, rank)
+    tensor_slice = Tensor(np.ascontiguousarray(np_tensor_slice))
+    return tensor_slice
+
+
+def _get_tensor_slice(np_tensor, dev_mat, tensor_map, rank):
+    """
+    Get the tensor slice of the rank by the device matrix and the tensor map.
+
+    Args:
+        np_tensor (numpy.ndarray): The tensor to be split.
+        dev_mat (list): The device matrix of devices.
+        tensor_map (list): The split strategy of tensor.
+        rank (int): The rank of the device.
+
+    Returns:
+        numpy.ndarray, the view of the tensor slice in np_tensor.
+
+    Raises:
+        ValueError: If the tensor can not be split by the strategy.
+    """
     tensor_strategy = _get_tensor_strategy(dev_mat, tensor_map)
     tensor_slice_index = _get_tensor_slice_index(dev_mat, tensor_strategy, tensor_map, rank)
-    np_tensor = tensor.asnumpy()
-    np_tensor_list = _chunk_tensor_by_strategy(np_tensor, tensor_strategy)
-    np_tensor_slice = np_tensor_list[int(tensor_slice_index)]
-    tensor_slice = Tensor(np_tensor_slice)
-    return tensor_slice
+    if len(tensor_strategy) != len(np_tensor.shape):
+        raise ValueError("The length of np_tensor does not match the length of strategy!")
+    if any(dim % num != 0 for dim, num in zip(np_tensor.shape, tensor_strategy)):
+        raise ValueError("np_tensor can not be split by strategy!")
+    # only the slice is taken out instead of splitting the whole tensor
+    slice_shape = [dim // num for dim, num in zip(np_tensor.shape, tensor_strategy)]
+    return np_tensor[_get_slice_position(tensor_strategy, int(tensor_slice_index), slice_shape)]
 
 
 def _load_tensor_by_layout(tensor, layout):
@@ -238,6 +264,59 @@ def _load_tensor_by_layout(tensor, layout):
     return _load_tensor(tensor, dev_mat, tensor_map)
 
 
+def _get_slice_position(tensor_strategy, slice_index, slice_shape):
+    """
+    Get the index ranges of the tensor slice in the whole tensor.
+
+    Args:
+        tensor_strategy (list): The split strategy of tensor.
+        slice_index (int): The index of the tensor slice.
+        slice_shape (tuple): The shape of the tensor slice.
+
+    Returns:
+        Tuple, slices of each dimension.
+    """
+    coordinate = _rank_to_coordinate(slice_index, tensor_strategy)
+    return tuple(slice(int(pos) * dim, (int(pos) + 1) * dim) for pos, dim in zip(coordinate, slice_shape))
+
+
+def _merge_tensor_slices(rank_slices, dev_mat, tensor_map):
+    """
+    Merge the tensor slices saved by ranks into the whole tensor by the device matrix and the tensor map.
+
+    Args:
+        rank_slices (dict): The rank and the tensor slice (numpy.ndarray) of it.
+        dev_mat (list): The device matrix of devices.
+        tensor_map (list): The split strategy of tensor.
+
+    Returns:
+        numpy.ndarray, the whole tensor.
+
+    Raises:
+        ValueError: If some slices of the tensor are missing.
+
+    Examples:
+        >>> rank_slices = {0: np.ones([2, 4]), 1: np.ones([2, 4]), 2: np.zeros([2, 4]), 3: np.zeros([2, 4])}
+        >>> tensor = _merge_tensor_slices(rank_slices, [2, 2], [1, -1])
+    """
+    tensor_strategy = _get_tensor_strategy(dev_mat, tensor_map)
+    slice_count = int(np.prod(tensor_strategy))
+    merged = None
+    merged_index = set()
+    for rank, tensor_slice in rank_slices.items():
+        slice_index = int(_get_tensor_slice_index(dev_mat, tensor_strategy, tensor_map, rank))
+        if slice_index in merged_index:
+            continue
+        if merged is None:
+            merged = np.empty([dim * num for dim, num in zip(tensor_slice.shape, tensor_strategy)], tensor_slice.dtype)
+        merged[_get_slice_position(tensor_strategy, slice_index, tensor_slice.shape)] = tensor_slice
+        merged_index.add(slice_index)
+    if len(merged_index) != slice_count:
+        raise ValueError("Only {} of {} slices are given, the tensor can not be merged.".format(len(merged_index),
+                                                                                              slice_count))
+    return merged
+
+
 def _reshape_param_data(param_data, dev_mat, tensor_map):
     """
     Combine param slice by the device matrix and the tensor map, used in model parallel scenario.
@@ -261,7 +340,8 @@ def _reshape_param_data(param_data, dev_mat, tensor_map):
     for dim in dev_mat:
         device_count *= dim
 
-    tensor_slices = np.split(param_data.asnumpy(), device_count, axis=0)
+    param_np = param_data.asnumpy()
+    tensor_slices = param_np.reshape((device_count, param_np.shape[0] // device_count) + param_np.shape[1:])
     tensor_strategy = _get_tensor_strategy(dev_mat, tensor_map)
 
     # get the actual number of slices,as: different devices may load the same slice
@@ -269,24 +349,31 @@ def _reshape_param_data(param_data, dev_mat, tensor_map):
     for dim in tensor_strategy:
         slice_count *= dim
 
-    # reorder slices and remove duplicates based on device matrix and tensor_map
-    tensor_slices_new = list(range(slice_count))
+    # pick one device for each slice based on device matrix and tensor_map
+    slice_devices = [-1] * slice_count
     for i in range(device_count):
-        slice_index = _get_tensor_slice_index(dev_mat, tensor_strategy, tensor_map, i)
-        tensor_slices_new[int(slice_index)] = np.array(tensor_slices[i])
+        slice_index = int(_get_tensor_slice_index(dev_mat, tensor_strategy, tensor_map, i))
+        if slice_devices[slice_index] == -1:
+            slice_devices[slice_index] = i
 
-    # combine slices to generate complete parameter
-    dim_len = len(tensor_strategy)
-    for i in range(dim_len):
-        ele_count = int(len(tensor_slices_new) / tensor_strategy[dim_len - 1 - i])
-        tensor_slices_new_inner = []
-        for j in range(ele_count):
-            new_tensor = tensor_slices_new[j * tensor_strategy[dim_len - 1 - i]]
-            for l in range(j * tensor_strategy[dim_len - 1 - i] + 1,
-                           (j + 1) * tensor_strategy[dim_len - 1 - i]):
-                new_tensor = np.concatenate((new_tensor, tensor_slices_new[l]), axis=dim_len - 1 - i)
-
-            tensor_slices_new_inner.insert(len(tensor_slices_new_inner), np.array(new_tensor))
-        tensor_slices_new = tensor_slices_new_inner
-
-    return Tensor(tensor_slices_new[0])
+    return Tensor(_merge_ordered_slices(tensor_slices[slice_devices], tensor_strategy))
+
+
+def _merge_ordered_slices(ordered_slices, tensor_strategy):
+    """
+    Merge the slices ordered by slice index into the whole tensor by one transpose.
+
+    Args:
+        ordered_slices (numpy.ndarray): The slices stacked in the order of slice index, the first dimension is the
+            number of slices.
+        tensor_strategy (list): The split strategy of tensor.
+
+    Returns:
+        numpy.ndarray, the whole tensor.
+    """
+    slice_shape = ordered_slices.shape[1:]
+    dim_len = len(slice_shape)
+    blocks = ordered_slices.reshape(tuple(tensor_strategy) + slice_shape)
+    # interleave the block axes with the slice axes, like (S0, s0, S1, s1, ...)
+    axes = [axis for i in range(dim_len) for axis in (i, dim_len + i)]
+    return blocks.transpose(axes).reshape([num * dim for num, dim in zip(tensor_strategy, slice_shape)])
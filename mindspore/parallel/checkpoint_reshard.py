@@ -0,0 +1,157 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Offline resharding of the checkpoint files saved by ranks between parallel layouts.
+
+Usage:
+    python -m mindspore.parallel.checkpoint_reshard --src_ckpt_files rank0.ckpt rank1.ckpt
+        --dst_layout layout.json --dst_ckpt_files new_rank0.ckpt new_rank1.ckpt new_rank2.ckpt new_rank3.ckpt
+"""
+import argparse
+import json
+import os
+import stat
+import numpy as np
+
+from mindspore import log as logger
+from mindspore.parallel._tensor import _get_tensor_slice
+
+__all__ = ["save_parameter_layout", "reshard_checkpoint"]
+
+
+def save_parameter_layout(net, layout_file_name):
+    """
+    Saves the layouts of the parameters of the compiled network into a json file.
+
+    The file is used as the destination layout of reshard_checkpoint, the network should be compiled with the
+    target device number and strategy, e.g. by set_strategy_ckpt_load_file.
+
+    Args:
+        net (Cell): The compiled network in auto parallel mode.
+        layout_file_name (str): Name of the layout file.
+
+    Raises:
+        TypeError: If net is not a Cell.
+    """
+    from mindspore.nn import Cell
+    if not isinstance(net, Cell):
+        raise TypeError("The net should be Cell, but got {}.".format(type(net)))
+    layouts = {}
+    for name, layout in net.parameter_layout_dict.items():
+        layouts[name] = [[int(dim) for dim in item] for item in layout[:3]]
+    with open(layout_file_name, "w") as f:
+        json.dump(layouts, f)
+
+
+def _load_parameter_layout(layout):
+    """Gets the device matrix and the tensor map of each parameter from the layout dict or the layout file."""
+    if isinstance(layout, str):
+        if not os.path.exists(layout):
+            raise ValueError("The layout file {} does not exist.".format(layout))
+        with open(layout) as f:
+            layout = json.load(f)
+    if not isinstance(layout, dict):
+        raise TypeError("The dst_layout should be dict or the name of layout file, but got {}.".format(type(layout)))
+
+    layouts = {}
+    for name, value in layout.items():
+        if not isinstance(value, (list, tuple)) or len(value) < 2:
+            raise ValueError("The layout of {} should be [dev_mat, tensor_map, ...], but got {}.".format(name, value))
+        layouts[name] = ([int(dim) for dim in value[0]], [int(dim) for dim in value[1]])
+    return layouts
+
+
+def reshard_checkpoint(src_ckpt_files, dst_layout, dst_ckpt_files):
+    """
+    Converts the checkpoint files saved by ranks in raw format to the checkpoint files of another parallel layout.
+
+    Only one parameter is merged and held in memory at a time, the source files are mapped into memory and the
+    slices of the destination ranks are written one by one. Parameters without destination layout, or not split
+    by it, are saved whole to every destination file.
+
+    Args:
+        src_ckpt_files (list[str]): Checkpoint files saved by all the ranks in raw format without integrated save,
+            a single file saved with integrated save is also accepted.
+        dst_layout (Union[dict, str]): Layout of each parameter, {param_name: [dev_mat, tensor_map, ...]}, like
+            parameter_layout_dict of the compiled network, or the file saved by save_parameter_layout.
+        dst_ckpt_files (list[str]): Checkpoint files to be saved, the i-th file is for rank i.
+
+    Raises:
+        ValueError: If the checkpoint files are invalid or the parameters can not be split by the layout.
+        TypeError: If dst_layout is invalid.
+
+    Examples:
+        >>> reshard_checkpoint(["rank0.ckpt", "rank1.ckpt"], "layout.json",
+        >>>                    ["new_rank0.ckpt", "new_rank1.ckpt", "new_rank2.ckpt", "new_rank3.ckpt"])
+    """
+    from mindspore.train.serialization import _iter_distributed_tensors, _RawCheckpointWriter
+    if not isinstance(src_ckpt_files, (list, tuple)) or not src_ckpt_files:
+        raise ValueError("The src_ckpt_files must be a non-empty list of checkpoint file names.")
+    if not isinstance(dst_ckpt_files, (list, tuple)) or not dst_ckpt_files:
+        raise ValueError("The dst_ckpt_files must be a non-empty list of checkpoint file names.")
+    for ckpt_file_name in dst_ckpt_files:
+        if not isinstance(ckpt_file_name, str) or ckpt_file_name[-5:] != ".ckpt":
+            raise ValueError("The checkpoint file name {} should end with .ckpt.".format(ckpt_file_name))
+        if ckpt_file_name in src_ckpt_files:
+            raise ValueError("The checkpoint file {} can not be both source and destination.".format(ckpt_file_name))
+    layouts = _load_parameter_layout(dst_layout)
+    device_num = len(dst_ckpt_files)
+    for name, (dev_mat, _) in layouts.items():
+        if int(np.prod(dev_mat)) != device_num:
+            raise ValueError("The device matrix {} of {} does not match the {} destination files."
+                             .format(dev_mat, name, device_num))
+
+    logger.info("Execute reshard checkpoint process.")
+    for ckpt_file_name in dst_ckpt_files:
+        if os.path.exists(ckpt_file_name):
+            os.chmod(ckpt_file_name, stat.S_IWUSR | stat.S_IRUSR)
+    writers = [_RawCheckpointWriter(ckpt_file_name) for ckpt_file_name in dst_ckpt_files]
+    try:
+        for name, data_type, param_data in _iter_distributed_tensors(src_ckpt_files):
+            dev_mat, tensor_map = layouts.get(name, (None, None))
+            if tensor_map is None or all(dim == -1 for dim in tensor_map) or param_data.size == 1:
+                for writer in writers:
+                    writer.write(name, data_type, param_data)
+                continue
+            for rank, writer in enumerate(writers):
+                param_slice = _get_tensor_slice(param_data, dev_mat, tensor_map, rank)
+                writer.write(name, data_type, param_slice,
+                             {"dev_mat": dev_mat, "tensor_map": tensor_map, "rank": rank})
+    except BaseException as e:
+        for writer in writers:
+            writer.abort()
+        logger.error("Failed to reshard the checkpoint files.")
+        raise e
+    for writer in writers:
+        writer.close()
+    for ckpt_file_name in dst_ckpt_files:
+        os.chmod(ckpt_file_name, stat.S_IRUSR)
+    logger.info("Reshard checkpoint process finish.")
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="Reshard the checkpoint files saved by ranks to another layout.")
+    parser.add_argument("--src_ckpt_files", type=str, nargs="+", required=True,
+                        help="Checkpoint files saved by all the ranks in raw format.")
+    parser.add_argument("--dst_layout", type=str, required=True,
+                        help="Layout file of the destination network saved by save_parameter_layout.")
+    parser.add_argument("--dst_ckpt_files", type=str, nargs="+", required=True,
+                        help="Checkpoint files to be saved, the i-th file is for rank i.")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = _parse_args()
+    reshard_checkpoint(args.src_ckpt_files, args.dst_layout, args.dst_ckpt_files)
@@ -17,13 +17,16 @@
 import os
 import shutil
 import stat
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import mindspore.context as context
 from mindspore import log as logger
-from mindspore._checkparam import check_bool, check_int_non_negative
+from mindspore._checkparam import check_bool, check_int_non_negative, check_int_positive
 from mindspore.train._utils import _make_directory
-from mindspore.train.serialization import _exec_save_checkpoint, _save_graph
+from mindspore.train.serialization import save_checkpoint, _get_checkpoint_param_list, _save_graph, \
+    _check_ckpt_format, _check_save_options
 
 from ._callback import Callback, set_cur_net
 
@@ -87,6 +90,21 @@ class CheckpointConfig:
             Can't be used with keep_checkpoint_max at the same time.
         integrated_save (bool): Whether to intergrated save in automatic model parallel scene. Default: True.
             Integrated save function is only supported in automatic parallel scene, not supported in manual parallel.
+            Without integrated save, each rank saves its parameter slices, and their layouts are recorded in raw
+            format for load_distributed_checkpoint.
+        ckpt_format (str): Format of checkpoint files, "protobuf" or "raw". The raw format is written parameter by
+            parameter and could be loaded by memory mapping, which suits large models. Default: "protobuf".
+        async_save (bool): Whether to save checkpoint files asynchronously. The parameters are copied to host memory
+            at the step, then written, renamed and pruned by a background thread. Default: False.
+        max_pending_saves (int): Maximum number of asynchronous saves not finished, the training waits when it is
+            reached. Default: 1.
+        storage_type (str): Type the float32 parameters are stored in raw format, "float16" or "bfloat16".
+            Default: None.
+        optimizer_states (str): How the optimizer states are saved when storage_type is set, "full" to keep them
+            in full precision, or "exclude" to not save them. Default: "full".
+        compress (bool): Whether to compress each parameter by zlib in raw format. Default: False.
+        checksum (bool): Whether to record the crc32 of each parameter in raw format, which is verified when
+            loaded. Default: False.
 
     Raises:
         ValueError: If the input_param is None or 0.
@@ -101,7 +119,14 @@ class CheckpointConfig:
                  save_checkpoint_seconds=0,
                  keep_checkpoint_max=5,
                  keep_checkpoint_per_n_minutes=0,
-                 integrated_save=True):
+                 integrated_save=True,
+                 ckpt_format="protobuf",
+                 async_save=False,
+                 max_pending_saves=1,
+                 storage_type=None,
+                 optimizer_states="full",
+                 compress=False,
+                 checksum=False):
 
         if not save_checkpoint_steps and not save_checkpoint_seconds and \
                 not keep_checkpoint_max and not keep_checkpoint_per_n_minutes:
@@ -130,6 +155,14 @@ class CheckpointConfig:
                 self._keep_checkpoint_max = 1
 
         self._integrated_save = check_bool(integrated_save)
+        self._ckpt_format = _check_ckpt_format(ckpt_format)
+        self._async_save = check_bool(async_save)
+        self._max_pending_saves = check_int_positive(max_pending_saves)
+        _check_save_options(ckpt_format, storage_type, optimizer_states, compress, checksum)
+        self._storage_type = storage_type
+        self._optimizer_states = optimizer_states
+        self._compress = compress
+        self._checksum = checksum
 
     @property
     def save_checkpoint_steps(self):
@@ -156,6 +189,41 @@ class CheckpointConfig:
         """Get the value of _integrated_save."""
         return self._integrated_save
 
+    @property
+    def ckpt_format(self):
+        """Get the value of _ckpt_format."""
+        return self._ckpt_format
+
+    @property
+    def async_save(self):
+        """Get the value of _async_save."""
+        return self._async_save
+
+    @property
+    def max_pending_saves(self):
+        """Get the value of _max_pending_saves."""
+        return self._max_pending_saves
+
+    @property
+    def storage_type(self):
+        """Get the value of _storage_type."""
+        return self._storage_type
+
+    @property
+    def optimizer_states(self):
+        """Get the value of _optimizer_states."""
+        return self._optimizer_states
+
+    @property
+    def compress(self):
+        """Get the value of _compress."""
+        return self._compress
+
+    @property
+    def checksum(self):
+        """Get the value of _checksum."""
+        return self._checksum
+
     def get_checkpoint_policy(self):
         """Get the policy of checkpoint."""
         checkpoint_policy = {'save_checkpoint_steps': self._save_checkpoint_steps,
@@ -167,6 +235,44 @@ class CheckpointConfig:
 
 
 
+class _AsyncSaver:
+    """
+    Runs the saves of checkpoint one by one in a background thread.
+
+    Args:
+        max_pending (int): Maximum number of saves not finished, submit blocks until one finishes when it is reached.
+    """
+    def __init__(self, max_pending):
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._semaphore = threading.BoundedSemaphore(max_pending)
+        self._futures = []
+
+    def _check_finished(self):
+        """Remove finished saves and raise the error of the failed one."""
+        finished = [future for future in self._futures if future.done()]
+        self._futures = [future for future in self._futures if not future.done()]
+        for future in finished:
+            future.result()
+
+    def submit(self, fn, *args):
+        """Submit the save, which is blocked while there are too many saves not finished."""
+        self._check_finished()
+        self._semaphore.acquire()
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        future.add_done_callback(lambda _: self._semaphore.release())
+        self._futures.append(future)
+
+    def flush(self):
+        """Wait for all the saves to finish."""
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+
+
 class ModelCheckpoint(Callback):
     """
     The checkpoint callback class.
@@ -212,6 +318,7 @@ class ModelCheckpoint(Callback):
         self._manager = CheckpointManager()
         self._prefix = _chg_ckpt_file_name_if_same_exist(self._directory, self._prefix)
         self._graph_saved = False
+        self._saver = _AsyncSaver(self._config.max_pending_saves) if self._config.async_save else None
 
     def step_end(self, run_context):
         """
@@ -238,6 +345,8 @@ class ModelCheckpoint(Callback):
         cb_params = run_context.original_args()
         _to_save_last_ckpt = True
         self._save_ckpt(cb_params, _to_save_last_ckpt)
+        if self._saver:
+            self._saver.flush()
 
         from mindspore.parallel._cell_wrapper import destroy_allgather_cell
         destroy_allgather_cell()
@@ -267,40 +376,59 @@ class ModelCheckpoint(Callback):
         if save_ckpt:
             cur_ckpoint_file = self._prefix + "-" + str(cb_params.cur_epoch_num) + "_" \
                                + str(step_num_in_epoch) + ".ckpt"
-            # update checkpoint file list.
-            self._manager.update_ckpoint_filelist(self._directory, self._prefix)
-            # keep checkpoint files number equal max number.
-            if self._config.keep_checkpoint_max and 0 < self._config.keep_checkpoint_max <= self._manager.ckpoint_num:
-                self._manager.remove_oldest_ckpoint_file()
-            elif self._config.keep_checkpoint_per_n_minutes and self._config.keep_checkpoint_per_n_minutes > 0:
-                self._cur_time_for_keep = time.time()
-                if (self._cur_time_for_keep - self._last_time_for_keep) \
-                        < self._config.keep_checkpoint_per_n_minutes * 60:
-                    self._manager.keep_one_ckpoint_per_minutes(self._config.keep_checkpoint_per_n_minutes,
-                                                               self._cur_time_for_keep)
-
             # generate the new checkpoint file and rename it.
             global _save_dir
             _save_dir = self._directory
             cur_file = os.path.join(self._directory, cur_ckpoint_file)
             tmp_ckpt_file_name_for_cur_process = str(os.getpid()) + "-" + 'parameters.ckpt'
             gen_file = os.path.join(_save_dir, tmp_ckpt_file_name_for_cur_process)
+            last_time_for_keep = self._last_time_for_keep
             self._last_time_for_keep = time.time()
             self._last_triggered_step = cb_params.cur_step_num
+            # set on the calling thread, so that it is the file of this step even if it is written in background
+            self._latest_ckpt_file_name = cur_file
 
             if context.get_context("enable_ge"):
                 set_cur_net(cb_params.train_network)
                 cb_params.train_network.exec_checkpoint_graph()
 
-            _exec_save_checkpoint(cb_params.train_network, gen_file, self._config.integrated_save)
-
-            if os.path.exists(gen_file):
-                shutil.move(gen_file, cur_file)
-            self._latest_ckpt_file_name = cur_file
+            if self._saver:
+                # parameters are copied before the next step updates them, the rest is done in background
+                param_list = _get_checkpoint_param_list(cb_params.train_network, self._config.integrated_save,
+                                                        snapshot=True)
+                self._saver.submit(self._write_ckpt, param_list, gen_file, cur_file, last_time_for_keep)
+            else:
+                param_list = _get_checkpoint_param_list(cb_params.train_network, self._config.integrated_save)
+                self._write_ckpt(param_list, gen_file, cur_file, last_time_for_keep)
+
+    def _write_ckpt(self, param_list, gen_file, cur_file, last_time_for_keep):
+        """Remove the old checkpoint files, then write the new one and rename it."""
+        # update checkpoint file list.
+        self._manager.update_ckpoint_filelist(self._directory, self._prefix)
+        # keep checkpoint files number equal max number.
+        if self._config.keep_checkpoint_max and 0 < self._config.keep_checkpoint_max <= self._manager.ckpoint_num:
+            self._manager.remove_oldest_ckpoint_file()
+        elif self._config.keep_checkpoint_per_n_minutes and self._config.keep_checkpoint_per_n_minutes > 0:
+            self._cur_time_for_keep = time.time()
+            if (self._cur_time_for_keep - last_time_for_keep) \
+                    < self._config.keep_checkpoint_per_n_minutes * 60:
+                self._manager.keep_one_ckpoint_per_minutes(self._config.keep_checkpoint_per_n_minutes,
+                                                           self._cur_time_for_keep)
+
+        save_checkpoint(param_list, gen_file, self._config.ckpt_format, self._config.storage_type,
+                        self._config.optimizer_states, self._config.compress, self._config.checksum)
+
+        if os.path.exists(gen_file):
+            shutil.move(gen_file, cur_file)
 
     @property
     def latest_ckpt_file_name(self):
-        """Return the latest checkpoint path and file name."""
+        """
+        Return the latest checkpoint path and file name.
+
+        In async save mode, it is set when the save is submitted, the file may be still being written until the
+        pending saves are finished at the end of training.
+        """
         return self._latest_ckpt_file_name
 
 
@@ -13,8 +13,15 @@
 # limitations under the License.
 # ============================================================================
 """Model and parameters serialization."""
+import bisect
+import hashlib
+import json
 import os
 import stat
+import struct
+import zlib
+from collections import OrderedDict
+from collections.abc import Mapping
 import numpy as np
 
 import mindspore.nn as nn
@@ -29,7 +36,8 @@ from mindspore.common.api import _executor
 from mindspore.common import dtype as mstype
 from mindspore._checkparam import check_input_data
 
-__all__ = ["save_checkpoint", "load_checkpoint", "load_param_into_net", "export"]
+__all__ = ["save_checkpoint", "save_delta_checkpoint", "compact_checkpoint", "load_checkpoint",
+           "load_distributed_checkpoint", "load_param_into_net", "export"]
 
 tensor_to_ms_type = {"Int8": mstype.int8, "Uint8": mstype.uint8, "Int16": mstype.int16, "Uint16": mstype.uint16,
                      "Int32": mstype.int32, "Uint32": mstype.uint32, "Int64": mstype.int64, "Uint64": mstype.uint64,
@@ -40,6 +48,24 @@ tensor_to_np_type = {"Int8": np.int8, "Uint8": np.uint8, "Int16": np.int16, "Uin
                      "Int32": np.int32, "Uint32": np.uint32, "Int64": np.int64, "Uint64": np.uint64,
                      "Float16": np.float16, "Float32": np.float32, "Float64": np.float64, "Bool": np.bool_}
 
+# raw checkpoint file: head of magic, offset and length of the tensor table, aligned raw data of the tensors written
+# one by one, then the tensor table in json
+_RAW_CKPT_MAGIC = b"MSCKPT\x00\x01"
+_RAW_CKPT_HEAD = struct.Struct("<8sQQ")
+_RAW_CKPT_ALIGN = 64
+
+_ckpt_formats = ("protobuf", "raw")
+
+# the float32 tensors could be stored in lower precision in raw checkpoint, the optimizer states are kept in full
+# precision or excluded
+_storage_types = {"float16": "Float16", "bfloat16": "BFloat16"}
+_optimizer_states_modes = ("full", "exclude")
+
+# delta checkpoint: raw checkpoint with its parent file in the table, the raw data of each tensor is split into blocks
+# of whole rows, only the blocks whose hashes differ from the parent are written, followed by the indexes of them
+_DELTA_BLOCK_BYTES = 4096
+_MAX_DELTA_CHAIN = 1024
+
 
 def _special_process_par(par, new_par):
     """
@@ -62,8 +88,35 @@ def _special_process_par(par, new_par):
     return False
 
 
-def _update_param(param, new_param):
-    """Updates param's data from new_param's data."""
+def _copy_param_data(param, new_param, copied_buffers):
+    """
+    Copies new_param's data into the buffer of param's data in place, instead of creating a new tensor.
+
+    Only the buffer owned by param, e.g. copied by set_parameter_data in the previous load, is copied into, since
+    the others may be shared with the arrays of user or the parameters of other networks. The buffers shared by
+    parameters are copied only once and replaced later. Returns False if the data could not be copied.
+    """
+    if param._owned_data is None or param._owned_data is not param.data:
+        return False
+    data = param.data.asnumpy()
+    address = data.__array_interface__["data"][0]
+    if address in copied_buffers or not data.flags.writeable or not data.flags.c_contiguous:
+        return False
+    np.copyto(data, new_param.data.asnumpy())
+    copied_buffers.add(address)
+    # the data on device is stale, it is synchronized from host when the tensor is used next time
+    param.data.init_flag = False
+    param.data.set_dirty(True)
+    return True
+
+
+def _update_param(param, new_param, copied_buffers=None):
+    """
+    Updates param's data from new_param's data.
+
+    The data is copied into the buffer of param in place if copied_buffers, the set of the addresses of buffers
+    copied before, is given.
+    """
 
     if isinstance(param.data, Tensor) and isinstance(new_param.data, Tensor):
         if param.data.dtype != new_param.data.dtype:
@@ -80,7 +133,8 @@ def _update_param(param, new_param):
                 raise RuntimeError(msg)
             return
 
-        param.set_parameter_data(new_param.data)
+        if copied_buffers is None or not _copy_param_data(param, new_param, copied_buffers):
+            param.set_parameter_data(new_param.data)
         return
 
     if isinstance(param.data, Tensor) and not isinstance(new_param.data, Tensor):
@@ -101,40 +155,228 @@ def _update_param(param, new_param):
         param.set_parameter_data(type(param.data)(new_param.data))
 
 
-def save_checkpoint(parameter_list, ckpoint_file_name):
+def _check_ckpt_format(ckpt_format):
+    if ckpt_format not in _ckpt_formats:
+        raise ValueError("Checkpoint format {} is not supported, it must be one of {}.".format(ckpt_format,
+                                                                                            _ckpt_formats))
+    return ckpt_format
+
+
+def _check_save_options(ckpt_format, storage_type, optimizer_states, compress, checksum):
+    """Checks the options of saving checkpoint, which are supported by raw format only."""
+    if storage_type is not None and storage_type not in _storage_types:
+        raise ValueError("Storage type {} is not supported, it must be None or one of {}."
+                         .format(storage_type, tuple(_storage_types)))
+    if optimizer_states not in _optimizer_states_modes:
+        raise ValueError("The optimizer_states must be one of {}, but got {}.".format(_optimizer_states_modes,
+                                                                                   optimizer_states))
+    if not isinstance(compress, bool) or not isinstance(checksum, bool):
+        raise TypeError("The compress and checksum must be bool.")
+    if ckpt_format != "raw" and (storage_type is not None or compress or checksum):
+        raise ValueError("The storage_type, compress and checksum are only supported by raw format.")
+
+
+def _to_storage_type(param_data, storage_type):
+    """Converts the float32 data to the storage type, the bfloat16 data is rounded to nearest even in uint16."""
+    if storage_type == "Float16":
+        return param_data.astype(np.float16)
+    bits = np.ascontiguousarray(param_data).view(np.uint32)
+    rounded = ((bits + 0x7fff + ((bits >> 16) & 1)) >> 16).astype(np.uint16)
+    return np.where(np.isnan(param_data), np.uint16(0x7fc0), rounded)
+
+
+def _from_storage_type(stored_data, storage_type, np_type):
+    """Converts the data in storage type back to the type of tensor."""
+    if storage_type == "Float16":
+        return stored_data.view(np.float16).astype(np_type)
+    return (stored_data.view("<u2").astype(np.uint32) << 16).view(np.float32).astype(np_type, copy=False)
+
+
+def _get_param_numpy(param):
+    """Get the numpy data of the parameter in parameter list of save_checkpoint."""
+    if isinstance(param["data"], np.ndarray):
+        return param["data"]
+    if isinstance(param["data"], Parameter):
+        param["data"].init_data()
+    return param["data"].asnumpy()
+
+
+def _get_param_type(param):
+    """Get the type name of the parameter in parameter list of save_checkpoint, like "Float32"."""
+    if isinstance(param["data"], np.ndarray):
+        return str(mstype.pytype_to_dtype(param["data"].dtype))
+    return str(param["data"].dtype)
+
+
+def _save_protobuf_checkpoint(parameter_list, ckpoint_file_name):
+    """Saves the parameters to a checkpoint file of protobuf."""
+    checkpoint_list = Checkpoint()
+    for param in parameter_list:
+        param_value = checkpoint_list.value.add()
+        param_value.tag = param["name"]
+        param_tensor = param_value.tensor
+        param_data = _get_param_numpy(param).reshape(-1)
+        param_tensor.tensor_content = param_data.tostring()
+        param_tensor.tensor_type = _get_param_type(param)
+
+        if param['data'].shape == ():
+            param_tensor.dims.append(0)
+        else:
+            for dim in param['data'].shape:
+                param_tensor.dims.append(dim)
+
+    with open(ckpoint_file_name, "wb") as f:
+        f.write(checkpoint_list.SerializeToString())
+
+
+class _RawCheckpointWriter:
+    """
+    Writes tensors into a raw checkpoint file one by one, the tensor table is written when it is closed.
+
+    Args:
+        ckpoint_file_name (str): Checkpoint file name.
+        table_info: Other items of the table, like the parent of delta checkpoint.
+    """
+
+    def __init__(self, ckpoint_file_name, **table_info):
+        self._file = open(ckpoint_file_name, "wb")
+        self._tensors = []
+        self._table_info = table_info
+        self._file.write(_RAW_CKPT_HEAD.pack(_RAW_CKPT_MAGIC, 0, 0))
+
+    def write_data(self, data):
+        """Writes the raw data of numpy array aligned, returns its offset and number of bytes."""
+        f = self._file
+        data = np.ascontiguousarray(data)
+        offset = -(-f.tell() // _RAW_CKPT_ALIGN) * _RAW_CKPT_ALIGN
+        f.write(bytes(offset - f.tell()))
+        f.write(data.reshape(-1).view(np.uint8))
+        return offset, data.nbytes
+
+    def add_tensor(self, tensor):
+        """Adds the item of a tensor whose data has been written to the table."""
+        self._tensors.append(tensor)
+
+    def write(self, name, data_type, param_data, layout=None, storage_type=None, compress=False, checksum=False):
+        """
+        Writes one tensor.
+
+        Args:
+            name (str): Name of the tensor.
+            data_type (str): Type name of the tensor, like "Float32".
+            param_data (numpy.ndarray): Data of the tensor.
+            layout (dict): Layout of the tensor slice, like {"dev_mat":xx, "tensor_map":xx, "rank":xx}.
+                Default: None
+            storage_type (str): Type name the tensor is stored in, "Float16" or "BFloat16". Default: None
+            compress (bool): Whether to compress the stored data by zlib. Default: False
+            checksum (bool): Whether to record the crc32 of the stored data. Default: False
+        """
+        tensor = {"name": name, "type": data_type, "shape": list(np.shape(param_data))}
+        if storage_type:
+            param_data = _to_storage_type(param_data, storage_type)
+            tensor["storage"] = storage_type
+        if compress or checksum:
+            param_data = np.ascontiguousarray(param_data).reshape(-1).view(np.uint8)
+            if compress:
+                # the fastest level, the data of weights are hardly compressed more by higher levels
+                param_data = np.frombuffer(zlib.compress(param_data, 1), np.uint8)
+                tensor["codec"] = "zlib"
+            if checksum:
+                tensor["crc32"] = zlib.crc32(param_data)
+        tensor["offset"], tensor["nbytes"] = self.write_data(param_data)
+        if layout:
+            tensor["layout"] = layout
+        self.add_tensor(tensor)
+
+    def close(self):
+        """Writes the tensor table and closes the file."""
+        f = self._file
+        table = dict(self._table_info, tensors=self._tensors)
+        table = json.dumps(table).encode("utf-8")
+        table_offset = f.tell()
+        f.write(table)
+        f.seek(0)
+        f.write(_RAW_CKPT_HEAD.pack(_RAW_CKPT_MAGIC, table_offset, len(table)))
+        f.close()
+
+    def abort(self):
+        """Closes the file without the tensor table, it could not be loaded."""
+        self._file.close()
+
+
+def _save_raw_checkpoint(parameter_list, ckpoint_file_name, storage_type=None, optimizer_states="full",
+                         compress=False, checksum=False):
+    """
+    Saves the parameters to a raw checkpoint file.
+
+    The data of each parameter is written once it is got, so only one parameter is held in memory besides the net.
+    """
+    writer = _RawCheckpointWriter(ckpoint_file_name)
+    try:
+        for param in parameter_list:
+            if storage_type and param.get("optimizer_state"):
+                if optimizer_states == "exclude":
+                    continue
+                param_storage_type = None
+            else:
+                param_storage_type = storage_type
+            data_type = _get_param_type(param)
+            if data_type != "Float32":
+                param_storage_type = None
+            writer.write(param["name"], data_type, _get_param_numpy(param), param.get("layout"),
+                         param_storage_type and _storage_types[param_storage_type], compress, checksum)
+    except BaseException:
+        writer.abort()
+        raise
+    writer.close()
+
+
+def save_checkpoint(parameter_list, ckpoint_file_name, ckpt_format="protobuf", storage_type=None,
+                    optimizer_states="full", compress=False, checksum=False):
     """
     Saves checkpoint info to a specified file.
 
     Args:
         parameter_list (list): Parameters list, each element is a dict
-                               like {"name":xx, "type":xx, "shape":xx, "data":xx}.
+                               like {"name":xx, "type":xx, "shape":xx, "data":xx}, the data could be a Tensor,
+                               a Parameter or a numpy.ndarray. The element with {"optimizer_state": True} is an
+                               optimizer state, like the moments, which are marked in the list got from network.
         ckpoint_file_name (str): Checkpoint file name.
+        ckpt_format (str): Format of the checkpoint file, "protobuf" or "raw". Default: "protobuf".
+
+            - protobuf: All the parameters are serialized into one protobuf message, which is limited to 2GB.
+            - raw: The raw data of parameters are written one by one and aligned, with a table of their names,
+              types, shapes and offsets, so that the file could be loaded by memory mapping. The layouts of
+              parameter slices, dicts like {"dev_mat":xx, "tensor_map":xx, "rank":xx} given by the "layout" of
+              elements in parameter_list, are recorded too.
+
+        storage_type (str): Type the float32 parameters are stored in, "float16" or "bfloat16", which are
+            converted back to float32 when loaded. Only supported by raw format. Default: None.
+        optimizer_states (str): How the optimizer states are saved when storage_type is set, "full" to keep them
+            in full precision, or "exclude" to not save them. Default: "full".
+        compress (bool): Whether to compress each parameter by zlib of the fastest level. Only supported by raw
+            format. Default: False.
+        checksum (bool): Whether to record the crc32 of each parameter, which is verified when loaded to detect
+            the corruption. Only supported by raw format. Default: False.
 
     Raises:
+        ValueError: Checkpoint format or the options are not supported.
         RuntimeError: Failed to save the Checkpoint file.
+
+    Examples:
+        >>> param_list = _get_checkpoint_param_list(net)
+        >>> save_checkpoint(param_list, "net.ckpt", "raw", storage_type="bfloat16", compress=True, checksum=True)
     """
+    _check_ckpt_format(ckpt_format)
+    _check_save_options(ckpt_format, storage_type, optimizer_states, compress, checksum)
     logger.info("Execute save checkpoint process.")
-    checkpoint_list = Checkpoint()
 
     try:
-        for param in parameter_list:
-            param_value = checkpoint_list.value.add()
-            param_value.tag = param["name"]
-            param_tensor = param_value.tensor
-            if isinstance(param["data"], Parameter):
-                param["data"].init_data()
-            param_data = param["data"].asnumpy().reshape(-1)
-            param_tensor.tensor_content = param_data.tostring()
-            param_tensor.tensor_type = str(param["data"].dtype)
-
-            if param['data'].shape == ():
-                param_tensor.dims.append(0)
-            else:
-                for dim in param['data'].shape:
-                    param_tensor.dims.append(dim)
-
-        with open(ckpoint_file_name, "wb") as f:
-            f.write(checkpoint_list.SerializeToString())
+        if ckpt_format == "raw":
+            _save_raw_checkpoint(parameter_list, ckpoint_file_name, storage_type, optimizer_states, compress,
+                                 checksum)
+        else:
+            _save_protobuf_checkpoint(parameter_list, ckpoint_file_name)
         os.chmod(ckpoint_file_name, stat.S_IRUSR)
 
     except BaseException as e:
@@ -143,19 +385,220 @@ def save_checkpoint(parameter_list, ckpoint_file_name):
     logger.info("Save checkpoint process finish.")
 
 
-def load_checkpoint(ckpoint_file_name, net=None):
+def _is_raw_checkpoint(ckpoint_file_name):
+    with open(ckpoint_file_name, "rb") as f:
+        return f.read(len(_RAW_CKPT_MAGIC)) == _RAW_CKPT_MAGIC
+
+
+def _read_raw_checkpoint_info(ckpoint_file_name):
+    """Reads the table of a raw checkpoint file, a dict of the tensors and other items like the parent."""
+    with open(ckpoint_file_name, "rb") as f:
+        _, table_offset, table_len = _RAW_CKPT_HEAD.unpack(f.read(_RAW_CKPT_HEAD.size))
+        f.seek(table_offset)
+        table = f.read(table_len)
+    if table_offset < _RAW_CKPT_HEAD.size or len(table) != table_len:
+        raise ValueError("The tensor table of the checkpoint file is broken.")
+    return json.loads(table.decode("utf-8"))
+
+
+def _read_raw_checkpoint_table(ckpoint_file_name):
+    """
+    Reads the tensor table of a raw checkpoint file.
+
+    Returns:
+        List, each element is a dict like {"name":xx, "type":xx, "shape":xx, "offset":xx, "nbytes":xx}.
+    """
+    info = _read_raw_checkpoint_info(ckpoint_file_name)
+    if "parent" in info:
+        raise ValueError("The checkpoint file {} is a delta checkpoint, it should be loaded by load_checkpoint."
+                         .format(ckpoint_file_name))
+    return info["tensors"]
+
+
+def _map_raw_data(file_data, tensor, key="offset", nbytes=None, np_type=np.uint8):
+    """Maps the raw data of the tensor item in the table from the file."""
+    offset = tensor[key]
+    nbytes = tensor["nbytes"] if nbytes is None else nbytes
+    if offset + nbytes > file_data.size:
+        raise ValueError("The data of {} exceeds the checkpoint file.".format(tensor["name"]))
+    return np.frombuffer(file_data, np_type, nbytes // np.dtype(np_type).itemsize, offset)
+
+
+class _DeferredTensorData:
+    """
+    Flat numpy data of a tensor in checkpoint file which is read by read_func(*args) when it is used, e.g. the data
+    to be decompressed or replayed, so that the tensors not used are not read into memory.
+    """
+
+    def __init__(self, read_func, *args):
+        self._read_func = read_func
+        self._args = args
+
+    def read(self):
+        return self._read_func(*self._args)
+
+
+def _get_tensor_data(param_data):
+    """Returns the flat numpy data of tensor in checkpoint file, which is read first if it is deferred."""
+    if isinstance(param_data, _DeferredTensorData):
+        return param_data.read()
+    return param_data
+
+
+def _decode_tensor_data(file_data, tensor):
+    """Verifies, decompresses and converts the stored data of the tensor item back to the type of tensor."""
+    np_type = tensor_to_np_type[tensor["type"]]
+    stored_data = _map_raw_data(file_data, tensor)
+    if "crc32" in tensor and zlib.crc32(stored_data) != tensor["crc32"]:
+        raise ValueError("The data of {} is corrupted, its checksum mismatches.".format(tensor["name"]))
+    if tensor.get("codec") == "zlib":
+        stored_data = np.frombuffer(zlib.decompress(stored_data), np.uint8)
+    elif "codec" in tensor:
+        raise ValueError("The codec {} of {} is not supported.".format(tensor["codec"], tensor["name"]))
+    if "storage" in tensor:
+        return _from_storage_type(stored_data, tensor["storage"], np_type)
+    return stored_data.view(np_type)
+
+
+def _read_tensor_data(file_data, tensor):
+    """
+    Reads the flat numpy data of the tensor item in the table of raw checkpoint, which is mapped from the file if it
+    is stored as is, otherwise it is deferred to be decoded when it is used.
+    """
+    if "storage" not in tensor and "codec" not in tensor and "crc32" not in tensor:
+        return _map_raw_data(file_data, tensor, np_type=tensor_to_np_type[tensor["type"]])
+    return _DeferredTensorData(_decode_tensor_data, file_data, tensor)
+
+
+def _parse_raw_checkpoint(ckpoint_file_name, with_layout=False, selected=None):
+    """
+    Yields name, type, shape and numpy data mapped from the file of each tensor in a raw checkpoint file,
+    followed by the layout of the tensor slice (None if it is not sliced) if with_layout is True.
+    The tensors not selected are skipped, and the data of the compressed or converted tensors are deferred to
+    be read when they are used.
+    """
+    tensors = _read_raw_checkpoint_table(ckpoint_file_name)
+    if not tensors:
+        return
+    file_data = np.memmap(ckpoint_file_name, dtype=np.uint8, mode="r")
+    for tensor in tensors:
+        if selected is not None and not selected(tensor["name"]):
+            continue
+        param_data = _read_tensor_data(file_data, tensor)
+        if with_layout:
+            yield tensor["name"], tensor["type"], tuple(tensor["shape"]), param_data, tensor.get("layout")
+        else:
+            yield tensor["name"], tensor["type"], tuple(tensor["shape"]), param_data
+
+
+def _parse_protobuf_checkpoint(ckpoint_file_name):
+    """Parses a checkpoint file of protobuf, returns the generator of name, type, shape and numpy data of tensors."""
+    checkpoint_list = Checkpoint()
+    with open(ckpoint_file_name, "rb") as f:
+        pb_content = f.read()
+    checkpoint_list.ParseFromString(pb_content)
+
+    def _tensors():
+        for element in checkpoint_list.value:
+            data_type = element.tensor.tensor_type
+            param_data = np.frombuffer(element.tensor.tensor_content, tensor_to_np_type[data_type])
+            dims = element.tensor.dims
+            yield element.tag, data_type, () if dims == [0] else tuple(dims), param_data
+
+    return _tensors()
+
+
+def _new_parameter(name, data_type, shape, param_data):
+    """Creates the parameter from the flat numpy data of tensor in checkpoint file."""
+    ms_type = tensor_to_ms_type[data_type]
+    param_data = _get_tensor_data(param_data)
+    if shape == ():
+        if 'Float' in data_type:
+            param_data = float(param_data[0])
+        elif 'Int' in data_type:
+            param_data = int(param_data[0])
+        return Parameter(Tensor(param_data, ms_type), name=name)
+    # the data mapped from the file or wrapping the protobuf content is read only, the parameter owns a copy of it
+    if not param_data.flags.writeable:
+        param_data = param_data.copy()
+    return Parameter(Tensor(param_data.reshape(shape), ms_type), name=name)
+
+
+class _LazyParameterDict(Mapping):
+    """
+    Maps parameter name to Parameter, which is created from the data in checkpoint file when it is accessed first.
+
+    Args:
+        tensors (iterable): Name, type, shape and numpy data of the tensors in checkpoint file.
+    """
+
+    def __init__(self, tensors):
+        self._tensors = OrderedDict((name, (data_type, shape, param_data))
+                                    for name, data_type, shape, param_data in tensors)
+        self._parameters = {}
+
+    def __getitem__(self, name):
+        if name not in self._parameters:
+            data_type, shape, param_data = self._tensors[name]
+            self._parameters[name] = _new_parameter(name, data_type, shape, param_data)
+        return self._parameters[name]
+
+    def __contains__(self, name):
+        return name in self._tensors
+
+    def __iter__(self):
+        return iter(self._tensors)
+
+    def __len__(self):
+        return len(self._tensors)
+
+
+def _check_load_selection(filter_prefix, names):
+    """Checks filter_prefix and names of load_checkpoint, returns them as tuples or None."""
+    if filter_prefix is not None:
+        if isinstance(filter_prefix, str):
+            filter_prefix = (filter_prefix,)
+        if not isinstance(filter_prefix, (list, tuple)) or not all(isinstance(x, str) for x in filter_prefix):
+            raise TypeError("The filter_prefix must be str or list of str, but got {}.".format(filter_prefix))
+        filter_prefix = tuple(filter_prefix)
+    if names is not None:
+        if isinstance(names, str) or not all(isinstance(x, str) for x in names):
+            raise TypeError("The names must be list of str, but got {}.".format(names))
+        names = frozenset(names)
+    return filter_prefix, names
+
+
+def _is_selected(name, filter_prefix, names):
+    """Whether the parameter is selected to be loaded by filter_prefix and names of load_checkpoint."""
+    return (filter_prefix is None or not name.startswith(filter_prefix)) and (names is None or name in names)
+
+
+def load_checkpoint(ckpoint_file_name, net=None, filter_prefix=None, names=None, lazy=False):
     """
     Loads checkpoint info from a specified file.
 
     Args:
         ckpoint_file_name (str): Checkpoint file name.
         net (Cell): Cell network. Default: None
+        filter_prefix (Union[str, list[str]]): Parameters whose names start with the prefix are not loaded.
+            Default: None
+        names (list[str]): Only the parameters with the names are loaded, all parameters are loaded if it is None.
+            Default: None
+        lazy (bool): Whether to create the parameters only when they are accessed in the returned mapping.
+            The data of checkpoint files in raw format are mapped from the file and only the accessed parameters
+            are read. The delta checkpoints are always replayed onto their parents when loaded. Default: False
 
     Returns:
-        Dict, key is parameter name, value is a Parameter.
+        Dict, key is parameter name, value is a Parameter. It is a Mapping when lazy is True.
 
     Raises:
         ValueError: Checkpoint file is incorrect.
+        TypeError: filter_prefix or names is not str or list of str.
+
+    Examples:
+        >>> # load the backbone only, the parameters of the head are not read and created
+        >>> param_dict = load_checkpoint("resnet.ckpt", filter_prefix="head.", lazy=True)
+        >>> load_param_into_net(backbone, param_dict)
     """
     if not isinstance(ckpoint_file_name, str):
         raise ValueError("The ckpoint_file_name must be String.")
@@ -166,48 +609,385 @@ def load_checkpoint(ckpoint_file_name, net=None):
     if os.path.getsize(ckpoint_file_name) == 0:
         raise ValueError("The checkpoint file may be empty, please make sure enter the correct file name.")
 
+    filter_prefix, names = _check_load_selection(filter_prefix, names)
     logger.info("Execute load checkpoint process.")
-    checkpoint_list = Checkpoint()
 
     try:
-        with open(ckpoint_file_name, "rb") as f:
-            pb_content = f.read()
-        checkpoint_list.ParseFromString(pb_content)
+        if _is_delta_checkpoint(ckpoint_file_name):
+            tensors = list(_parse_delta_checkpoint(ckpoint_file_name,
+                                                   lambda name: _is_selected(name, filter_prefix, names)))
+        elif _is_raw_checkpoint(ckpoint_file_name):
+            tensors = list(_parse_raw_checkpoint(ckpoint_file_name,
+                                                 selected=lambda name: _is_selected(name, filter_prefix, names)))
+        else:
+            tensors = _parse_protobuf_checkpoint(ckpoint_file_name)
     except BaseException as e:
         logger.error("Failed to read the checkpoint file %s, please check the correct of the file.", ckpoint_file_name)
         raise ValueError(e.__str__())
 
-    parameter_dict = {}
+    if filter_prefix is not None or names is not None:
+        tensors = (x for x in tensors if _is_selected(x[0], filter_prefix, names))
 
-    try:
-        for element in checkpoint_list.value:
-            data = element.tensor.tensor_content
-            data_type = element.tensor.tensor_type
-            np_type = tensor_to_np_type[data_type]
-            ms_type = tensor_to_ms_type[data_type]
-            param_data = np.fromstring(data, np_type)
-            dims = element.tensor.dims
+    if lazy:
+        parameter_dict = _LazyParameterDict(tensors)
+        logger.info("Load checkpoint process finish, parameters are created when accessed.")
+    else:
+        parameter_dict = {}
+
+        try:
+            for name, data_type, shape, param_data in tensors:
+                parameter_dict[name] = _new_parameter(name, data_type, shape, param_data)
+
+            logger.info("Load checkpoint process finish.")
+
+        except ValueError:
+            logger.error("Failed to read the checkpoint file %s, please check the correct of the file.",
+                         ckpoint_file_name)
+            raise
+        except BaseException as e:
+            logger.error("Failed to load the checkpoint file %s.", ckpoint_file_name)
+            raise RuntimeError(e.__str__())
+
+    if net:
+        load_param_into_net(net, parameter_dict)
+
+    return parameter_dict
 
-            if dims == [0]:
-                if 'Float' in data_type:
-                    param_data = float(param_data[0])
-                elif 'Int' in data_type:
-                    param_data = int(param_data[0])
-                parameter_dict[element.tag] = Parameter(Tensor(param_data, ms_type), name=element.tag)
-            elif dims == [1]:
-                parameter_dict[element.tag] = Parameter(Tensor(param_data, ms_type), name=element.tag)
+
+def _is_delta_checkpoint(ckpoint_file_name):
+    return _is_raw_checkpoint(ckpoint_file_name) and "parent" in _read_raw_checkpoint_info(ckpoint_file_name)
+
+
+def _get_block_nbytes(shape, data_nbytes):
+    """Gets the number of bytes of the blocks of a tensor, each block is made of whole rows."""
+    if not shape or shape[0] == 0:
+        return max(1, data_nbytes)
+    row_nbytes = max(1, data_nbytes // shape[0])
+    return max(1, _DELTA_BLOCK_BYTES // row_nbytes) * row_nbytes
+
+
+def _get_block_hashes(flat_data, block_nbytes):
+    """Gets the 64 bits hashes of the blocks of the raw data of a tensor."""
+    data = memoryview(flat_data)
+    count = max(1, -(-len(data) // block_nbytes))
+    digests = b"".join(hashlib.blake2b(data[i * block_nbytes:(i + 1) * block_nbytes], digest_size=8).digest()
+                       for i in range(count))
+    return np.frombuffer(digests, "<u8")
+
+
+def _get_changed_blocks(flat_data, block_nbytes, changed):
+    """Gets the raw data of the changed blocks of a tensor, the last block may be shorter than the others."""
+    full_count = flat_data.size // block_nbytes
+    full_changed = changed[changed < full_count]
+    blocks = flat_data[:full_count * block_nbytes].reshape(full_count, block_nbytes)[full_changed].reshape(-1)
+    if full_changed.size < changed.size:
+        blocks = np.concatenate((blocks, flat_data[full_count * block_nbytes:]))
+    return blocks
+
+
+def _get_parent_hashes(parent_tensor, parent_data, data_type, shape, block_nbytes):
+    """Gets the block hashes of the tensor in the parent checkpoint, None if it could not be compared."""
+    if parent_tensor is None or parent_tensor["type"] != data_type or tuple(parent_tensor["shape"]) != shape:
+        return None
+    if "hash_offset" in parent_tensor:
+        if parent_tensor["block_nbytes"] != block_nbytes:
+            return None
+        count = max(1, -(-parent_tensor["data_nbytes"] // block_nbytes))
+        return _map_raw_data(parent_data, parent_tensor, "hash_offset", count * 8, "<u8")
+    # a full checkpoint saved by save_checkpoint, the hashes are got from its data once
+    return _get_block_hashes(_get_tensor_data(_read_tensor_data(parent_data, parent_tensor)).view(np.uint8),
+                             block_nbytes)
+
+
+def _save_delta_checkpoint(parameter_list, ckpoint_file_name, parent_ckpoint_file_name):
+    """Saves the changed blocks of the parameters and the hashes of all the blocks."""
+    parent_info = _read_raw_checkpoint_info(parent_ckpoint_file_name)
+    parent_tensors = {tensor["name"]: tensor for tensor in parent_info["tensors"]}
+    parent_data = np.memmap(parent_ckpoint_file_name, dtype=np.uint8, mode="r")
+    parent = os.path.relpath(os.path.realpath(parent_ckpoint_file_name),
+                             os.path.dirname(os.path.realpath(ckpoint_file_name)))
+    writer = _RawCheckpointWriter(ckpoint_file_name, parent=parent)
+    try:
+        for param in parameter_list:
+            param_data = _get_param_numpy(param)
+            # the shape is got before the data is made contiguous, which turns a scalar into shape [1]
+            shape = np.shape(param_data)
+            flat_data = np.ascontiguousarray(param_data).reshape(-1).view(np.uint8)
+            data_type = _get_param_type(param)
+            block_nbytes = _get_block_nbytes(shape, flat_data.nbytes)
+            hashes = _get_block_hashes(flat_data, block_nbytes)
+            parent_hashes = _get_parent_hashes(parent_tensors.get(param["name"]), parent_data, data_type,
+                                               shape, block_nbytes)
+            tensor = {"name": param["name"], "type": data_type, "shape": list(shape),
+                      "block_nbytes": block_nbytes, "data_nbytes": flat_data.nbytes}
+            changed = None if parent_hashes is None else np.flatnonzero(hashes != parent_hashes)
+            # the tensor is written whole if most of it is changed, so that it is replayed faster
+            if changed is None or changed.size * 2 > hashes.size:
+                tensor["offset"], tensor["nbytes"] = writer.write_data(flat_data)
             else:
-                param_dim = []
-                for dim in dims:
-                    param_dim.append(dim)
-                param_value = param_data.reshape(param_dim)
-                parameter_dict[element.tag] = Parameter(Tensor(param_value, ms_type), name=element.tag)
+                tensor["offset"], tensor["nbytes"] = writer.write_data(
+                    _get_changed_blocks(flat_data, block_nbytes, changed))
+                tensor["changed_offset"], _ = writer.write_data(changed.astype("<i8"))
+                tensor["changed_count"] = int(changed.size)
+            tensor["hash_offset"], _ = writer.write_data(hashes)
+            if param.get("layout"):
+                tensor["layout"] = param["layout"]
+            writer.add_tensor(tensor)
+    except BaseException:
+        writer.abort()
+        raise
+    writer.close()
+
+
+def save_delta_checkpoint(parameter_list, ckpoint_file_name, parent_ckpoint_file_name):
+    """
+    Saves the parameters changed since the parent checkpoint to a delta checkpoint file.
+
+    The raw data of each parameter is split into blocks of whole rows, only the blocks whose content hashes differ
+    from the parent are written, so that the huge embedding tables updated sparsely are saved by the changed rows.
+    The hashes of all the blocks are written too, the next delta checkpoint could use this file as its parent
+    without reading the data. The delta checkpoint is loaded by load_checkpoint, which replays the chain of
+    delta checkpoints onto the full checkpoint, and the chain could be folded into a new full checkpoint by
+    compact_checkpoint. The parent files should be kept until the chain is compacted.
+
+    Args:
+        parameter_list (list): Parameters list, same as save_checkpoint.
+        ckpoint_file_name (str): Checkpoint file name.
+        parent_ckpoint_file_name (str): The previous checkpoint file, a full checkpoint in raw format or a delta
+            checkpoint. It is recorded relative to the directory of ckpoint_file_name.
 
-        logger.info("Load checkpoint process finish.")
+    Raises:
+        ValueError: The parent checkpoint file is not in raw format.
+        RuntimeError: Failed to save the Checkpoint file.
+
+    Examples:
+        >>> save_checkpoint(param_list, "step_0.ckpt", ckpt_format="raw")
+        >>> save_delta_checkpoint(param_list, "step_100.ckpt", "step_0.ckpt")
+        >>> save_delta_checkpoint(param_list, "step_200.ckpt", "step_100.ckpt")
+        >>> param_dict = load_checkpoint("step_200.ckpt")
+    """
+    if not isinstance(parent_ckpoint_file_name, str) or not os.path.exists(parent_ckpoint_file_name) or \
+            not _is_raw_checkpoint(parent_ckpoint_file_name):
+        raise ValueError("The parent checkpoint file {} does not exist or is not in raw format."
+                         .format(parent_ckpoint_file_name))
+    logger.info("Execute save delta checkpoint process.")
+
+    try:
+        _save_delta_checkpoint(parameter_list, ckpoint_file_name, parent_ckpoint_file_name)
+        os.chmod(ckpoint_file_name, stat.S_IRUSR)
 
     except BaseException as e:
-        logger.error("Failed to load the checkpoint file %s.", ckpoint_file_name)
+        logger.error("Failed to save the delta checkpoint file %s.", ckpoint_file_name)
         raise RuntimeError(e.__str__())
+    logger.info("Save delta checkpoint process finish.")
+
+
+def _read_delta_chain(ckpoint_file_name):
+    """Reads the tables and maps the data of the checkpoint files from the delta checkpoint back to the full one."""
+    chain = []
+    file_names = set()
+    while True:
+        file_name = os.path.realpath(ckpoint_file_name)
+        if file_name in file_names or len(chain) >= _MAX_DELTA_CHAIN:
+            raise ValueError("The chain of delta checkpoint {} is cyclic or too long.".format(ckpoint_file_name))
+        if not os.path.exists(file_name) or not _is_raw_checkpoint(file_name):
+            raise ValueError("The parent checkpoint file {} does not exist or is not in raw format."
+                             .format(ckpoint_file_name))
+        file_names.add(file_name)
+        info = _read_raw_checkpoint_info(file_name)
+        tensors = OrderedDict((tensor["name"], tensor) for tensor in info["tensors"])
+        chain.append((tensors, np.memmap(file_name, dtype=np.uint8, mode="r")))
+        if "parent" not in info:
+            return chain
+        ckpoint_file_name = os.path.join(os.path.dirname(file_name), info["parent"])
+
+
+def _replay_delta_tensor(name, entries):
+    """Replays the changed blocks onto the data of the tensor in full checkpoint, returns its flat numpy data."""
+    tensor, file_data = entries[-1]
+    param_data = _get_tensor_data(_read_tensor_data(file_data, tensor))
+    if len(entries) == 1:
+        return param_data
+
+    block_nbytes = entries[0][0]["block_nbytes"]
+    data_nbytes = param_data.nbytes
+    block_count = max(1, -(-data_nbytes // block_nbytes))
+    # the last block is padded, so that the changed blocks are copied by one assignment
+    buffer = np.zeros(block_count * block_nbytes, np.uint8)
+    buffer[:data_nbytes] = param_data.view(np.uint8)
+    blocks = buffer.reshape(block_count, block_nbytes)
+    for delta, delta_data in reversed(entries[:-1]):
+        if delta["block_nbytes"] != block_nbytes or delta["data_nbytes"] != data_nbytes:
+            raise ValueError("The blocks of {} in the delta checkpoints are inconsistent.".format(name))
+        count = delta["changed_count"]
+        changed = _map_raw_data(delta_data, delta, "changed_offset", count * 8, "<i8")
+        changed_data = np.zeros(count * block_nbytes, np.uint8)
+        changed_data[:delta["nbytes"]] = _map_raw_data(delta_data, delta)
+        blocks[changed] = changed_data.reshape(count, block_nbytes)
+    return buffer[:data_nbytes].view(param_data.dtype)
+
+
+def _parse_delta_checkpoint(ckpoint_file_name, selected=None, with_layout=False):
+    """
+    Yields name, type, shape and numpy data of each tensor in a delta checkpoint, which are deferred to be replayed
+    from the chain of its parents, followed by the layout if with_layout is True. The tensors not selected are
+    skipped.
+    """
+    chain = _read_delta_chain(ckpoint_file_name)
+    for name, tensor in chain[0][0].items():
+        if selected is not None and not selected(name):
+            continue
+        # the entries from the delta checkpoint back to the one where the tensor is written whole
+        entries = []
+        for tensors, file_data in chain:
+            entry = tensors.get(name)
+            if entry is None:
+                raise ValueError("The tensor {} is missing in the parent checkpoint file.".format(name))
+            entries.append((entry, file_data))
+            if "changed_offset" not in entry:
+                break
+        else:
+            raise ValueError("The tensor {} is missing in the full checkpoint file.".format(name))
+        param_data = _DeferredTensorData(_replay_delta_tensor, name, entries)
+        if with_layout:
+            yield name, tensor["type"], tuple(tensor["shape"]), param_data, tensor.get("layout")
+        else:
+            yield name, tensor["type"], tuple(tensor["shape"]), param_data
+
+
+def compact_checkpoint(ckpoint_file_name, new_ckpoint_file_name):
+    """
+    Folds the chain of a delta checkpoint into a new full checkpoint in raw format.
+
+    The new file could be loaded without the parents and be the parent of later delta checkpoints, the hashes
+    of the blocks are kept in it so that they are not computed again.
+
+    Args:
+        ckpoint_file_name (str): The delta checkpoint file.
+        new_ckpoint_file_name (str): The full checkpoint file to be saved.
+
+    Raises:
+        ValueError: The checkpoint file is not a delta checkpoint.
+        RuntimeError: Failed to read the chain of the delta checkpoint or save the Checkpoint file.
+
+    Examples:
+        >>> compact_checkpoint("step_200.ckpt", "step_200_full.ckpt")
+    """
+    if not isinstance(ckpoint_file_name, str) or not os.path.exists(ckpoint_file_name) or \
+            not _is_delta_checkpoint(ckpoint_file_name):
+        raise ValueError("The checkpoint file {} does not exist or is not a delta checkpoint."
+                         .format(ckpoint_file_name))
+    logger.info("Execute compact checkpoint process.")
+
+    try:
+        writer = _RawCheckpointWriter(new_ckpoint_file_name)
+        try:
+            delta_tensors, delta_data = _read_delta_chain(ckpoint_file_name)[0]
+            for name, data_type, shape, param_data, layout in _parse_delta_checkpoint(ckpoint_file_name,
+                                                                                      with_layout=True):
+                delta = delta_tensors[name]
+                count = max(1, -(-delta["data_nbytes"] // delta["block_nbytes"]))
+                tensor = {"name": name, "type": data_type, "shape": list(shape),
+                          "block_nbytes": delta["block_nbytes"], "data_nbytes": delta["data_nbytes"]}
+                tensor["offset"], tensor["nbytes"] = writer.write_data(_get_tensor_data(param_data))
+                tensor["hash_offset"], _ = writer.write_data(_map_raw_data(delta_data, delta, "hash_offset",
+                                                                           count * 8, "<u8"))
+                if layout:
+                    tensor["layout"] = layout
+                writer.add_tensor(tensor)
+        except BaseException:
+            writer.abort()
+            raise
+        writer.close()
+        os.chmod(new_ckpoint_file_name, stat.S_IRUSR)
+
+    except BaseException as e:
+        logger.error("Failed to compact the checkpoint file %s.", ckpoint_file_name)
+        raise RuntimeError(e.__str__())
+    logger.info("Compact checkpoint process finish.")
+
+
+def _merge_distributed_tensor(name, slices):
+    """Merges the slices of one tensor in the checkpoint files of ranks, returns its type and whole numpy data."""
+    data_type, shape, param_data, layout = slices[0]
+    if layout is None:
+        return data_type, _get_tensor_data(param_data).reshape(shape)
+
+    from mindspore.parallel._tensor import _merge_tensor_slices
+    rank_slices = {}
+    for slice_type, slice_shape, slice_data, slice_layout in slices:
+        if slice_type != data_type or slice_layout is None or \
+                (slice_layout["dev_mat"], slice_layout["tensor_map"]) != (layout["dev_mat"], layout["tensor_map"]):
+            raise ValueError("The slices of {} in checkpoint files have different types or layouts.".format(name))
+        rank_slices[slice_layout["rank"]] = _get_tensor_data(slice_data).reshape(slice_shape)
+    return data_type, _merge_tensor_slices(rank_slices, layout["dev_mat"], layout["tensor_map"])
+
+
+def _iter_distributed_tensors(ckpoint_file_names):
+    """
+    Yields name, type and whole numpy data of each tensor in the raw checkpoint files saved by ranks.
+
+    The files are mapped into memory, and one tensor is decoded and merged at a time.
+    """
+    for ckpoint_file_name in ckpoint_file_names:
+        if not isinstance(ckpoint_file_name, str) or not os.path.exists(ckpoint_file_name) or \
+                ckpoint_file_name[-5:] != ".ckpt" or not _is_raw_checkpoint(ckpoint_file_name):
+            raise ValueError("The checkpoint file {} does not exist or is not in raw format.".format(ckpoint_file_name))
+
+    try:
+        tensor_slices = OrderedDict()
+        for ckpoint_file_name in ckpoint_file_names:
+            for name, data_type, shape, param_data, layout in _parse_raw_checkpoint(ckpoint_file_name, True):
+                tensor_slices.setdefault(name, []).append((data_type, shape, param_data, layout))
+    except BaseException as e:
+        logger.error("Failed to read the checkpoint files, please check the correct of the files.")
+        raise ValueError(e.__str__())
+
+    for name in list(tensor_slices.keys()):
+        data_type, param_data = _merge_distributed_tensor(name, tensor_slices.pop(name))
+        yield name, data_type, param_data
+
+
+def load_distributed_checkpoint(ckpoint_file_names, net=None, layout_dict=None):
+    """
+    Loads the checkpoint files saved by all the ranks in raw format without integrated save.
+
+    Each file holds the slices of parameters on one rank and their layouts. The slices of a parameter are merged
+    into the whole parameter one parameter at a time, so the number of devices and the parallel strategy could
+    differ from those of saving.
+
+    Args:
+        ckpoint_file_names (list[str]): Checkpoint file names of all the ranks.
+        net (Cell): Cell network, the parameters are loaded into it. Default: None
+        layout_dict (dict): Layouts of parameters on the current rank, like the parameter_layout_dict of a compiled
+            network. The merged parameters in it are sliced for the current rank at once, so the whole parameters
+            are not kept in memory. Default: None
+
+    Returns:
+        Dict, key is parameter name, value is a Parameter.
+
+    Raises:
+        ValueError: Checkpoint files are incorrect, or slices of some parameters are missing.
+
+    Examples:
+        >>> ckpt_files = ["./rank_{}/CKP-1_32.ckpt".format(i) for i in range(8)]
+        >>> param_dict = load_distributed_checkpoint(ckpt_files)
+        >>> load_param_into_net(net, param_dict)
+    """
+    if not isinstance(ckpoint_file_names, (list, tuple)) or not ckpoint_file_names:
+        raise ValueError("The ckpoint_file_names must be a non-empty list of checkpoint file names.")
+
+    logger.info("Execute load distributed checkpoint process.")
+    from mindspore.parallel._tensor import _load_tensor_by_layout
+    parameter_dict = {}
+    for name, data_type, param_data in _iter_distributed_tensors(ckpoint_file_names):
+        if layout_dict and name in layout_dict:
+            tensor = _load_tensor_by_layout(Tensor(param_data, tensor_to_ms_type[data_type]), layout_dict[name])
+            parameter_dict[name] = Parameter(tensor, name=name)
+            parameter_dict[name].sliced = True
+        else:
+            parameter_dict[name] = _new_parameter(name, data_type, param_data.shape, param_data)
+    logger.info("Load distributed checkpoint process finish.")
 
     if net:
         load_param_into_net(net, parameter_dict)
@@ -219,9 +999,13 @@ def load_param_into_net(net, parameter_dict):
     """
     Loads parameters into network.
 
+    The data of parameters are copied into the existing buffers of the network parameters in place. The parameters
+    not found by name are looked up by the names with a prefix in parameter_dict, like "network." of the wrapped
+    network saved.
+
     Args:
         net (Cell): Cell network.
-        parameter_dict (dict): Parameter dict.
+        parameter_dict (dict): Parameter dict, or the mapping returned by load_checkpoint in lazy mode.
 
     Raises:
         TypeError: Argument is not a Cell, or parameter_dict is not a Parameter dict.
@@ -231,15 +1015,16 @@ def load_param_into_net(net, parameter_dict):
         msg = ("Argument net should be a Cell, but got {}.".format(type(net)))
         raise TypeError(msg)
 
-    if not isinstance(parameter_dict, dict):
+    if not isinstance(parameter_dict, Mapping):
         logger.error("Failed to combine the net and the parameters.")
         msg = ("Argument parameter_dict should be a dict, but got {}.".format(type(parameter_dict)))
         raise TypeError(msg)
 
     logger.info("Execute load parameter into net process.")
     net.init_parameters_data()
-    param_not_load = []
-    for _, param in net.parameters_and_names():
+    param_not_load = OrderedDict()
+    copied_buffers = set()
+    for param in net.get_parameters():
         if param.name in parameter_dict:
             new_param = parameter_dict[param.name]
             if not isinstance(new_param, Parameter):
@@ -247,12 +1032,12 @@ def load_param_into_net(net, parameter_dict):
                 msg = ("Argument parameter_dict element should be a Parameter, but got {}.".format(type(new_param)))
                 raise TypeError(msg)
             param.init_data()
-            _update_param(param, new_param)
+            _update_param(param, new_param, copied_buffers)
         else:
-            param_not_load.append(param.name)
+            param_not_load.setdefault(param.name, []).append(param)
 
     if param_not_load:
-        _load_dismatch_prefix_params(net, parameter_dict, param_not_load)
+        _load_dismatch_prefix_params(parameter_dict, param_not_load, copied_buffers)
 
     logger.debug("Params not matched(in net but not in parameter_dict):")
     for param_name in param_not_load:
@@ -261,29 +1046,53 @@ def load_param_into_net(net, parameter_dict):
     logger.info("Load parameter into net finish, {} parameters has not been loaded.".format(len(param_not_load)))
 
 
-def _load_dismatch_prefix_params(net, parameter_dict, param_not_load):
-    """When some net parameter did not load, try to continue load."""
-    prefix_name = ""
-    longest_name = param_not_load[0]
-    while prefix_name != longest_name and param_not_load:
+def _find_name_by_suffix(suffix_index, suffix):
+    """
+    Finds the first name ending with suffix in the suffix index, None if not found.
+
+    The suffix index is the sorted list of the reversed names and their orders, where the names ending with suffix
+    are adjacent.
+    """
+    reversed_suffix = suffix[::-1]
+    pos = bisect.bisect_left(suffix_index, (reversed_suffix,))
+    found = None
+    while pos < len(suffix_index) and suffix_index[pos][0].startswith(reversed_suffix):
+        if found is None or suffix_index[pos][1] < found[1]:
+            found = suffix_index[pos]
+        pos += 1
+    return None if found is None else found[0][::-1]
+
+
+def _load_dismatch_prefix_params(parameter_dict, param_not_load, copied_buffers=None):
+    """
+    When some net parameter did not load, try to continue load.
+
+    The prefix is got from the first name in parameter_dict which ends with a name not loaded, then all the
+    parameters found with the prefix are loaded, until no prefix is found. The loaded names are removed from
+    param_not_load.
+    """
+    suffix_index = sorted((dict_name[::-1], order) for order, dict_name in enumerate(parameter_dict))
+    # the names which are not the suffix of any name in parameter_dict are not looked up again
+    no_suffix = set()
+    while param_not_load:
         logger.debug("Count: {} parameters has not been loaded, try to load continue.".format(len(param_not_load)))
-        prefix_name = longest_name
+        prefix_name = None
         for net_param_name in param_not_load:
-            for dict_name in parameter_dict:
-                if dict_name.endswith(net_param_name):
-                    prefix_name = dict_name[:-len(net_param_name)]
-                    break
-            if prefix_name != longest_name:
-                break
+            if net_param_name in no_suffix:
+                continue
+            dict_name = _find_name_by_suffix(suffix_index, net_param_name)
+            if dict_name is None:
+                no_suffix.add(net_param_name)
+                continue
+            prefix_name = dict_name[:-len(net_param_name)]
+            break
 
-        if prefix_name != longest_name:
-            logger.warning("Remove parameter prefix name: {}, continue to load.".format(prefix_name))
-            for _, param in net.parameters_and_names():
-                new_param_name = prefix_name + param.name
-                if param.name in param_not_load and new_param_name in parameter_dict:
-                    new_param = parameter_dict[new_param_name]
-                    _update_param(param, new_param)
-                    param_not_load.remove(param.name)
+        if prefix_name is None:
+            break
+        logger.warning("Remove parameter prefix name: {}, continue to load.".format(prefix_name))
+        for net_param_name in [name for name in param_not_load if prefix_name + name in parameter_dict]:
+            for param in param_not_load.pop(net_param_name):
+                _update_param(param, parameter_dict[prefix_name + net_param_name], copied_buffers)
 
 
 def _save_graph(network, file_name):
@@ -303,23 +1112,29 @@ def _save_graph(network, file_name):
         os.chmod(file_name, stat.S_IWUSR | stat.S_IRUSR)
 
 
-def _exec_save_checkpoint(train_network, ckpoint_file_name, integrated_save=True):
+def _get_checkpoint_param_list(train_network, integrated_save=True, snapshot=False):
     """
-    Saves checkpoint for 'ms' backend.
+    Gets the parameters list of the network to be saved by save_checkpoint.
 
     Args:
         train_network (Network): The train network for training.
-        ckpoint_file_name (str): The name of checkpoint file.
         integrated_save (bool): Whether to intergrated save in automatic model parallel scene.
-    """
+        snapshot (bool): Whether to copy the data of parameters to host memory, so that the list is not changed
+            by the following training steps.
 
+    Returns:
+        List, each element is a dict like {"name":xx, "data":xx}.
+    """
     param_dict = {}
     for _, param in train_network.parameters_and_names():
         param_dict[param.name] = param
+    optimizer_states = _get_optimizer_states(train_network)
 
     param_list = []
     for (key, value) in param_dict.items():
         each_param = {"name": key}
+        if value in optimizer_states:
+            each_param["optimizer_state"] = True
         value.init_data()
         if isinstance(value.data, Tensor):
             param_data = value.data
@@ -327,14 +1142,48 @@ def _exec_save_checkpoint(train_network, ckpoint_file_name, integrated_save=True
             param_data = Tensor(value.data)
 
         # in automatic model parallel scenario, some parameters were spliteds to all the devices,
-        # which should be combined before saving
+        # which should be combined before saving, or saved with their layouts
         if integrated_save and key in train_network.parameter_layout_dict:
             param_data = _get_merged_param_data(train_network, key, param_data)
+        elif key in train_network.parameter_layout_dict:
+            each_param["layout"] = _get_slice_layout(train_network.parameter_layout_dict[key])
 
-        each_param["data"] = param_data
+        each_param["data"] = param_data.asnumpy().copy() if snapshot else param_data
         param_list.append(each_param)
+    return param_list
 
-    save_checkpoint(param_list, ckpoint_file_name)
+
+def _get_optimizer_states(train_network):
+    """Gets the parameters owned by the optimizers only, like the moments, which are not the weights of network."""
+    optimizer_params = set()
+    network_params = set()
+    for _, cell in train_network.cells_and_names():
+        params = optimizer_params if isinstance(cell, nn.Optimizer) else network_params
+        params.update(param for param in cell.get_parameters(expand=False))
+    return optimizer_params - network_params
+
+
+def _get_slice_layout(layout):
+    """Gets the layout of the parameter slice on current rank to be saved, None if it is not sliced."""
+    if len(layout) < 2 or all(dim == -1 for dim in layout[1]):
+        return None
+    from mindspore.parallel._utils import _get_global_rank
+    return {"dev_mat": [int(dim) for dim in layout[0]], "tensor_map": [int(dim) for dim in layout[1]],
+            "rank": int(_get_global_rank())}
+
+
+def _exec_save_checkpoint(train_network, ckpoint_file_name, integrated_save=True, ckpt_format="protobuf"):
+    """
+    Saves checkpoint for 'ms' backend.
+
+    Args:
+        train_network (Network): The train network for training.
+        ckpoint_file_name (str): The name of checkpoint file.
+        integrated_save (bool): Whether to intergrated save in automatic model parallel scene.
+        ckpt_format (str): Format of the checkpoint file, "protobuf" or "raw". Default: "protobuf".
+    """
+    param_list = _get_checkpoint_param_list(train_network, integrated_save)
+    save_checkpoint(param_list, ckpoint_file_name, ckpt_format)
 
 
 def _get_merged_param_data(net, param_name, param_data):
@@ -18,6 +18,7 @@
 import math
 import itertools as it
 import numpy as np
+from mindspore.dataset.transforms.vision import bbox_util
 from .config import config
 
 
@@ -64,8 +65,6 @@ class GeneratDefaultBoxes():
 
 default_boxes_ltrb = GeneratDefaultBoxes().default_boxes_ltrb
 default_boxes = GeneratDefaultBoxes().default_boxes
-y1, x1, y2, x2 = np.split(default_boxes_ltrb[:, :4], 4, axis=-1)
-vol_anchors = (x2 - x1) * (y2 - y1)
 matching_threshold = config.match_thershold
 
 
@@ -81,53 +80,15 @@ def ssd_bboxes_encode(boxes):
         gt_label: class ground truth with shape [num_anchors, 1].
         num_matched_boxes: number of positives in an image.
     """
-
-    def jaccard_with_anchors(bbox):
-        """Compute jaccard score a box and the anchors."""
-        # Intersection bbox and volume.
-        ymin = np.maximum(y1, bbox[0])
-        xmin = np.maximum(x1, bbox[1])
-        ymax = np.minimum(y2, bbox[2])
-        xmax = np.minimum(x2, bbox[3])
-        w = np.maximum(xmax - xmin, 0.)
-        h = np.maximum(ymax - ymin, 0.)
-
-        # Volumes.
-        inter_vol = h * w
-        union_vol = vol_anchors + (bbox[2] - bbox[0]) * (bbox[3] - bbox[1]) - inter_vol
-        jaccard = inter_vol / union_vol
-        return np.squeeze(jaccard)
-
-    pre_scores = np.zeros((config.num_ssd_boxes), dtype=np.float32)
-    t_boxes = np.zeros((config.num_ssd_boxes, 4), dtype=np.float32)
-    t_label = np.zeros((config.num_ssd_boxes), dtype=np.int64)
-    for bbox in boxes:
-        label = int(bbox[4])
-        scores = jaccard_with_anchors(bbox)
-        idx = np.argmax(scores)
-        scores[idx] = 2.0
-        mask = (scores > matching_threshold)
-        mask = mask & (scores > pre_scores)
-        pre_scores = np.maximum(pre_scores, scores * mask)
-        t_label = mask * label + (1 - mask) * t_label
-        for i in range(4):
-            t_boxes[:, i] = mask * bbox[i] + (1 - mask) * t_boxes[:, i]
-
+    t_boxes, t_label, _ = bbox_util.assign_targets(boxes[:, :4], boxes[:, 4].astype(np.int64),
+                                                   default_boxes_ltrb, matching_threshold)
     index = np.nonzero(t_label)
 
-    # Transform to ltrb.
-    bboxes = np.zeros((config.num_ssd_boxes, 4), dtype=np.float32)
-    bboxes[:, [0, 1]] = (t_boxes[:, [0, 1]] + t_boxes[:, [2, 3]]) / 2
-    bboxes[:, [2, 3]] = t_boxes[:, [2, 3]] - t_boxes[:, [0, 1]]
-
     # Encode features.
-    bboxes_t = bboxes[index]
-    default_boxes_t = default_boxes[index]
-    bboxes_t[:, :2] = (bboxes_t[:, :2] - default_boxes_t[:, :2]) / (default_boxes_t[:, 2:] * config.prior_scaling[0])
-    bboxes_t[:, 2:4] = np.log(bboxes_t[:, 2:4] / default_boxes_t[:, 2:4]) / config.prior_scaling[1]
-    bboxes[index] = bboxes_t
+    bboxes = np.zeros((config.num_ssd_boxes, 4), dtype=np.float32)
+    bboxes[index] = bbox_util.encode_boxes(t_boxes[index], default_boxes_ltrb[index], config.prior_scaling)
 
-    num_match = np.array([len(np.nonzero(t_label)[0])], dtype=np.int32)
+    num_match = np.array([len(index[0])], dtype=np.int32)
     return bboxes, t_label.astype(np.int32), num_match
 
 
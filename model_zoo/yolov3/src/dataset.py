@@ -23,6 +23,7 @@ from PIL import Image
 import mindspore.dataset as de
 from mindspore.mindrecord import FileWriter
 import mindspore.dataset.transforms.vision.c_transforms as C
+from mindspore.dataset.transforms.vision import bbox_util
 from src.config import ConfigYOLOV3ResNet18
 
 iter_cnt = 0
@@ -41,54 +42,10 @@ def preprocess_fn(image, box, is_training):
 
     def _preprocess_true_boxes(true_boxes, anchors, in_shape=None):
         """Get true boxes."""
-        num_layers = anchors.shape[0] // 3
         anchor_mask = [[6, 7, 8], [3, 4, 5], [0, 1, 2]]
         true_boxes = np.array(true_boxes, dtype='float32')
-        # input_shape = np.array([in_shape, in_shape], dtype='int32')
-        input_shape = np.array(in_shape, dtype='int32')
-        boxes_xy = (true_boxes[..., 0:2] + true_boxes[..., 2:4]) // 2.
-        boxes_wh = true_boxes[..., 2:4] - true_boxes[..., 0:2]
-        true_boxes[..., 0:2] = boxes_xy / input_shape[::-1]
-        true_boxes[..., 2:4] = boxes_wh / input_shape[::-1]
-
-        grid_shapes = [input_shape // 32, input_shape // 16, input_shape // 8]
-        y_true = [np.zeros((grid_shapes[l][0], grid_shapes[l][1], len(anchor_mask[l]),
-                            5 + num_classes), dtype='float32') for l in range(num_layers)]
-
-        anchors = np.expand_dims(anchors, 0)
-        anchors_max = anchors / 2.
-        anchors_min = -anchors_max
-
-        valid_mask = boxes_wh[..., 0] >= 1
-
-        wh = boxes_wh[valid_mask]
-
-
-        if len(wh) >= 1:
-            wh = np.expand_dims(wh, -2)
-            boxes_max = wh / 2.
-            boxes_min = -boxes_max
-
-            intersect_min = np.maximum(boxes_min, anchors_min)
-            intersect_max = np.minimum(boxes_max, anchors_max)
-            intersect_wh = np.maximum(intersect_max - intersect_min, 0.)
-            intersect_area = intersect_wh[..., 0] * intersect_wh[..., 1]
-            box_area = wh[..., 0] * wh[..., 1]
-            anchor_area = anchors[..., 0] * anchors[..., 1]
-            iou = intersect_area / (box_area + anchor_area - intersect_area)
-
-            best_anchor = np.argmax(iou, axis=-1)
-            for t, n in enumerate(best_anchor):
-                for l in range(num_layers):
-                    if n in anchor_mask[l]:
-                        i = np.floor(true_boxes[t, 0] * grid_shapes[l][1]).astype('int32')
-                        j = np.floor(true_boxes[t, 1] * grid_shapes[l][0]).astype('int32')
-                        k = anchor_mask[l].index(n)
-
-                        c = true_boxes[t, 4].astype('int32')
-                        y_true[l][j, i, k, 0:4] = true_boxes[t, 0:4]
-                        y_true[l][j, i, k, 4] = 1.
-                        y_true[l][j, i, k, 5 + c] = 1.
+        y_true = bbox_util.assign_yolo_targets(true_boxes[..., 0:4], true_boxes[..., 4], anchors, anchor_mask,
+                                               in_shape, [32, 16, 8], num_classes)
 
         pad_gt_box0 = np.zeros(shape=[50, 4], dtype=np.float32)
         pad_gt_box1 = np.zeros(shape=[50, 4], dtype=np.float32)
@@ -0,0 +1,93 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""test file size and read performance of MindRecord File with blob data compressed by lz4, zstd or not at all"""
+import os
+import sys
+import time
+import numpy as np
+
+import mindspore.dataset as ds
+from mindspore.mindrecord import FileReader, FileWriter
+
+MINDRECORD_FILE = "./compression.mindrecord"
+SHARD_NUM = 4
+SCHEMA = {"id": {"type": "int64"},
+          "text": {"type": "bytes"},
+          "tokens": {"type": "int32", "shape": [256]},
+          "feature": {"type": "float32", "shape": [64]}}
+
+
+def make_columns(num_rows):
+    words = np.array([b"mindspore", b"record", b"page", b"blob", b"shard", b"index", b"reader", b"writer"])
+    return {"id": np.arange(num_rows, dtype=np.int64),
+            "text": [b" ".join(words[np.random.randint(0, len(words), 128)]) for _ in range(num_rows)],
+            "tokens": np.random.randint(0, 1000, (num_rows, 256)).astype(np.int32),
+            "feature": np.round(np.random.rand(num_rows, 64), 2).astype(np.float32)}
+
+
+def file_names():
+    return ["{}{}".format(MINDRECORD_FILE, x) for x in range(SHARD_NUM)]
+
+
+def remove_files():
+    for file_name in file_names():
+        for suffix in ["", ".db"]:
+            if os.path.exists(file_name + suffix):
+                os.remove(file_name + suffix)
+
+
+def write(columns, compression):
+    remove_files()
+    writer = FileWriter(MINDRECORD_FILE, SHARD_NUM, compression=compression)
+    writer.add_schema(SCHEMA, "compression")
+    writer.add_index(["id"])
+    writer.write_columns(columns)
+    writer.commit()
+
+
+def files_size():
+    return sum(os.path.getsize(file_name) for file_name in file_names())
+
+
+def read_by_filereader():
+    start = time.time()
+    reader = FileReader(MINDRECORD_FILE + "0", num_consumer=4)
+    num_iter = 0
+    for _ in reader.get_next():
+        num_iter += 1
+    reader.close()
+    return num_iter, time.time() - start
+
+
+def read_by_minddataset():
+    start = time.time()
+    data_set = ds.MindDataset(dataset_file=MINDRECORD_FILE + "0", num_parallel_workers=4)
+    num_iter = 0
+    for _ in data_set.create_dict_iterator():
+        num_iter += 1
+    return num_iter, time.time() - start
+
+
+if __name__ == '__main__':
+    rows_num = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    data = make_columns(rows_num)
+    for codec in [None, "lz4", "zstd"]:
+        write(data, codec)
+        size = files_size()
+        rows, cost = read_by_filereader()
+        print("{}: file size {:.1f}MB, FileReader {:.0f} rows/s".format(codec, size / 1024 / 1024, rows / cost))
+        rows, cost = read_by_minddataset()
+        print("{}: MindDataset {:.0f} rows/s".format(codec, rows / cost))
+    remove_files()
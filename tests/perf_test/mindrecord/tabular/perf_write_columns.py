@@ -0,0 +1,77 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""test write performance of FileWriter.write_columns against FileWriter.write_raw_data on tabular data"""
+import os
+import sys
+import time
+import numpy as np
+
+from mindspore.mindrecord import FileWriter
+
+MINDRECORD_FILE = "./tabular.mindrecord"
+SHARD_NUM = 4
+SCHEMA = {"id": {"type": "int64"},
+          "score": {"type": "float64"},
+          "category": {"type": "string"},
+          "feature": {"type": "float32", "shape": [16]},
+          "tokens": {"type": "int32", "shape": [32]}}
+
+
+def make_columns(num_rows):
+    return {"id": np.arange(num_rows, dtype=np.int64),
+            "score": np.random.rand(num_rows),
+            "category": np.random.choice(["a", "b", "c", "d"], num_rows),
+            "feature": np.random.rand(num_rows, 16).astype(np.float32),
+            "tokens": np.random.randint(0, 30000, (num_rows, 32)).astype(np.int32)}
+
+
+def remove_files():
+    for x in range(SHARD_NUM):
+        for suffix in ["", ".db"]:
+            file_name = "{}{}{}".format(MINDRECORD_FILE, x, suffix)
+            if os.path.exists(file_name):
+                os.remove(file_name)
+
+
+def write(columns, num_rows, batch_size, use_columns):
+    remove_files()
+    start = time.time()
+    writer = FileWriter(MINDRECORD_FILE, SHARD_NUM)
+    writer.add_schema(SCHEMA, "tabular")
+    writer.add_index(["id"])
+    for begin in range(0, num_rows, batch_size):
+        batch = {k: v[begin:begin + batch_size] for k, v in columns.items()}
+        if use_columns:
+            writer.write_columns(batch)
+        else:
+            rows = [{"id": int(batch["id"][i]), "score": float(batch["score"][i]),
+                     "category": str(batch["category"][i]), "feature": batch["feature"][i],
+                     "tokens": batch["tokens"][i]} for i in range(len(batch["id"]))]
+            writer.write_raw_data(rows)
+    writer.commit()
+    end = time.time()
+    remove_files()
+    return end - start
+
+
+if __name__ == '__main__':
+    rows_num = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    data = make_columns(rows_num)
+    raw_data_cost = write(data, rows_num, 10000, False)
+    print("write_raw_data: {} rows cost {:.2f}s, {:.0f} rows/s".format(rows_num, raw_data_cost,
+                                                                      rows_num / raw_data_cost))
+    columns_cost = write(data, rows_num, 10000, True)
+    print("write_columns: {} rows cost {:.2f}s, {:.0f} rows/s".format(rows_num, columns_cost,
+                                                                     rows_num / columns_cost))
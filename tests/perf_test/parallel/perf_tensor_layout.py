@@ -0,0 +1,92 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""test the time of merging and slicing large tensors by layouts, against concatenating and chunking"""
+import time
+from unittest import mock
+
+import numpy as np
+
+from mindspore import Tensor
+from mindspore.parallel import _tensor
+from mindspore.parallel._tensor import _reshape_param_data, _load_tensor, _get_tensor_strategy, \
+    _get_tensor_slice_index, _chunk_tensor_by_strategy
+
+# name, shape, dev_mat and tensor_map, the gathered slices of the dense weight are repeated on 4 devices
+LAYOUTS = [("embedding", [1048576, 1024], [8], [0, -1]),
+           ("embedding", [262144, 1024], [8, 8], [1, 0]),
+           ("dense", [8192, 8192], [4, 4, 4], [2, 0])]
+
+
+def concatenate_slices(param_data, dev_mat, tensor_map):
+    """Merge the slices by concatenating them in nested loops, as _reshape_param_data did before."""
+    device_count = int(np.prod(dev_mat))
+    tensor_slices = np.split(param_data, device_count, axis=0)
+    tensor_strategy = _get_tensor_strategy(dev_mat, tensor_map)
+    tensor_slices_new = list(range(int(np.prod(tensor_strategy))))
+    for i in range(device_count):
+        slice_index = _get_tensor_slice_index(dev_mat, tensor_strategy, tensor_map, i)
+        tensor_slices_new[int(slice_index)] = np.array(tensor_slices[i])
+    dim_len = len(tensor_strategy)
+    for i in range(dim_len):
+        ele_count = int(len(tensor_slices_new) / tensor_strategy[dim_len - 1 - i])
+        tensor_slices_new_inner = []
+        for j in range(ele_count):
+            new_tensor = tensor_slices_new[j * tensor_strategy[dim_len - 1 - i]]
+            for k in range(j * tensor_strategy[dim_len - 1 - i] + 1, (j + 1) * tensor_strategy[dim_len - 1 - i]):
+                new_tensor = np.concatenate((new_tensor, tensor_slices_new[k]), axis=dim_len - 1 - i)
+            tensor_slices_new_inner.append(np.array(new_tensor))
+        tensor_slices_new = tensor_slices_new_inner
+    return tensor_slices_new[0]
+
+
+def chunk_slice(np_tensor, dev_mat, tensor_map, rank):
+    """Split the whole tensor into all the slices and pick one, as _load_tensor did before."""
+    tensor_strategy = _get_tensor_strategy(dev_mat, tensor_map)
+    slice_index = _get_tensor_slice_index(dev_mat, tensor_strategy, tensor_map, rank)
+    return np.array(_chunk_tensor_by_strategy(np_tensor, tensor_strategy)[int(slice_index)])
+
+
+def run(name, func):
+    start = time.time()
+    result = func()
+    print("{} - cost time: {:.3f}s".format(name, time.time() - start))
+    return result
+
+
+def perf_layout(name, shape, dev_mat, tensor_map):
+    print("{} {} by dev_mat {} and tensor_map {}".format(name, shape, dev_mat, tensor_map))
+    whole = np.random.rand(*shape).astype(np.float32)
+    tensor_strategy = _get_tensor_strategy(dev_mat, tensor_map)
+    device_count = int(np.prod(dev_mat))
+    tensor_slices = _chunk_tensor_by_strategy(whole, tensor_strategy)
+    gathered = np.concatenate([tensor_slices[int(_get_tensor_slice_index(dev_mat, tensor_strategy, tensor_map, i))]
+                               for i in range(device_count)], axis=0)
+    del tensor_slices
+
+    merged = run("  concatenate slices", lambda: concatenate_slices(gathered, dev_mat, tensor_map))
+    reshaped = run("  _reshape_param_data", lambda: _reshape_param_data(Tensor(gathered), dev_mat, tensor_map))
+    assert np.array_equal(merged, reshaped.asnumpy())
+    del merged, reshaped, gathered
+
+    rank = device_count - 1
+    chunked = run("  chunk whole tensor", lambda: chunk_slice(whole, dev_mat, tensor_map, rank))
+    with mock.patch.object(_tensor, "get_rank", return_value=rank):
+        loaded = run("  _load_tensor", lambda: _load_tensor(Tensor(whole), dev_mat, tensor_map))
+    assert np.array_equal(chunked, loaded.asnumpy())
+
+
+if __name__ == '__main__':
+    for layout in LAYOUTS:
+        perf_layout(*layout)
@@ -0,0 +1,89 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""test throughput of the fused BertEncode op against the chained Bert text ops"""
+import sys
+import time
+
+import mindspore.common.dtype as mstype
+import mindspore.dataset as ds
+import mindspore.dataset.text as text
+import mindspore.dataset.transforms.c_transforms as ops
+
+MAX_SEQ_LEN = 128
+NUM_PARALLEL_WORKERS = 8
+print_step = 100000
+
+
+def print_log(count):
+    if count % print_step == 0:
+        print("Read {} rows ...".format(count))
+
+
+def run(data_set, name):
+    start = time.time()
+    num_iter = 0
+    for _ in data_set.create_dict_iterator():
+        num_iter += 1
+        print_log(num_iter)
+    end = time.time()
+    print("{} - total rows: {}, cost time: {}s, rows/s: {}".format(name, num_iter, end - start,
+                                                                   num_iter / (end - start)))
+
+
+def special_ids(vocab_file):
+    """Get the ids of [CLS], [SEP] and [PAD], Vocab.from_file numbers the lines of vocab_file from 0."""
+    with open(vocab_file, encoding="utf8") as f:
+        word_ids = {line.strip(): word_id for word_id, line in enumerate(f)}
+    return word_ids["[CLS]"], word_ids["[SEP]"], word_ids["[PAD]"]
+
+
+def use_chained_ops(corpus, vocab, vocab_file):
+    """BertTokenizer, Lookup, truncate, add [CLS]/[SEP], pad and build token types and mask as separate ops."""
+    cls_id, sep_id, pad_id = special_ids(vocab_file)
+    data_set = ds.TextFileDataset(corpus, shuffle=False, num_parallel_workers=NUM_PARALLEL_WORKERS)
+    data_set = data_set.map(input_columns=["text"], num_parallel_workers=NUM_PARALLEL_WORKERS,
+                            operations=[text.BertTokenizer(vocab, lower_case=True),
+                                        text.Lookup(vocab),
+                                        ops.Slice(slice(0, MAX_SEQ_LEN - 2)),
+                                        ops.Concatenate(prepend=[cls_id], append=[sep_id])])
+    data_set = data_set.map(input_columns=["text"], output_columns=["input_ids", "attention_mask"],
+                            columns_order=["input_ids", "attention_mask"], operations=ops.Duplicate(),
+                            num_parallel_workers=NUM_PARALLEL_WORKERS)
+    data_set = data_set.map(input_columns=["input_ids"], operations=ops.PadEnd([MAX_SEQ_LEN], pad_id),
+                            num_parallel_workers=NUM_PARALLEL_WORKERS)
+    data_set = data_set.map(input_columns=["attention_mask"], output_columns=["attention_mask", "token_type_ids"],
+                            columns_order=["input_ids", "token_type_ids", "attention_mask"],
+                            operations=[ops.Fill(1), ops.PadEnd([MAX_SEQ_LEN], 0), ops.Duplicate()],
+                            num_parallel_workers=NUM_PARALLEL_WORKERS)
+    data_set = data_set.map(input_columns=["token_type_ids"], operations=[ops.Fill(0), ops.TypeCast(mstype.int32)],
+                            num_parallel_workers=NUM_PARALLEL_WORKERS)
+    run(data_set, "Chained BertTokenizer/Lookup/Slice/Concatenate/PadEnd")
+
+
+def use_bert_encode(corpus, vocab):
+    data_set = ds.TextFileDataset(corpus, shuffle=False, num_parallel_workers=NUM_PARALLEL_WORKERS)
+    data_set = data_set.map(input_columns=["text"], output_columns=["input_ids", "token_type_ids", "attention_mask"],
+                            columns_order=["input_ids", "token_type_ids", "attention_mask"],
+                            operations=text.BertEncode(vocab, MAX_SEQ_LEN, lower_case=True),
+                            num_parallel_workers=NUM_PARALLEL_WORKERS)
+    run(data_set, "Fused BertEncode")
+
+
+if __name__ == '__main__':
+    # usage: python perf_bert_encode.py <corpus text file, one text per line> <bert vocab.txt>
+    corpus_file = sys.argv[1]
+    bert_vocab = text.Vocab.from_file(sys.argv[2])
+    use_chained_ops(corpus_file, bert_vocab, sys.argv[2])
+    use_bert_encode(corpus_file, bert_vocab)
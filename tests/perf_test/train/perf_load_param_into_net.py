@@ -0,0 +1,122 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""test the time of loading the parameters of bert large into net, against creating new tensors per parameter"""
+import argparse
+import time
+
+import numpy as np
+
+import mindspore.nn as nn
+from mindspore import Tensor
+from mindspore.common.parameter import Parameter
+from mindspore.train.serialization import load_param_into_net
+
+VOCAB_SIZE = 30522
+HIDDEN_SIZE = 1024
+INTERMEDIATE_SIZE = 4096
+NUM_LAYERS = 24
+MAX_POSITION = 512
+
+
+def bert_large_shapes():
+    """Names and shapes of the parameters of bert large."""
+    shapes = [("embedding.word_embeddings", [VOCAB_SIZE, HIDDEN_SIZE]),
+              ("embedding.position_embeddings", [MAX_POSITION, HIDDEN_SIZE]),
+              ("embedding.token_type_embeddings", [2, HIDDEN_SIZE]),
+              ("embedding.layernorm.gamma", [HIDDEN_SIZE]), ("embedding.layernorm.beta", [HIDDEN_SIZE])]
+    for i in range(NUM_LAYERS):
+        layer = "encoder.layer{}.".format(i)
+        for name in ("query", "key", "value", "output"):
+            shapes.append((layer + "attention.{}.weight".format(name), [HIDDEN_SIZE, HIDDEN_SIZE]))
+            shapes.append((layer + "attention.{}.bias".format(name), [HIDDEN_SIZE]))
+        shapes += [(layer + "intermediate.weight", [INTERMEDIATE_SIZE, HIDDEN_SIZE]),
+                   (layer + "intermediate.bias", [INTERMEDIATE_SIZE]),
+                   (layer + "output.weight", [HIDDEN_SIZE, INTERMEDIATE_SIZE]),
+                   (layer + "output.bias", [HIDDEN_SIZE])]
+        for name in ("attention.layernorm", "output.layernorm"):
+            shapes += [(layer + name + ".gamma", [HIDDEN_SIZE]), (layer + name + ".beta", [HIDDEN_SIZE])]
+    shapes += [("pooler.weight", [HIDDEN_SIZE, HIDDEN_SIZE]), ("pooler.bias", [HIDDEN_SIZE])]
+    return shapes
+
+
+class ParamNet(nn.Cell):
+    """Net holding the parameters only."""
+
+    def __init__(self, shapes):
+        super(ParamNet, self).__init__()
+        for i, (name, shape) in enumerate(shapes):
+            setattr(self, "param{}".format(i), Parameter(Tensor(np.zeros(shape, np.float32)), name=name))
+
+    def construct(self):
+        return None
+
+
+def load_param_into_net_before(net, parameter_dict):
+    """Load the parameters by creating new tensors, with the prefix matched by scanning, as it did before."""
+    param_not_load = []
+    for _, param in net.parameters_and_names():
+        if param.name in parameter_dict:
+            param.set_parameter_data(parameter_dict[param.name].data)
+        else:
+            param_not_load.append(param.name)
+    prefix_name = ""
+    longest_name = param_not_load[0] if param_not_load else ""
+    while prefix_name != longest_name and param_not_load:
+        prefix_name = longest_name
+        for net_param_name in param_not_load:
+            for dict_name in parameter_dict:
+                if dict_name.endswith(net_param_name):
+                    prefix_name = dict_name[:-len(net_param_name)]
+                    break
+            if prefix_name != longest_name:
+                break
+        if prefix_name != longest_name:
+            for _, param in net.parameters_and_names():
+                new_param_name = prefix_name + param.name
+                if param.name in param_not_load and new_param_name in parameter_dict:
+                    param.set_parameter_data(parameter_dict[new_param_name].data)
+                    param_not_load.remove(param.name)
+
+
+def run(name, func):
+    start = time.time()
+    func()
+    print("{} - cost time: {:.3f}s".format(name, time.time() - start))
+
+
+def perf_load(prefix, moments):
+    shapes = bert_large_shapes()
+    if moments:
+        # the names of optimizer moments, like the parameters cloned by Adam
+        shapes += [(moment + "." + name, shape) for moment in ("moment1", "moment2") for name, shape in shapes]
+    print("{} parameters, {:.1f}M elements, names in checkpoint with prefix '{}'"
+          .format(len(shapes), sum(np.prod(shape) for _, shape in shapes) / 1e6, prefix))
+    parameter_dict = {prefix + name: Parameter(Tensor(np.ones(shape, np.float32)), name=prefix + name)
+                      for name, shape in shapes}
+
+    net = ParamNet(shapes)
+    run("  new tensor per parameter", lambda: load_param_into_net_before(net, parameter_dict))
+    del net
+    net = ParamNet(shapes)
+    run("  load_param_into_net", lambda: load_param_into_net(net, parameter_dict))
+    assert all(np.all(param.data.asnumpy() == 1) for param in net.get_parameters())
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Time of loading the parameters of bert large.")
+    parser.add_argument("--moments", action="store_true", help="Load the optimizer moments too.")
+    args = parser.parse_args()
+    perf_load("", args.moments)
+    perf_load("network.", args.moments)
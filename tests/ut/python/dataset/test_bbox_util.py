@@ -0,0 +1,177 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Testing vectorized bounding box utilities
+"""
+import numpy as np
+from numpy.testing import assert_allclose
+
+import mindspore.dataset as ds
+from mindspore.dataset.transforms.vision import bbox_util
+from mindspore import log as logger
+
+
+def random_boxes(num, size=1.):
+    corner = np.random.rand(num, 2) * size
+    return np.concatenate((corner, corner + np.random.rand(num, 2) * size + 0.01 * size), axis=1)
+
+
+def test_bbox_iou():
+    """
+    Test pairwise and batched IoU against a per box computation
+    """
+    logger.info("test_bbox_iou")
+    boxes_a = random_boxes(5)
+    boxes_b = random_boxes(7)
+    iou = bbox_util.bbox_iou(boxes_a, boxes_b)
+    assert iou.shape == (5, 7)
+    for i, box_a in enumerate(boxes_a):
+        for j, box_b in enumerate(boxes_b):
+            inter_w = max(0., min(box_a[2], box_b[2]) - max(box_a[0], box_b[0]))
+            inter_h = max(0., min(box_a[3], box_b[3]) - max(box_a[1], box_b[1]))
+            inter = inter_w * inter_h
+            union = bbox_util.box_area(box_a) + bbox_util.box_area(box_b) - inter
+            assert_allclose(iou[i, j], inter / union, rtol=1e-5)
+
+    batched = bbox_util.bbox_iou(np.stack((boxes_a, boxes_a)), boxes_b)
+    assert batched.shape == (2, 5, 7)
+    assert_allclose(batched[1], iou)
+
+
+def test_xywh_conversion():
+    """
+    Test conversion between the dataset (x, y, w, h) layout and corner format
+    """
+    logger.info("test_xywh_conversion")
+    boxes = np.array([[10, 20, 30, 40, 1]], dtype=np.float32)
+    xyxy = bbox_util.xywh_to_xyxy(boxes)
+    assert_allclose(xyxy, [[10, 20, 40, 60, 1]])
+    assert_allclose(bbox_util.xyxy_to_xywh(xyxy), boxes)
+
+
+def test_encode_decode_boxes():
+    """
+    Test decoding encoded boxes gives back the boxes
+    """
+    logger.info("test_encode_decode_boxes")
+    boxes = random_boxes(20)
+    anchors = random_boxes(20)
+    encoded = bbox_util.encode_boxes(boxes, anchors)
+    assert_allclose(bbox_util.decode_boxes(encoded, anchors), boxes, atol=1e-5)
+
+
+def test_assign_targets():
+    """
+    Test anchors are assigned to the ground truth box they overlap most
+    """
+    logger.info("test_assign_targets")
+    anchors = np.array([[0, 0, 10, 10], [0, 0, 5, 5], [20, 20, 30, 30], [50, 50, 60, 60]], dtype=np.float32)
+    gt_boxes = np.array([[0, 0, 10, 9], [21, 21, 30, 30]], dtype=np.float32)
+    boxes, labels, matched = bbox_util.assign_targets(gt_boxes, np.array([3, 7]), anchors, 0.5)
+    np.testing.assert_array_equal(labels, [3, 0, 7, 0])
+    np.testing.assert_array_equal(matched, [True, False, True, False])
+    assert_allclose(boxes[0], gt_boxes[0])
+    assert_allclose(boxes[3], 0)
+
+    # the best anchor is matched even below the threshold
+    _, labels, _ = bbox_util.assign_targets([[40, 40, 52, 52]], [1], anchors, 0.5)
+    np.testing.assert_array_equal(labels, [0, 0, 0, 1])
+
+
+def test_assign_yolo_targets():
+    """
+    Test YOLO targets are set in the cell and slot of the best anchor
+    """
+    logger.info("test_assign_yolo_targets")
+    anchors = np.array([[10, 10], [40, 40], [100, 100]], dtype=np.float32)
+    gt_boxes = np.array([[0, 0, 40, 40], [60, 60, 160, 160], [0, 0, 0, 0]], dtype=np.float32)
+    targets = bbox_util.assign_yolo_targets(gt_boxes, [1, 2, 0], anchors, [[2], [0, 1]], (320, 320), [32, 16], 3)
+    assert targets[0].shape == (10, 10, 1, 8)
+    assert targets[1].shape == (20, 20, 2, 8)
+    assert targets[0][..., 4].sum() == 1
+    assert targets[1][..., 4].sum() == 1
+    assert_allclose(targets[0][3, 3, 0, :5], [110 / 320, 110 / 320, 100 / 320, 100 / 320, 1])
+    assert targets[0][3, 3, 0, 7] == 1
+    assert_allclose(targets[1][1, 1, 1, :5], [20 / 320, 20 / 320, 40 / 320, 40 / 320, 1])
+    assert targets[1][1, 1, 1, 6] == 1
+
+
+def test_flip_crop_affine_boxes():
+    """
+    Test box-aware flip, crop and affine transform
+    """
+    logger.info("test_flip_crop_affine_boxes")
+    boxes = np.array([[10, 10, 50, 50, 1], [100, 100, 120, 150, 2]], dtype=np.float32)
+
+    assert_allclose(bbox_util.flip_boxes(boxes, 200), [[150, 10, 190, 50, 1], [80, 100, 100, 150, 2]])
+
+    cropped, keep = bbox_util.crop_boxes(boxes, [[0, 0, 60, 60], [90, 90, 200, 200]])
+    np.testing.assert_array_equal(keep, [[True, False], [False, True]])
+    assert_allclose(cropped[0, 0], [10, 10, 50, 50, 1])
+    assert_allclose(cropped[1, 1], [10, 10, 30, 60, 2])
+
+    transformed, keep = bbox_util.affine_boxes(boxes, [[1, 0, 5], [0, 1, -20]], 110, 200)
+    assert_allclose(transformed, [[15, 0, 55, 30, 1], [105, 80, 110, 130, 2]])
+    np.testing.assert_array_equal(keep, [True, True])
+
+    # rotating by 90 degrees around the origin swaps the box sides
+    transformed, _ = bbox_util.affine_boxes(boxes[:1], [[0, -1, 100], [1, 0, 0]], 100, 100)
+    assert_allclose(transformed, [[50, 10, 90, 50, 1]])
+
+
+def test_random_crop_with_boxes():
+    """
+    Test the random crop window keeps boxes whose center lies in the crop
+    """
+    logger.info("test_random_crop_with_boxes")
+    ds.config.set_seed(0)
+    boxes = np.array([[10, 10, 150, 150], [100, 100, 190, 190]], dtype=np.float32)
+    for _ in range(10):
+        crop, cropped = bbox_util.random_crop_with_boxes(boxes, 200, 200, min_iou_choices=(0.3,))
+        if crop is None:
+            continue
+        assert cropped.shape[0] >= 1
+        assert np.all(cropped[:, 2:4] <= crop[2:4] - crop[0:2])
+        assert np.all(cropped[:, 0:2] >= 0)
+
+
+def test_random_crop_with_boxes_seed():
+    """
+    Test the random crop window is reproducible under ds.config.set_seed
+    """
+    logger.info("test_random_crop_with_boxes_seed")
+    boxes = np.array([[10, 10, 150, 150], [100, 100, 190, 190]], dtype=np.float32)
+    original_seed = ds.config.get_seed()
+    crops = []
+    for _ in range(2):
+        ds.config.set_seed(5)
+        crop, cropped = bbox_util.random_crop_with_boxes(boxes, 200, 200, min_iou_choices=(None, 0.1, 0.3))
+        crops.append((crop, cropped))
+    ds.config.set_seed(original_seed)
+    assert (crops[0][0] is None) == (crops[1][0] is None)
+    if crops[0][0] is not None:
+        assert_allclose(crops[0][0], crops[1][0])
+    assert_allclose(crops[0][1], crops[1][1])
+
+
+if __name__ == "__main__":
+    test_bbox_iou()
+    test_xywh_conversion()
+    test_encode_decode_boxes()
+    test_assign_targets()
+    test_assign_yolo_targets()
+    test_flip_crop_affine_boxes()
+    test_random_crop_with_boxes()
+    test_random_crop_with_boxes_seed()
@@ -0,0 +1,120 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Testing BertEncode op in DE
+"""
+import numpy as np
+import pytest
+
+import mindspore.dataset as ds
+import mindspore.dataset.text as nlp
+from mindspore import log as logger
+
+BERT_TOKENIZER_FILE = "../data/dataset/testTokenizerData/bert_tokenizer.txt"
+
+vocab_bert = [
+    "床", "前", "明", "月", "光", "疑", "是", "地", "上", "霜", "举", "头", "望", "低", "思", "故", "乡",
+    "繁", "體", "字", "嘿", "哈", "大", "笑", "嘻",
+    "i", "am", "mak", "make", "small", "mistake", "##s", "during", "work", "##ing", "hour",
+    "😀", "😃", "😄", "😁", "+", "/", "-", "=", "12", "28", "40", "16", " ", "I",
+    "[CLS]", "[SEP]", "[UNK]", "[PAD]", "[MASK]"
+]
+
+
+def chained_ids(text_file, vocab, lower_case):
+    """Get the ids of every line with the chained BertTokenizer and Lookup ops."""
+    dataset = ds.TextFileDataset(text_file, shuffle=False)
+    dataset = dataset.map(operations=[nlp.BertTokenizer(vocab=vocab, lower_case=lower_case),
+                                      nlp.Lookup(vocab)])
+    return [item["text"] for item in dataset.create_dict_iterator()]
+
+
+def test_bert_encode_single():
+    """
+    Test BertEncode on single texts gives the chained BertTokenizer and Lookup ids, with special tokens and padding
+    """
+    logger.info("test_bert_encode_single")
+    vocab = nlp.Vocab.from_list(vocab_bert)
+    max_seq_len = 12
+    cls_id, sep_id, pad_id = [vocab_bert.index(token) for token in ["[CLS]", "[SEP]", "[PAD]"]]
+    expected = chained_ids(BERT_TOKENIZER_FILE, vocab, True)
+
+    bert_encode_op = nlp.BertEncode(vocab, max_seq_len, lower_case=True)
+    dataset = ds.TextFileDataset(BERT_TOKENIZER_FILE, shuffle=False)
+    dataset = dataset.map(input_columns=["text"], output_columns=["input_ids", "token_type_ids", "attention_mask"],
+                          columns_order=["input_ids", "token_type_ids", "attention_mask"],
+                          operations=bert_encode_op)
+    count = 0
+    for item, ids in zip(dataset.create_dict_iterator(), expected):
+        ids = ids[:max_seq_len - 2]
+        length = len(ids) + 2
+        np.testing.assert_array_equal(item["input_ids"][:length], np.concatenate(([cls_id], ids, [sep_id])))
+        np.testing.assert_array_equal(item["input_ids"][length:], pad_id)
+        np.testing.assert_array_equal(item["token_type_ids"], 0)
+        np.testing.assert_array_equal(item["attention_mask"][:length], 1)
+        np.testing.assert_array_equal(item["attention_mask"][length:], 0)
+        assert item["input_ids"].dtype == np.int32
+        count += 1
+    assert count == len(expected)
+    hits, misses = bert_encode_op.get_cache_stats()
+    logger.info("hits: {}, misses: {}".format(hits, misses))
+    assert misses > 0
+
+
+def test_bert_encode_pair():
+    """
+    Test BertEncode on text pairs truncates the longer text first and sets the token types
+    """
+    logger.info("test_bert_encode_pair")
+    vocab = nlp.Vocab.from_list(vocab_bert)
+    cls_id, sep_id = [vocab_bert.index(token) for token in ["[CLS]", "[SEP]"]]
+    ids = {word: vocab_bert.index(word) for word in vocab_bert}
+
+    def gen():
+        yield (np.array("床前明月光"), np.array("i am making"))
+
+    dataset = ds.GeneratorDataset(gen, column_names=["text_a", "text_b"])
+    dataset = dataset.map(input_columns=["text_a", "text_b"],
+                          output_columns=["input_ids", "token_type_ids", "attention_mask"],
+                          columns_order=["input_ids", "token_type_ids", "attention_mask"],
+                          operations=nlp.BertEncode(vocab, 9, lower_case=True))
+    for item in dataset.create_dict_iterator():
+        expected_ids = [cls_id, ids["床"], ids["前"], ids["明"], sep_id, ids["i"], ids["am"], ids["mak"], sep_id]
+        np.testing.assert_array_equal(item["input_ids"], expected_ids)
+        np.testing.assert_array_equal(item["token_type_ids"], [0, 0, 0, 0, 0, 1, 1, 1, 1])
+        np.testing.assert_array_equal(item["attention_mask"], 1)
+
+
+def test_bert_encode_invalid():
+    """
+    Test BertEncode parameter checks
+    """
+    logger.info("test_bert_encode_invalid")
+    vocab = nlp.Vocab.from_list(vocab_bert)
+    with pytest.raises(ValueError) as info:
+        nlp.BertEncode(vocab, 2)
+    assert "max_seq_len" in str(info.value)
+    with pytest.raises(ValueError) as info:
+        nlp.BertEncode(vocab_bert, 16)
+    assert "vocab" in str(info.value)
+    with pytest.raises(ValueError) as info:
+        nlp.BertEncode(vocab, 16, cache_size=-1)
+    assert "cache_size" in str(info.value)
+
+
+if __name__ == '__main__':
+    test_bert_encode_single()
+    test_bert_encode_pair()
+    test_bert_encode_invalid()
@@ -15,15 +15,20 @@
 """
 Testing Decode op in DE
 """
+import glob
+import pickle
 import cv2
+import numpy as np
 
 import mindspore.dataset as ds
 import mindspore.dataset.transforms.vision.c_transforms as vision
+import mindspore.dataset.transforms.vision.py_transforms as py_vision
 from mindspore import log as logger
 from util import diff_mse
 
 DATA_DIR = ["../data/dataset/test_tf_file_3_images/train-0000-of-0001.data"]
 SCHEMA_DIR = "../data/dataset/test_tf_file_3_images/datasetSchema.json"
+SPILL_FILE = "decode_cache_spill.bin"
 
 
 def test_decode_op():
@@ -74,6 +79,72 @@ def test_decode_op_tf_file_dataset():
         assert mse == 0
 
 
+def test_decode_cache_py():
+    """
+    Test py Decode op with a decoded image cache across epochs
+    """
+    logger.info("test_decode_cache_py")
+
+    # a small memory budget makes the cache spill decoded images to the mapped file
+    cache = py_vision.DecodeCache(max_bytes=256 * 1024, spill_file=SPILL_FILE, spill_bytes=64 * 1024 * 1024)
+    data1 = ds.TFRecordDataset(DATA_DIR, SCHEMA_DIR, columns_list=["image"], shuffle=False)
+    transforms = py_vision.ComposeOp([py_vision.Decode(cache=cache), py_vision.ToTensor()])
+    data1 = data1.map(input_columns=["image"], operations=transforms())
+
+    data2 = ds.TFRecordDataset(DATA_DIR, SCHEMA_DIR, columns_list=["image"], shuffle=False)
+    transforms = py_vision.ComposeOp([py_vision.Decode(), py_vision.ToTensor()])
+    data2 = data2.map(input_columns=["image"], operations=transforms())
+
+    for _ in range(2):
+        for item1, item2 in zip(data1.create_dict_iterator(), data2.create_dict_iterator()):
+            np.testing.assert_array_equal(item1["image"], item2["image"])
+    assert cache.misses == 3
+    assert cache.hits == 3
+    assert len(cache) == 3
+    cache.close()
+    assert not glob.glob(SPILL_FILE + ".*")
+
+
+def test_decode_cache_py_spill_file_per_copy():
+    """
+    Test the copies of a decoded image cache pickled into workers spill to their own files
+    """
+    logger.info("test_decode_cache_py_spill_file_per_copy")
+
+    cache = py_vision.DecodeCache(max_bytes=100, spill_file=SPILL_FILE, spill_bytes=1024)
+    worker_cache = pickle.loads(pickle.dumps(cache))
+    images = [np.full((4, 4, 4), i, np.uint8) for i in range(4)]
+    # the first image put into each cache is evicted by the second one and spilled
+    cache.put(b"0", images[0])
+    cache.put(b"1", images[1])
+    worker_cache.put(b"2", images[2])
+    worker_cache.put(b"3", images[3])
+    np.testing.assert_array_equal(cache.get(b"0"), images[0])
+    np.testing.assert_array_equal(worker_cache.get(b"2"), images[2])
+    assert cache.get(b"2") is None
+    cache.close()
+    worker_cache.close()
+    assert not glob.glob(SPILL_FILE + ".*")
+
+
+def test_decode_cache_py_resize():
+    """
+    Test py Decode op with a decoded image cache downscaling the cached images
+    """
+    logger.info("test_decode_cache_py_resize")
+
+    cache = py_vision.DecodeCache(max_bytes=1024 * 1024, resize=32)
+    data = ds.TFRecordDataset(DATA_DIR, SCHEMA_DIR, columns_list=["image"], shuffle=False)
+    data = data.map(input_columns=["image"], operations=py_vision.ComposeOp([py_vision.Decode(cache=cache),
+                                                                            py_vision.ToTensor()])())
+    for item in data.create_dict_iterator():
+        assert min(item["image"].shape[1:]) == 32
+    assert cache.cached_bytes <= 1024 * 1024
+
+
 if __name__ == "__main__":
     test_decode_op()
     test_decode_op_tf_file_dataset()
+    test_decode_cache_py()
+    test_decode_cache_py_spill_file_per_copy()
+    test_decode_cache_py_resize()
@@ -15,6 +15,7 @@
 """
 Testing from_dataset in mindspore.dataset
 """
+import os
 import numpy as np
 import mindspore.dataset as ds
 import mindspore.dataset.text as text
@@ -138,9 +139,73 @@ def test_from_dataset_exceptions():
     test_config([123], (2, 3), 0, "columns need to be a list of strings")
 
 
+def test_from_dataset_num_parallel_workers():
+    """ test the vocab is the same whatever the number of workers counting the words """
+
+    def gen_corpus():
+        for i in range(200):
+            yield (np.array(["w{}".format(j) for j in range(i % 37)], dtype='S'),)
+
+    def lookup_ids(vocab):
+        data = ds.GeneratorDataset(gen_corpus, column_names=["text"])
+        data = data.map(input_columns="text", operations=text.Lookup(vocab))
+        return [list(d["text"]) for d in data.create_dict_iterator()]
+
+    num_parallel_workers_original = ds.config.get_num_parallel_workers()
+    res = []
+    for num_workers in [1, 3, 8]:
+        ds.config.set_num_parallel_workers(num_workers)
+        corpus_dataset = ds.GeneratorDataset(gen_corpus, column_names=["text"])
+        vocab = text.Vocab.from_dataset(corpus_dataset, None, (3, None), 20, special_tokens=["<pad>", "<unk>"])
+        res.append(lookup_ids(vocab))
+    ds.config.set_num_parallel_workers(num_parallel_workers_original)
+    assert res[0] == res[1] == res[2]
+
+
+def test_from_dataset_word_count_file():
+    """ test a vocab built incrementally with a word count file is the same as built from all the data """
+    word_count_file = "./word_count_test.bin"
+    if os.path.exists(word_count_file):
+        os.remove(word_count_file)
+
+    def gen_corpus(corpus):
+        def gen():
+            for k, v in corpus.items():
+                yield (np.array([k] * v, dtype='S'),)
+
+        return gen
+
+    def gen_input():
+        for word in "A B C D E <unk>".split(" "):
+            yield (np.array(word, dtype='S'),)
+
+    def lookup_ids(vocab):
+        data = ds.GeneratorDataset(gen_input, column_names=["text"])
+        data = data.map(input_columns="text", operations=text.Lookup(vocab))
+        return [d["text"].item() for d in data.create_dict_iterator()]
+
+    part1 = {"A": 1, "B": 3, "C": 2}
+    part2 = {"A": 4, "D": 2, "E": 1}
+    whole = {"A": 5, "B": 3, "C": 2, "D": 2, "E": 1}
+
+    data = ds.GeneratorDataset(gen_corpus(part1), column_names=["text"])
+    vocab = text.Vocab.from_dataset(data, None, (2, None), None, ["<unk>"], True, word_count_file)
+    assert lookup_ids(vocab) == [0, 1, 2, 0, 0, 0]
+    assert os.path.exists(word_count_file)
+
+    data = ds.GeneratorDataset(gen_corpus(part2), column_names=["text"])
+    incremental_vocab = text.Vocab.from_dataset(data, None, (2, None), None, ["<unk>"], True, word_count_file)
+    data = ds.GeneratorDataset(gen_corpus(whole), column_names=["text"])
+    whole_vocab = text.Vocab.from_dataset(data, None, (2, None), None, ["<unk>"], True)
+    assert lookup_ids(incremental_vocab) == lookup_ids(whole_vocab) == [1, 2, 3, 4, 0, 0]
+    os.remove(word_count_file)
+
+
 if __name__ == '__main__':
     test_demo_basic_from_dataset()
     test_from_dataset()
     test_from_dataset_exceptions()
     test_demo_basic_from_dataset_with_tokenizer()
     test_from_dataset_special_token()
+    test_from_dataset_num_parallel_workers()
+    test_from_dataset_word_count_file()
@@ -65,6 +65,8 @@ def add_and_remove_cv_file():
     for x in paths:
         os.remove("{}".format(x))
         os.remove("{}.db".format(x))
+    if os.path.exists(CV_FILE_NAME + ".mrmanifest"):
+        os.remove(CV_FILE_NAME + ".mrmanifest")
 
 
 @pytest.fixture
@@ -98,6 +100,7 @@ def add_and_remove_nlp_file():
     for x in paths:
         os.remove("{}".format(x))
         os.remove("{}.db".format(x))
+    os.remove("{}.mrmanifest".format(NLP_FILE_NAME))
 
 
 @pytest.fixture
@@ -143,6 +146,7 @@ def add_and_remove_nlp_compress_file():
     for x in paths:
         os.remove("{}".format(x))
         os.remove("{}.db".format(x))
+    os.remove("{}.mrmanifest".format(NLP_FILE_NAME))
 
 
 def test_nlp_compress_data(add_and_remove_nlp_compress_file):
@@ -215,6 +219,7 @@ def test_cv_minddataset_writer_tutorial():
     for x in paths:
         os.remove("{}".format(x))
         os.remove("{}.db".format(x))
+    os.remove("{}.mrmanifest".format(CV_FILE_NAME))
 
 
 def test_cv_minddataset_partition_tutorial(add_and_remove_cv_file):
@@ -557,10 +562,14 @@ def test_cv_minddataset_reader_two_dataset(add_and_remove_cv_file):
         os.remove(CV1_FILE_NAME)
     if os.path.exists("{}.db".format(CV1_FILE_NAME)):
         os.remove("{}.db".format(CV1_FILE_NAME))
+    if os.path.exists("{}.mrmanifest".format(CV1_FILE_NAME)):
+        os.remove("{}.mrmanifest".format(CV1_FILE_NAME))
     if os.path.exists(CV2_FILE_NAME):
         os.remove(CV2_FILE_NAME)
     if os.path.exists("{}.db".format(CV2_FILE_NAME)):
         os.remove("{}.db".format(CV2_FILE_NAME))
+    if os.path.exists("{}.mrmanifest".format(CV2_FILE_NAME)):
+        os.remove("{}.mrmanifest".format(CV2_FILE_NAME))
     writer = FileWriter(CV1_FILE_NAME, 1)
     data = get_data(CV_DIR_NAME)
     cv_schema_json = {"id": {"type": "int32"},
@@ -605,10 +614,14 @@ def test_cv_minddataset_reader_two_dataset(add_and_remove_cv_file):
         os.remove(CV1_FILE_NAME)
     if os.path.exists("{}.db".format(CV1_FILE_NAME)):
         os.remove("{}.db".format(CV1_FILE_NAME))
+    if os.path.exists("{}.mrmanifest".format(CV1_FILE_NAME)):
+        os.remove("{}.mrmanifest".format(CV1_FILE_NAME))
     if os.path.exists(CV2_FILE_NAME):
         os.remove(CV2_FILE_NAME)
     if os.path.exists("{}.db".format(CV2_FILE_NAME)):
         os.remove("{}.db".format(CV2_FILE_NAME))
+    if os.path.exists("{}.mrmanifest".format(CV2_FILE_NAME)):
+        os.remove("{}.mrmanifest".format(CV2_FILE_NAME))
 
 
 def test_cv_minddataset_reader_two_dataset_partition(add_and_remove_cv_file):
@@ -652,6 +665,7 @@ def test_cv_minddataset_reader_two_dataset_partition(add_and_remove_cv_file):
     for x in paths:
         os.remove("{}".format(x))
         os.remove("{}.db".format(x))
+    os.remove("{}.mrmanifest".format(CV1_FILE_NAME))
 
 
 def test_cv_minddataset_reader_basic_tutorial(add_and_remove_cv_file):
@@ -675,6 +689,67 @@ def test_cv_minddataset_reader_basic_tutorial(add_and_remove_cv_file):
         num_iter += 1
     assert num_iter == 10
 
+def test_cv_minddataset_reader_use_mmap(add_and_remove_cv_file):
+    """tutorial for cv minderdataset reading by mmap."""
+    columns_list = ["data", "file_name", "label"]
+    num_readers = 4
+    results = []
+    for use_mmap in [False, True]:
+        data_set = ds.MindDataset(CV_FILE_NAME + "0", columns_list, num_readers, shuffle=False, use_mmap=use_mmap)
+        assert data_set.get_dataset_size() == 10
+        results.append([(item["file_name"].item(), item["label"].item(), item["data"].tobytes())
+                        for item in data_set.create_dict_iterator()])
+    assert len(results[1]) == 10
+    assert results[0] == results[1]
+
+def test_cv_minddataset_size_from_manifest(add_and_remove_cv_file):
+    """tutorial for cv minddataset getting dataset size from manifest."""
+    manifest_file = CV_FILE_NAME + ".mrmanifest"
+    with open(manifest_file) as f:
+        manifest = json.load(f)
+    paths = ["{}{}".format(CV_FILE_NAME, str(x)) for x in range(FILES_NUM)]
+    assert manifest["num_rows"] == 10
+    assert [shard["name"] for shard in manifest["shards"]] == [os.path.basename(x) for x in paths]
+    assert sum(sum(shard["categories"]["label"].values()) for shard in manifest["shards"]) == 10
+
+    # the manifest is used instead of the files while they are not modified
+    manifest["shards"][0]["num_rows"] += 1
+    with open(manifest_file, "w") as f:
+        json.dump(manifest, f)
+    assert ds.MindDataset(CV_FILE_NAME + "0", ["data"], 4).get_dataset_size() == 11
+    assert ds.MindDataset(paths, ["data"], 4).get_dataset_size() == 11
+
+    os.utime(paths[0], (0, 0))
+    assert ds.MindDataset(CV_FILE_NAME + "0", ["data"], 4).get_dataset_size() == 10
+
+
+def test_cv_minddataset_filter_pushed_into_index(add_and_remove_cv_file):
+    """tutorial for cv minddataset filtering rows by the index."""
+    data = get_data(CV_DIR_NAME)
+    predicate = (ds.index_field("label") >= 2) & (ds.index_field("label") != 5)
+    expected = sorted(x["file_name"] for x in data if 2 <= x["label"] != 5)
+
+    data_set = ds.MindDataset(CV_FILE_NAME + "0", ["file_name", "label"], 4, shuffle=False)
+    filtered = data_set.filter(predicate)
+    assert isinstance(filtered, ds.MindDataset)
+    assert data_set.get_dataset_size() == 10
+    assert filtered.get_dataset_size() == len(expected)
+    file_names = [item["file_name"].item() for item in filtered.create_dict_iterator()]
+    assert sorted(file_names) == expected
+
+    # string fields and IN lists, evaluated on rows when the predicate is not pushed down
+    names = [data[0]["file_name"], data[3]["file_name"], "not_exist.jpg"]
+    filtered = data_set.filter(ds.index_field("file_name").isin(names))
+    assert filtered.get_dataset_size() == 2
+    fallback = ds.MindDataset(CV_FILE_NAME + "0", ["file_name", "label"], 4,
+                              sampler=ds.PKSampler(2)).filter(ds.index_field("file_name").isin(names))
+    assert not isinstance(fallback, ds.MindDataset)
+    fallback = ds.MindDataset(CV_FILE_NAME + "0", ["file_name", "label"], 4, shuffle=False,
+                              block_reader=True).filter(predicate)
+    file_names = [item["file_name"].item() for item in fallback.create_dict_iterator()]
+    assert sorted(file_names) == expected
+
+
 def test_nlp_minddataset_reader_basic_tutorial(add_and_remove_nlp_file):
     """tutorial for nlp minderdataset."""
     num_readers = 4
@@ -989,6 +1064,8 @@ def test_write_with_multi_bytes_and_array_and_read_by_MindDataset():
         os.remove("{}".format(mindrecord_file_name))
     if os.path.exists("{}.db".format(mindrecord_file_name)):
         os.remove("{}.db".format(mindrecord_file_name))
+    if os.path.exists("{}.mrmanifest".format(mindrecord_file_name)):
+        os.remove("{}.mrmanifest".format(mindrecord_file_name))
     data = [{"file_name": "001.jpg", "label": 4,
              "image1": bytes("image1 bytes abc", encoding='UTF-8'),
              "image2": bytes("image1 bytes def", encoding='UTF-8'),
@@ -1232,6 +1309,7 @@ def test_write_with_multi_bytes_and_array_and_read_by_MindDataset():
 
     os.remove("{}".format(mindrecord_file_name))
     os.remove("{}.db".format(mindrecord_file_name))
+    os.remove("{}.mrmanifest".format(mindrecord_file_name))
 
 
 def test_write_with_multi_bytes_and_MindDataset():
@@ -1408,6 +1486,7 @@ def test_write_with_multi_bytes_and_MindDataset():
 
     os.remove("{}".format(mindrecord_file_name))
     os.remove("{}.db".format(mindrecord_file_name))
+    os.remove("{}.mrmanifest".format(mindrecord_file_name))
 
 
 def test_write_with_multi_array_and_MindDataset():
@@ -1606,6 +1685,7 @@ def test_write_with_multi_array_and_MindDataset():
 
     os.remove("{}".format(mindrecord_file_name))
     os.remove("{}.db".format(mindrecord_file_name))
+    os.remove("{}.mrmanifest".format(mindrecord_file_name))
 
 def test_write_with_float32_float64_float32_array_float64_array_and_MindDataset():
     mindrecord_file_name = "test.mindrecord"
@@ -1752,3 +1832,4 @@ def test_write_with_float32_float64_float32_array_float64_array_and_MindDataset(
 
     os.remove("{}".format(mindrecord_file_name))
     os.remove("{}.db".format(mindrecord_file_name))
+    os.remove("{}.mrmanifest".format(mindrecord_file_name))
@@ -30,6 +30,8 @@ def create_cv_mindrecord(files_num):
         os.remove(CV_FILE_NAME)
     if os.path.exists("{}.db".format(CV_FILE_NAME)):
         os.remove("{}.db".format(CV_FILE_NAME))
+    if os.path.exists("{}.mrmanifest".format(CV_FILE_NAME)):
+        os.remove("{}.mrmanifest".format(CV_FILE_NAME))
     writer = FileWriter(CV_FILE_NAME, files_num)
     cv_schema_json = {"file_name": {"type": "string"}, "label": {"type": "int32"}, "data": {"type": "bytes"}}
     data = [{"file_name": "001.jpg", "label": 43, "data": bytes('0xffsafdafda', encoding='utf-8')}]
@@ -45,6 +47,8 @@ def create_diff_schema_cv_mindrecord(files_num):
         os.remove(CV1_FILE_NAME)
     if os.path.exists("{}.db".format(CV1_FILE_NAME)):
         os.remove("{}.db".format(CV1_FILE_NAME))
+    if os.path.exists("{}.mrmanifest".format(CV1_FILE_NAME)):
+        os.remove("{}.mrmanifest".format(CV1_FILE_NAME))
     writer = FileWriter(CV1_FILE_NAME, files_num)
     cv_schema_json = {"file_name_1": {"type": "string"}, "label": {"type": "int32"}, "data": {"type": "bytes"}}
     data = [{"file_name_1": "001.jpg", "label": 43, "data": bytes('0xffsafdafda', encoding='utf-8')}]
@@ -60,6 +64,8 @@ def create_diff_page_size_cv_mindrecord(files_num):
         os.remove(CV1_FILE_NAME)
     if os.path.exists("{}.db".format(CV1_FILE_NAME)):
         os.remove("{}.db".format(CV1_FILE_NAME))
+    if os.path.exists("{}.mrmanifest".format(CV1_FILE_NAME)):
+        os.remove("{}.mrmanifest".format(CV1_FILE_NAME))
     writer = FileWriter(CV1_FILE_NAME, files_num)
     writer.set_page_size(1 << 26)  # 64MB
     cv_schema_json = {"file_name": {"type": "string"}, "label": {"type": "int32"}, "data": {"type": "bytes"}}
@@ -79,6 +85,7 @@ def test_cv_lack_json():
         ds.MindDataset(CV_FILE_NAME, "no_exist.json", columns_list, num_readers)
     os.remove(CV_FILE_NAME)
     os.remove("{}.db".format(CV_FILE_NAME))
+    os.remove("{}.mrmanifest".format(CV_FILE_NAME))
 
 
 def test_cv_lack_mindrecord():
@@ -106,6 +113,7 @@ def test_invalid_mindrecord():
 def test_minddataset_lack_db():
     create_cv_mindrecord(1)
     os.remove("{}.db".format(CV_FILE_NAME))
+    os.remove("{}.mrmanifest".format(CV_FILE_NAME))
     columns_list = ["data", "file_name", "label"]
     num_readers = 4
     with pytest.raises(Exception, match="MindRecordOp init failed"):
@@ -129,6 +137,7 @@ def test_cv_minddataset_pk_sample_error_class_column():
             num_iter += 1
     os.remove(CV_FILE_NAME)
     os.remove("{}.db".format(CV_FILE_NAME))
+    os.remove("{}.mrmanifest".format(CV_FILE_NAME))
 
 
 def test_cv_minddataset_pk_sample_exclusive_shuffle():
@@ -144,6 +153,7 @@ def test_cv_minddataset_pk_sample_exclusive_shuffle():
             num_iter += 1
     os.remove(CV_FILE_NAME)
     os.remove("{}.db".format(CV_FILE_NAME))
+    os.remove("{}.mrmanifest".format(CV_FILE_NAME))
 
 
 def test_cv_minddataset_reader_different_schema():
@@ -159,8 +169,10 @@ def test_cv_minddataset_reader_different_schema():
             num_iter += 1
     os.remove(CV_FILE_NAME)
     os.remove("{}.db".format(CV_FILE_NAME))
+    os.remove("{}.mrmanifest".format(CV_FILE_NAME))
     os.remove(CV1_FILE_NAME)
     os.remove("{}.db".format(CV1_FILE_NAME))
+    os.remove("{}.mrmanifest".format(CV1_FILE_NAME))
 
 
 def test_cv_minddataset_reader_different_page_size():
@@ -176,8 +188,10 @@ def test_cv_minddataset_reader_different_page_size():
             num_iter += 1
     os.remove(CV_FILE_NAME)
     os.remove("{}.db".format(CV_FILE_NAME))
+    os.remove("{}.mrmanifest".format(CV_FILE_NAME))
     os.remove(CV1_FILE_NAME)
     os.remove("{}.db".format(CV1_FILE_NAME))
+    os.remove("{}.mrmanifest".format(CV1_FILE_NAME))
 
 
 def test_minddataset_invalidate_num_shards():
@@ -191,6 +205,7 @@ def test_minddataset_invalidate_num_shards():
             num_iter += 1
     os.remove(CV_FILE_NAME)
     os.remove("{}.db".format(CV_FILE_NAME))
+    os.remove("{}.mrmanifest".format(CV_FILE_NAME))
 
 
 def test_minddataset_invalidate_shard_id():
@@ -204,6 +219,7 @@ def test_minddataset_invalidate_shard_id():
             num_iter += 1
     os.remove(CV_FILE_NAME)
     os.remove("{}.db".format(CV_FILE_NAME))
+    os.remove("{}.mrmanifest".format(CV_FILE_NAME))
 
 
 def test_minddataset_shard_id_bigger_than_num_shard():
@@ -224,3 +240,4 @@ def test_minddataset_shard_id_bigger_than_num_shard():
 
     os.remove(CV_FILE_NAME)
     os.remove("{}.db".format(CV_FILE_NAME))
+    os.remove("{}.mrmanifest".format(CV_FILE_NAME))
@@ -78,3 +78,5 @@ def test_cv_minddataset_reader_multi_image_and_ndarray_tutorial():
         os.remove(CV_FILE_NAME + ".db")
     if os.path.exists("{}".format(CV_FILE_NAME)):
         os.remove(CV_FILE_NAME)
+    if os.path.exists("{}".format(CV_FILE_NAME + ".mrmanifest")):
+        os.remove(CV_FILE_NAME + ".mrmanifest")
@@ -62,6 +62,7 @@ def add_and_remove_cv_file():
     for x in paths:
         os.remove("{}".format(x))
         os.remove("{}.db".format(x))
+    os.remove("{}.mrmanifest".format(CV_FILE_NAME))
 
 
 @pytest.fixture
@@ -95,6 +96,7 @@ def add_and_remove_nlp_file():
     for x in paths:
         os.remove("{}".format(x))
         os.remove("{}.db".format(x))
+    os.remove("{}.mrmanifest".format(NLP_FILE_NAME))
 
 def test_cv_minddataset_reader_basic_padded_samples(add_and_remove_cv_file):
     """tutorial for cv minderdataset."""
@@ -53,6 +53,7 @@ def add_and_remove_cv_file():
     for x in paths:
         os.remove("{}".format(x))
         os.remove("{}.db".format(x))
+    os.remove("{}.mrmanifest".format(CV_FILE_NAME))
 
 
 def test_cv_minddataset_pk_sample_no_column(add_and_remove_cv_file):
@@ -0,0 +1,193 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Testing batch mode of py_transforms on stacked Numpy image arrays
+"""
+import numpy as np
+from numpy.testing import assert_allclose
+
+import mindspore.dataset as ds
+import mindspore.dataset.transforms.vision.py_transforms as py_vision
+from mindspore import log as logger
+from util import config_get_set_seed
+
+DATA_DIR = ["../data/dataset/test_tf_file_3_images/train-0000-of-0001.data"]
+SCHEMA_DIR = "../data/dataset/test_tf_file_3_images/datasetSchema.json"
+
+
+def test_hwc2chw_batch():
+    """
+    Test HWC2CHW on a batch of images
+    """
+    logger.info("test_hwc2chw_batch")
+    images = np.random.randint(0, 256, (4, 8, 6, 3)).astype(np.uint8)
+    output = py_vision.HWC2CHW()(images)
+    assert output.shape == (4, 3, 8, 6)
+    for image, out in zip(images, output):
+        np.testing.assert_array_equal(py_vision.HWC2CHW()(image), out)
+
+
+def test_normalize_batch():
+    """
+    Test Normalize on a batch of images matches per image normalization
+    """
+    logger.info("test_normalize_batch")
+    images = np.random.rand(4, 3, 8, 6).astype(np.float32)
+    normalize_op = py_vision.Normalize((0.491, 0.482, 0.447), (0.247, 0.243, 0.262))
+    output = normalize_op(images)
+    assert output.shape == images.shape
+    for image, out in zip(images, output):
+        assert_allclose(normalize_op(image), out, rtol=1e-6)
+
+
+def test_to_type_batch():
+    """
+    Test ToType on a batch of images
+    """
+    logger.info("test_to_type_batch")
+    images = np.random.rand(4, 3, 8, 6)
+    output = py_vision.ToType(np.float16)(images)
+    assert output.dtype == np.float16
+    assert output.shape == images.shape
+
+
+def test_random_horizontal_flip_batch():
+    """
+    Test RandomHorizontalFlip flips each image of a batch independently
+    """
+    logger.info("test_random_horizontal_flip_batch")
+    ds.config.set_seed(0)
+    images = np.random.rand(16, 3, 8, 6).astype(np.float32)
+
+    # the width is the last axis of a batch of CHW images
+    output = py_vision.RandomHorizontalFlip(1.0)(images)
+    np.testing.assert_array_equal(output, images[..., ::-1])
+    output = py_vision.RandomHorizontalFlip(0.0)(images)
+    np.testing.assert_array_equal(output, images)
+
+    output = py_vision.RandomHorizontalFlip(0.5)(images)
+    num_flipped = 0
+    for image, out in zip(images, output):
+        if np.array_equal(image[..., ::-1], out):
+            num_flipped += 1
+        else:
+            np.testing.assert_array_equal(image, out)
+    assert 0 < num_flipped < 16
+
+
+def test_cutout_batch():
+    """
+    Test Cutout on a batch of images cuts patches of at most length x length in every image
+    """
+    logger.info("test_cutout_batch")
+    ds.config.set_seed(0)
+    images = np.ones((8, 3, 32, 32), dtype=np.float32)
+    output = py_vision.Cutout(8)(images)
+    assert output.shape == images.shape
+    for out in output:
+        num_erased = np.sum(out[0] == 0)
+        assert 0 <= num_erased <= 64
+        # every channel is cut out at the same location
+        np.testing.assert_array_equal(out[0], out[1])
+    # the input batch is left untouched
+    assert np.all(images == 1)
+
+
+def test_random_erasing_batch():
+    """
+    Test RandomErasing on a batch of images, with prob 0 and prob 1
+    """
+    logger.info("test_random_erasing_batch")
+    ds.config.set_seed(0)
+    images = np.ones((8, 3, 32, 32), dtype=np.float32)
+
+    output = py_vision.RandomErasing(prob=0.0)(images)
+    np.testing.assert_array_equal(output, images)
+
+    output = py_vision.RandomErasing(prob=1.0, value=(2, 3, 4))(images)
+    for out in output:
+        erased = out[0] == 2
+        assert np.any(erased)
+        np.testing.assert_array_equal(out[1][erased], 3)
+        np.testing.assert_array_equal(out[2][erased], 4)
+        np.testing.assert_array_equal(out[0][~erased], 1)
+
+
+def test_batch_mode_pipeline():
+    """
+    Test batch mode ops applied after batch() give the same shapes as per image ops
+    """
+    logger.info("test_batch_mode_pipeline")
+    data = ds.TFRecordDataset(DATA_DIR, SCHEMA_DIR, columns_list=["image"], shuffle=False)
+    transforms = [
+        py_vision.Decode(),
+        py_vision.Resize((32, 32)),
+        py_vision.ToTensor()
+    ]
+    data = data.map(input_columns=["image"], operations=py_vision.ComposeOp(transforms)())
+    data = data.batch(3)
+    data = data.map(input_columns=["image"], operations=[
+        py_vision.Normalize((0.491, 0.482, 0.447), (0.247, 0.243, 0.262)),
+        py_vision.RandomErasing(prob=0.5),
+        py_vision.Cutout(8)])
+
+    num_iter = 0
+    for item in data.create_dict_iterator():
+        assert item["image"].shape == (3, 3, 32, 32)
+        num_iter += 1
+    assert num_iter == 1
+
+
+def test_batch_mode_pipeline_with_seed():
+    """
+    Test batch mode ops give the same batches in two pipelines with the same seed
+    """
+    logger.info("test_batch_mode_pipeline_with_seed")
+
+    def run_pipeline():
+        data = ds.TFRecordDataset(DATA_DIR, SCHEMA_DIR, columns_list=["image"], shuffle=False)
+        transforms = [
+            py_vision.Decode(),
+            py_vision.Resize((32, 32)),
+            py_vision.ToTensor()
+        ]
+        data = data.map(input_columns=["image"], operations=py_vision.ComposeOp(transforms)())
+        data = data.batch(3)
+        data = data.map(input_columns=["image"], operations=[
+            py_vision.RandomHorizontalFlip(0.5),
+            py_vision.RandomErasing(prob=0.5, value="random"),
+            py_vision.Cutout(8, 2)])
+        return [item["image"] for item in data.create_dict_iterator()]
+
+    original_seed = config_get_set_seed(5)
+    images1 = run_pipeline()
+    ds.config.set_seed(5)
+    # the batch ops do not depend on the global numpy random state used by others
+    np.random.rand(10)
+    images2 = run_pipeline()
+    for image1, image2 in zip(images1, images2):
+        np.testing.assert_array_equal(image1, image2)
+    ds.config.set_seed(original_seed)
+
+
+if __name__ == "__main__":
+    test_hwc2chw_batch()
+    test_normalize_batch()
+    test_to_type_batch()
+    test_random_horizontal_flip_batch()
+    test_cutout_batch()
+    test_random_erasing_batch()
+    test_batch_mode_pipeline()
+    test_batch_mode_pipeline_with_seed()
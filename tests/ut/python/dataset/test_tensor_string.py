@@ -164,6 +164,7 @@ def test_tfrecord3():
 
 def create_text_mindrecord():
     # methood to create mindrecord with string data, used to generate testTextMindRecord/test.mindrecord
+    import os
     from mindspore.mindrecord import FileWriter
 
     mindrecord_file_name = "test.mindrecord"
@@ -181,6 +182,8 @@ def create_text_mindrecord():
     writer.add_schema(schema)
     writer.write_raw_data(data)
     writer.commit()
+    # only the file and its db are kept as test data
+    os.remove("{}.mrmanifest".format(mindrecord_file_name))
 
 
 def test_mindrecord():
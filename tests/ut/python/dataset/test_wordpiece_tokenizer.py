@@ -15,12 +15,16 @@
 """
 Testing WordpieceTokenizer op in DE
 """
+import json
+import os
 import numpy as np
+import pytest
 import mindspore.dataset as ds
 from mindspore import log as logger
 import mindspore.dataset.text as nlp
 
 WORDPIECE_TOKENIZER_FILE = "../data/dataset/testTokenizerData/wordpiece_tokenizer.txt"
+CACHE_PROFILING_FILE = "./tensor_op_cache_profiling_1.json"
 
 vocab_english = [
     "book", "cholera", "era", "favor", "##ite", "my", "is", "love", "dur", "##ing", "the"
@@ -82,7 +86,8 @@ test_paras = [
 ]
 
 
-def check_wordpiece_tokenizer(first, last, expect_str, vocab_list, unknown_token='[UNK]', max_bytes_per_token=100):
+def check_wordpiece_tokenizer(first, last, expect_str, vocab_list, unknown_token='[UNK]', max_bytes_per_token=100,
+                              cache_size=10000):
     dataset = ds.TextFileDataset(WORDPIECE_TOKENIZER_FILE, shuffle=False)
     if first > 1:
         dataset = dataset.skip(first - 1)
@@ -90,7 +95,7 @@ def check_wordpiece_tokenizer(first, last, expect_str, vocab_list, unknown_token
         dataset = dataset.take(last - first + 1)
     vocab = nlp.Vocab.from_list(vocab_list)
     tokenizer_op = nlp.WordpieceTokenizer(vocab=vocab, unknown_token=unknown_token,
-                                          max_bytes_per_token=max_bytes_per_token)
+                                          max_bytes_per_token=max_bytes_per_token, cache_size=cache_size)
     dataset = dataset.map(operations=tokenizer_op)
     count = 0
     for i in dataset.create_dict_iterator():
@@ -109,5 +114,66 @@ def test_wordpiece_tokenizer():
         check_wordpiece_tokenizer(**paras)
 
 
+def test_wordpiece_tokenizer_cache_size():
+    """
+    Test WordpieceTokenizer gives the same result without cache and with a cache smaller than the vocab
+    """
+    for cache_size in [0, 2]:
+        for paras in test_paras:
+            check_wordpiece_tokenizer(cache_size=cache_size, **paras)
+
+
+def test_wordpiece_tokenizer_cache_stats():
+    """
+    Test the cache hits and misses of WordpieceTokenizer are reported by profiling
+    """
+    os.environ['PROFILING_MODE'] = 'true'
+    os.environ['MINDDATA_PROFILING_DIR'] = '.'
+    os.environ['DEVICE_ID'] = '1'
+
+    dataset = ds.TextFileDataset(WORDPIECE_TOKENIZER_FILE, shuffle=False)
+    dataset = dataset.repeat(2)
+    tokenizer_op = nlp.WordpieceTokenizer(vocab=nlp.Vocab.from_list(vocab_mix))
+    dataset = dataset.map(operations=tokenizer_op)
+    for _ in dataset.create_dict_iterator():
+        pass
+
+    # every line of the file is one word, all of them are cached after the first epoch
+    hits, misses = tokenizer_op.get_cache_stats()
+    logger.info("hits: {}, misses: {}".format(hits, misses))
+    assert hits + misses == 50
+    assert hits >= 25
+
+    assert os.path.exists(CACHE_PROFILING_FILE) is True
+    with open(CACHE_PROFILING_FILE) as f:
+        op_info = json.load(f)["op_info"]
+    os.remove(CACHE_PROFILING_FILE)
+    assert len(op_info) == 1
+    assert op_info[0]["tensor_op"] == "WordpieceTokenizerOp"
+    assert op_info[0]["metrics"]["cache"]["hits"][-1] == hits
+    assert op_info[0]["metrics"]["cache"]["misses"][-1] == misses
+    os.remove("./pipeline_profiling_1.json")
+    os.remove("./dataset_iterator_profiling_1.txt")
+    del os.environ['PROFILING_MODE']
+    del os.environ['MINDDATA_PROFILING_DIR']
+
+
+def test_wordpiece_tokenizer_cache_size_invalid():
+    """
+    Test the cache size of WordpieceTokenizer and BertTokenizer is checked
+    """
+    vocab = nlp.Vocab.from_list(vocab_mix)
+    for cache_size in [-1, 2 ** 31, 1.5]:
+        with pytest.raises(ValueError) as info:
+            nlp.WordpieceTokenizer(vocab, cache_size=cache_size)
+        assert "cache_size" in str(info.value)
+        with pytest.raises(ValueError) as info:
+            nlp.BertTokenizer(vocab, cache_size=cache_size)
+        assert "cache_size" in str(info.value)
+
+
 if __name__ == '__main__':
     test_wordpiece_tokenizer()
+    test_wordpiece_tokenizer_cache_size()
+    test_wordpiece_tokenizer_cache_stats()
+    test_wordpiece_tokenizer_cache_size_invalid()
@@ -37,6 +37,10 @@ def fixture_file():
             os.remove("{}_test".format(x))
         if os.path.exists("{}_test.db".format(x)):
             os.remove("{}_test.db".format(x))
+        if os.path.exists("{}.mrmanifest".format(x)):
+            os.remove("{}.mrmanifest".format(x))
+        if os.path.exists("{}_test.mrmanifest".format(x)):
+            os.remove("{}_test.mrmanifest".format(x))
 
     remove_file(MINDRECORD_FILE)
     yield "yield_fixture_data"
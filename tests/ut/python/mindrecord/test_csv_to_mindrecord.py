@@ -41,6 +41,8 @@ def fixture_remove():
         remove_one_file(x)
         x = MINDRECORD_FILE + ".db"
         remove_one_file(x)
+        x = MINDRECORD_FILE + ".mrmanifest"
+        remove_one_file(x)
         for i in range(PARTITION_NUMBER):
             x = MINDRECORD_FILE + str(i)
             remove_one_file(x)
@@ -141,3 +143,17 @@ def test_csv_to_mindrecord_illegal_filename(remove_mindrecord_file):
     with pytest.raises(Exception, match="File name should not contains"):
         csv_trans = CsvToMR(CSV_FILE, filename)
         csv_trans.transform()
+
+def test_csv_to_mindrecord_num_workers(remove_mindrecord_file):
+    """test transform csv to mindrecord with multiple worker processes."""
+    csv_trans = CsvToMR(CSV_FILE, MINDRECORD_FILE, partition_number=PARTITION_NUMBER, num_workers=2)
+    csv_trans.transform()
+    for i in range(PARTITION_NUMBER):
+        assert os.path.exists(MINDRECORD_FILE + str(i))
+        assert os.path.exists(MINDRECORD_FILE + str(i) + ".db")
+
+    df = pd.read_csv(CSV_FILE)
+    reader = FileReader(MINDRECORD_FILE + "0")
+    names = sorted(x["Name"] for x in reader.get_next())
+    reader.close()
+    assert names == sorted(df["Name"].tolist())
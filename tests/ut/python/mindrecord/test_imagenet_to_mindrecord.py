@@ -36,6 +36,8 @@ def fixture_file():
         remove_one_file(x)
         x = MINDRECORD_FILE + ".db"
         remove_one_file(x)
+        x = MINDRECORD_FILE + ".mrmanifest"
+        remove_one_file(x)
         for i in range(PARTITION_NUMBER):
             x = MINDRECORD_FILE + str(i)
             remove_one_file(x)
@@ -114,3 +116,22 @@ def test_imagenet_to_mindrecord_illegal_filename(fixture_file):
                                             IMAGENET_IMAGE_DIR, filename,
                                             PARTITION_NUMBER)
         imagenet_transformer.transform()
+
+def test_imagenet_to_mindrecord_num_workers(fixture_file):
+    """test transform imagenet dataset to mindrecord with multiple worker processes."""
+    imagenet_transformer = ImageNetToMR(IMAGENET_MAP_FILE, IMAGENET_IMAGE_DIR,
+                                        MINDRECORD_FILE, PARTITION_NUMBER, num_workers=2)
+    imagenet_transformer.transform()
+    for i in range(PARTITION_NUMBER):
+        assert os.path.exists(MINDRECORD_FILE + str(i))
+        assert os.path.exists(MINDRECORD_FILE + str(i) + ".db")
+    read(MINDRECORD_FILE + "0")
+    read(MINDRECORD_FILE + str(PARTITION_NUMBER - 1))
+
+def test_imagenet_to_mindrecord_num_workers_0(fixture_file):
+    """
+    test transform imagenet dataset to mindrecord
+    when num_workers is 0.
+    """
+    with pytest.raises(Exception, match="The parameter num_workers must be int"):
+        ImageNetToMR(IMAGENET_MAP_FILE, IMAGENET_IMAGE_DIR, MINDRECORD_FILE, PARTITION_NUMBER, num_workers=0)
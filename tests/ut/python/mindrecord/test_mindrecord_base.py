@@ -13,13 +13,19 @@
 # limitations under the License.
 # ============================================================================
 """test mindrecord base"""
+import json
 import os
+import sqlite3
+import struct
 import uuid
 import numpy as np
+import pytest
 from utils import get_data, get_nlp_data
 
 from mindspore import log as logger
 from mindspore.mindrecord import FileWriter, FileReader, MindPage, SUCCESS
+from mindspore.mindrecord import MRMGenerateIndexError
+from mindspore.mindrecord.shardindexgenerator import ShardIndexGenerator
 
 FILES_NUM = 4
 CV_FILE_NAME = "./imagenet.mindrecord"
@@ -77,6 +83,51 @@ def test_write_read_process():
 
     os.remove("{}".format(mindrecord_file_name))
     os.remove("{}.db".format(mindrecord_file_name))
+    os.remove("{}.mrmanifest".format(mindrecord_file_name))
+
+
+def test_write_read_process_with_batch():
+    mindrecord_file_name = "test.mindrecord"
+    data = [{"file_name": "{:03d}.jpg".format(i), "label": i * 7, "score": i / 3.0,
+             "mask": np.arange(i % 3 + 1, dtype=np.int64),
+             "segments": np.full((2, 2), i, dtype=np.float32),
+             "data": bytes("image bytes {}".format("x" * i), encoding='UTF-8')} for i in range(10)]
+    writer = FileWriter(mindrecord_file_name)
+    schema = {"file_name": {"type": "string"},
+              "label": {"type": "int32"},
+              "score": {"type": "float64"},
+              "mask": {"type": "int64", "shape": [-1]},
+              "segments": {"type": "float32", "shape": [2, 2]},
+              "data": {"type": "bytes"}}
+    writer.add_schema(schema, "data is so cool")
+    writer.write_raw_data(data)
+    writer.commit()
+
+    reader = FileReader(mindrecord_file_name)
+    count = 0
+    for batch in reader.get_next_batch(4):
+        assert len(batch) == 6
+        num_rows = len(batch["file_name"])
+        assert num_rows == min(4, len(data) - count)
+        assert batch["label"].dtype == np.int32
+        assert batch["segments"].shape == (num_rows, 2, 2)
+        for i in range(num_rows):
+            row = data[count + i]
+            assert batch["file_name"][i] == row["file_name"]
+            assert batch["label"][i] == row["label"]
+            assert batch["score"][i] == row["score"]
+            assert (batch["segments"][i] == row["segments"]).all()
+            values, offsets = batch["mask"]
+            assert (values[offsets[i]:offsets[i + 1]] == row["mask"]).all()
+            values, offsets = batch["data"]
+            assert values[offsets[i]:offsets[i + 1]].tobytes() == row["data"]
+        count += num_rows
+    assert count == 10
+    reader.close()
+
+    os.remove("{}".format(mindrecord_file_name))
+    os.remove("{}.db".format(mindrecord_file_name))
+    os.remove("{}.mrmanifest".format(mindrecord_file_name))
 
 
 def test_write_read_process_with_define_index_field():
@@ -128,6 +179,31 @@ def test_write_read_process_with_define_index_field():
 
     os.remove("{}".format(mindrecord_file_name))
     os.remove("{}.db".format(mindrecord_file_name))
+    os.remove("{}.mrmanifest".format(mindrecord_file_name))
+
+
+def test_manifest_counts_categorical_index_fields():
+    """test the manifest counts the categories of index fields except the unique ones."""
+    mindrecord_file_name = "test_manifest.mindrecord"
+    data = [{"file_name": "{:03d}.jpg".format(i), "label": i % 4, "data": bytes("image bytes", encoding='UTF-8')}
+            for i in range(20)]
+    writer = FileWriter(mindrecord_file_name)
+    schema = {"file_name": {"type": "string"}, "label": {"type": "int32"}, "data": {"type": "bytes"}}
+    writer.add_schema(schema, "data is so cool")
+    writer.add_index(["file_name", "label"])
+    writer.write_raw_data(data)
+    writer.commit()
+
+    with open("{}.mrmanifest".format(mindrecord_file_name)) as f:
+        manifest = json.load(f)
+    assert manifest["num_rows"] == 20
+    categories = manifest["shards"][0]["categories"]
+    assert "file_name" not in categories
+    assert categories["label"] == {"0": 5, "1": 5, "2": 5, "3": 5}
+
+    os.remove("{}".format(mindrecord_file_name))
+    os.remove("{}.db".format(mindrecord_file_name))
+    os.remove("{}.mrmanifest".format(mindrecord_file_name))
 
 
 def test_cv_file_writer_tutorial():
@@ -169,6 +245,7 @@ def test_cv_file_append_writer():
     for x in paths:
         os.remove("{}".format(x))
         os.remove("{}.db".format(x))
+    os.remove("{}.mrmanifest".format(CV3_FILE_NAME))
 
 
 def test_cv_file_append_writer_absolute_path():
@@ -198,6 +275,50 @@ def test_cv_file_append_writer_absolute_path():
     for x in paths:
         os.remove("{}".format(x))
         os.remove("{}.db".format(x))
+    os.remove("{}.mrmanifest".format(CV4_FILE_NAME))
+
+
+def test_cv_file_append_writer_incremental_index():
+    """test the index is updated incrementally and stays consistent after appending."""
+    writer = FileWriter(CV3_FILE_NAME, 1)
+    data = get_data("../data/mindrecord/testImageNetData/")
+    cv_schema_json = {"file_name": {"type": "string"},
+                      "label": {"type": "int64"}, "data": {"type": "bytes"}}
+    writer.add_schema(cv_schema_json, "img_schema")
+    writer.add_index(["file_name", "label"])
+    writer.write_raw_data(data[0:4])
+    writer.commit()
+    for start in (4, 7):
+        write_append = FileWriter.open_for_append(CV3_FILE_NAME)
+        write_append.write_raw_data(data[start:start + 3])
+        write_append.commit()
+
+    generator = ShardIndexGenerator(os.path.realpath(CV3_FILE_NAME), True)
+    generator.build()
+    assert generator.check_index() == SUCCESS
+    conn = sqlite3.connect(CV3_FILE_NAME + ".db")
+    row_ids = [x[0] for x in conn.execute("SELECT ROW_ID FROM INDEXES ORDER BY ROW_ID;")]
+    file_names = sorted(x[0] for x in conn.execute("SELECT file_name_0 FROM INDEXES;"))
+    conn.close()
+    assert row_ids == list(range(10))
+    assert file_names == sorted(x["file_name"] for x in data[0:10])
+
+    reader = MindPage(CV3_FILE_NAME)
+    reader.category_field = "file_name"
+    row = reader.read_at_page_by_name(data[8]["file_name"], 0, 1)
+    assert row[0]["label"] == data[8]["label"]
+    assert row[0]["data"] == data[8]["data"]
+
+    # a damaged index is detected
+    conn = sqlite3.connect(CV3_FILE_NAME + ".db")
+    conn.execute("DELETE FROM INDEXES WHERE ROW_ID = 5;")
+    conn.commit()
+    conn.close()
+    with pytest.raises(MRMGenerateIndexError):
+        generator.check_index()
+    os.remove(CV3_FILE_NAME)
+    os.remove(CV3_FILE_NAME + ".db")
+    os.remove(CV3_FILE_NAME + ".mrmanifest")
 
 
 def test_cv_file_writer_loop_and_read():
@@ -226,6 +347,7 @@ def test_cv_file_writer_loop_and_read():
     for x in paths:
         os.remove("{}".format(x))
         os.remove("{}.db".format(x))
+    os.remove("{}.mrmanifest".format(CV2_FILE_NAME))
 
 
 def test_cv_file_reader_tutorial():
@@ -312,6 +434,45 @@ def test_cv_page_reader_tutorial_by_file_name():
     assert row1[0]['label'] == 13
 
 
+def test_cv_page_reader_with_cache():
+    """test cv page reader with page cache and prefetch."""
+    reader = MindPage(CV_FILE_NAME + "0", cache_size=1 << 24, prefetch=True)
+    reader.category_field = "label"
+    info = json.loads(reader.read_category_info())
+    category = max(info["categories"], key=lambda x: x["count"])
+
+    row = reader.read_at_page_by_id(category["id"], 0, 1)
+    assert len(row) == 1
+    assert row[0]["label"] == int(category["name"])
+    assert reader.read_at_page_by_id(category["id"], 0, 1) == row
+    row1 = reader.read_at_page_by_name(category["name"], 0, 1)
+    assert row1[0]["file_name"] == row[0]["file_name"]
+
+    stats = reader.cache_stats
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["cached_bytes"] > 0
+    assert stats["latency_p50"] <= stats["latency_p99"]
+
+    if category["count"] > 1:
+        # the next page is prefetched after the first page is read
+        reader.read_at_page_by_id(category["id"], 1, 1)
+        assert reader.cache_stats["hits"] == 2
+
+    # the rows handed out are copies of the cached ones
+    row[0]["label"] = -1
+    assert reader.read_at_page_by_id(category["id"], 0, 1)[0]["label"] == int(category["name"])
+    reader.close()
+
+    # a page larger than the cache is not cached
+    reader = MindPage(CV_FILE_NAME + "0", cache_size=1)
+    reader.category_field = "label"
+    reader.read_at_page_by_id(0, 0, 1)
+    reader.read_at_page_by_id(0, 0, 1)
+    assert reader.cache_stats["hits"] == 0
+    assert reader.cache_stats["cached_bytes"] == 0
+
+
 def test_cv_page_reader_tutorial_new_api():
     """tutorial for cv page reader."""
     reader = MindPage(CV_FILE_NAME + "0")
@@ -339,6 +500,7 @@ def test_cv_page_reader_tutorial_new_api():
     for x in paths:
         os.remove("{}".format(x))
         os.remove("{}.db".format(x))
+    os.remove("{}.mrmanifest".format(CV_FILE_NAME))
 
 
 def test_nlp_file_writer_tutorial():
@@ -402,6 +564,7 @@ def test_nlp_page_reader_tutorial():
     for x in paths:
         os.remove("{}".format(x))
         os.remove("{}.db".format(x))
+    os.remove("{}.mrmanifest".format(NLP_FILE_NAME))
 
 
 def test_cv_file_writer_shard_num_10():
@@ -420,6 +583,7 @@ def test_cv_file_writer_shard_num_10():
     for x in paths:
         os.remove("{}".format(x))
         os.remove("{}.db".format(x))
+    os.remove("{}.mrmanifest".format(CV_FILE_NAME))
 
 
 def test_cv_file_writer_absolute_path():
@@ -439,6 +603,7 @@ def test_cv_file_writer_absolute_path():
     for x in paths:
         os.remove("{}".format(x))
         os.remove("{}.db".format(x))
+    os.remove("{}.mrmanifest".format(file_name))
 
 
 def test_cv_file_writer_without_data():
@@ -458,6 +623,7 @@ def test_cv_file_writer_without_data():
     reader.close()
     os.remove(CV_FILE_NAME)
     os.remove("{}.db".format(CV_FILE_NAME))
+    os.remove("{}.mrmanifest".format(CV_FILE_NAME))
 
 
 def test_cv_file_writer_no_blob():
@@ -480,6 +646,7 @@ def test_cv_file_writer_no_blob():
     reader.close()
     os.remove(CV_FILE_NAME)
     os.remove("{}.db".format(CV_FILE_NAME))
+    os.remove("{}.mrmanifest".format(CV_FILE_NAME))
 
 
 def test_cv_file_writer_no_raw():
@@ -508,6 +675,7 @@ def test_cv_file_writer_no_raw():
     reader.close()
     os.remove(NLP_FILE_NAME)
     os.remove("{}.db".format(NLP_FILE_NAME))
+    os.remove("{}.mrmanifest".format(NLP_FILE_NAME))
 
 
 def test_write_read_process_with_multi_bytes():
@@ -633,6 +801,7 @@ def test_write_read_process_with_multi_bytes():
 
     os.remove("{}".format(mindrecord_file_name))
     os.remove("{}.db".format(mindrecord_file_name))
+    os.remove("{}.mrmanifest".format(mindrecord_file_name))
 
 
 def test_write_read_process_with_multi_array():
@@ -777,6 +946,7 @@ def test_write_read_process_with_multi_array():
 
     os.remove("{}".format(mindrecord_file_name))
     os.remove("{}.db".format(mindrecord_file_name))
+    os.remove("{}.mrmanifest".format(mindrecord_file_name))
 
 
 def test_write_read_process_with_multi_bytes_and_array():
@@ -964,3 +1134,166 @@ def test_write_read_process_with_multi_bytes_and_array():
 
     os.remove("{}".format(mindrecord_file_name))
     os.remove("{}.db".format(mindrecord_file_name))
+    os.remove("{}.mrmanifest".format(mindrecord_file_name))
+
+
+def test_write_columns_read_process():
+    mindrecord_file_name = "test.mindrecord"
+    num_rows = 20
+    columns = {"file_name": ["{:03d}.jpg".format(i) for i in range(num_rows)],
+               "label": np.arange(num_rows, dtype=np.int32),
+               "score": np.random.rand(num_rows),
+               "mask": [np.arange(i % 5, dtype=np.int64) for i in range(num_rows)],
+               "segments": np.random.rand(num_rows, 2, 2).astype(np.float32),
+               "data": [bytes("image bytes {}".format(i), encoding='UTF-8') for i in range(num_rows)]}
+    writer = FileWriter(mindrecord_file_name)
+    schema = {"file_name": {"type": "string"},
+              "label": {"type": "int32"},
+              "score": {"type": "float64"},
+              "mask": {"type": "int64", "shape": [-1]},
+              "segments": {"type": "float32", "shape": [2, 2]},
+              "data": {"type": "bytes"}}
+    writer.add_schema(schema, "data is so cool")
+    writer.add_index(["label"])
+    writer.write_columns(columns)
+    writer.commit()
+
+    reader = FileReader(mindrecord_file_name)
+    count = 0
+    for index, x in enumerate(reader.get_next()):
+        assert len(x) == 6
+        for field in x:
+            if isinstance(x[field], np.ndarray):
+                assert (x[field] == columns[field][count]).all()
+            else:
+                assert x[field] == columns[field][count]
+        count = count + 1
+        logger.info("#item{}: {}".format(index, x))
+    assert count == num_rows
+    reader.close()
+
+    os.remove("{}".format(mindrecord_file_name))
+    os.remove("{}.db".format(mindrecord_file_name))
+    os.remove("{}.mrmanifest".format(mindrecord_file_name))
+
+
+def test_write_read_process_with_compression():
+    mindrecord_file_name = "test.mindrecord"
+    num_rows = 20
+    schema = {"file_name": {"type": "string"},
+              "label": {"type": "int32"},
+              "mask": {"type": "int64", "shape": [-1]},
+              "data": {"type": "bytes"}}
+    data = [{"file_name": "{:03d}.jpg".format(i), "label": i,
+             "mask": np.arange(i % 5 + 1, dtype=np.int64),
+             "data": bytes("image bytes {}".format(i), encoding='UTF-8') * 100} for i in range(num_rows)]
+    for compression in ["lz4", "zstd"]:
+        writer = FileWriter(mindrecord_file_name, FILES_NUM, compression=compression)
+        writer.add_schema(schema, "data is so cool")
+        writer.add_index(["label"])
+        writer.write_raw_data(data)
+        writer.commit()
+
+        with open(mindrecord_file_name + "0", "rb") as f:
+            header_len = struct.unpack("=Q", f.read(8))[0]
+            header = json.loads(f.read(header_len).decode("utf-8"))
+        assert header["compression"] == compression
+
+        reader = FileReader(mindrecord_file_name + "0")
+        count = 0
+        for x in reader.get_next():
+            expected = data[x["label"]]
+            assert x["file_name"] == expected["file_name"]
+            assert (x["mask"] == expected["mask"]).all()
+            assert x["data"] == expected["data"]
+            count = count + 1
+        assert count == num_rows
+        reader.close()
+
+        for x in range(FILES_NUM):
+            os.remove("{}{}".format(mindrecord_file_name, x))
+            os.remove("{}{}.db".format(mindrecord_file_name, x))
+        os.remove("{}.mrmanifest".format(mindrecord_file_name))
+
+
+def test_write_read_process_with_mmap():
+    mindrecord_file_name = "test.mindrecord"
+    num_rows = 20
+    schema = {"file_name": {"type": "string"},
+              "label": {"type": "int32"},
+              "mask": {"type": "int64", "shape": [-1]},
+              "segments": {"type": "float32", "shape": [2, 2]},
+              "data": {"type": "bytes"}}
+    data = [{"file_name": "{:03d}.jpg".format(i), "label": i,
+             "mask": np.arange(i % 5 + 1, dtype=np.int64),
+             "segments": np.random.rand(2, 2).astype(np.float32),
+             "data": bytes("image bytes {}".format(i), encoding='UTF-8')} for i in range(num_rows)]
+    writer = FileWriter(mindrecord_file_name, FILES_NUM)
+    writer.add_schema(schema, "data is so cool")
+    writer.add_index(["label"])
+    writer.write_raw_data(data)
+    writer.commit()
+
+    reader = FileReader(mindrecord_file_name + "0", use_mmap=True)
+    count = 0
+    for x in reader.get_next():
+        expected = data[x["label"]]
+        assert x["file_name"] == expected["file_name"]
+        assert (x["mask"] == expected["mask"]).all()
+        # blob fields are read-only views into the mapped files
+        assert isinstance(x["data"], memoryview)
+        assert x["data"].readonly
+        assert x["data"] == expected["data"]
+        assert not x["segments"].flags.writeable
+        assert (x["segments"] == expected["segments"]).all()
+        count = count + 1
+    assert count == num_rows
+    reader.close()
+
+    reader = FileReader(mindrecord_file_name + "0", columns=["label", "segments"], use_mmap=True)
+    count = 0
+    for x in reader.get_next():
+        assert set(x.keys()) == {"label", "segments"}
+        assert (x["segments"] == data[x["label"]]["segments"]).all()
+        count = count + 1
+    assert count == num_rows
+    reader.close()
+
+    for x in range(FILES_NUM):
+        os.remove("{}{}".format(mindrecord_file_name, x))
+        os.remove("{}{}.db".format(mindrecord_file_name, x))
+    os.remove("{}.mrmanifest".format(mindrecord_file_name))
+
+
+def test_write_columns_same_as_write_raw_data():
+    mindrecord_file_name = "test.mindrecord"
+    num_rows = 10
+    schema = {"label": {"type": "int64"},
+              "input_ids": {"type": "int32", "shape": [8]},
+              "input_mask": {"type": "int32", "shape": [8]}}
+    columns = {"label": np.arange(num_rows),
+               "input_ids": np.random.randint(0, 100, (num_rows, 8)),
+               "input_mask": np.ones((num_rows, 8), dtype=np.int32)}
+
+    results = []
+    for write_columns in [True, False]:
+        writer = FileWriter(mindrecord_file_name, FILES_NUM)
+        writer.add_schema(schema, "data is so cool")
+        if write_columns:
+            writer.write_columns(columns)
+        else:
+            writer.write_raw_data([{"label": int(columns["label"][i]),
+                                    "input_ids": columns["input_ids"][i].astype(np.int32),
+                                    "input_mask": columns["input_mask"][i]} for i in range(num_rows)])
+        writer.commit()
+        reader = FileReader(mindrecord_file_name + "0")
+        results.append(sorted([(x["label"], x["input_ids"].tolist(), x["input_mask"].tolist())
+                               for x in reader.get_next()]))
+        reader.close()
+        for x in range(FILES_NUM):
+            os.remove("{}{}".format(mindrecord_file_name, x))
+            os.remove("{}{}.db".format(mindrecord_file_name, x))
+        os.remove("{}.mrmanifest".format(mindrecord_file_name))
+    assert len(results[0]) == num_rows
+    assert results[0] == results[1]
+
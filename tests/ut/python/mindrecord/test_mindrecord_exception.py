@@ -14,13 +14,15 @@
 # ============================================================================
 """test mindrecord exception"""
 import os
+import numpy as np
 import pytest
 from utils import get_data
 
 from mindspore import log as logger
 from mindspore.mindrecord import FileWriter, FileReader, MindPage, SUCCESS
 from mindspore.mindrecord import MRMOpenError, MRMGenerateIndexError, ParamValueError, MRMGetMetaError, \
-    MRMFetchDataError
+    MRMFetchDataError, MRMValidateDataError
+from mindspore.mindrecord.shardreader import ShardReader
 
 CV_FILE_NAME = "./imagenet.mindrecord"
 NLP_FILE_NAME = "./aclImdb.mindrecord"
@@ -35,6 +37,8 @@ def remove_file(file_name):
     remove_one_file(x)
     x = file_name + ".db"
     remove_one_file(x)
+    x = file_name + ".mrmanifest"
+    remove_one_file(x)
     for i in range(FILES_NUM):
         x = file_name + str(i)
         remove_one_file(x)
@@ -79,6 +83,12 @@ def test_cv_page_reader_consumer_num_str():
         MindPage(CV_FILE_NAME + "0", "2")
 
 
+def test_cv_page_reader_cache_size_negative():
+    """test cv page reader when cache size is negative."""
+    with pytest.raises(Exception, match="Cache size should be int and greater than or equal to 0."):
+        MindPage(CV_FILE_NAME + "0", cache_size=-1)
+
+
 def test_nlp_file_reader_consumer_num_none():
     """test nlp file reader when consumer number is None."""
     with pytest.raises(Exception, match="Consumer number is illegal."):
@@ -122,6 +132,16 @@ def test_lack_db(fixture_cv_file):
            'error_msg: MindRecord File could not open successfully.' \
            in str(err.value)
 
+def test_get_blob_views_without_mmap(fixture_cv_file):
+    """test the error of getting blob views is raised instead of ending the iteration."""
+    create_cv_mindrecord(1)
+    reader = ShardReader()
+    reader.open(CV_FILE_NAME)
+    reader.launch(True)
+    with pytest.raises(MRMFetchDataError):
+        reader.get_blob_views(0, 1)
+    reader.close()
+
 def test_lack_some_partition_and_db(fixture_cv_file):
     """test file reader when some partition and db do not exist."""
     create_cv_mindrecord(4)
@@ -280,6 +300,13 @@ def test_cv_file_writer_shard_num_greater_than_1000():
     assert 'Shard number should between' in str(err.value)
 
 
+def test_cv_file_writer_compression_invalid():
+    """test cv file writer with unsupported compression."""
+    with pytest.raises(ParamValueError) as err:
+        FileWriter(CV_FILE_NAME, compression="gzip")
+    assert 'Compression should be one of' in str(err.value)
+
+
 def test_add_index_without_add_schema():
     with pytest.raises(MRMGetMetaError) as err:
         fw = FileWriter(CV_FILE_NAME)
@@ -341,3 +368,36 @@ def test_mindpage_filename_not_exist(fixture_cv_file):
 
     _ = ["{}{}".format(CV_FILE_NAME, str(x).rjust(1, '0'))
          for x in range(FILES_NUM)]
+
+
+def test_write_columns_not_match_schema():
+    """test write_columns raises if a column does not match the schema"""
+    schema = {"label": {"type": "int32"}, "feature": {"type": "float32", "shape": [2, 3]}}
+    invalid_columns = [{"label": np.arange(4)},
+                       {"label": np.arange(4), "feature": np.random.rand(3, 2, 3)},
+                       {"label": np.random.rand(4), "feature": np.random.rand(4, 2, 3)},
+                       {"label": np.arange(4), "feature": np.random.rand(4, 3, 3)},
+                       {"label": np.arange(4) + 2 ** 31, "feature": np.random.rand(4, 2, 3)}]
+    for columns in invalid_columns:
+        writer = FileWriter(CV_FILE_NAME)
+        writer.add_schema(schema, "data is so cool")
+        with pytest.raises(MRMValidateDataError):
+            writer.write_columns(columns)
+        writer.commit()
+        remove_file(CV_FILE_NAME)
+
+def test_write_columns_lossy_cast():
+    """test write_columns raises instead of truncating or wrapping the values of array columns"""
+    schema = {"ids": {"type": "int32", "shape": [2]}, "mask": {"type": "int32", "shape": [-1]}}
+    invalid_columns = [{"ids": np.random.rand(4, 2), "mask": [np.arange(2)] * 4},
+                       {"ids": np.arange(8).reshape(4, 2) + 2 ** 31, "mask": [np.arange(2)] * 4},
+                       {"ids": np.arange(8).reshape(4, 2), "mask": [np.arange(2) - 2 ** 40] * 4},
+                       {"ids": np.arange(8).reshape(4, 2), "mask": [np.arange(2) + 0.5] * 4}]
+    for columns in invalid_columns:
+        writer = FileWriter(CV_FILE_NAME)
+        writer.add_schema(schema, "data is so cool")
+        with pytest.raises(MRMValidateDataError):
+            writer.write_columns(columns)
+        writer.commit()
+        remove_file(CV_FILE_NAME)
+
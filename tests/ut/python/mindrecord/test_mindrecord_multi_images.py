@@ -43,6 +43,8 @@ def test_write_two_images_mindrecord():
         os.remove(CV_FILE_NAME + ".db")
     if os.path.exists("{}".format(CV_FILE_NAME)):
         os.remove(CV_FILE_NAME)
+    if os.path.exists("{}".format(CV_FILE_NAME + ".mrmanifest")):
+        os.remove(CV_FILE_NAME + ".mrmanifest")
     writer = FileWriter(CV_FILE_NAME, FILES_NUM)
     data = get_two_bytes_data(MAP_FILE_NAME)
     cv_schema_json = {"img_data": {"type": "bytes"}, "label_data": {"type": "bytes"}}
@@ -57,6 +59,8 @@ def test_write_two_images_mindrecord():
         os.remove(CV_FILE_NAME + ".db")
     if os.path.exists("{}".format(CV_FILE_NAME)):
         os.remove(CV_FILE_NAME)
+    if os.path.exists("{}".format(CV_FILE_NAME + ".mrmanifest")):
+        os.remove(CV_FILE_NAME + ".mrmanifest")
 
 
 def test_write_two_images_mindrecord_whole_field():
@@ -65,6 +69,8 @@ def test_write_two_images_mindrecord_whole_field():
         os.remove(CV_FILE_NAME + ".db")
     if os.path.exists("{}".format(CV_FILE_NAME)):
         os.remove(CV_FILE_NAME)
+    if os.path.exists("{}".format(CV_FILE_NAME + ".mrmanifest")):
+        os.remove(CV_FILE_NAME + ".mrmanifest")
     writer = FileWriter(CV_FILE_NAME, FILES_NUM)
     data = get_two_bytes_data(MAP_FILE_NAME)
     cv_schema_json = {"id": {"type": "int32"}, "file_name": {"type": "string"},
@@ -81,6 +87,8 @@ def test_write_two_images_mindrecord_whole_field():
         os.remove(CV_FILE_NAME + ".db")
     if os.path.exists("{}".format(CV_FILE_NAME)):
         os.remove(CV_FILE_NAME)
+    if os.path.exists("{}".format(CV_FILE_NAME + ".mrmanifest")):
+        os.remove(CV_FILE_NAME + ".mrmanifest")
 
 
 def test_write_two_diff_shape_images_mindrecord():
@@ -89,6 +97,8 @@ def test_write_two_diff_shape_images_mindrecord():
         os.remove(CV_FILE_NAME + ".db")
     if os.path.exists("{}".format(CV_FILE_NAME)):
         os.remove(CV_FILE_NAME)
+    if os.path.exists("{}".format(CV_FILE_NAME + ".mrmanifest")):
+        os.remove(CV_FILE_NAME + ".mrmanifest")
     bytes_num = 2
     writer = FileWriter(CV_FILE_NAME, FILES_NUM)
     data = get_multi_bytes_data(DIFF_SHAPE_FILE_NAME, bytes_num)
@@ -108,6 +118,8 @@ def test_write_multi_images_mindrecord():
         os.remove(CV_FILE_NAME + ".db")
     if os.path.exists("{}".format(CV_FILE_NAME)):
         os.remove(CV_FILE_NAME)
+    if os.path.exists("{}".format(CV_FILE_NAME + ".mrmanifest")):
+        os.remove(CV_FILE_NAME + ".mrmanifest")
     bytes_num = 10
     writer = FileWriter(CV_FILE_NAME, FILES_NUM)
     data = get_multi_bytes_data(MAP_FILE_FAKE_NAME, bytes_num)
@@ -127,6 +139,8 @@ def test_write_two_images_and_array_mindrecord():
         os.remove(CV_FILE_NAME + ".db")
     if os.path.exists("{}".format(CV_FILE_NAME)):
         os.remove(CV_FILE_NAME)
+    if os.path.exists("{}".format(CV_FILE_NAME + ".mrmanifest")):
+        os.remove(CV_FILE_NAME + ".mrmanifest")
 
     bytes_num = 2
     writer = FileWriter(CV_FILE_NAME, FILES_NUM)
@@ -151,3 +165,5 @@ def test_write_two_images_and_array_mindrecord():
         os.remove(CV_FILE_NAME + ".db")
     if os.path.exists("{}".format(CV_FILE_NAME)):
         os.remove(CV_FILE_NAME)
+    if os.path.exists("{}".format(CV_FILE_NAME + ".mrmanifest")):
+        os.remove(CV_FILE_NAME + ".mrmanifest")
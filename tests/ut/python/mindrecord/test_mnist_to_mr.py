@@ -39,10 +39,14 @@ def fixture_file():
         remove_one_file(x)
         x = "mnist_train.mindrecord.db"
         remove_one_file(x)
+        x = "mnist_train.mindrecord.mrmanifest"
+        remove_one_file(x)
         x = "mnist_test.mindrecord"
         remove_one_file(x)
         x = "mnist_test.mindrecord.db"
         remove_one_file(x)
+        x = "mnist_test.mindrecord.mrmanifest"
+        remove_one_file(x)
         for i in range(PARTITION_NUM):
             x = "mnist_train.mindrecord" + str(i)
             remove_one_file(x)
@@ -15,12 +15,14 @@
 import collections
 from importlib import import_module
 import os
+import struct
 
 import numpy as np
 import pytest
 from mindspore import log as logger
 from mindspore.mindrecord import FileReader
 from mindspore.mindrecord import TFRecordToMR
+from mindspore.mindrecord.tools.tfrecord import FixedLenFeature, VarLenFeature, crc32c, parse_example, read_tfrecord
 
 SupportedTensorFlowVersion = '2.1.0'
 
@@ -125,6 +127,8 @@ def test_tfrecord_to_mindrecord():
         os.remove(MINDRECORD_FILE_NAME)
     if os.path.exists(MINDRECORD_FILE_NAME + ".db"):
         os.remove(MINDRECORD_FILE_NAME + ".db")
+    if os.path.exists(MINDRECORD_FILE_NAME + ".mrmanifest"):
+        os.remove(MINDRECORD_FILE_NAME + ".mrmanifest")
 
     tfrecord_transformer = TFRecordToMR(os.path.join(TFRECORD_DATA_DIR, TFRECORD_FILE_NAME),
                                         MINDRECORD_FILE_NAME, feature_dict, ["image_bytes"])
@@ -138,6 +142,7 @@ def test_tfrecord_to_mindrecord():
 
     os.remove(MINDRECORD_FILE_NAME)
     os.remove(MINDRECORD_FILE_NAME + ".db")
+    os.remove(MINDRECORD_FILE_NAME + ".mrmanifest")
 
     os.remove(os.path.join(TFRECORD_DATA_DIR, TFRECORD_FILE_NAME))
 
@@ -164,6 +169,8 @@ def test_tfrecord_to_mindrecord_scalar_with_1():
         os.remove(MINDRECORD_FILE_NAME)
     if os.path.exists(MINDRECORD_FILE_NAME + ".db"):
         os.remove(MINDRECORD_FILE_NAME + ".db")
+    if os.path.exists(MINDRECORD_FILE_NAME + ".mrmanifest"):
+        os.remove(MINDRECORD_FILE_NAME + ".mrmanifest")
 
     tfrecord_transformer = TFRecordToMR(os.path.join(TFRECORD_DATA_DIR, TFRECORD_FILE_NAME),
                                         MINDRECORD_FILE_NAME, feature_dict, ["image_bytes"])
@@ -177,6 +184,7 @@ def test_tfrecord_to_mindrecord_scalar_with_1():
 
     os.remove(MINDRECORD_FILE_NAME)
     os.remove(MINDRECORD_FILE_NAME + ".db")
+    os.remove(MINDRECORD_FILE_NAME + ".mrmanifest")
 
     os.remove(os.path.join(TFRECORD_DATA_DIR, TFRECORD_FILE_NAME))
 
@@ -203,6 +211,8 @@ def test_tfrecord_to_mindrecord_scalar_with_1_list_small_len_exception():
         os.remove(MINDRECORD_FILE_NAME)
     if os.path.exists(MINDRECORD_FILE_NAME + ".db"):
         os.remove(MINDRECORD_FILE_NAME + ".db")
+    if os.path.exists(MINDRECORD_FILE_NAME + ".mrmanifest"):
+        os.remove(MINDRECORD_FILE_NAME + ".mrmanifest")
 
     with pytest.raises(ValueError):
         tfrecord_transformer = TFRecordToMR(os.path.join(TFRECORD_DATA_DIR, TFRECORD_FILE_NAME),
@@ -213,6 +223,8 @@ def test_tfrecord_to_mindrecord_scalar_with_1_list_small_len_exception():
         os.remove(MINDRECORD_FILE_NAME)
     if os.path.exists(MINDRECORD_FILE_NAME + ".db"):
         os.remove(MINDRECORD_FILE_NAME + ".db")
+    if os.path.exists(MINDRECORD_FILE_NAME + ".mrmanifest"):
+        os.remove(MINDRECORD_FILE_NAME + ".mrmanifest")
 
     os.remove(os.path.join(TFRECORD_DATA_DIR, TFRECORD_FILE_NAME))
 
@@ -239,6 +251,8 @@ def test_tfrecord_to_mindrecord_list_with_diff_type_exception():
         os.remove(MINDRECORD_FILE_NAME)
     if os.path.exists(MINDRECORD_FILE_NAME + ".db"):
         os.remove(MINDRECORD_FILE_NAME + ".db")
+    if os.path.exists(MINDRECORD_FILE_NAME + ".mrmanifest"):
+        os.remove(MINDRECORD_FILE_NAME + ".mrmanifest")
 
     with pytest.raises(ValueError):
         tfrecord_transformer = TFRecordToMR(os.path.join(TFRECORD_DATA_DIR, TFRECORD_FILE_NAME),
@@ -249,6 +263,8 @@ def test_tfrecord_to_mindrecord_list_with_diff_type_exception():
         os.remove(MINDRECORD_FILE_NAME)
     if os.path.exists(MINDRECORD_FILE_NAME + ".db"):
         os.remove(MINDRECORD_FILE_NAME + ".db")
+    if os.path.exists(MINDRECORD_FILE_NAME + ".mrmanifest"):
+        os.remove(MINDRECORD_FILE_NAME + ".mrmanifest")
 
     os.remove(os.path.join(TFRECORD_DATA_DIR, TFRECORD_FILE_NAME))
 
@@ -275,6 +291,8 @@ def test_tfrecord_to_mindrecord_list_without_bytes_type():
         os.remove(MINDRECORD_FILE_NAME)
     if os.path.exists(MINDRECORD_FILE_NAME + ".db"):
         os.remove(MINDRECORD_FILE_NAME + ".db")
+    if os.path.exists(MINDRECORD_FILE_NAME + ".mrmanifest"):
+        os.remove(MINDRECORD_FILE_NAME + ".mrmanifest")
 
     tfrecord_transformer = TFRecordToMR(os.path.join(TFRECORD_DATA_DIR, TFRECORD_FILE_NAME),
                                         MINDRECORD_FILE_NAME, feature_dict)
@@ -288,6 +306,7 @@ def test_tfrecord_to_mindrecord_list_without_bytes_type():
 
     os.remove(MINDRECORD_FILE_NAME)
     os.remove(MINDRECORD_FILE_NAME + ".db")
+    os.remove(MINDRECORD_FILE_NAME + ".mrmanifest")
 
     os.remove(os.path.join(TFRECORD_DATA_DIR, TFRECORD_FILE_NAME))
 
@@ -314,6 +333,8 @@ def test_tfrecord_to_mindrecord_scalar_with_2_exception():
         os.remove(MINDRECORD_FILE_NAME)
     if os.path.exists(MINDRECORD_FILE_NAME + ".db"):
         os.remove(MINDRECORD_FILE_NAME + ".db")
+    if os.path.exists(MINDRECORD_FILE_NAME + ".mrmanifest"):
+        os.remove(MINDRECORD_FILE_NAME + ".mrmanifest")
 
     tfrecord_transformer = TFRecordToMR(os.path.join(TFRECORD_DATA_DIR, TFRECORD_FILE_NAME),
                                         MINDRECORD_FILE_NAME, feature_dict, ["image_bytes"])
@@ -324,6 +345,8 @@ def test_tfrecord_to_mindrecord_scalar_with_2_exception():
         os.remove(MINDRECORD_FILE_NAME)
     if os.path.exists(MINDRECORD_FILE_NAME + ".db"):
         os.remove(MINDRECORD_FILE_NAME + ".db")
+    if os.path.exists(MINDRECORD_FILE_NAME + ".mrmanifest"):
+        os.remove(MINDRECORD_FILE_NAME + ".mrmanifest")
 
     os.remove(os.path.join(TFRECORD_DATA_DIR, TFRECORD_FILE_NAME))
 
@@ -350,6 +373,8 @@ def test_tfrecord_to_mindrecord_scalar_string_with_1_exception():
         os.remove(MINDRECORD_FILE_NAME)
     if os.path.exists(MINDRECORD_FILE_NAME + ".db"):
         os.remove(MINDRECORD_FILE_NAME + ".db")
+    if os.path.exists(MINDRECORD_FILE_NAME + ".mrmanifest"):
+        os.remove(MINDRECORD_FILE_NAME + ".mrmanifest")
 
     with pytest.raises(ValueError):
         tfrecord_transformer = TFRecordToMR(os.path.join(TFRECORD_DATA_DIR, TFRECORD_FILE_NAME),
@@ -360,6 +385,8 @@ def test_tfrecord_to_mindrecord_scalar_string_with_1_exception():
         os.remove(MINDRECORD_FILE_NAME)
     if os.path.exists(MINDRECORD_FILE_NAME + ".db"):
         os.remove(MINDRECORD_FILE_NAME + ".db")
+    if os.path.exists(MINDRECORD_FILE_NAME + ".mrmanifest"):
+        os.remove(MINDRECORD_FILE_NAME + ".mrmanifest")
 
     os.remove(os.path.join(TFRECORD_DATA_DIR, TFRECORD_FILE_NAME))
 
@@ -386,6 +413,8 @@ def test_tfrecord_to_mindrecord_scalar_bytes_with_10_exception():
         os.remove(MINDRECORD_FILE_NAME)
     if os.path.exists(MINDRECORD_FILE_NAME + ".db"):
         os.remove(MINDRECORD_FILE_NAME + ".db")
+    if os.path.exists(MINDRECORD_FILE_NAME + ".mrmanifest"):
+        os.remove(MINDRECORD_FILE_NAME + ".mrmanifest")
 
     with pytest.raises(ValueError):
         tfrecord_transformer = TFRecordToMR(os.path.join(TFRECORD_DATA_DIR, TFRECORD_FILE_NAME),
@@ -396,5 +425,140 @@ def test_tfrecord_to_mindrecord_scalar_bytes_with_10_exception():
         os.remove(MINDRECORD_FILE_NAME)
     if os.path.exists(MINDRECORD_FILE_NAME + ".db"):
         os.remove(MINDRECORD_FILE_NAME + ".db")
+    if os.path.exists(MINDRECORD_FILE_NAME + ".mrmanifest"):
+        os.remove(MINDRECORD_FILE_NAME + ".mrmanifest")
 
     os.remove(os.path.join(TFRECORD_DATA_DIR, TFRECORD_FILE_NAME))
+
+def test_tfrecord_to_mindrecord_var_len_feature():
+    """test transform tfrecord with VarLenFeature to mindrecord."""
+    if not tf or tf.__version__ < SupportedTensorFlowVersion:
+        # skip the test
+        logger.warning("Module tensorflow is not found or version wrong, \
+            please use pip install it / reinstall version >= {}.".format(SupportedTensorFlowVersion))
+        return
+
+    generate_tfrecord()
+    assert os.path.exists(os.path.join(TFRECORD_DATA_DIR, TFRECORD_FILE_NAME))
+
+    feature_dict = {"file_name": tf.io.FixedLenFeature([], tf.string),
+                    "image_bytes": tf.io.FixedLenFeature([], tf.string),
+                    "int64_scalar": tf.io.FixedLenFeature([], tf.int64),
+                    "float_scalar": tf.io.FixedLenFeature([], tf.float32),
+                    "int64_list": tf.io.VarLenFeature(tf.int64),
+                    "float_list": tf.io.VarLenFeature(tf.float32),
+                    }
+
+    if os.path.exists(MINDRECORD_FILE_NAME):
+        os.remove(MINDRECORD_FILE_NAME)
+    if os.path.exists(MINDRECORD_FILE_NAME + ".db"):
+        os.remove(MINDRECORD_FILE_NAME + ".db")
+    if os.path.exists(MINDRECORD_FILE_NAME + ".mrmanifest"):
+        os.remove(MINDRECORD_FILE_NAME + ".mrmanifest")
+
+    tfrecord_transformer = TFRecordToMR(os.path.join(TFRECORD_DATA_DIR, TFRECORD_FILE_NAME),
+                                        MINDRECORD_FILE_NAME, feature_dict, ["image_bytes"])
+    assert tfrecord_transformer.mindrecord_schema["int64_list"] == {"type": "int64", "shape": [-1]}
+    tfrecord_transformer.transform()
+
+    fr_mindrecord = FileReader(MINDRECORD_FILE_NAME)
+    verify_data(tfrecord_transformer, fr_mindrecord)
+
+    os.remove(MINDRECORD_FILE_NAME)
+    os.remove(MINDRECORD_FILE_NAME + ".db")
+    os.remove(MINDRECORD_FILE_NAME + ".mrmanifest")
+
+    os.remove(os.path.join(TFRECORD_DATA_DIR, TFRECORD_FILE_NAME))
+
+def _encode_varint(value):
+    if value < 0:
+        value += 1 << 64
+    out = bytearray()
+    while value > 0x7f:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+def _encode_field(number, payload):
+    """encode a length delimited field of protobuf"""
+    return _encode_varint(number << 3 | 2) + _encode_varint(len(payload)) + payload
+
+def _encode_example(features):
+    """encode tf.train.Example, values are list of bytes, float or int"""
+    entries = b""
+    for name, values in features.items():
+        if isinstance(values[0], bytes):
+            feature = _encode_field(1, b"".join(_encode_field(1, v) for v in values))
+        elif isinstance(values[0], float):
+            feature = _encode_field(2, _encode_field(1, struct.pack("<{}f".format(len(values)), *values)))
+        else:
+            feature = _encode_field(3, _encode_field(1, b"".join(_encode_varint(v) for v in values)))
+        entries += _encode_field(1, _encode_field(1, name.encode("utf-8")) + _encode_field(2, feature))
+    return _encode_field(1, entries)
+
+def _masked_crc(data):
+    crc = crc32c(data)
+    return (((crc >> 15) | (crc << 17)) + 0xa282ead8) & 0xffffffff
+
+def test_tfrecord_to_mindrecord_without_tensorflow():
+    """test read tfrecord and transform it to mindrecord without tensorflow."""
+    tfrecord_file = os.path.join(TFRECORD_DATA_DIR, "no_tf.tfrecord")
+    with open(tfrecord_file, "wb") as fp:
+        for i in range(10):
+            example = _encode_example({"label": [i - 5], "file name": [bytes("{}.jpg".format(i), encoding="utf-8")],
+                                       "boxes": [float(x) for x in range(i + 1)], "ids": list(range(i * 2 + 1))})
+            length = struct.pack("<Q", len(example))
+            fp.write(length + struct.pack("<I", _masked_crc(length)) + example +
+                     struct.pack("<I", _masked_crc(example)))
+
+    records = list(read_tfrecord(tfrecord_file, check_crc=True))
+    assert len(records) == 10
+    features = parse_example(records[3])
+    assert features["label"][1].tolist() == [-2]
+    assert features["file name"][1] == [b"3.jpg"]
+    assert features["boxes"][1].tolist() == [0., 1., 2., 3.]
+
+    if os.path.exists(MINDRECORD_FILE_NAME):
+        os.remove(MINDRECORD_FILE_NAME)
+    if os.path.exists(MINDRECORD_FILE_NAME + ".db"):
+        os.remove(MINDRECORD_FILE_NAME + ".db")
+    if os.path.exists(MINDRECORD_FILE_NAME + ".mrmanifest"):
+        os.remove(MINDRECORD_FILE_NAME + ".mrmanifest")
+
+    feature_dict = {"label": FixedLenFeature([], "int64"),
+                    "file name": FixedLenFeature([], "string"),
+                    "boxes": VarLenFeature("float32"),
+                    "ids": VarLenFeature("int64"),
+                    "weight": FixedLenFeature([], "float32", default_value=1.0)}
+    tfrecord_transformer = TFRecordToMR(tfrecord_file, MINDRECORD_FILE_NAME, feature_dict)
+    tfrecord_transformer.transform()
+
+    count = 0
+    fr_mindrecord = FileReader(MINDRECORD_FILE_NAME)
+    for item in fr_mindrecord.get_next():
+        i = int(item["label"]) + 5
+        assert item["file_name"] == "{}.jpg".format(i)
+        assert item["boxes"].tolist() == [float(x) for x in range(i + 1)]
+        assert item["ids"].tolist() == list(range(i * 2 + 1))
+        assert item["weight"] == 1.0
+        count += 1
+    assert count == 10
+    fr_mindrecord.close()
+    os.remove(MINDRECORD_FILE_NAME)
+    os.remove(MINDRECORD_FILE_NAME + ".db")
+    os.remove(MINDRECORD_FILE_NAME + ".mrmanifest")
+
+    # int64 values out of the range of int32 are not wrapped silently
+    with open(tfrecord_file, "wb") as fp:
+        example = _encode_example({"label": [1 << 40]})
+        length = struct.pack("<Q", len(example))
+        fp.write(length + struct.pack("<I", _masked_crc(length)) + example +
+                 struct.pack("<I", _masked_crc(example)))
+    tfrecord_transformer = TFRecordToMR(tfrecord_file, MINDRECORD_FILE_NAME, {"label": FixedLenFeature([], "int32")})
+    with pytest.raises(ValueError):
+        tfrecord_transformer.transform()
+    for file_name in (MINDRECORD_FILE_NAME, MINDRECORD_FILE_NAME + ".db", MINDRECORD_FILE_NAME + ".mrmanifest",
+                      tfrecord_file):
+        if os.path.exists(file_name):
+            os.remove(file_name)
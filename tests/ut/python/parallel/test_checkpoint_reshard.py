@@ -0,0 +1,68 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import os
+import stat
+import numpy as np
+import pytest
+
+from mindspore import Tensor
+from mindspore.parallel.checkpoint_reshard import reshard_checkpoint
+from mindspore.train.serialization import save_checkpoint, load_distributed_checkpoint, _parse_raw_checkpoint
+
+_cur_dir = os.path.dirname(os.path.realpath(__file__))
+
+
+def _remove_files(file_names):
+    for file_name in file_names:
+        if os.path.exists(file_name):
+            os.chmod(file_name, stat.S_IWRITE)
+            os.remove(file_name)
+
+
+def test_reshard_checkpoint():
+    weight = np.arange(8 * 6).reshape([8, 6]).astype(np.float32)
+    bias = np.arange(6).astype(np.float32)
+    # weight is split into 2 x 2 slices on 4 ranks, bias is not split
+    weight_slices = [np.ascontiguousarray(weight[i:i + 4, j:j + 3]) for i in (0, 4) for j in (0, 3)]
+    src_files = [os.path.join(_cur_dir, './reshard_src_{}.ckpt'.format(rank)) for rank in range(4)]
+    dst_files = [os.path.join(_cur_dir, './reshard_dst_{}.ckpt'.format(rank)) for rank in range(2)]
+    layout_file = os.path.join(_cur_dir, './reshard_layout.json')
+    _remove_files(src_files + dst_files + [layout_file])
+    for rank, src_file in enumerate(src_files):
+        parameter_list = [{'name': "weight", 'data': Tensor(weight_slices[rank]),
+                           'layout': {"dev_mat": [2, 2], "tensor_map": [1, 0], "rank": rank}},
+                          {'name': "bias", 'data': Tensor(bias)}]
+        save_checkpoint(parameter_list, src_file, ckpt_format="raw")
+
+    # weight is split by columns on 2 ranks, bias is split into 2 slices
+    with open(layout_file, "w") as f:
+        json.dump({"weight": [[2], [-1, 0], [8, 3]], "bias": [[2], [0], [3]]}, f)
+    reshard_checkpoint(src_files, layout_file, dst_files)
+
+    for rank, dst_file in enumerate(dst_files):
+        tensors = {name: param_data.reshape(shape)
+                   for name, _, shape, param_data, _ in _parse_raw_checkpoint(dst_file, True)}
+        assert np.array_equal(tensors["weight"], weight[:, rank * 3:(rank + 1) * 3])
+        assert np.array_equal(tensors["bias"], bias[rank * 3:(rank + 1) * 3])
+    par_dict = load_distributed_checkpoint(dst_files)
+    assert np.array_equal(par_dict['weight'].data.asnumpy(), weight)
+    assert np.array_equal(par_dict['bias'].data.asnumpy(), bias)
+
+    # 4 destination files do not match the device matrix of the layout
+    with pytest.raises(ValueError):
+        reshard_checkpoint(src_files, layout_file, dst_files * 2)
+    with pytest.raises(ValueError):
+        reshard_checkpoint(src_files, {"weight": [[2], [-1, 0]]}, src_files[:2])
+    _remove_files(src_files + dst_files + [layout_file])
@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
+
 from mindspore import Tensor
-from mindspore.parallel._tensor import _reshape_param_data
+from mindspore.parallel._tensor import _reshape_param_data, _get_tensor_strategy, _get_tensor_slice_index, \
+    _chunk_tensor_by_strategy
 
 
 def test_reshape_param_data():
@@ -50,5 +53,19 @@ def test_reshape_param_data():
         raise AssertionError
 
 
+
+def test_reshape_param_data_by_layouts():
+    tensor = np.arange(8 * 4 * 6).reshape([8, 4, 6]).astype(np.float32)
+    dev_mat = [2, 2, 2]
+    for tensor_map in ([2, 1, 0], [0, -1, 1], [-1, 2, -1], [1, 0, -1]):
+        tensor_strategy = _get_tensor_strategy(dev_mat, tensor_map)
+        tensor_slices = _chunk_tensor_by_strategy(tensor, tensor_strategy)
+        # slices are gathered along the first dimension in the order of ranks
+        slice_indexes = [int(_get_tensor_slice_index(dev_mat, tensor_strategy, tensor_map, rank)) for rank in range(8)]
+        input_tensor = Tensor(np.concatenate([tensor_slices[index] for index in slice_indexes], axis=0))
+        merged = _reshape_param_data(input_tensor, dev_mat, tensor_map)
+        assert np.array_equal(merged.asnumpy(), tensor)
+
+
 if __name__ == '__main__':
     test_reshape_param_data()
@@ -14,6 +14,7 @@
 # ============================================================================
 """test callback function."""
 import os
+import shutil
 import stat
 from unittest import mock
 
@@ -272,6 +273,43 @@ def test_checkpoint_save_ckpt_seconds():
     ckpt_cb2.step_end(run_context)
 
 
+def test_checkpoint_async_save():
+    """Test checkpoint saved asynchronously."""
+    train_config = CheckpointConfig(
+        save_checkpoint_steps=1,
+        keep_checkpoint_max=2,
+        ckpt_format="raw",
+        async_save=True,
+        max_pending_saves=2)
+    directory = './test_files_async'
+    if os.path.exists(directory):
+        shutil.rmtree(directory)
+    ckpt_cb = ModelCheckpoint(prefix="async", directory=directory, config=train_config)
+    cb_params = _InternalCallbackParam()
+    net = Net()
+    loss = nn.SoftmaxCrossEntropyWithLogits()
+    optim = Momentum(net.trainable_params(), learning_rate=0.1, momentum=0.9)
+    network_ = WithLossCell(net, loss)
+    _train_network = TrainOneStepCell(network_, optim)
+    cb_params.train_network = _train_network
+    cb_params.epoch_num = 1
+    cb_params.cur_epoch_num = 1
+    cb_params.batch_num = 4
+    run_context = RunContext(cb_params)
+    ckpt_cb.begin(run_context)
+    for step in range(1, 5):
+        cb_params.cur_step_num = step
+        ckpt_cb.step_end(run_context)
+        # the file of the step is reported at once, even if it is still being written
+        assert ckpt_cb.latest_ckpt_file_name == os.path.join(directory, "async-1_{}.ckpt".format(step))
+    ckpt_cb.end(run_context)
+
+    ckpt_files = sorted(x for x in os.listdir(directory) if x.endswith(".ckpt"))
+    assert ckpt_files == ["async-1_3.ckpt", "async-1_4.ckpt"]
+    assert ckpt_cb.latest_ckpt_file_name == os.path.join(directory, "async-1_4.ckpt")
+    shutil.rmtree(directory)
+
+
 def test_CallbackManager():
     """TestCallbackManager."""
     ck_obj = ModelCheckpoint()
@@ -350,6 +388,16 @@ def test_Checkpoint_Config():
     with pytest.raises(ValueError):
         CheckpointConfig(0, None, 0, 0, True)
 
+    # the save options are supported by raw format only
+    with pytest.raises(ValueError):
+        CheckpointConfig(storage_type="float16")
+    with pytest.raises(ValueError):
+        CheckpointConfig(ckpt_format="raw", storage_type="float64")
+    train_config = CheckpointConfig(ckpt_format="raw", storage_type="bfloat16", optimizer_states="exclude",
+                                    compress=True, checksum=True)
+    assert train_config.storage_type == "bfloat16"
+    assert train_config.optimizer_states == "exclude"
+
 
 def test_step_end_save_graph():
     """Test save checkpoint."""
@@ -29,9 +29,10 @@ from mindspore.nn import SoftmaxCrossEntropyWithLogits
 from mindspore.nn import WithLossCell, TrainOneStepCell
 from mindspore.nn.optim.momentum import Momentum
 from mindspore.ops import operations as P
+from mindspore.train import serialization
 from mindspore.train.callback import _CheckpointManager
 from mindspore.train.serialization import save_checkpoint, load_checkpoint, load_param_into_net, \
-    _exec_save_checkpoint, export, _save_graph
+    _exec_save_checkpoint, export, _save_graph, load_distributed_checkpoint, save_delta_checkpoint, compact_checkpoint
 from ..ut_filter import non_graph_engine
 
 context.set_context(mode=context.GRAPH_MODE, print_file_path="print.pb")
@@ -132,6 +133,218 @@ def test_load_checkpoint():
     assert isinstance(par_dict, dict)
 
 
+def test_save_and_load_raw_checkpoint():
+    """ test_save_and_load_raw_checkpoint """
+    weight = np.random.randint(0, 255, [12, 1024]).astype(np.float32)
+    parameter_list = [{'name': "weight", 'data': Tensor(weight)},
+                      {'name': "step", 'data': Tensor(np.array(3, np.int32))},
+                      {'name': "mask", 'data': Tensor(np.array([True, False, True]))},
+                      {'name': "scale", 'data': Tensor(np.ones([2, 3, 1]), dtype=mstype.float16)}]
+    ckpoint_file_name = os.path.join(_cur_dir, './raw_parameters.ckpt')
+    save_checkpoint(parameter_list, ckpoint_file_name, ckpt_format="raw")
+    par_dict = load_checkpoint(ckpoint_file_name)
+
+    assert list(par_dict.keys()) == ["weight", "step", "mask", "scale"]
+    assert np.array_equal(par_dict['weight'].data.asnumpy(), weight)
+    assert par_dict['step'].data.dtype == mstype.int32
+    assert par_dict['step'].data.asnumpy() == 3
+    assert par_dict['mask'].data.asnumpy().tolist() == [True, False, True]
+    assert par_dict['scale'].data.dtype == mstype.float16
+    assert par_dict['scale'].data.shape == (2, 3, 1)
+
+    # checkpoint files of protobuf are still readable
+    assert len(load_checkpoint(os.path.join(_cur_dir, './parameters.ckpt'))) == 3
+    with pytest.raises(ValueError):
+        save_checkpoint(parameter_list, ckpoint_file_name, ckpt_format="hdf5")
+
+
+def test_load_raw_checkpoint_parameters_own_data():
+    """ test the parameters loaded do not change when the checkpoint file is overwritten """
+    weight = np.random.rand(4, 8).astype(np.float32)
+    ckpoint_file_name = os.path.join(_cur_dir, './raw_owned_parameters.ckpt')
+    save_checkpoint([{'name': "weight", 'data': Tensor(weight)}], ckpoint_file_name, ckpt_format="raw")
+    par_dict = load_checkpoint(ckpoint_file_name)
+    loaded_weight = par_dict['weight']
+
+    save_checkpoint([{'name': "weight", 'data': Tensor(weight + 1)}], ckpoint_file_name, ckpt_format="raw")
+    assert np.array_equal(loaded_weight.data.asnumpy(), weight)
+    os.remove(ckpoint_file_name)
+
+
+def test_save_raw_checkpoint_with_options():
+    """ test_save_raw_checkpoint_with_options """
+    weight = np.random.randn(64, 32).astype(np.float32)
+    moment = np.random.randn(64, 32).astype(np.float32)
+    parameter_list = [{'name': "weight", 'data': Tensor(weight)},
+                      {'name': "moment1.weight", 'data': Tensor(moment), 'optimizer_state': True},
+                      {'name': "step", 'data': Tensor(np.array([3], np.int32))}]
+    ckpoint_file_name = os.path.join(_cur_dir, './options_parameters.ckpt')
+    for storage_type, tolerance in (("float16", 1e-3), ("bfloat16", 1e-2)):
+        if os.path.exists(ckpoint_file_name):
+            os.chmod(ckpoint_file_name, stat.S_IWRITE)
+            os.remove(ckpoint_file_name)
+        save_checkpoint(parameter_list, ckpoint_file_name, "raw", storage_type=storage_type, compress=True,
+                        checksum=True)
+        par_dict = load_checkpoint(ckpoint_file_name)
+        assert par_dict['weight'].data.dtype == mstype.float32
+        assert np.allclose(par_dict['weight'].data.asnumpy(), weight, rtol=tolerance, atol=0)
+        # the optimizer states are kept in full precision
+        assert np.array_equal(par_dict['moment1.weight'].data.asnumpy(), moment)
+        assert par_dict['step'].data.asnumpy()[0] == 3
+
+    os.chmod(ckpoint_file_name, stat.S_IWRITE)
+    os.remove(ckpoint_file_name)
+    save_checkpoint(parameter_list, ckpoint_file_name, "raw", storage_type="bfloat16", optimizer_states="exclude")
+    assert sorted(load_checkpoint(ckpoint_file_name).keys()) == ["step", "weight"]
+
+    # the corruption of data is detected by the checksum
+    os.chmod(ckpoint_file_name, stat.S_IWRITE)
+    os.remove(ckpoint_file_name)
+    save_checkpoint(parameter_list, ckpoint_file_name, "raw", checksum=True)
+    os.chmod(ckpoint_file_name, stat.S_IWRITE | stat.S_IREAD)
+    with open(ckpoint_file_name, "r+b") as f:
+        f.seek(100)
+        byte = f.read(1)
+        f.seek(100)
+        f.write(bytes([byte[0] ^ 0xff]))
+    with pytest.raises(ValueError):
+        load_checkpoint(ckpoint_file_name)
+    with pytest.raises(ValueError):
+        save_checkpoint(parameter_list, ckpoint_file_name, "protobuf", compress=True)
+    os.remove(ckpoint_file_name)
+
+
+def test_load_compressed_checkpoint_lazily(monkeypatch):
+    """ test_load_compressed_checkpoint_lazily """
+    weight = np.random.randn(64, 32).astype(np.float32)
+    bias = np.random.randn(32).astype(np.float32)
+    parameter_list = [{'name': "weight", 'data': Tensor(weight)}, {'name': "bias", 'data': Tensor(bias)}]
+    ckpoint_file_name = os.path.join(_cur_dir, './compressed_parameters.ckpt')
+    if os.path.exists(ckpoint_file_name):
+        os.chmod(ckpoint_file_name, stat.S_IWRITE)
+        os.remove(ckpoint_file_name)
+    save_checkpoint(parameter_list, ckpoint_file_name, "raw", compress=True, checksum=True)
+
+    decoded_names = []
+    decode_tensor_data = serialization._decode_tensor_data
+
+    def _decode_and_record(file_data, tensor):
+        decoded_names.append(tensor["name"])
+        return decode_tensor_data(file_data, tensor)
+
+    monkeypatch.setattr(serialization, "_decode_tensor_data", _decode_and_record)
+    par_dict = load_checkpoint(ckpoint_file_name, lazy=True)
+    assert len(par_dict) == 2
+    assert not decoded_names
+    assert np.array_equal(par_dict['bias'].data.asnumpy(), bias)
+    assert decoded_names == ["bias"]
+    assert np.array_equal(par_dict['weight'].data.asnumpy(), weight)
+    assert decoded_names == ["bias", "weight"]
+    os.chmod(ckpoint_file_name, stat.S_IWRITE)
+    os.remove(ckpoint_file_name)
+
+
+def test_load_checkpoint_selective_and_lazy():
+    """ test_load_checkpoint_selective_and_lazy """
+    ckpoint_file_name = os.path.join(_cur_dir, './raw_parameters.ckpt')
+    par_dict = load_checkpoint(ckpoint_file_name, filter_prefix=["s"])
+    assert list(par_dict.keys()) == ["weight", "mask"]
+    par_dict = load_checkpoint(ckpoint_file_name, names=["mask", "not_exist"])
+    assert list(par_dict.keys()) == ["mask"]
+
+    par_dict = load_checkpoint(ckpoint_file_name, filter_prefix="mask", lazy=True)
+    assert not isinstance(par_dict, dict)
+    assert len(par_dict) == 3
+    assert "scale" in par_dict and "mask" not in par_dict
+    assert par_dict["scale"] is par_dict["scale"]
+    assert par_dict["scale"].data.shape == (2, 3, 1)
+
+    par_dict = load_checkpoint(os.path.join(_cur_dir, './parameters.ckpt'), names=["param"], lazy=True)
+    assert par_dict["param"].data.shape == (12, 1024)
+    with pytest.raises(TypeError):
+        load_checkpoint(ckpoint_file_name, names="weight")
+
+
+def test_load_distributed_checkpoint():
+    """ test_load_distributed_checkpoint """
+    weight = np.arange(8 * 6).reshape([8, 6]).astype(np.float32)
+    bias = np.arange(6).astype(np.float32)
+    dev_mat = [2, 2]
+    # weight is split into 2 x 2 slices, bias is split into 2 slices and repeated on 2 ranks
+    weight_slices = [np.ascontiguousarray(weight[i:i + 4, j:j + 3]) for i in (0, 4) for j in (0, 3)]
+    bias_slices = [bias[:3], bias[3:], bias[:3], bias[3:]]
+    ckpoint_file_names = []
+    for rank in range(4):
+        parameter_list = [{'name': "weight", 'data': Tensor(weight_slices[rank]),
+                           'layout': {"dev_mat": dev_mat, "tensor_map": [1, 0], "rank": rank}},
+                          {'name': "bias", 'data': Tensor(bias_slices[rank]),
+                           'layout': {"dev_mat": dev_mat, "tensor_map": [0], "rank": rank}},
+                          {'name': "step", 'data': Tensor(np.array(5, np.int32))}]
+        ckpoint_file_name = os.path.join(_cur_dir, './dist_rank_{}.ckpt'.format(rank))
+        if os.path.exists(ckpoint_file_name):
+            os.chmod(ckpoint_file_name, stat.S_IWRITE)
+            os.remove(ckpoint_file_name)
+        save_checkpoint(parameter_list, ckpoint_file_name, ckpt_format="raw")
+        ckpoint_file_names.append(ckpoint_file_name)
+
+    par_dict = load_distributed_checkpoint(ckpoint_file_names[::-1])
+    assert np.array_equal(par_dict['weight'].data.asnumpy(), weight)
+    assert np.array_equal(par_dict['bias'].data.asnumpy(), bias)
+    assert par_dict['step'].data.asnumpy() == 5
+    # bias could be merged from 2 ranks, weight could not
+    with pytest.raises(ValueError):
+        load_distributed_checkpoint(ckpoint_file_names[:2])
+    with pytest.raises(ValueError):
+        load_distributed_checkpoint([os.path.join(_cur_dir, './parameters.ckpt')])
+    for ckpoint_file_name in ckpoint_file_names:
+        os.chmod(ckpoint_file_name, stat.S_IWRITE)
+        os.remove(ckpoint_file_name)
+
+
+def test_save_and_load_delta_checkpoint():
+    """ test_save_and_load_delta_checkpoint """
+    embedding = np.random.rand(1000, 16).astype(np.float32)
+    weight = np.random.rand(4, 4).astype(np.float32)
+    file_names = [os.path.join(_cur_dir, './delta_{}.ckpt'.format(i)) for i in range(4)]
+    for file_name in file_names:
+        if os.path.exists(file_name):
+            os.chmod(file_name, stat.S_IWRITE)
+            os.remove(file_name)
+    save_checkpoint([{'name': "embedding", 'data': Tensor(embedding)}, {'name': "weight", 'data': Tensor(weight)},
+                     {'name': "global_step", 'data': Tensor(np.array(0, np.int32))}], file_names[0], ckpt_format="raw")
+    for i in (1, 2):
+        # only a few rows of the embedding are updated, the weight is updated whole
+        embedding[[i, 500, 999]] += i
+        weight += i
+        save_delta_checkpoint([{'name': "embedding", 'data': Tensor(embedding)},
+                               {'name': "weight", 'data': Tensor(weight)},
+                               {'name': "global_step", 'data': Tensor(np.array(i, np.int32))}],
+                              file_names[i], file_names[i - 1])
+        assert os.path.getsize(file_names[i]) < os.path.getsize(file_names[0]) // 4
+
+    par_dict = load_checkpoint(file_names[2])
+    assert np.array_equal(par_dict['embedding'].data.asnumpy(), embedding)
+    assert np.array_equal(par_dict['weight'].data.asnumpy(), weight)
+    assert par_dict['global_step'].data.shape == ()
+    assert par_dict['global_step'].data.asnumpy() == 2
+    par_dict = load_checkpoint(file_names[1], names=["weight"])
+    assert list(par_dict.keys()) == ["weight"]
+    assert np.array_equal(par_dict['weight'].data.asnumpy(), weight - 2)
+
+    compact_checkpoint(file_names[2], file_names[3])
+    par_dict = load_checkpoint(file_names[3])
+    assert np.array_equal(par_dict['embedding'].data.asnumpy(), embedding)
+    assert par_dict['global_step'].data.shape == ()
+    assert par_dict['global_step'].data.asnumpy() == 2
+    with pytest.raises(ValueError):
+        load_distributed_checkpoint([file_names[2]])
+    with pytest.raises(ValueError):
+        compact_checkpoint(file_names[0], file_names[3])
+    for file_name in file_names:
+        os.chmod(file_name, stat.S_IWRITE)
+        os.remove(file_name)
+
+
 def test_checkpoint_manager():
     """ test_checkpoint_manager """
     ckp_mgr = _CheckpointManager()
@@ -276,6 +489,60 @@ def test_load_param_into_net():
     assert net.conv1.weight.default_input.asnumpy()[0][0][0][0] == 1
 
 
+def test_load_param_into_net_in_place_with_prefix():
+    net = Net(10)
+    net.init_parameters_data()
+
+    parameter_dict = {}
+    parameter_dict["network.conv1.weight"] = Parameter(Tensor(np.ones(shape=(64, 3, 7, 7)), dtype=mstype.float32),
+                                                       name="network.conv1.weight")
+    parameter_dict["network.fc.bias"] = Parameter(Tensor(np.ones([10]).astype(np.float32)), name="network.fc.bias")
+    # the first load copies the data to the buffers owned by the parameters, found by the names with prefix
+    load_param_into_net(net, parameter_dict)
+    weight_data = net.conv1.weight.default_input
+    assert np.all(weight_data.asnumpy() == 1)
+    assert np.all(net.fc.bias.default_input.asnumpy() == 1)
+
+    parameter_dict["network.conv1.weight"] = Parameter(Tensor(np.full((64, 3, 7, 7), 2), dtype=mstype.float32),
+                                                       name="network.conv1.weight")
+    load_param_into_net(net, parameter_dict)
+    # the later loads copy the data into the owned buffers in place
+    assert net.conv1.weight.default_input is weight_data
+    assert np.all(weight_data.asnumpy() == 2)
+    # the net does not share the buffers with parameter_dict
+    parameter_dict["network.conv1.weight"].default_input.asnumpy()[0] = 3
+    assert np.all(weight_data.asnumpy() == 2)
+
+
+class ParamNet(nn.Cell):
+    """ net with a single parameter """
+
+    def __init__(self, weight):
+        super(ParamNet, self).__init__()
+        self.weight = Parameter(weight, name="weight")
+
+    def construct(self, x):
+        return x * self.weight
+
+
+def test_load_param_into_net_not_overwrite_shared_data():
+    init_tensor = Tensor(np.zeros([4]).astype(np.float32))
+    init_array = np.zeros([4]).astype(np.float32)
+    for init_data in (init_tensor, init_array):
+        net1 = ParamNet(init_data)
+        net2 = ParamNet(init_data)
+        cloned = net1.weight.clone("cloned")
+        for value in (1, 2):
+            parameter_dict = {"weight": Parameter(Tensor(np.full([4], value).astype(np.float32)), name="weight")}
+            load_param_into_net(net1, parameter_dict)
+            assert np.all(net1.weight.default_input.asnumpy() == value)
+        # the loads into net1 do not change the data of other nets, the clones or the user
+        assert np.all(net2.weight.default_input.asnumpy() == 0)
+        assert np.all(cloned.default_input.asnumpy() == 0)
+    assert np.all(init_tensor.asnumpy() == 0)
+    assert np.all(init_array == 0)
+
+
 def test_exec_save_checkpoint():
     net = Net()
     loss = SoftmaxCrossEntropyWithLogits(is_grad=False, sparse=True)
@@ -373,7 +640,7 @@ def test_print():
 
 
 def teardown_module():
-    files = ['parameters.ckpt', 'new_ckpt.ckpt', 'empty.ckpt', 'print.pb']
+    files = ['parameters.ckpt', 'raw_parameters.ckpt', 'new_ckpt.ckpt', 'empty.ckpt', 'print.pb']
     for item in files:
         file_name = './' + item
         if not os.path.exists(file_name):